@@ -6,8 +6,11 @@ import {
     ContextMenuItem,
     ContextMenuTrigger,
 } from "@/components/ui/context-menu";
+import { backendConfig } from "@/config/backend";
 import { Model } from "@/types/model";
+import axios from "axios";
 import moment from "moment-timezone";
+import { useEffect, useState } from "react";
 import { GoIterations } from "react-icons/go";
 import { useSearchParams } from "react-router-dom";
 
@@ -17,6 +20,40 @@ interface ModelCardInfoProps {
 
 const ModelCardInfo = ({ model }: ModelCardInfoProps) => {
     const [searchParams] = useSearchParams();
+
+    const { url, port } = backendConfig;
+
+    const predictionsCount = model.input_schema ? model.input_schema.rows : 0;
+
+    const [lastPredictionDate, setLastPredictionDate] = useState<
+        string | null
+    >(null);
+
+    /**
+     * Fetch date of the last prediction only, predictions are not part of the model
+     */
+    useEffect(() => {
+        if (!model.iteration || predictionsCount === 0) return;
+
+        let abortController = new AbortController();
+
+        axios
+            .get(`${url}:${port}/monitored-models/${model._id}/predictions`, {
+                params: { limit: 1, order: "desc", fields: "prediction_date" },
+                signal: abortController.signal,
+            })
+            .then((res) => {
+                if (res.data.predictions.length > 0) {
+                    setLastPredictionDate(
+                        res.data.predictions[0].prediction_date
+                    );
+                }
+            })
+            .catch(() => setLastPredictionDate(null));
+
+        return () => abortController.abort();
+    }, [model._id, predictionsCount]);
+
     const IterationBlock = () => {
         if (!model.iteration) {
             return (
@@ -79,28 +116,27 @@ const ModelCardInfo = ({ model }: ModelCardInfoProps) => {
 
     const PredictionHistoryBlock = () => {
         if (model.iteration) {
-            if (model.predictions_data && model.predictions_data.length > 0) {
+            if (predictionsCount > 0) {
                 return (
                     <>
                         <div className="flex items-center mb-2">
                             <Cycle className="flex-shrink-0 w-5 h-5 mr-1 text-mlops-secondary-tx dark:text-[#D5D5D5]" />
                             <span className="text-sm font-semibold">
-                                {model.predictions_data.length} historical
-                                prediction
-                                {model.predictions_data.length > 1 ? "s" : ""}
-                            </span>
-                        </div>
-                        <div className="flex items-center">
-                            <Timeline className="flex-shrink-0 w-5 h-5 mr-1 text-mlops-secondary-tx dark:text-[#D5D5D5]" />
-                            <span className="text-sm font-semibold">
-                                Last prediction on{" "}
-                                {moment(
-                                    model.predictions_data[
-                                        model.predictions_data.length - 1
-                                    ].prediction_date
-                                ).format("DD.MM.YYYY, HH:mm")}
+                                {predictionsCount} historical prediction
+                                {predictionsCount > 1 ? "s" : ""}
                             </span>
                         </div>
+                        {lastPredictionDate && (
+                            <div className="flex items-center">
+                                <Timeline className="flex-shrink-0 w-5 h-5 mr-1 text-mlops-secondary-tx dark:text-[#D5D5D5]" />
+                                <span className="text-sm font-semibold">
+                                    Last prediction on{" "}
+                                    {moment(lastPredictionDate).format(
+                                        "DD.MM.YYYY, HH:mm"
+                                    )}
+                                </span>
+                            </div>
+                        )}
                     </>
                 );
             } else {
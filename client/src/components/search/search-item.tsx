@@ -270,9 +270,8 @@ const SearchItem = ({ type, data, handleClose }: SearchItemProps) => {
                                             style={{ width: "12px" }}
                                         />
                                         <span>
-                                            {data.model.predictions_data
-                                                ? data.model.predictions_data
-                                                      .length
+                                            {data.model.input_schema
+                                                ? data.model.input_schema.rows
                                                 : 0}
                                         </span>
                                     </Badge>
@@ -56,6 +56,7 @@ interface DataStore {
         prediction_id: string,
         prediction: Prediction
     ) => void;
+    setPredictions: (model_id: string, predictions: Prediction[]) => void;
 
     setAll: (
         projectData: Project[],
@@ -410,4 +411,23 @@ export const useData = create<DataStore>((set) => ({
             return { models: null };
         });
     },
+
+    setPredictions: (model_id: string, predictions: Prediction[]) => {
+        set((state) => {
+            if (state.models) {
+                const index = state.models.findIndex(
+                    (model) => model._id === model_id
+                );
+
+                if (index === -1) return state;
+
+                state.models[index] = {
+                    ...state.models[index],
+                    predictions_data: predictions,
+                };
+                return { models: [...state.models] };
+            }
+            return { models: null };
+        });
+    },
 }));
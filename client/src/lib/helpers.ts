@@ -1,2 +1,34 @@
+import { Chart, EncodedChartData } from "@/types/chart";
+import { Keyable } from "@/types/types";
+
 export const sleep = (delay: number) =>
     new Promise((resolve) => setTimeout(resolve, delay));
+
+/**
+ * Decode chart data sent as base64 encoded little-endian array to lists of numbers, other data are returned as they are.
+ */
+export const decodeChartData = (data: any[][] | EncodedChartData): any[][] => {
+    if (Array.isArray(data)) return data;
+
+    const bytes = Uint8Array.from(atob(data.data), (char) => char.charCodeAt(0));
+    const view = new DataView(bytes.buffer);
+    const itemSize = data.dtype === "float32" ? 4 : 8;
+    const [seriesCount, pointsCount] = data.shape;
+
+    return Array.from({ length: seriesCount }, (_, series) =>
+        Array.from({ length: pointsCount }, (_, point) => {
+            const offset = (series * pointsCount + point) * itemSize;
+            return itemSize === 4
+                ? view.getFloat32(offset, true)
+                : view.getFloat64(offset, true);
+        })
+    );
+};
+
+export const decodeChart = (chart: Keyable): Chart => {
+    return {
+        ...chart,
+        x_data: decodeChartData(chart.x_data),
+        y_data: decodeChartData(chart.y_data),
+    } as Chart;
+};
@@ -18,6 +18,7 @@ import {
     useSearchParams,
 } from "react-router-dom";
 import { Keyable } from "@/types/types";
+import { decodeChart } from "@/lib/helpers";
 import { GoIterations } from "react-icons/go";
 import { Experiment } from "@/types/experiment";
 import DataTableContainer from "@/components/data-table/data-table-container";
@@ -423,9 +424,9 @@ const CompareIterations = () => {
 
             let customChartsInIterationsPacked = customChartsInIterations.map(
                 (data: Keyable) => {
-                    return data.interactive_charts.map((chart: Chart) => {
+                    return data.interactive_charts.map((chart: Keyable) => {
                         return {
-                            ...chart,
+                            ...decodeChart(chart),
                             iteration_name: data.iteration_name,
                         };
                     });
@@ -23,6 +23,7 @@ import ReactEcharts from "echarts-for-react";
 import { useTheme } from "@/components/providers/theme-provider";
 import { metricsChartOptionsGenerator } from "./single-iteration/metrics-chart-options";
 import { Keyable } from "@/types/types";
+import { decodeChart } from "@/lib/helpers";
 import Masonry from "react-masonry-css";
 import { breakpointsMasonryImageCharts } from "@/config/breakpoints";
 import ImageChart from "@/components/image-charts/image-chart";
@@ -32,7 +33,6 @@ import "@/components/image-lightbox/light-box.css";
 import IterationDropdownActions from "./single-iteration/iteration-dropdown-actions";
 import { dataImageType } from "@/lib/utils";
 import CustomChart from "@/components/custom-charts/single/custom-chart";
-import { Chart } from "@/types/chart";
 import SingleIterationLoading from "@/components/experiments/iterations/single/single-iteration-loading";
 
 const SingleIteration = () => {
@@ -205,7 +205,7 @@ const SingleIteration = () => {
                                 theme={theme}
                                 type={chart_data.chart_type}
                                 iteration_name={iterationData.iteration_name}
-                                chart_data={chart_data as Chart}
+                                chart_data={decodeChart(chart_data)}
                             />
                         );
                     }
@@ -9,6 +9,11 @@ import ModelIsEmpty from "@/components/monitoring/model/model-messages/model-is-
 import PageHeader from "@/components/page-header";
 import { useData } from "@/hooks/use-data-hook";
 import { Model } from "@/types/model";
+import { Prediction } from "@/types/prediction";
+import { Keyable } from "@/types/types";
+import { backendConfig } from "@/config/backend";
+import axios from "axios";
+import { useErrorBoundary } from "react-error-boundary";
 import { useEffect, useState } from "react";
 import { useNavigate, useParams, useSearchParams } from "react-router-dom";
 import MonitoringWrapper from "@/components/monitoring/monitoring-wrapper";
@@ -28,6 +33,53 @@ const Monitoring = () => {
 
     const [modelData, setModelData] = useState<null | Model>(null);
 
+    const [predictionsLoaded, setPredictionsLoaded] = useState(false);
+
+    const { showBoundary } = useErrorBoundary();
+
+    const { url, port } = backendConfig;
+
+    /**
+     * Fetch predictions of the model page by page, model responses do not contain predictions
+     */
+    useEffect(() => {
+        if (!data.models || !model_id) return;
+
+        let abortController = new AbortController();
+        let signal = abortController.signal;
+
+        setPredictionsLoaded(false);
+
+        (async () => {
+            try {
+                let predictions: Prediction[] = [];
+                let cursor: string | null = null;
+                do {
+                    const response: { data: Keyable } = await axios.get(
+                        `${url}:${port}/monitored-models/${model_id}/predictions`,
+                        {
+                            params: { limit: 1000, cursor: cursor },
+                            signal: signal,
+                        }
+                    );
+                    predictions = predictions.concat(
+                        response.data.predictions
+                    );
+                    cursor = response.data.next_cursor;
+                } while (cursor);
+
+                data.setPredictions(model_id, predictions);
+                setPredictionsLoaded(true);
+            } catch (error: any) {
+                if (!signal.aborted) {
+                    showBoundary(error);
+                }
+            }
+        })();
+
+        return () => abortController.abort();
+    }, [data.models !== null, model_id]);
+
     useEffect(() => {
         if (data.models) {
             const foundModel = data.models.find(
@@ -48,7 +100,7 @@ const Monitoring = () => {
         }
     }, [data.models, model_id]);
 
-    if (modelData === null) {
+    if (modelData === null || !predictionsLoaded) {
         return <MonitoringLoading />;
     }
 
@@ -5,6 +5,11 @@ export enum ChartType {
     SCATTER = "scatter",
     BOXPLOT = "boxplot",
 }
+export interface EncodedChartData {
+    dtype: "float32" | "float64";
+    shape: [number, number];
+    data: string;
+}
 export interface Chart {
     id: string;
     chart_type: ChartType;
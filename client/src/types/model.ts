@@ -3,6 +3,10 @@ import { MonitoringChart } from "./monitoring-chart";
 import { Prediction } from "./prediction";
 import { ModelStatus } from "./types";
 
+export interface InputSchema {
+    rows: number;
+}
+
 export interface Model {
     _id: string;
 
@@ -13,7 +17,9 @@ export interface Model {
     iteration?: Iteration;
     pinned: boolean;
 
+    // predictions are loaded with GET /monitored-models/{id}/predictions, the field is empty in model responses
     predictions_data: Prediction[];
+    input_schema?: InputSchema;
     ml_model?: string;
 
     interactive_charts: MonitoringChart[];
@@ -0,0 +1,9 @@
+"""
+Asyncio versions of mlops.tracking and mlops.monitoring functions. Requests are sent through a connection pool
+shared by all coroutines running in the same event loop. Requires httpx (pip install mlops-ai[aio]).
+"""
+from mlops.aio.iteration import AsyncIteration
+from mlops.aio.tracking import get_project, get_project_by_name, create_project, set_active_project, \
+    get_experiment, get_experiment_by_name, create_experiment, set_active_experiment, create_dataset, get_dataset, \
+    query_iterations, start_iteration
+from mlops.aio.monitoring import get_model_by_name, create_model, set_active_model, send_prediction
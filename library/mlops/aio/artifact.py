@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+
+from mlops.config.config import settings
+from mlops.exceptions.artifact import artifact_upload_failed_exception, artifact_checksum_mismatch_exception
+from mlops.src.artifact import get_file_checksum
+
+
+def read_chunk(path: str, offset: int) -> bytes:
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        return file.read(settings.artifact_chunk_size)
+
+
+async def upload_artifact(path: str) -> str:
+    """
+    Upload file to the server artifact store, see mlops.src.artifact.upload_artifact. File is hashed and read
+    in a thread, so the event loop is not blocked.
+
+    Args:
+        path: Path to file.
+
+    Returns:
+        Artifact id.
+    """
+    client = settings.async_client
+    sha256, size = await asyncio.to_thread(get_file_checksum, path)
+
+    app_response = await client.post(f"{settings.url}/artifacts/uploads", json={"size": size, "sha256": sha256})
+    if app_response.status_code != 201:
+        raise artifact_upload_failed_exception(app_response)
+
+    upload = app_response.json()
+    upload_url = f"{settings.url}/artifacts/uploads/{upload['_id']}"
+    offset = upload['offset']
+    retries = 0
+
+    while upload['artifact_id'] is None and offset < size:
+        chunk = await asyncio.to_thread(read_chunk, path, offset)
+
+        try:
+            app_response = await client.patch(upload_url, params={"offset": offset}, content=chunk)
+        except httpx.TransportError as e:
+            if retries >= settings.artifact_upload_retries:
+                raise e
+            app_response = None
+
+        if app_response is not None and app_response.status_code == 200:
+            offset = app_response.json()['offset']
+            retries = 0
+            continue
+        if app_response is not None and (app_response.status_code not in (409, 500, 502, 503, 504) or
+                                         retries >= settings.artifact_upload_retries):
+            raise artifact_upload_failed_exception(app_response)
+
+        # resume from the offset confirmed by the server
+        retries += 1
+        app_response = await client.get(upload_url)
+        if app_response.status_code != 200:
+            raise artifact_upload_failed_exception(app_response)
+        offset = app_response.json()['offset']
+
+    app_response = await client.post(f"{upload_url}/complete")
+    if app_response.status_code != 200:
+        raise artifact_upload_failed_exception(app_response)
+
+    artifact_id = app_response.json()['artifact_id']
+    if artifact_id != sha256:
+        raise artifact_checksum_mismatch_exception(sha256, artifact_id)
+
+    return artifact_id
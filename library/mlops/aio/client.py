@@ -0,0 +1,115 @@
+import asyncio
+import gzip
+import json
+from typing import Optional
+
+import httpx
+
+from mlops.src.client import Client
+
+
+class AsyncClient:
+    """
+    Asyncio HTTP client used by mlops.aio functions to communicate with mlops server. Requests of all coroutines
+    share one connection pool, created in the running event loop.
+
+    Timeouts, retries, backoff and gzip compression of JSON bodies follow options of the synchronous client,
+    so settings.set_timeout, set_max_retries and set_gzip_requests_flag apply to both clients.
+    """
+
+    def __init__(self, options: Client):
+        self.options: Client = options
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled httpx client, created on first use and recreated in a new event loop, which cannot reuse
+        connections of the previous one.
+
+        Returns:
+            client: httpx async client
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            limits = httpx.Limits(max_connections=self.options.pool_size,
+                                  max_keepalive_connections=self.options.pool_size)
+            self._client = httpx.AsyncClient(limits=limits)
+            self._client_loop = loop
+
+        return self._client
+
+    async def close(self):
+        """
+        Close pooled connections.
+        """
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    def get_timeout(self) -> httpx.Timeout:
+        timeout = self.options.timeout
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.Timeout(timeout)
+
+    async def request(self, method: str, url: str, json_data=None, **kwargs) -> httpx.Response:
+        """
+        Send request through pooled client. Connection errors are retried with exponential backoff for all methods,
+        other transport errors and 5xx responses only for idempotent methods.
+
+        Args:
+            method: HTTP method
+            url: request url
+            json_data: JSON body of the request, gzip compressed if enabled and large enough
+            **kwargs: other arguments of httpx.AsyncClient.request
+
+        Returns:
+            response: server response
+        """
+        if json_data is not None:
+            body = json.dumps(json_data).encode('utf-8')
+            headers = dict(kwargs.pop('headers', None) or {})
+            headers['Content-Type'] = 'application/json'
+            if self.options.gzip_requests and len(body) >= self.options.gzip_min_size:
+                body = gzip.compress(body)
+                headers['Content-Encoding'] = 'gzip'
+            kwargs['content'] = body
+            kwargs['headers'] = headers
+
+        kwargs.setdefault('timeout', self.get_timeout())
+        idempotent = method in Client.retry_methods
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+                if not idempotent or response.status_code not in Client.retry_statuses or \
+                        attempt >= self.options.max_retries:
+                    return response
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                if attempt >= self.options.max_retries:
+                    raise
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.options.max_retries:
+                    raise
+
+            await asyncio.sleep(self.options.backoff_factor * 2 ** attempt)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, json=None, **kwargs) -> httpx.Response:
+        return await self.request('POST', url, json_data=json, **kwargs)
+
+    async def put(self, url: str, json=None, **kwargs) -> httpx.Response:
+        return await self.request('PUT', url, json_data=json, **kwargs)
+
+    async def patch(self, url: str, json=None, **kwargs) -> httpx.Response:
+        return await self.request('PATCH', url, json_data=json, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request('DELETE', url, **kwargs)
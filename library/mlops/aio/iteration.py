@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import os
+
+import httpx
+
+from mlops.aio.artifact import upload_artifact
+from mlops.config.config import settings
+from mlops.src.iteration import Iteration
+from mlops.src.mailgun import MailGun
+from mlops.exceptions.tracking import request_failed_exception
+from mlops.exceptions.iteration import iteration_request_failed_exception
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncIteration(Iteration):
+    """
+    Class for logging iteration data from asyncio code. Methods which communicate with the server are coroutines.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metric_flushes: list = []
+
+    def log_metric(self, metric_name: str, value, step: int = None):
+        """
+        Logging single metric. If step is given, the value is also added to the metric series, which is sent
+        to the server in batches by background tasks while the iteration is running.
+
+        Args:
+            metric_name: name of the logged metric
+            value: value of the logged metric
+            step: step of the value, e.g. epoch or batch number (optional)
+        """
+        self.metrics[metric_name] = value
+
+        if step is not None:
+            self.metric_buffer.add(metric_name, step, value)
+            if self.metric_buffer.should_flush():
+                self.metric_flushes = [task for task in self.metric_flushes if not task.done()]
+                self.metric_flushes.append(asyncio.get_running_loop().create_task(self.flush_metrics()))
+
+    async def flush_metrics(self):
+        """
+        Send buffered metric series points to the server, see Iteration.flush_metrics.
+        """
+        metrics = self.metric_buffer.take()
+        if not metrics:
+            return
+
+        if settings.async_submission:
+            await asyncio.to_thread(settings.spool.submit, self.get_metrics_url(), {"metrics": metrics})
+            return
+
+        try:
+            app_response = await settings.async_client.post(self.get_metrics_url(), json={"metrics": metrics})
+            error = None if app_response.status_code == 201 else f"status code {app_response.status_code}"
+        except httpx.HTTPError as e:
+            error = str(e)
+
+        if error is not None:
+            logger.warning(f"Metric series of iteration '{self.iteration_name}' not sent, retrying with the next "
+                           f"batch: {error}")
+            self.metric_buffer.restore(metrics)
+
+    async def log_path_to_model(self, path_to_model: str):
+        """
+        Logging path to model. Model file is uploaded to the server artifact store in chunks. If async submission
+        is enabled, the file is uploaded by the spool worker before the iteration is sent.
+
+        Args:
+            path_to_model: input path to model
+        """
+        self.set_path_to_model(path_to_model)
+        if settings.async_submission:
+            self.ml_model_artifact_id = None
+            return
+        self.ml_model_artifact_id = await upload_artifact(self.path_to_model)
+
+    async def log_dataset(self, dataset_id: str):
+        """
+        Logging dataset
+
+        Args:
+            dataset_id: string containing dataset id
+        """
+        app_response = await settings.async_client.get(f"{settings.url}/datasets/{dataset_id}")
+
+        response_json = app_response.json()
+
+        if app_response.status_code == 200:
+            self.dataset_name = response_json["dataset_name"]
+            self.dataset_id = dataset_id
+            self.has_dataset = True
+        else:
+            raise request_failed_exception(app_response)
+
+    async def end_iteration(self) -> dict or None:
+        """
+        End iteration and send data to API. If async submission is enabled, iteration is written to the spool
+        and sent by a background thread.
+
+        Returns:
+            iteration: json data of created iteration, None if iteration is sent in the background
+        """
+        await asyncio.gather(*self.metric_flushes)
+        await self.flush_metrics()
+        if self.metric_buffer.size:
+            logger.warning(f"{self.metric_buffer.size} metric series points of iteration '{self.iteration_name}' "
+                           f"were not sent to the server.")
+
+        data = self.get_iteration_json()
+        url = f'{settings.url}/projects/{self.project_id}/experiments/{self.experiment_id}/iterations/'
+
+        if settings.async_submission:
+            # model file logged in async mode is uploaded by the spool worker, possibly in a later run
+            artifact_path = os.path.abspath(self.path_to_model) if self.path_to_model and \
+                self.ml_model_artifact_id is None else None
+            await asyncio.to_thread(settings.spool.submit, url, data, self.send_email, artifact_path)
+            return None
+
+        app_response = await settings.async_client.post(url, json=data)
+
+        response_json = app_response.json()
+
+        if app_response.status_code == 201:
+            return response_json
+        else:
+            detail = response_json['detail']
+            if self.send_email or settings.send_emails:
+                await asyncio.to_thread(MailGun().send_tracking_failure,
+                                        f"Request failed with status code {app_response.status_code}: {detail}")
+
+            raise iteration_request_failed_exception(app_response)
@@ -0,0 +1,102 @@
+import asyncio
+
+import pandas as pd
+
+from mlops.config.config import settings
+from mlops.src.mailgun import MailGun
+from mlops.exceptions.tracking import request_failed_exception
+from mlops.exceptions.monitoring import failed_to_set_active_model_exception
+
+
+async def get_model_by_name(model_name: str) -> dict:
+    """
+    Function for retrieving mlops monitored model from database
+
+    Args:
+        model_name: unique name of the monitored model to be retrieved
+
+    Returns:
+        monitored_model: json data of monitored model
+    """
+    app_response = await settings.async_client.get(f"{settings.url}/monitored-models/name/{model_name}")
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def create_model(model_name: str, model_description: str = None, iteration_dict: dict = None) -> dict:
+    """
+    Function for creating mlops monitored model
+
+    Args:
+        model_name: unique name of the created name
+        model_description: description of monitored model
+        iteration_dict: dictionary containing valid iteration data with a path to model
+
+    Returns:
+        monitored_model: json data of monitored model
+    """
+    data = {
+        "model_name": model_name,
+        "model_description": model_description,
+        "model_status": "idle" if iteration_dict is None else "active",
+        "iteration": iteration_dict
+    }
+
+    app_response = await settings.async_client.post(f"{settings.url}/monitored-models/", json=data)
+
+    if app_response.status_code == 201:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def set_active_model(model_name: str) -> str:
+    """
+    Function for setting active model from monitored models
+
+    Args:
+        model_name: Name of monitored model, that will be set as active
+
+    Returns:
+        Information about new active model setup
+    """
+    try:
+        model = await get_model_by_name(model_name)
+    except Exception as e:
+        raise failed_to_set_active_model_exception(e)
+
+    settings.change_active_model(model["model_name"])
+    return f"Active model set to: {settings.active_model}"
+
+
+async def send_prediction(model_name: str, data: pd.DataFrame, send_email: bool = False) -> dict:
+    """
+    Function to invoke a prediction from monitored model. Function takes a pandas dataframe, where every record is
+    taken as a separate prediction.
+
+    Args:
+        send_email: Email alert flag
+        model_name: Name of monitored model that will be used in prediction
+        data: Pandas Dataframe containing data for prediction
+
+    Returns:
+        List of dictionaries containing results for each executed prediction
+    """
+    model = await get_model_by_name(model_name)
+    mailgun = MailGun() if send_email or settings.send_emails else None
+
+    app_response = await settings.async_client.post(f"{settings.url}/monitored-models/{model['_id']}/predict",
+                                                    json=data.to_dict(orient="records"))
+
+    if app_response.status_code == 200:
+        prediction = app_response.json()
+        if mailgun is not None:
+            await asyncio.to_thread(mailgun.send_prediction_success, prediction)
+        return prediction
+    else:
+        if mailgun is not None:
+            await asyncio.to_thread(mailgun.send_prediction_failure, request_failed_exception(app_response))
+        raise request_failed_exception(app_response)
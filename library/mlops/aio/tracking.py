@@ -0,0 +1,358 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncContextManager, List
+
+from mlops.aio.iteration import AsyncIteration
+from mlops.config.config import settings
+from mlops.src.dataset import Dataset
+from mlops.src.dataset_profile import profile_dataset
+from mlops.src.mailgun import MailGun
+from mlops.exceptions.tracking import project_id_is_none_exception, experiment_id_is_none_exception, \
+    failed_to_set_active_project_exception, failed_to_set_active_experiment_exception, request_failed_exception
+
+
+async def get_project(project_id: str = None) -> dict:
+    """
+    Function for getting projects from mlops server
+
+    Args:
+        project_id: Id od the desired project, that will be retrieved from mlops app
+
+    Returns:
+        project: json data of the project
+    """
+    project_id = settings.active_project_id if not project_id else project_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+
+    app_response = await settings.async_client.get(f"{settings.url}/projects/{project_id}")
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def get_project_by_name(project_title: str) -> dict:
+    """
+    Function for getting projects from mlops server by name
+
+    Args:
+        project_title: name od the desired project, that will be retrieved from mlops app
+
+    Returns:
+        project: json data of the project
+    """
+    app_response = await settings.async_client.get(f"{settings.url}/projects/title/{project_title}")
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def create_project(title: str, description: str = None,
+                         status: str = 'not_started', archived: bool = False) -> dict:
+    """
+    Function for creating mlops projects
+
+    Args:
+        title: Title of the created project
+        description: Description of the created project (optional)
+        status: Status of the created project (optional)
+        archived: Archived status of the created project (optional)
+
+    Returns:
+        project: JSON data of the created project
+    """
+    data = {
+        "title": title,
+        "description": description,
+        "status": status,
+        "archived": archived
+    }
+
+    app_response = await settings.async_client.post(f"{settings.url}/projects/", json=data)
+
+    if app_response.status_code == 201:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def set_active_project(project_id: str) -> str:
+    """
+    Function for setting active project
+
+    Args:
+        project_id: Id of the project, that will be set as active
+
+    Returns:
+        Information about new active project setup
+    """
+    try:
+        await get_project(project_id)
+    except Exception as e:
+        raise failed_to_set_active_project_exception(e)
+
+    settings.change_active_project(project_id)
+    return f"Active project set to: {settings.active_project_id}"
+
+
+async def get_experiment(experiment_id: str = None, project_id: str = None) -> dict:
+    """
+    Function for getting experiments from mlops server
+
+    Args:
+        experiment_id: Id of the experiment, that will be retrieved from mlops app
+        project_id: Id of the project, that the experiment comes from (optional)
+
+    Returns:
+        experiment: json data of the experiment
+    """
+    experiment_id = settings.active_experiment_id if not experiment_id else experiment_id
+    project_id = settings.active_project_id if not project_id else project_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+    if experiment_id is None:
+        raise experiment_id_is_none_exception()
+
+    app_response = await settings.async_client.get(
+        f"{settings.url}/projects/{project_id}/experiments/{experiment_id}")
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def get_experiment_by_name(experiment_name: str, project_id: str = None) -> dict:
+    """
+    Function for getting experiments from mlops server by name
+
+    Args:
+        experiment_name: Name of the experiment, that will be retrieved from mlops app
+        project_id: Id of the project, that the experiment comes from (optional)
+
+    Returns:
+        experiment: json data of the experiment
+    """
+    project_id = settings.active_project_id if not project_id else project_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+
+    app_response = await settings.async_client.get(
+        f"{settings.url}/projects/{project_id}/experiments/name/{experiment_name}")
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def create_experiment(name: str, description: str = None, project_id: str = None) -> dict:
+    """
+    Function for creating mlops experiments
+
+    Args:
+        name: Name of the created experiment
+        description: Description of the created experiment (optional)
+        project_id: Id of the project, that the experiment comes from (optional)
+
+    Returns:
+        experiment: json data of the created experiment
+    """
+    project_id = settings.active_project_id if not project_id else project_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+
+    data = {
+        "name": name,
+        "description": description,
+    }
+
+    app_response = await settings.async_client.post(f"{settings.url}/projects/{project_id}/experiments/", json=data)
+
+    if app_response.status_code == 201:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def set_active_experiment(experiment_id: str) -> str:
+    """
+    Function for setting active experiment
+
+    Args:
+        experiment_id: Id of the experiment, that will be set as active
+
+    Returns:
+        Information about new active experiment setup
+    """
+    try:
+        await get_experiment(experiment_id, settings.active_project_id)
+    except Exception as e:
+        raise failed_to_set_active_experiment_exception(e)
+
+    settings.change_active_experiment(experiment_id)
+    return f"Active experiment set to: {settings.active_experiment_id}"
+
+
+async def create_dataset(dataset_name: str, path_to_dataset: str, dataset_description: str = None,
+                         tags: str = '', version: str = None, profile: bool = False) -> dict:
+    """
+    Function for creating mlops datasets
+
+    Args:
+        dataset_name: name of the created dataset
+        path_to_dataset: path to dataset files
+        dataset_description: short description of the dataset displayed in the app
+        tags: tags for dataset
+        version: version of the dataset
+        profile: compute profile of local CSV or Parquet dataset file (content hash, rows and columns counts and
+            statistics of columns) and attach it to the dataset, requires pandas and pyarrow
+            (pip install mlops-ai[profile])
+
+    Returns:
+        dataset: json data of created dataset
+    """
+    dataset_profile = await asyncio.to_thread(profile_dataset, path_to_dataset) if profile else None
+    dataset = Dataset(dataset_name, path_to_dataset, dataset_description, tags, version, dataset_profile)
+
+    app_response = await settings.async_client.post(f"{settings.url}/datasets/", json=dataset.get_dataset_json())
+
+    if app_response.status_code == 201:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def get_dataset(dataset_name: str, dataset_version: str) -> dict:
+    """
+    Function for getting mlops datasets based on name and version
+
+    Args:
+        dataset_name: name of the dataset
+        dataset_version: version of the dataset
+
+    Returns:
+        dataset: json data of the dataset
+    """
+    app_response = await settings.async_client.get(
+        f"{settings.url}/datasets/name/{dataset_name}/version/{dataset_version}")
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+async def query_iterations(metrics: dict = None, parameters: dict = None, sort_by: str = 'created_at',
+                           order: str = 'asc', limit: int = 100, offset: int = 0, cursor: str = None,
+                           fields: List[str] = None, user_name: str = None, dataset_id: str = None,
+                           date_from: datetime = None, date_to: datetime = None, experiment_id: str = None,
+                           project_id: str = None) -> dict:
+    """
+    Function for querying iterations of experiment on mlops server, e.g. top 10 iterations by metric with
+    parameter in range. Iterations are filtered and sorted by the server, only requested page is returned.
+
+    Args:
+        metrics: filters of metrics by metric name, e.g. {"val_auc": {"gte": 0.8}}, supported operators are
+            eq, ne, gt, gte, lt, lte and in
+        parameters: filters of parameters by parameter name, e.g. {"lr": {"lt": 0.01}}
+        sort_by: sort field, 'created_at', 'iteration_name', 'user_name', 'metrics.<name>' or 'parameters.<name>'
+        order: sort order, 'asc' or 'desc'
+        limit: maximum number of iterations in page (1-1000)
+        offset: number of skipped iterations
+        cursor: 'next_cursor' returned with previous page, to get the next page
+        fields: returned fields, e.g. ['iteration_name', 'metrics.val_auc'], all fields except charts if None
+        user_name: username of iterations
+        dataset_id: id of the dataset of iterations
+        date_from: minimum iteration creation date
+        date_to: maximum iteration creation date
+        experiment_id: id of the experiment (optional)
+        project_id: id of the project, that the experiment comes from (optional)
+
+    Returns:
+        page: json data with iterations and 'next_cursor', None if there are no more iterations
+    """
+    experiment_id = settings.active_experiment_id if not experiment_id else experiment_id
+    project_id = settings.active_project_id if not project_id else project_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+    if experiment_id is None:
+        raise experiment_id_is_none_exception()
+
+    query = {
+        "metrics": metrics,
+        "parameters": parameters,
+        "sort_by": sort_by,
+        "order": order,
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor,
+        "fields": fields,
+        "user_name": user_name,
+        "dataset_id": dataset_id,
+        "date_from": date_from.isoformat() if date_from else None,
+        "date_to": date_to.isoformat() if date_to else None
+    }
+    query = {key: value for key, value in query.items() if value is not None}
+
+    app_response = await settings.async_client.post(
+        f"{settings.url}/projects/{project_id}/experiments/{experiment_id}/iterations/query", json=query)
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
+@asynccontextmanager
+async def start_iteration(iteration_name: str, project_id: str = None,
+                          experiment_id: str = None, send_email: bool = False) -> AsyncContextManager[AsyncIteration]:
+    """
+    Function for creating mlops iteration in asyncio code, used as `async with start_iteration(...) as iteration`.
+    Iteration is sent to the server when the block exits without exception.
+
+    Args:
+        iteration_name: name of the created iteration
+        project_id: if passed id of the project, else active project_id from settings
+        experiment_id: if passed id of the experiment, else active experiment_id from settings
+        send_email: if True, email will be sent after iteration ends
+
+    Returns:
+        AsyncIteration, its end_iteration() method output is available as iteration.response
+    """
+    project_id = settings.active_project_id if not project_id else project_id
+    experiment_id = settings.active_experiment_id if not experiment_id else experiment_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+    if experiment_id is None:
+        raise experiment_id_is_none_exception()
+
+    iteration = AsyncIteration(
+        iteration_name=iteration_name,
+        project_id=project_id,
+        experiment_id=experiment_id,
+        send_email=send_email
+    )
+    mailgun = MailGun()
+
+    try:
+        yield iteration
+    except Exception as e:
+        if send_email or settings.send_emails:
+            await asyncio.to_thread(mailgun.send_tracking_failure, str(e))
+        raise e
+
+    iteration.response = await iteration.end_iteration()
+    if iteration.response is not None and (send_email or settings.send_emails):
+        await asyncio.to_thread(mailgun.send_tracking_success, iteration.response)
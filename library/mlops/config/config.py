@@ -1,5 +1,7 @@
 import os
 
+from mlops.src.client import Client
+
 
 class Settings:
     """
@@ -12,12 +14,51 @@ class Settings:
         self.active_model: str = None
         self.user_name: str = self.get_username()
 
+        # pooled http client used by all requests to the server
+        self.client: Client = Client()
+        self._async_client = None
+
+        # background iteration submission variables
+        self.async_submission: bool = False
+        self.spool_path: str = os.path.join(os.path.expanduser('~'), '.mlops', 'spool')
+        self.spool_flush_timeout: float = 30
+        self._spool = None
+
+        # metric series variables
+        self.metric_flush_size: int = 1000
+        self.metric_flush_interval: float = 10
+
+        # artifact upload variables
+        self.artifact_chunk_size: int = 8 * 1024 * 1024
+        self.artifact_upload_retries: int = 3
+
         # mailgun variables
         self.mailgun_domain = None
         self.mailgun_api_key = None
         self.user_email = None
         self.send_emails = False
 
+    @property
+    def async_client(self):
+        """
+        Asyncio http client used by mlops.aio functions, sharing options with the synchronous client.
+        Requires httpx package, so it is created on first use.
+        """
+        if self._async_client is None:
+            from mlops.aio.client import AsyncClient
+            self._async_client = AsyncClient(self.client)
+        return self._async_client
+
+    @property
+    def spool(self):
+        """
+        Spool of iterations submitted in the background, created on first use.
+        """
+        if self._spool is None:
+            from mlops.src.spool import Spool
+            self._spool = Spool(self.spool_path)
+        return self._spool
+
     @staticmethod
     def get_username():
         # Check if the code is running in a GitHub Actions environment
@@ -54,5 +95,28 @@ class Settings:
     def set_send_emails_flag(self, send_emails: bool):
         self.send_emails = send_emails
 
+    def set_artifact_chunk_size(self, artifact_chunk_size: int):
+        self.artifact_chunk_size = artifact_chunk_size
+
+    def set_timeout(self, timeout):
+        self.client.configure(timeout=timeout)
+
+    def set_max_retries(self, max_retries: int, backoff_factor: float = 0.5):
+        self.client.configure(max_retries=max_retries, backoff_factor=backoff_factor)
+
+    def set_gzip_requests_flag(self, gzip_requests: bool):
+        self.client.configure(gzip_requests=gzip_requests)
+
+    def set_async_submission_flag(self, async_submission: bool):
+        self.async_submission = async_submission
+
+    def set_spool_path(self, spool_path: str):
+        self.spool_path = spool_path
+        self._spool = None
+
+    def set_metric_flush(self, metric_flush_size: int = 1000, metric_flush_interval: float = 10):
+        self.metric_flush_size = metric_flush_size
+        self.metric_flush_interval = metric_flush_interval
+
 
 settings = Settings()
@@ -0,0 +1,12 @@
+from requests import HTTPError, Response
+
+
+def artifact_upload_failed_exception(response: Response):
+    detail = response.json()['detail']
+    return HTTPError(f"Artifact not uploaded. Request failed with status code {response.status_code}: {detail}",
+                     response=response)
+
+
+def artifact_checksum_mismatch_exception(expected_sha256: str, artifact_id: str):
+    return Exception(f"Artifact not uploaded. Uploaded artifact {artifact_id} does not match file checksum "
+                     f"{expected_sha256}.")
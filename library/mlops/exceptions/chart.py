@@ -0,0 +1,2 @@
+def chart_encoding_not_supported_exception(encoding: str):
+    return ValueError(f"Chart encoding {encoding} is not supported. Supported encodings are float32 and float64.")
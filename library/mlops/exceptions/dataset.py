@@ -0,0 +1,6 @@
+def dataset_profile_format_not_supported_exception(path: str):
+    return ValueError(f"Dataset not profiled. Only local CSV and Parquet files can be profiled: {path}")
+
+
+def dataset_profile_missing_package_exception(package: str):
+    return ImportError(f"Dataset not profiled. Profiling requires {package} (pip install mlops-ai[profile]).")
@@ -1,4 +1,3 @@
-import requests
 from mlops.config.config import settings
 from mlops.src.mailgun import MailGun
 from mlops.exceptions.tracking import request_failed_exception
@@ -16,7 +15,7 @@ def get_model_by_name(model_name: str) -> dict:
     Returns:
         monitored_model: json data of monitored model
     """
-    app_response = requests.get(f"{settings.url}/monitored-models/name/{model_name}")
+    app_response = settings.client.get(f"{settings.url}/monitored-models/name/{model_name}")
     response_json = app_response.json()
 
     if app_response.status_code == 200:
@@ -49,7 +48,7 @@ def create_model(model_name: str, model_description: str = None, iteration_dict:
         "iteration": iteration_dict
     }
 
-    app_response = requests.post(f"{settings.url}/monitored-models/", json=data)
+    app_response = settings.client.post(f"{settings.url}/monitored-models/", json=data)
     response_json = app_response.json()
 
     if app_response.status_code == 201:
@@ -97,7 +96,7 @@ def send_prediction(model_name: str, data: pd.DataFrame, send_email: bool = Fals
 
     data_json = data.to_dict(orient="records")
 
-    app_response = requests.post(f"{settings.url}/monitored-models/{model['_id']}/predict", json=data_json)
+    app_response = settings.client.post(f"{settings.url}/monitored-models/{model['_id']}/predict", json=data_json)
 
     prediction = app_response.json()
 
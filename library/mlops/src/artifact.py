@@ -0,0 +1,87 @@
+import hashlib
+import os
+from typing import Tuple
+
+import requests
+
+from mlops.config.config import settings
+from mlops.exceptions.artifact import artifact_upload_failed_exception, artifact_checksum_mismatch_exception
+
+
+def get_file_checksum(path: str) -> Tuple[str, int]:
+    """
+    Compute SHA-256 hash and size of file, reading it in chunks.
+
+    Args:
+        path: Path to file.
+
+    Returns:
+        SHA-256 hash of file content as hex string and file size in bytes.
+    """
+    content_hash = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while chunk := file.read(settings.artifact_chunk_size):
+            content_hash.update(chunk)
+
+    return content_hash.hexdigest(), os.path.getsize(path)
+
+
+def upload_artifact(path: str) -> str:
+    """
+    Upload file to the server artifact store. File is streamed from disk in chunks of raw bytes, so it is never
+    loaded into memory at once. Interrupted chunks are sent again from the offset confirmed by the server and
+    the stored artifact is verified against the file checksum. File already stored on the server is not sent.
+
+    Args:
+        path: Path to file.
+
+    Returns:
+        Artifact id.
+    """
+    sha256, size = get_file_checksum(path)
+
+    app_response = settings.client.post(f"{settings.url}/artifacts/uploads", json={"size": size, "sha256": sha256})
+    if app_response.status_code != 201:
+        raise artifact_upload_failed_exception(app_response)
+
+    upload = app_response.json()
+    upload_url = f"{settings.url}/artifacts/uploads/{upload['_id']}"
+    offset = upload['offset']
+    retries = 0
+
+    with open(path, 'rb') as file:
+        while upload['artifact_id'] is None and offset < size:
+            file.seek(offset)
+            chunk = file.read(settings.artifact_chunk_size)
+
+            try:
+                app_response = settings.client.patch(upload_url, params={"offset": offset}, data=chunk)
+            except requests.exceptions.ConnectionError as e:
+                if retries >= settings.artifact_upload_retries:
+                    raise e
+                app_response = None
+
+            if app_response is not None and app_response.status_code == 200:
+                offset = app_response.json()['offset']
+                retries = 0
+                continue
+            if app_response is not None and (app_response.status_code not in (409, 500, 502, 503, 504) or
+                                             retries >= settings.artifact_upload_retries):
+                raise artifact_upload_failed_exception(app_response)
+
+            # resume from the offset confirmed by the server
+            retries += 1
+            app_response = settings.client.get(upload_url)
+            if app_response.status_code != 200:
+                raise artifact_upload_failed_exception(app_response)
+            offset = app_response.json()['offset']
+
+    app_response = settings.client.post(f"{upload_url}/complete")
+    if app_response.status_code != 200:
+        raise artifact_upload_failed_exception(app_response)
+
+    artifact_id = app_response.json()['artifact_id']
+    if artifact_id != sha256:
+        raise artifact_checksum_mismatch_exception(sha256, artifact_id)
+
+    return artifact_id
@@ -1,3 +1,10 @@
+import base64
+
+import numpy as np
+
+from mlops.exceptions.chart import chart_encoding_not_supported_exception
+
+CHART_ENCODINGS = ('float32', 'float64')
 
 
 class Chart:
@@ -6,7 +13,8 @@ class Chart:
     """
     def __init__(self, chart_name: str, chart_type: str, chart_title: str, chart_subtitle: str = None,  x_data: list = [list],
                  y_data: list = [list], y_data_names: [str] = [], x_label: str = "x", y_label: str = "y",
-                 x_min: float = None, x_max: float = None, y_min: float = None, y_max: float = None, comparable: bool = False):
+                 x_min: float = None, x_max: float = None, y_min: float = None, y_max: float = None, comparable: bool = False,
+                 encoding: str = None):
         """
         Interactive chart model.
 
@@ -24,7 +32,10 @@ class Chart:
         - **x_max (Optional float)**: Maximum value of x.
         - **y_max (Optional float)**: Maximum value of y.
         - **comperable (Optional bool)**: Determines whether chart can be compared with other charts
+        - **encoding (Optional str)**: 'float32' or 'float64' to send numeric data as encoded arrays instead of lists
         """
+        if encoding is not None and encoding not in CHART_ENCODINGS:
+            raise chart_encoding_not_supported_exception(encoding)
 
         self.chart_name = chart_name
         self.chart_title = chart_title
@@ -40,6 +51,7 @@ class Chart:
         self.y_min = y_min
         self.y_max = y_max
         self.comparable = comparable
+        self.encoding = encoding
 
     def get_chart_dictionary(self):
         chart_dictionary = {
@@ -47,8 +59,8 @@ class Chart:
             "chart_title": self.chart_title,
             "chart_subtitle": self.chart_subtitle,
             "chart_type": self.chart_type,
-            "x_data": self.x_data,
-            "y_data": self.y_data,
+            "x_data": get_chart_data(self.x_data, self.encoding),
+            "y_data": get_chart_data(self.y_data, self.encoding),
             "y_data_names": self.y_data_names,
             "x_label": self.x_label,
             "y_label": self.y_label,
@@ -60,3 +72,56 @@ class Chart:
         }
 
         return chart_dictionary
+
+
+def encode_chart_data(data, dtype: str = 'float64') -> dict:
+    """
+    Encode series of numbers as base64 of row-major, little-endian array, a compact alternative to lists of numbers.
+
+    Args:
+        data: List of series of equal length, or two-dimensional array
+        dtype: 'float32' or 'float64'
+
+    Returns:
+        Encoded data: dtype, shape (number of series and number of points) and base64 encoded array
+    """
+    if dtype not in CHART_ENCODINGS:
+        raise chart_encoding_not_supported_exception(dtype)
+
+    array = np.ascontiguousarray(data, dtype=np.dtype(dtype).newbyteorder('<'))
+    if array.ndim != 2:
+        raise ValueError(f"Chart data must be two-dimensional, got shape {array.shape}")
+
+    return {
+        "dtype": dtype,
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode('ascii')
+    }
+
+
+def decode_chart_data(encoded: dict) -> np.ndarray:
+    """
+    Decode series of numbers encoded with encode_chart_data.
+
+    Args:
+        encoded: Encoded data: dtype, shape and base64 encoded array
+
+    Returns:
+        Two-dimensional array of series
+    """
+    dtype = np.dtype(encoded["dtype"]).newbyteorder('<')
+    return np.frombuffer(base64.b64decode(encoded["data"]), dtype=dtype).reshape(encoded["shape"])
+
+
+def get_chart_data(data, encoding: str = None):
+    """
+    Get chart data sent to the server. Data are encoded if encoding is set and data are series of numbers of equal
+    length, other data, e.g. labels of bar chart, are sent as lists.
+    """
+    if encoding is None:
+        return data.tolist() if isinstance(data, np.ndarray) else data
+
+    try:
+        return encode_chart_data(data, encoding)
+    except (TypeError, ValueError):
+        return data.tolist() if isinstance(data, np.ndarray) else data
@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class Client:
+    """
+    HTTP client used by all library functions to communicate with mlops server. Requests share a pooled session,
+    so connections are kept alive between calls.
+
+    Requests are sent with timeouts. Connection errors are retried with exponential backoff for all methods,
+    5xx responses only for idempotent methods (GET, PUT, PATCH, DELETE), so POST creating an object is never
+    sent twice. JSON bodies can be gzip compressed.
+    """
+
+    retry_methods = frozenset(['HEAD', 'GET', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'])
+    retry_statuses = frozenset([500, 502, 503, 504])
+
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = (5, 60), max_retries: int = 3,
+                 backoff_factor: float = 0.5, pool_size: int = 10, gzip_requests: bool = False,
+                 gzip_min_size: int = 1024):
+        self.timeout: Union[float, Tuple[float, float]] = timeout
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.pool_size: int = pool_size
+        self.gzip_requests: bool = gzip_requests
+        self.gzip_min_size: int = gzip_min_size
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+
+    def configure(self, **kwargs):
+        """
+        Change client configuration, e.g. client.configure(timeout=10, gzip_requests=True).
+        The session is recreated with the new configuration on the next request.
+
+        Args:
+            **kwargs: client attributes to change
+        """
+        for name, value in kwargs.items():
+            if name not in ('timeout', 'max_retries', 'backoff_factor', 'pool_size', 'gzip_requests',
+                            'gzip_min_size'):
+                raise AttributeError(f"Client has no option '{name}'")
+            setattr(self, name, value)
+
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Pooled session, created on first use and recreated in forked processes, which cannot share connections
+        with the parent process.
+
+        Returns:
+            session: requests session
+        """
+        if self._session is None or self._session_pid != os.getpid():
+            retry = Retry(
+                total=self.max_retries,
+                connect=self.max_retries,
+                read=self.max_retries,
+                status=self.max_retries,
+                backoff_factor=self.backoff_factor,
+                status_forcelist=self.retry_statuses,
+                allowed_methods=self.retry_methods,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry)
+
+            self._session = requests.Session()
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            self._session_pid = os.getpid()
+
+        return self._session
+
+    def close(self):
+        """
+        Close pooled session connections.
+        """
+        if self._session is not None and self._session_pid == os.getpid():
+            self._session.close()
+        self._session = None
+        self._session_pid = None
+
+    def request(self, method: str, url: str, json_data=None, **kwargs) -> requests.Response:
+        """
+        Send request through pooled session.
+
+        Args:
+            method: HTTP method
+            url: request url
+            json_data: JSON body of the request, gzip compressed if enabled and large enough
+            **kwargs: other arguments of requests.Session.request
+
+        Returns:
+            response: server response
+        """
+        if json_data is not None:
+            body = json.dumps(json_data).encode('utf-8')
+            headers = dict(kwargs.pop('headers', None) or {})
+            headers['Content-Type'] = 'application/json'
+            if self.gzip_requests and len(body) >= self.gzip_min_size:
+                body = gzip.compress(body)
+                headers['Content-Encoding'] = 'gzip'
+            kwargs['data'] = body
+            kwargs['headers'] = headers
+
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, json=None, **kwargs) -> requests.Response:
+        return self.request('POST', url, json_data=json, **kwargs)
+
+    def put(self, url: str, json=None, **kwargs) -> requests.Response:
+        return self.request('PUT', url, json_data=json, **kwargs)
+
+    def patch(self, url: str, json=None, **kwargs) -> requests.Response:
+        return self.request('PATCH', url, json_data=json, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request('DELETE', url, **kwargs)
@@ -1,4 +1,3 @@
-import requests
 from mlops.config.config import settings
 from mlops.exceptions.tracking import request_failed_exception
 
@@ -9,12 +8,13 @@ class Dataset:
     """
 
     def __init__(self, dataset_name: str, path_to_dataset: str, dataset_description: str = None,
-                 tags: str = None, version: str = None):
+                 tags: str = None, version: str = None, profile: dict = None):
         self.dataset_name: str = dataset_name
         self.path_to_dataset: str = path_to_dataset
         self.dataset_description: str = dataset_description
         self.tags: str = tags
         self.version: str = version
+        self.profile: dict = profile
 
     def get_dataset_json(self) -> dict:
         """
@@ -27,7 +27,8 @@ class Dataset:
             "path_to_dataset": self.path_to_dataset,
             "dataset_description": self.dataset_description,
             "tags": self.tags,
-            "version": self.version
+            "version": self.version,
+            "profile": self.profile
         }
 
         return dataset_dict
@@ -41,7 +42,7 @@ class Dataset:
         """
         data = self.get_dataset_json()
 
-        app_response = requests.post(f"{settings.url}/datasets/", json=data)
+        app_response = settings.client.post(f"{settings.url}/datasets/", json=data)
 
         response_json = app_response.json()
 
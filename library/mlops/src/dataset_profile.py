@@ -0,0 +1,296 @@
+import hashlib
+import io
+import os
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from mlops.exceptions.dataset import dataset_profile_format_not_supported_exception, \
+    dataset_profile_missing_package_exception
+from mlops.src.artifact import get_file_checksum
+
+# levels of quantiles computed for numeric columns, differences between levels are proportions of rows between
+# quantiles, so they can be used as bins of drift baselines
+PROFILE_QUANTILE_LEVELS = [0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+
+CSV_SUFFIXES = {'.csv': ',', '.tsv': '\t', '.txt': ','}
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream of numbers with bounded memory. Sketch keeps at most 2 * max_size weighted
+    centroids, each chunk of values is compressed into max_size centroids of equal weight, and centroids are
+    compressed again whenever there are too many of them. Rank error is about 1 / max_size per compression.
+    """
+
+    def __init__(self, max_size: int = 500):
+        self.max_size: int = max_size
+        self.values: np.ndarray = np.empty(0)
+        self.weights: np.ndarray = np.empty(0)
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def update(self, values: np.ndarray):
+        """
+        Add values to the sketch.
+
+        Args:
+            values: numbers without missing values
+        """
+        if len(values) == 0:
+            return
+
+        values = np.sort(values.astype(float))
+        self.min = values[0] if self.min is None else min(self.min, values[0])
+        self.max = values[-1] if self.max is None else max(self.max, values[-1])
+
+        weights = np.ones(len(values))
+        if len(values) > self.max_size:
+            values, weights = self.compress(values, weights)
+
+        self.values = np.concatenate([self.values, values])
+        self.weights = np.concatenate([self.weights, weights])
+
+        if len(self.values) > 2 * self.max_size:
+            order = np.argsort(self.values, kind='stable')
+            self.values, self.weights = self.compress(self.values[order], self.weights[order])
+
+    def compress(self, values: np.ndarray, weights: np.ndarray) -> tuple:
+        """
+        Merge sorted centroids into max_size centroids of about equal weight.
+
+        Args:
+            values: sorted values of centroids
+            weights: weights of centroids
+
+        Returns:
+            Values and weights of merged centroids
+        """
+        cumulative = np.cumsum(weights)
+        buckets = np.minimum(((cumulative - weights / 2) / cumulative[-1] * self.max_size).astype(int),
+                             self.max_size - 1)
+
+        bucket_weights = np.bincount(buckets, weights=weights, minlength=self.max_size)
+        bucket_sums = np.bincount(buckets, weights=values * weights, minlength=self.max_size)
+        not_empty = bucket_weights > 0
+
+        return bucket_sums[not_empty] / bucket_weights[not_empty], bucket_weights[not_empty]
+
+    def quantiles(self, levels: List[float]) -> Optional[List[float]]:
+        """
+        Get approximate quantiles, minimum and maximum are exact.
+
+        Args:
+            levels: levels of quantiles between 0 and 1
+
+        Returns:
+            Quantiles, None if no values were added
+        """
+        if self.min is None:
+            return None
+
+        order = np.argsort(self.values, kind='stable')
+        values, weights = self.values[order], self.weights[order]
+        total = weights.sum()
+        ranks = np.concatenate([[0], np.cumsum(weights) - weights / 2, [total]])
+        values = np.concatenate([[self.min], values, [self.max]])
+
+        return [float(quantile) for quantile in np.interp(np.array(levels) * total, ranks, values)]
+
+
+class ColumnProfile:
+    """
+    Statistics of dataset column, updated chunk by chunk.
+    """
+
+    def __init__(self, name: str, sketch_size: int):
+        self.name: str = name
+        self.dtype: Optional[str] = None
+        self.count: int = 0
+        self.null_count: int = 0
+        self.min = None
+        self.max = None
+        self.sketch: QuantileSketch = QuantileSketch(sketch_size)
+
+    def update(self, column):
+        """
+        Add values of column chunk.
+
+        Args:
+            column: pandas series with values of the column in the chunk
+        """
+        self.dtype = merge_dtypes(self.dtype, str(column.dtype))
+
+        values = column.dropna()
+        self.count += len(values)
+        self.null_count += len(column) - len(values)
+
+        if len(values) == 0:
+            return
+
+        if is_numeric_dtype(column.dtype):
+            self.sketch.update(values.to_numpy())
+            return
+
+        try:
+            chunk_min, chunk_max = values.min(), values.max()
+            self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+            self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+        except TypeError:
+            # values of different types, e.g. numbers and strings, can not be compared
+            self.min, self.max = None, None
+
+    def get_profile(self) -> dict:
+        numeric = self.dtype is not None and is_numeric_dtype(self.dtype)
+
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "count": self.count,
+            "null_count": self.null_count,
+            "min": to_json_value(self.sketch.min if numeric else self.min),
+            "max": to_json_value(self.sketch.max if numeric else self.max),
+            "quantiles": self.sketch.quantiles(PROFILE_QUANTILE_LEVELS) if numeric else None
+        }
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Binary file reader computing SHA-256 hash of read bytes, so the file is hashed while it is parsed.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.content_hash = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self.file.readinto(buffer)
+        self.content_hash.update(memoryview(buffer)[:size])
+        return size
+
+
+def is_numeric_dtype(dtype) -> bool:
+    try:
+        return np.issubdtype(np.dtype(dtype), np.number)
+    except TypeError:
+        # pandas extension dtypes, e.g. string or categorical
+        return False
+
+
+def merge_dtypes(dtype: Optional[str], chunk_dtype: str) -> str:
+    """
+    Get dtype of column from dtype of previous chunks and dtype inferred for the current chunk, e.g. float64 for
+    int64 column with missing values in some chunk.
+    """
+    if dtype is None or dtype == chunk_dtype:
+        return chunk_dtype
+    if is_numeric_dtype(dtype) and is_numeric_dtype(chunk_dtype):
+        return str(np.promote_types(dtype, chunk_dtype))
+    return 'object'
+
+
+def to_json_value(value):
+    if value is None:
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    return str(value)
+
+
+def get_dataset_format(path: str, file_format: Optional[str] = None) -> str:
+    suffix = os.path.splitext(path)[1].lower()
+    if file_format is None:
+        if suffix in CSV_SUFFIXES:
+            file_format = 'csv'
+        elif suffix in PARQUET_SUFFIXES:
+            file_format = 'parquet'
+
+    if file_format not in ('csv', 'parquet'):
+        raise dataset_profile_format_not_supported_exception(path)
+
+    return file_format
+
+
+def iter_csv_chunks(reader: io.BufferedReader, path: str, chunk_size: int) -> Iterator:
+    try:
+        import pandas as pd
+    except ImportError:
+        raise dataset_profile_missing_package_exception('pandas')
+
+    separator = CSV_SUFFIXES.get(os.path.splitext(path)[1].lower(), ',')
+    yield from pd.read_csv(reader, sep=separator, chunksize=chunk_size, low_memory=True)
+
+
+def iter_parquet_chunks(path: str, chunk_size: int) -> Iterator:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise dataset_profile_missing_package_exception('pyarrow')
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+
+def profile_dataset(path: str, file_format: Optional[str] = None, chunk_size: int = 100_000,
+                    sketch_size: int = 500) -> dict:
+    """
+    Compute fingerprint and content statistics of CSV or Parquet dataset file. File is streamed in chunks of rows,
+    so memory used does not depend on file size. Content hash is SHA-256 of the file, computed while the file is
+    read. Quantiles of numeric columns are approximate, computed with bounded size sketches.
+
+    Args:
+        path: path to local dataset file
+        file_format: 'csv' or 'parquet', inferred from file extension if None
+        chunk_size: number of rows read at once
+        sketch_size: number of centroids of quantile sketches, more is more accurate
+
+    Returns:
+        profile: content hash, file size and format, rows and columns counts, quantile levels and statistics
+            of columns (dtype, count, null count, min, max and quantiles)
+    """
+    file_format = get_dataset_format(path, file_format)
+    columns = {}
+    rows_count = 0
+
+    with open(path, 'rb', buffering=0) as file:
+        hashing_reader = HashingReader(file)
+        reader = io.BufferedReader(hashing_reader, buffer_size=1024 * 1024)
+
+        if file_format == 'csv':
+            chunks = iter_csv_chunks(reader, path, chunk_size)
+        else:
+            chunks = iter_parquet_chunks(path, chunk_size)
+
+        for chunk in chunks:
+            rows_count += len(chunk)
+            for name in chunk.columns:
+                column = columns.setdefault(str(name), ColumnProfile(str(name), sketch_size))
+                column.update(chunk[name])
+
+        if file_format == 'csv':
+            # bytes after the last parsed row, e.g. trailing new lines, are part of the content too
+            while reader.read(1024 * 1024):
+                pass
+            content_hash = hashing_reader.content_hash.hexdigest()
+
+    if file_format == 'parquet':
+        # parquet is read by seeking to its footer and row groups, so it is hashed separately
+        content_hash, _ = get_file_checksum(path)
+
+    return {
+        "content_hash": content_hash,
+        "size": os.path.getsize(path),
+        "format": file_format,
+        "rows_count": rows_count,
+        "columns_count": len(columns),
+        "quantile_levels": PROFILE_QUANTILE_LEVELS,
+        "columns": [column.get_profile() for column in columns.values()]
+    }
@@ -1,12 +1,15 @@
 import os
 import base64
-import pickle
+import logging
+import time
 from pathlib import Path
 
 import requests
 
 from mlops.config.config import settings
+from mlops.src.artifact import upload_artifact
 from mlops.src.chart import Chart
+from mlops.src.metric_buffer import MetricBuffer
 from mlops.src.mailgun import MailGun
 from mlops.exceptions.tracking import request_failed_exception
 from mlops.exceptions.iteration import (
@@ -14,6 +17,19 @@ from mlops.exceptions.iteration import (
     model_path_not_exist_exception, monitored_model_encoding_pkl_file_exception
 )
 
+logger = logging.getLogger(__name__)
+
+
+def generate_iteration_id() -> str:
+    """
+    Generate iteration id on the client, in the format of MongoDB ObjectId (timestamp followed by random bytes),
+    so metric series can be sent before the iteration is created.
+
+    Returns:
+        iteration_id: 24 hex digits string
+    """
+    return f"{int(time.time()):08x}{os.urandom(8).hex()}"
+
 
 class Iteration:
     """
@@ -26,13 +42,14 @@ class Iteration:
             experiment_id: str = None,
             send_email: bool = False
     ):
+        self.iteration_id: str = generate_iteration_id()
         self.iteration_name: str = iteration_name
         self.project_id: str = project_id
         self.experiment_id: str = experiment_id
         self.user_name: str = settings.user_name
         self.send_email: bool = send_email
         self.path_to_model: str = ''
-        self.encoded_ml_model: str = None
+        self.ml_model_artifact_id: str = None
         self.parameters: dict = {}
         self.metrics: dict = {}
         self.dataset_id: str = None
@@ -40,6 +57,7 @@ class Iteration:
         self.dataset_name: str = None
         self.has_dataset: bool = False
         self.image_charts: list = []
+        self.metric_buffer: MetricBuffer = MetricBuffer()
 
     def format_path(self):
         self.path_to_model = Path(r'' + self.path_to_model).as_posix()
@@ -56,9 +74,9 @@ class Iteration:
         else:
             raise model_path_not_exist_exception()
 
-    def log_path_to_model(self, path_to_model: str):
+    def set_path_to_model(self, path_to_model: str):
         """
-        Logging path to model.
+        Setting path to model, checking if it is an existing pickle file.
 
         Args:
             path_to_model: input path to model
@@ -67,37 +85,80 @@ class Iteration:
         self.format_path()
         self.path_to_model_exists()
 
-        try:
-            # Load the model from the file
-            _, file_extension = os.path.splitext(self.path_to_model)
+        _, file_extension = os.path.splitext(self.path_to_model)
+        if file_extension not in ['.pkl', '.pickle']:
+            raise monitored_model_encoding_pkl_file_exception("It is not a pickle file.")
 
-            if file_extension in ['.pkl', '.pickle']:
-                self.encoded_ml_model = self.__encode_ml_model(self.path_to_model)
-            else:
-                raise monitored_model_encoding_pkl_file_exception("It is not a pickle file.")
+    def log_path_to_model(self, path_to_model: str):
+        """
+        Logging path to model. Model file is uploaded to the server artifact store in chunks. If async submission
+        is enabled, the file is uploaded by the spool worker before the iteration is sent.
 
-        except Exception as e:
-            # Handle any exceptions or errors that may occur
-            raise monitored_model_encoding_pkl_file_exception(str(e))
+        Args:
+            path_to_model: input path to model
+        """
+        self.set_path_to_model(path_to_model)
+        if settings.async_submission:
+            self.ml_model_artifact_id = None
+            return
+        self.ml_model_artifact_id = upload_artifact(self.path_to_model)
 
-    def log_metric(self, metric_name: str, value):
+    def log_metric(self, metric_name: str, value, step: int = None):
         """
-        Logging single metric.
+        Logging single metric. If step is given, the value is also added to the metric series, which is sent
+        to the server in batches while the iteration is running. The last value is kept as the iteration metric.
 
         Args:
             metric_name: name of the logged metric
             value: value of the logged metric
+            step: step of the value, e.g. epoch or batch number (optional)
         """
         self.metrics[metric_name] = value
 
-    def log_metrics(self, metrics: dict):
+        if step is not None:
+            self.metric_buffer.add(metric_name, step, value)
+            if self.metric_buffer.should_flush():
+                self.flush_metrics()
+
+    def log_metrics(self, metrics: dict, step: int = None):
         """
         Logging multiple metrics.
 
         Args:
             metrics: dictionary of metrics
+            step: step of the values, e.g. epoch or batch number (optional)
+        """
+        for metric_name, value in metrics.items():
+            self.log_metric(metric_name, value, step)
+
+    def get_metrics_url(self) -> str:
+        return f'{settings.url}/projects/{self.project_id}/experiments/{self.experiment_id}/iterations/' \
+               f'{self.iteration_id}/metrics'
+
+    def flush_metrics(self):
+        """
+        Send buffered metric series points to the server. Points which could not be sent are kept in the buffer
+        and sent with the next batch, so a failing request does not stop the training. If async submission is
+        enabled, points are written to the spool instead.
         """
-        self.metrics.update(metrics)
+        metrics = self.metric_buffer.take()
+        if not metrics:
+            return
+
+        if settings.async_submission:
+            settings.spool.submit(self.get_metrics_url(), {"metrics": metrics})
+            return
+
+        try:
+            app_response = settings.client.post(self.get_metrics_url(), json={"metrics": metrics})
+            error = None if app_response.status_code == 201 else f"status code {app_response.status_code}"
+        except requests.RequestException as e:
+            error = str(e)
+
+        if error is not None:
+            logger.warning(f"Metric series of iteration '{self.iteration_name}' not sent, retrying with the next "
+                           f"batch: {error}")
+            self.metric_buffer.restore(metrics)
 
     def log_parameter(self, parameter_name: str, value):
         """
@@ -126,7 +187,7 @@ class Iteration:
             dataset_id: string containing dataset id
         """
 
-        app_response = requests.get(f"{settings.url}/datasets/{dataset_id}")
+        app_response = settings.client.get(f"{settings.url}/datasets/{dataset_id}")
 
         response_json = app_response.json()
 
@@ -141,7 +202,7 @@ class Iteration:
                   x_data: list = [list],
                   y_data: list = [list], y_data_names: [str] = [], x_label: str = "x", y_label: str = "y",
                   x_min: float = None, x_max: float = None, y_min: float = None, y_max: float = None,
-                  comparable: bool = False):
+                  comparable: bool = False, encoding: str = None):
         """
         Logging a single chart
 
@@ -158,12 +219,15 @@ class Iteration:
             **x_max (Optional float)**: Maximum value of x.
             **y_max (Optional float)**: Maximum value of y.
             **comparable (Optional bool)**: Determines whether chart can be compared with other charts
+            **encoding (Optional str)**: 'float32' or 'float64' to send numeric data as base64 encoded arrays, which
+                are smaller and faster to validate than lists for charts with many points
         """
 
         chart = Chart(chart_name=chart_name, chart_type=chart_type, chart_title=chart_title,
                       chart_subtitle=chart_subtitle, x_data=x_data,
                       y_data=y_data, y_data_names=y_data_names, x_label=x_label, y_label=y_label,
-                      x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max, comparable=comparable)
+                      x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max, comparable=comparable,
+                      encoding=encoding)
 
         self.charts.append(chart)
 
@@ -194,12 +258,12 @@ class Iteration:
 
         self.image_charts.append({"name": name, "encoded_image": encoded_image})
 
-    def end_iteration(self) -> dict or None:
+    def get_iteration_json(self) -> dict:
         """
-        End iteration and send data to API.
+        Transform iteration values into dictionary to be used in http request body
 
         Returns:
-            iteration: json data of created iteration
+            iteration_dict: dictionary containing iteration data
         """
         if self.dataset_id:
             dataset = {"id": self.dataset_id}
@@ -211,20 +275,45 @@ class Iteration:
         else:
             interactive_charts = None
 
-        data = {
+        iteration_dict = {
+            "id": self.iteration_id,
             "user_name": self.user_name,
             "iteration_name": self.iteration_name,
             "metrics": self.metrics,
             "parameters": self.parameters,
             "path_to_model": self.path_to_model,
-            "encoded_ml_model": self.encoded_ml_model,
+            "ml_model_artifact_id": self.ml_model_artifact_id,
             "dataset": dataset,
             "image_charts": self.image_charts,
             "interactive_charts": interactive_charts
         }
 
-        app_response = requests.post(
-            f'{settings.url}/projects/{self.project_id}/experiments/{self.experiment_id}/iterations/', json=data)
+        return iteration_dict
+
+    def end_iteration(self) -> dict or None:
+        """
+        End iteration and send data to API. If async submission is enabled, iteration is written to the spool
+        and sent by a background thread.
+
+        Returns:
+            iteration: json data of created iteration, None if iteration is sent in the background
+        """
+        self.flush_metrics()
+        if self.metric_buffer.size:
+            logger.warning(f"{self.metric_buffer.size} metric series points of iteration '{self.iteration_name}' "
+                           f"were not sent to the server.")
+
+        data = self.get_iteration_json()
+        url = f'{settings.url}/projects/{self.project_id}/experiments/{self.experiment_id}/iterations/'
+
+        if settings.async_submission:
+            # model file logged in async mode is uploaded by the spool worker, possibly in a later run
+            artifact_path = os.path.abspath(self.path_to_model) if self.path_to_model and \
+                self.ml_model_artifact_id is None else None
+            settings.spool.submit(url, data, self.send_email, artifact_path)
+            return None
+
+        app_response = settings.client.post(url, json=data)
 
         response_json = app_response.json()
 
@@ -242,34 +331,3 @@ class Iteration:
                 )
 
             raise iteration_request_failed_exception(app_response)
-
-    @staticmethod
-    def __encode_ml_model(path_to_model: str):
-        """
-        Encode ml model.
-
-        Args:
-            path_to_model: Path to model.
-        """
-
-        try:
-            # Load the model from the file
-            _, file_extension = os.path.splitext(path_to_model)
-
-            if file_extension in ['.pkl', '.pickle']:
-
-                ml_model = pickle.load(open(path_to_model, 'rb'))
-
-                # Serialize the model
-                ml_model = pickle.dumps(ml_model)
-
-                # Encode the serialized model as base64
-                ml_model = base64.b64encode(ml_model).decode("utf-8")
-
-                return ml_model
-            else:
-                raise monitored_model_encoding_pkl_file_exception("It is not a pickle file.")
-
-        except Exception as e:
-            # Handle any exceptions or errors that may occur
-            raise monitored_model_encoding_pkl_file_exception(str(e))
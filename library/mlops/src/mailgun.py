@@ -77,7 +77,7 @@ class MailGun:
                     </html>
                     """
 
-        response = requests.post(
+        response = settings.client.post(
             f"https://api.mailgun.net/v3/{self.domain}/messages",
             auth=("api", f"{self.api_key}"),
             data={"from": f"MLOps mailgun <mailgun@{self.domain}>",
@@ -148,7 +148,7 @@ class MailGun:
                     </html>
                     """
 
-        response = requests.post(
+        response = settings.client.post(
             f"https://api.mailgun.net/v3/{self.domain}/messages",
             auth=("api", f"{self.api_key}"),
             data={"from": f"MLOps mailgun <mailgun@{self.domain}>",
@@ -211,7 +211,7 @@ class MailGun:
                     </html>
                     """
 
-        response = requests.post(
+        response = settings.client.post(
             f"https://api.mailgun.net/v3/{self.domain}/messages",
             auth=("api", f"{self.api_key}"),
             data={"from": f"MLOps mailgun <mailgun@{self.domain}>",
@@ -282,7 +282,7 @@ class MailGun:
                     </html>
                     """
 
-        response = requests.post(
+        response = settings.client.post(
             f"https://api.mailgun.net/v3/{self.domain}/messages",
             auth=("api", f"{self.api_key}"),
             data={"from": f"MLOps mailgun <mailgun@{self.domain}>",
@@ -0,0 +1,68 @@
+import time
+from datetime import datetime
+
+from mlops.config.config import settings
+
+
+class MetricBuffer:
+    """
+    Buffer of step-wise metric values logged during iteration. Points are kept as parallel arrays of steps, values
+    and timestamps per metric, and sent to the server in batches of settings.metric_flush_size points or every
+    settings.metric_flush_interval seconds. After a failed batch, points are sent again only after the interval.
+    """
+
+    def __init__(self):
+        self.metrics: dict = {}
+        self.size: int = 0
+        self.last_flush: float = time.monotonic()
+        self.failed: bool = False
+
+    def add(self, metric_name: str, step: int, value):
+        """
+        Add point to the buffer.
+
+        Args:
+            metric_name: name of the metric
+            step: step of the point, e.g. epoch or batch number
+            value: value of the metric
+        """
+        series = self.metrics.setdefault(metric_name, {"steps": [], "values": [], "timestamps": []})
+        series["steps"].append(step)
+        series["values"].append(value)
+        series["timestamps"].append(datetime.now().isoformat())
+        self.size += 1
+
+    def should_flush(self) -> bool:
+        if self.size == 0:
+            return False
+        if self.size >= settings.metric_flush_size and not self.failed:
+            return True
+        return time.monotonic() - self.last_flush >= settings.metric_flush_interval
+
+    def take(self) -> dict:
+        """
+        Take all buffered points out of the buffer.
+
+        Returns:
+            Points by metric name
+        """
+        metrics = self.metrics
+        self.metrics = {}
+        self.size = 0
+        self.last_flush = time.monotonic()
+        self.failed = False
+        return metrics
+
+    def restore(self, metrics: dict):
+        """
+        Put back points which were not sent, before points logged in the meantime.
+
+        Args:
+            metrics: points by metric name returned by take()
+        """
+        for metric_name, series in metrics.items():
+            buffered = self.metrics.setdefault(metric_name, {"steps": [], "values": [], "timestamps": []})
+            for key in ("steps", "values", "timestamps"):
+                buffered[key][:0] = series[key]
+            self.size += len(series["steps"])
+        self.failed = True
@@ -0,0 +1,298 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Deque
+
+import requests
+
+from mlops.config.config import settings
+from mlops.src.artifact import upload_artifact
+from mlops.src.mailgun import MailGun
+
+logger = logging.getLogger(__name__)
+
+
+class Spool:
+    """
+    Write-ahead spool of iterations submitted in the background. Submitted iteration is appended to an append-only
+    log on disk before it is queued, and a background thread sends queued iterations to the server, retrying
+    with exponential backoff while the server is unavailable. Sent iterations are marked as done in the log and
+    the log is removed when nothing is pending.
+
+    Every process writes its own log in the spool directory. Logs of processes, which ended before all their
+    iterations were sent, are taken over and sent by the next spool started in the same directory. Iterations
+    rejected by the server (4xx responses) are not retried, they are written to the 'rejected.log' file.
+
+    Delivery is at-least-once, an iteration whose response was lost may be sent again. Iterations have client
+    generated ids, so the server rejects such iteration with 409 status code, which is treated as sent.
+    Batches of metric series points are spooled the same way and sent in order with iterations. Model file
+    logged in async mode is uploaded by the worker right before its iteration is sent, so the server does not
+    have to be available when the model is logged.
+    """
+
+    retry_statuses = frozenset([408, 429, 500, 502, 503, 504])
+
+    def __init__(self, path: str, max_backoff: float = 30, stale_after: float = 120):
+        self.path: str = path
+        self.max_backoff: float = max_backoff
+        self.stale_after: float = stale_after
+        self.log_path: str = os.path.join(path, f"{os.getpid()}-{uuid.uuid4().hex}.log")
+
+        self._pending: Deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._running: bool = False
+        self._sending: bool = False
+
+        os.makedirs(path, exist_ok=True)
+        self.recover()
+        atexit.register(self.flush_at_exit)
+
+    def append(self, record: dict, log_path: str = None):
+        with open(log_path or self.log_path, 'a', encoding='utf-8') as log:
+            log.write(json.dumps(record) + '\n')
+            log.flush()
+            os.fsync(log.fileno())
+
+    @staticmethod
+    def read_pending(log_path: str) -> list:
+        """
+        Replay log and return iterations which are not marked as done. Last line of the log may be torn
+        if the process was killed while writing it, such line is skipped.
+
+        Args:
+            log_path: path to the log
+
+        Returns:
+            List of pending records
+        """
+        pending = {}
+        with open(log_path, encoding='utf-8') as log:
+            for line in log:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get('type') == 'iteration':
+                    pending[record['id']] = record
+                else:
+                    pending.pop(record.get('id'), None)
+
+        return list(pending.values())
+
+    def recover(self):
+        """
+        Take over logs of other processes, which were not modified for stale_after seconds, and queue their
+        pending iterations. Log is claimed by renaming it, so only one process can take it over.
+        """
+        now = time.time()
+        for name in sorted(os.listdir(self.path)):
+            log_path = os.path.join(self.path, name)
+            if not name.endswith('.log') or name == 'rejected.log' or log_path == self.log_path:
+                continue
+            try:
+                if now - os.path.getmtime(log_path) < self.stale_after:
+                    continue
+                claimed_path = f"{self.log_path}.{uuid.uuid4().hex}.recovering"
+                os.rename(log_path, claimed_path)
+            except OSError:
+                continue
+
+            records = self.read_pending(claimed_path)
+            with self._lock:
+                for record in records:
+                    self.append(record)
+                    self._pending.append(record)
+                self.start()
+            os.remove(claimed_path)
+
+            if records:
+                logger.info(f"Recovered {len(records)} iterations not sent by previous runs.")
+
+    def start(self):
+        # called with lock held, worker thread exits only when nothing is pending
+        if not self._running and self._pending:
+            self._running = True
+            threading.Thread(target=self.run, name='mlops-spool', daemon=True).start()
+
+    def submit(self, url: str, data: dict, send_email: bool = False, artifact_path: str = None):
+        """
+        Write iteration to the log and queue it to be sent in the background.
+
+        Args:
+            url: url of the iterations endpoint
+            data: iteration data
+            send_email: if True, email will be sent after iteration is sent
+            artifact_path: path to model file, which is uploaded to the artifact store before iteration is sent
+        """
+        record = {"type": "iteration", "id": uuid.uuid4().hex, "url": url, "data": data, "send_email": send_email}
+        if artifact_path is not None:
+            record['artifact_path'] = artifact_path
+
+        with self._lock:
+            self.append(record)
+            self._pending.append(record)
+            self.start()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until all queued iterations are sent to the server or rejected.
+
+        Args:
+            timeout: maximum time to wait in seconds, wait without limit if None
+
+        Returns:
+            True if nothing is pending, False if timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._lock:
+            while self._pending or self._sending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+
+        return True
+
+    def flush_at_exit(self):
+        if not self.flush(settings.spool_flush_timeout):
+            logger.warning(f"{len(self._pending)} iterations were not sent to the server before exit. "
+                           f"They are kept in {self.log_path} and will be sent by the next run.")
+
+    def run(self):
+        retries = 0
+
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self.remove_log()
+                    self._running = False
+                    self._condition.notify_all()
+                    return
+                record = self._pending[0]
+                self._sending = True
+
+            try:
+                sent = self.send(record)
+            except Exception as e:
+                logger.exception(f"{self.describe(record)} not sent, retrying: {e}")
+                sent = False
+
+            with self._lock:
+                self._sending = False
+                if sent:
+                    self._pending.popleft()
+                    self.append({"type": "done", "id": record['id']})
+                    retries = 0
+                self._condition.notify_all()
+
+            if not sent:
+                # touching the log keeps it from being taken over by other processes while the server is down
+                os.utime(self.log_path)
+                time.sleep(min(settings.client.backoff_factor * 2 ** retries, self.max_backoff))
+                retries += 1
+
+    def send(self, record: dict) -> bool:
+        """
+        Send iteration to the server.
+
+        Args:
+            record: log record of the iteration
+
+        Returns:
+            True if iteration was created or rejected by the server, False if it should be retried
+        """
+        if record.get('artifact_path') and record['data'].get('ml_model_artifact_id') is None:
+            if not self.upload_artifact(record):
+                return False
+
+        try:
+            app_response = settings.client.post(record['url'], json=record['data'])
+        except requests.RequestException as e:
+            logger.warning(f"{self.describe(record)} not sent, retrying: {e}")
+            return False
+
+        if app_response.status_code in self.retry_statuses:
+            logger.warning(f"{self.describe(record)} not sent, retrying: status code {app_response.status_code}")
+            return False
+
+        send_email = record.get('send_email') or settings.send_emails
+
+        if app_response.status_code == 201:
+            if send_email:
+                self.send_email('send_tracking_success', app_response.json())
+            return True
+        if app_response.status_code == 409:
+            # created by previous attempt, whose response was lost
+            return True
+
+        try:
+            detail = app_response.json()['detail']
+        except (ValueError, KeyError, TypeError):
+            detail = app_response.text
+        message = f"{self.describe(record)} not created. Request failed with status code " \
+                  f"{app_response.status_code}: {detail}"
+
+        logger.error(f"{message}. It is saved in {os.path.join(self.path, 'rejected.log')}")
+        self.append({**record, "type": "rejected", "detail": message}, os.path.join(self.path, 'rejected.log'))
+        if send_email:
+            self.send_email('send_tracking_failure', message)
+
+        return True
+
+    def upload_artifact(self, record: dict) -> bool:
+        """
+        Upload model file of the iteration to the server artifact store and set its id in iteration data.
+        If the file cannot be read or the server rejects it, iteration is sent without the model.
+
+        Args:
+            record: log record of the iteration
+
+        Returns:
+            True if iteration can be sent, False if upload should be retried
+        """
+        try:
+            artifact_id = upload_artifact(record['artifact_path'])
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in self.retry_statuses:
+                logger.warning(f"{self.describe(record)} model not uploaded, retrying: {e}")
+                return False
+            logger.error(f"{self.describe(record)} model not uploaded, iteration is sent without it: {e}")
+            record.pop('artifact_path')
+        except requests.RequestException as e:
+            logger.warning(f"{self.describe(record)} model not uploaded, retrying: {e}")
+            return False
+        except OSError as e:
+            logger.error(f"{self.describe(record)} model not uploaded, iteration is sent without it: {e}")
+            record.pop('artifact_path')
+        else:
+            record['data']['ml_model_artifact_id'] = artifact_id
+            # logged again with the artifact id, so the file is not uploaded again if the process ends now
+            with self._lock:
+                self.append(record)
+
+        return True
+
+    @staticmethod
+    def describe(record: dict) -> str:
+        if 'iteration_name' in record['data']:
+            return f"Iteration '{record['data']['iteration_name']}'"
+        return "Metric series batch"
+
+    @staticmethod
+    def send_email(method: str, content):
+        # failed email must not stop the worker, iteration is already sent
+        try:
+            getattr(MailGun(), method)(content)
+        except Exception as e:
+            logger.error(f"Email not sent: {e}")
+
+    def remove_log(self):
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
@@ -1,12 +1,13 @@
-import requests
 from contextlib import contextmanager
+from datetime import datetime
 from mlops.config.config import settings
 from mlops.src.iteration import Iteration
 from mlops.src.dataset import Dataset
+from mlops.src.dataset_profile import profile_dataset
 from mlops.src.mailgun import MailGun
 from mlops.exceptions.tracking import project_id_is_none_exception, experiment_id_is_none_exception, \
     failed_to_set_active_project_exception, failed_to_set_active_experiment_exception, request_failed_exception
-from typing import ContextManager
+from typing import ContextManager, List
 
 
 def get_project(project_id: str = None) -> dict:
@@ -24,7 +25,7 @@ def get_project(project_id: str = None) -> dict:
     if project_id is None:
         raise project_id_is_none_exception()
 
-    app_response = requests.get(f"{settings.url}/projects/{project_id}")
+    app_response = settings.client.get(f"{settings.url}/projects/{project_id}")
     response_json = app_response.json()
 
     if app_response.status_code == 200:
@@ -43,7 +44,7 @@ def get_project_by_name(project_title: str) -> dict:
     Returns:
         project: json data of the project
     """
-    app_response = requests.get(f"{settings.url}/projects/title/{project_title}")
+    app_response = settings.client.get(f"{settings.url}/projects/title/{project_title}")
     response_json = app_response.json()
 
     if app_response.status_code == 200:
@@ -73,7 +74,7 @@ def create_project(title: str, description: str = None,
         "archived": archived
     }
 
-    app_response = requests.post(f"{settings.url}/projects/", json=data)
+    app_response = settings.client.post(f"{settings.url}/projects/", json=data)
     response_json = app_response.json()
 
     if app_response.status_code == 201:
@@ -121,7 +122,7 @@ def get_experiment(experiment_id: str = None, project_id: str = None) -> dict:
     if experiment_id is None:
         raise experiment_id_is_none_exception()
 
-    app_response = requests.get(f"{settings.url}/projects/{project_id}/experiments/{experiment_id}")
+    app_response = settings.client.get(f"{settings.url}/projects/{project_id}/experiments/{experiment_id}")
 
     if app_response.status_code == 200:
         experiment = app_response.json()
@@ -146,7 +147,7 @@ def get_experiment_by_name(experiment_name: str, project_id: str = None) -> dict
     if project_id is None:
         raise project_id_is_none_exception()
 
-    app_response = requests.get(f"{settings.url}/projects/{project_id}/experiments/name/{experiment_name}")
+    app_response = settings.client.get(f"{settings.url}/projects/{project_id}/experiments/name/{experiment_name}")
 
     if app_response.status_code == 200:
         experiment = app_response.json()
@@ -178,7 +179,7 @@ def create_experiment(name: str, description: str = None,
         "description": description,
     }
 
-    app_response = requests.post(f"{settings.url}/projects/{project_id}/experiments/", json=data)
+    app_response = settings.client.post(f"{settings.url}/projects/{project_id}/experiments/", json=data)
     response_json = app_response.json()
 
     if app_response.status_code == 201:
@@ -207,7 +208,7 @@ def set_active_experiment(experiment_id: str) -> str:
 
 
 def create_dataset(dataset_name: str, path_to_dataset: str, dataset_description: str = None,
-                   tags: str = '', version: str = None) -> dict:
+                   tags: str = '', version: str = None, profile: bool = False) -> dict:
     """
     Function for creating mlops datasets
 
@@ -217,12 +218,16 @@ def create_dataset(dataset_name: str, path_to_dataset: str, dataset_description:
         dataset_description: short description of the dataset displayed in the app
         tags: tags for dataset
         version: version of the dataset
+        profile: compute profile of local CSV or Parquet dataset file (content hash, rows and columns counts and
+            statistics of columns) and attach it to the dataset, requires pandas and pyarrow
+            (pip install mlops-ai[profile])
 
     Returns:
         dataset: json data of created dataset
     """
 
-    dataset = Dataset(dataset_name, path_to_dataset, dataset_description, tags, version)
+    dataset_profile = profile_dataset(path_to_dataset) if profile else None
+    dataset = Dataset(dataset_name, path_to_dataset, dataset_description, tags, version, dataset_profile)
 
     app_response = dataset.create_dataset_in_app()
 
@@ -240,7 +245,7 @@ def get_dataset(dataset_name: str, dataset_version: str):
     Returns:
         dataset: json data of the dataset
     """
-    app_response = requests.get(f"{settings.url}/datasets/name/{dataset_name}/version/{dataset_version}")
+    app_response = settings.client.get(f"{settings.url}/datasets/name/{dataset_name}/version/{dataset_version}")
 
     if app_response.status_code == 200:
         dataset = app_response.json()
@@ -249,6 +254,67 @@ def get_dataset(dataset_name: str, dataset_version: str):
         raise request_failed_exception(app_response)
 
 
+def query_iterations(metrics: dict = None, parameters: dict = None, sort_by: str = 'created_at',
+                     order: str = 'asc', limit: int = 100, offset: int = 0, cursor: str = None,
+                     fields: List[str] = None, user_name: str = None, dataset_id: str = None,
+                     date_from: datetime = None, date_to: datetime = None, experiment_id: str = None,
+                     project_id: str = None) -> dict:
+    """
+    Function for querying iterations of experiment on mlops server, e.g. top 10 iterations by metric with
+    parameter in range. Iterations are filtered and sorted by the server, only requested page is returned.
+
+    Args:
+        metrics: filters of metrics by metric name, e.g. {"val_auc": {"gte": 0.8}}, supported operators are
+            eq, ne, gt, gte, lt, lte and in
+        parameters: filters of parameters by parameter name, e.g. {"lr": {"lt": 0.01}}
+        sort_by: sort field, 'created_at', 'iteration_name', 'user_name', 'metrics.<name>' or 'parameters.<name>'
+        order: sort order, 'asc' or 'desc'
+        limit: maximum number of iterations in page (1-1000)
+        offset: number of skipped iterations
+        cursor: 'next_cursor' returned with previous page, to get the next page
+        fields: returned fields, e.g. ['iteration_name', 'metrics.val_auc'], all fields except charts if None
+        user_name: username of iterations
+        dataset_id: id of the dataset of iterations
+        date_from: minimum iteration creation date
+        date_to: maximum iteration creation date
+        experiment_id: id of the experiment (optional)
+        project_id: id of the project, that the experiment comes from (optional)
+
+    Returns:
+        page: json data with iterations and 'next_cursor', None if there are no more iterations
+    """
+    experiment_id = settings.active_experiment_id if not experiment_id else experiment_id
+    project_id = settings.active_project_id if not project_id else project_id
+
+    if project_id is None:
+        raise project_id_is_none_exception()
+    if experiment_id is None:
+        raise experiment_id_is_none_exception()
+
+    query = {
+        "metrics": metrics,
+        "parameters": parameters,
+        "sort_by": sort_by,
+        "order": order,
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor,
+        "fields": fields,
+        "user_name": user_name,
+        "dataset_id": dataset_id,
+        "date_from": date_from.isoformat() if date_from else None,
+        "date_to": date_to.isoformat() if date_to else None
+    }
+    query = {key: value for key, value in query.items() if value is not None}
+
+    app_response = settings.client.post(f"{settings.url}/projects/{project_id}/experiments/{experiment_id}/iterations/query", json=query)
+
+    if app_response.status_code == 200:
+        return app_response.json()
+    else:
+        raise request_failed_exception(app_response)
+
+
 @contextmanager
 def start_iteration(iteration_name: str, project_id: str = None,
                     experiment_id: str = None, send_email: bool = False) -> ContextManager[Iteration]:
@@ -291,5 +357,20 @@ def start_iteration(iteration_name: str, project_id: str = None,
     finally:
         if not exception_occurred:
             output = iteration.end_iteration()
-            if send_email or settings.send_emails:
+            # iteration sent in the background is reported by the spool after it is created
+            if output is not None and (send_email or settings.send_emails):
                 mailgun.send_tracking_success(output)
+
+
+def flush(timeout: float = None) -> bool:
+    """
+    Function for waiting until iterations submitted in the background are sent to the server. It is also called
+    at exit with settings.spool_flush_timeout, iterations not sent by then are sent by the next run.
+
+    Args:
+        timeout: maximum time to wait in seconds, wait without limit if None
+
+    Returns:
+        True if all iterations were sent, False if timeout expired
+    """
+    return settings.spool.flush(timeout)
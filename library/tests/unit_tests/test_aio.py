@@ -0,0 +1,70 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+
+from mlops.aio.client import AsyncClient
+from mlops.src.client import Client
+
+
+def use_mock_transport(async_client: AsyncClient, handler):
+    async_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async_client._client_loop = asyncio.get_running_loop()
+
+
+def test_async_client_gzip_json_body():
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(201, json={})
+
+    async_client = AsyncClient(Client(gzip_requests=True, gzip_min_size=100))
+    data = {"title": "test_project", "description": "description " * 100}
+
+    async def send():
+        use_mock_transport(async_client, handler)
+        await asyncio.gather(async_client.post("http://127.0.0.1:8000/projects/", json=data),
+                             async_client.post("http://127.0.0.1:8000/projects/", json={"title": "test_project"}))
+        await async_client.close()
+
+    asyncio.run(send())
+
+    assert sent[0].headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(sent[0].content)) == data
+    assert "Content-Encoding" not in sent[1].headers
+    assert json.loads(sent[1].content) == {"title": "test_project"}
+
+
+def test_async_client_retries_only_idempotent_methods():
+    methods = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(503, json={"detail": "unavailable"})
+
+    async_client = AsyncClient(Client(max_retries=2, backoff_factor=0))
+
+    async def send():
+        use_mock_transport(async_client, handler)
+        get_response = await async_client.get("http://127.0.0.1:8000/projects/")
+        post_response = await async_client.post("http://127.0.0.1:8000/projects/", json={})
+        return get_response, post_response
+
+    get_response, post_response = asyncio.run(send())
+
+    assert get_response.status_code == post_response.status_code == 503
+    assert methods == ["GET", "GET", "GET", "POST"]
+
+
+def test_async_client_recreated_in_new_event_loop():
+    async_client = AsyncClient(Client())
+
+    async def get_client():
+        return async_client.client
+
+    first_client = asyncio.run(get_client())
+    second_client = asyncio.run(get_client())
+
+    assert first_client is not second_client
@@ -0,0 +1,45 @@
+import gzip
+import json
+
+import pytest
+
+from mlops.src.client import Client
+
+
+def test_client_reuses_pooled_session():
+    client = Client(max_retries=5, pool_size=4)
+
+    session = client.session
+    assert client.session is session
+
+    adapter = session.get_adapter("http://127.0.0.1:8000")
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.status_forcelist == Client.retry_statuses
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+    client.configure(timeout=10)
+    assert client.timeout == 10
+    assert client.session is not session
+
+
+def test_client_configure_unknown_option():
+    client = Client()
+
+    with pytest.raises(AttributeError):
+        client.configure(unknown_option=True)
+
+
+def test_client_gzip_json_body(monkeypatch):
+    client = Client(gzip_requests=True, gzip_min_size=100)
+    sent = []
+    monkeypatch.setattr(client.session, "request", lambda method, url, **kwargs: sent.append(kwargs))
+
+    data = {"title": "test_project", "description": "description " * 100}
+    client.post("http://127.0.0.1:8000/projects/", json=data)
+    client.post("http://127.0.0.1:8000/projects/", json={"title": "test_project"})
+
+    assert sent[0]["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(sent[0]["data"])) == data
+    assert sent[0]["timeout"] == client.timeout
+    assert "Content-Encoding" not in sent[1]["headers"]
+    assert json.loads(sent[1]["data"]) == {"title": "test_project"}
@@ -0,0 +1,37 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from mlops.src.dataset_profile import QuantileSketch, profile_dataset
+
+
+def test_profile_csv_dataset(tmp_path):
+    path = tmp_path / "dataset.csv"
+    rows = ["x,y,label"] + [f"{i},{'' if i % 10 == 0 else i / 2},{'a' if i % 2 else 'b'}" for i in range(1000)]
+    path.write_text("\n".join(rows) + "\n\n")
+
+    profile = profile_dataset(str(path), chunk_size=64, sketch_size=50)
+
+    assert profile["content_hash"] == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert profile["format"] == "csv"
+    assert profile["rows_count"] == 1000
+    assert profile["columns_count"] == 3
+
+    x, y, label = profile["columns"]
+    assert (x["dtype"], x["count"], x["null_count"], x["min"], x["max"]) == ("int64", 1000, 0, 0, 999)
+    assert (y["dtype"], y["count"], y["null_count"]) == ("float64", 900, 100)
+    assert (label["min"], label["max"], label["quantiles"]) == ("a", "b", None)
+    assert x["quantiles"][profile["quantile_levels"].index(0.5)] == pytest.approx(499.5, abs=20)
+
+
+def test_quantile_sketch_memory_is_bounded():
+    values = np.random.default_rng(0).normal(size=100_000)
+    sketch = QuantileSketch(max_size=100)
+
+    for chunk in np.array_split(values, 100):
+        sketch.update(chunk)
+
+    assert len(sketch.values) <= 200
+    assert sketch.weights.sum() == len(values)
+    assert sketch.quantiles([0.1, 0.5, 0.9]) == pytest.approx(np.quantile(values, [0.1, 0.5, 0.9]), abs=0.05)
@@ -0,0 +1,43 @@
+import requests
+
+from mlops.config.config import settings
+from mlops.src.iteration import Iteration
+
+
+def test_log_metric_with_step_sends_batches(monkeypatch):
+    sent = []
+    failures = [requests.ConnectionError("server is down")]
+
+    def post(url, json=None, **kwargs):
+        if failures:
+            raise failures.pop()
+        sent.append((url, json))
+        response = requests.Response()
+        response.status_code = 201
+        return response
+
+    monkeypatch.setattr(settings.client, "post", post)
+    monkeypatch.setattr(settings, "metric_flush_size", 3)
+
+    iteration = Iteration(iteration_name='test_iteration', project_id='test_project', experiment_id='test_experiment')
+
+    for step in range(4):
+        iteration.log_metrics({"loss": 1 / (step + 1), "accuracy": step / 4}, step=step)
+    iteration.log_metric("f1", 0.5)
+
+    # failed batch is not retried before flush interval
+    assert sent == []
+    assert iteration.metric_buffer.size == 8
+
+    iteration.flush_metrics()
+
+    assert len(sent) == 1
+    url, data = sent[0]
+    assert url.endswith(f"/iterations/{iteration.iteration_id}/metrics")
+    assert data["metrics"]["loss"]["steps"] == [0, 1, 2, 3]
+    assert data["metrics"]["accuracy"]["values"] == [0, 0.25, 0.5, 0.75]
+    assert len(data["metrics"]["loss"]["timestamps"]) == 4
+    assert iteration.metric_buffer.size == 0
+    assert iteration.metrics == {"loss": 0.25, "accuracy": 0.75, "f1": 0.5}
+    assert iteration.get_iteration_json()["id"] == iteration.iteration_id
+    assert len(iteration.iteration_id) == 24
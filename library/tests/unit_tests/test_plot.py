@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from mlops.src.chart import Chart, decode_chart_data, encode_chart_data
+
+
+def test_encode_chart_data_round_trip():
+    data = [[0.5, 1.5, 2.5], [1, 2, 3]]
+
+    encoded = encode_chart_data(data, 'float32')
+
+    assert (encoded["dtype"], encoded["shape"]) == ("float32", [2, 3])
+    assert decode_chart_data(encoded).tolist() == data
+    assert decode_chart_data(encode_chart_data(np.array(data).T)).shape == (3, 2)
+
+
+def test_chart_encodes_only_numeric_data():
+    chart = Chart(chart_name="bar", chart_type="bar", chart_title="Bar", x_data=[["a", "b"]],
+                  y_data=np.array([[1, 2], [3, 4]]), encoding='float64')
+
+    chart_dictionary = chart.get_chart_dictionary()
+
+    assert chart_dictionary["x_data"] == [["a", "b"]]
+    assert decode_chart_data(chart_dictionary["y_data"]).tolist() == [[1, 2], [3, 4]]
+
+
+def test_chart_encoding_not_supported():
+    with pytest.raises(ValueError):
+        Chart(chart_name="line", chart_type="line", chart_title="Line", encoding='int8')
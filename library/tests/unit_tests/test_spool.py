@@ -0,0 +1,114 @@
+import json
+import os
+
+import requests
+
+from mlops.config.config import settings
+from mlops.src.artifact import get_file_checksum
+from mlops.src.iteration import Iteration
+from mlops.src.spool import Spool
+
+
+def get_response(status_code: int, content: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(content).encode('utf-8')
+    return response
+
+
+def test_spool_retries_until_server_is_available(tmp_path, monkeypatch):
+    responses = [requests.ConnectionError("server is down"), get_response(503, {"detail": "unavailable"}),
+                 get_response(201, {"iteration_name": "test_iteration"})]
+    sent = []
+
+    def post(url, json=None, **kwargs):
+        sent.append((url, json))
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(settings.client, "post", post)
+    monkeypatch.setattr(settings.client, "backoff_factor", 0)
+
+    spool = Spool(str(tmp_path))
+    spool.submit("http://127.0.0.1:8000/iterations/", {"iteration_name": "test_iteration"})
+
+    assert spool.flush(timeout=10)
+    assert len(sent) == 3
+    assert sent[-1] == ("http://127.0.0.1:8000/iterations/", {"iteration_name": "test_iteration"})
+    assert not os.path.exists(spool.log_path)
+
+
+def test_spool_recovers_pending_iterations_of_previous_run(tmp_path, monkeypatch):
+    log_path = tmp_path / "1-previous.log"
+    with open(log_path, 'w') as log:
+        for record in [{"type": "iteration", "id": "1", "url": "url", "data": {"iteration_name": "sent"}},
+                       {"type": "iteration", "id": "2", "url": "url", "data": {"iteration_name": "pending"}},
+                       {"type": "done", "id": "1"}]:
+            log.write(json.dumps(record) + '\n')
+        log.write('{"type": "iteration", "id": "3", "ur')
+    os.utime(log_path, (0, 0))
+
+    sent = []
+    monkeypatch.setattr(settings.client, "post",
+                        lambda url, json=None, **kwargs: sent.append(json) or get_response(201, json))
+
+    spool = Spool(str(tmp_path))
+
+    assert spool.flush(timeout=10)
+    assert sent == [{"iteration_name": "pending"}]
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_does_not_retry_rejected_iteration(tmp_path, monkeypatch):
+    sent = []
+    monkeypatch.setattr(settings.client, "post", lambda url, json=None, **kwargs: sent.append(json) or
+                        get_response(422, {"detail": "invalid iteration"}))
+
+    spool = Spool(str(tmp_path))
+    spool.submit("http://127.0.0.1:8000/iterations/", {"iteration_name": "test_iteration"})
+
+    assert spool.flush(timeout=10)
+    assert len(sent) == 1
+    with open(os.path.join(tmp_path, "rejected.log")) as log:
+        record = json.loads(log.readline())
+    assert record["data"] == {"iteration_name": "test_iteration"}
+    assert "invalid iteration" in record["detail"]
+
+
+def test_spool_uploads_model_logged_while_server_is_down(tmp_path, monkeypatch):
+    model_path = tmp_path / "model.pkl"
+    model_path.write_bytes(b"model")
+    sha256, size = get_file_checksum(str(model_path))
+    server_up = False
+    sent = []
+
+    def post(url, json=None, **kwargs):
+        if not server_up:
+            raise requests.ConnectionError("server is down")
+        sent.append((url, json))
+        if url.endswith("/artifacts/uploads"):
+            return get_response(201, {"_id": "upload", "offset": 0, "artifact_id": None})
+        if url.endswith("/complete"):
+            return get_response(200, {"_id": "upload", "offset": size, "artifact_id": sha256})
+        return get_response(201, json)
+
+    monkeypatch.setattr(settings.client, "post", post)
+    monkeypatch.setattr(settings.client, "patch", lambda url, **kwargs: get_response(200, {"offset": size}))
+    monkeypatch.setattr(settings.client, "backoff_factor", 0)
+    monkeypatch.setattr(settings, "async_submission", True)
+    monkeypatch.setattr(settings, "_spool", Spool(str(tmp_path / "spool")))
+
+    iteration = Iteration("test_iteration", "project", "experiment")
+    iteration.log_path_to_model(str(model_path))
+    iteration.end_iteration()
+
+    assert not settings.spool.flush(timeout=0.5)
+    server_up = True
+    assert settings.spool.flush(timeout=10)
+
+    assert [url.rsplit("/", 2)[-2:] for url, _ in sent] == [["artifacts", "uploads"], ["upload", "complete"],
+                                                            ["iterations", ""]]
+    assert sent[-1][1]["ml_model_artifact_id"] == sha256
+    assert sent[-1][1]["path_to_model"] == model_path.as_posix()
@@ -7,7 +7,12 @@ from app.routers.project import router as project_router
 from app.routers.experiment import experiment_router as experiment_router
 from app.routers.iteration import iteration_router as iteration_router
 from app.routers.dataset import dataset_router as dataset_router
-from app.routers.monitored_model import monitored_model_router as monitored_model_router
+from app.routers.artifact import artifact_router as artifact_router
+from app.routers.monitored_model import monitored_model_router as monitored_model_router, start_inference_pool
+from app.utils.chart_data import CHART_DTYPE_HEADER, CHART_SHAPE_HEADER
+from app.utils.gzip_request import GZipRequestMiddleware
+from app.utils.inference_pool import inference_pool
+from app.utils.pagination import TOTAL_COUNT_HEADER, NEXT_CURSOR_HEADER
 
 app = FastAPI(title=settings.PROJECT_NAME)
 
@@ -18,13 +23,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[TOTAL_COUNT_HEADER, NEXT_CURSOR_HEADER, CHART_DTYPE_HEADER, CHART_SHAPE_HEADER],
 )
+app.add_middleware(GZipRequestMiddleware)
 
 app.include_router(project_router, tags=["Project"], prefix="/projects")
 app.include_router(experiment_router, tags=["Experiment"], prefix="/projects/{project_id}/experiments")
 app.include_router(iteration_router, tags=['Iteration'], prefix="/projects/{project_id}/experiments/{experiment_id}/iterations")
 app.include_router(dataset_router, tags=["Dataset"], prefix="/datasets")
 app.include_router(monitored_model_router, tags=["Monitored model"], prefix="/monitored-models")
+app.include_router(artifact_router, tags=["Artifact"], prefix="/artifacts")
 
 
 
@@ -35,6 +43,15 @@ async def app_init():
     Initialize the crucial app components on startup
     """
     await init_mongo_db()
+    await start_inference_pool()
+
+
+@app.on_event("shutdown")
+async def app_shutdown():
+    """
+    Shut down the app components on shutdown
+    """
+    inference_pool.shutdown()
 
 
 @app.get("/", tags=["Root"])
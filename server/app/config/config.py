@@ -18,6 +18,31 @@ class Settings(BaseSettings):
     MONGODB_DB_NAME: str = config("MONGODB_DB_NAME", cast=str)
     TESTING: bool = config("TESTING", cast=bool, default=False)
     MONGODB_TEST_DB_NAME = config("MONGODB_TEST_DB_NAME", cast=str)
+    RENAME_DUPLICATE_NAMES: bool = config("RENAME_DUPLICATE_NAMES", cast=bool, default=False)
+
+    # Requests
+    GZIP_REQUEST_MAX_SIZE: int = config("GZIP_REQUEST_MAX_SIZE", cast=int, default=104857600)
+
+    # Monitored models
+    ML_MODEL_CACHE_SIZE: int = config("ML_MODEL_CACHE_SIZE", cast=int, default=16)
+    PREDICTION_BATCH_MAX_ROWS: int = config("PREDICTION_BATCH_MAX_ROWS", cast=int, default=64)
+    PREDICTION_BATCH_MAX_DELAY_MS: float = config("PREDICTION_BATCH_MAX_DELAY_MS", cast=float, default=5)
+    INFERENCE_POOL_TYPE: str = config("INFERENCE_POOL_TYPE", cast=str, default="thread")
+    INFERENCE_POOL_WORKERS: int = config("INFERENCE_POOL_WORKERS", cast=int, default=4)
+    INFERENCE_POOL_MAX_QUEUE: int = config("INFERENCE_POOL_MAX_QUEUE", cast=int, default=64)
+    INPUT_SCHEMA_MAX_VALUES: int = config("INPUT_SCHEMA_MAX_VALUES", cast=int, default=100)
+    CHART_AGGREGATE_BUILD_TIMEOUT: float = config("CHART_AGGREGATE_BUILD_TIMEOUT", cast=float, default=300)
+    DRIFT_BUCKET_SECONDS: int = config("DRIFT_BUCKET_SECONDS", cast=int, default=3600)
+    DRIFT_PSI_THRESHOLD: float = config("DRIFT_PSI_THRESHOLD", cast=float, default=0.2)
+
+    # Datasets
+    DATASET_URL_TIMEOUT: float = config("DATASET_URL_TIMEOUT", cast=float, default=5)
+    DATASET_URL_CACHE_TTL: float = config("DATASET_URL_CACHE_TTL", cast=float, default=300)
+    DATASET_URL_CACHE_SIZE: int = config("DATASET_URL_CACHE_SIZE", cast=int, default=1024)
+
+    # Artifacts
+    ARTIFACT_STORE_BACKEND: str = config("ARTIFACT_STORE_BACKEND", cast=str, default="gridfs")
+    ARTIFACT_STORE_PATH: str = config("ARTIFACT_STORE_PATH", cast=str, default="artifacts")
 
     class Config:
         case_sensitive = True
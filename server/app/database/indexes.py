@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime
+from typing import List, Type
+
+from beanie import Document, PydanticObjectId
+from pymongo import TEXT
+
+from app.models.dataset import Dataset
+from app.models.drift_bucket import DriftBucket
+from app.models.iteration_document import IterationDocument
+from app.models.metric_series import MetricSeries
+from app.models.monitored_model import MonitoredModel
+from app.models.prediction import Prediction
+from app.models.project import Project
+
+# queries on the client call paths, with the sort they are run with, checked by the query plans report
+SAMPLE_ID = PydanticObjectId()
+HOT_QUERIES = [
+    (Project, {"title": ""}, None),
+    (Project, {}, [("created_at", 1), ("_id", 1)]),
+    (Project, {"archived": False}, [("created_at", 1), ("_id", 1)]),
+    (Project, {}, [("title", 1), ("_id", 1)]),
+    (Dataset, {"dataset_name": ""}, None),
+    (Dataset, {"dataset_name": "", "version": ""}, None),
+    (Dataset, {"archived": False}, [("created_at", 1), ("_id", 1)]),
+    (Dataset, {"profile.content_hash": ""}, None),
+    (MonitoredModel, {"model_name": ""}, None),
+    (MonitoredModel, {"model_status": "active"}, [("created_at", 1), ("_id", 1)]),
+    (MonitoredModel, {"model_status": {"$ne": "archived"}}, [("created_at", 1), ("_id", 1)]),
+    (IterationDocument, {"project_id": SAMPLE_ID, "experiment_id": SAMPLE_ID}, [("created_at", 1)]),
+    (IterationDocument, {"experiment_id": {"$in": [SAMPLE_ID]}}, [("created_at", 1)]),
+    (IterationDocument, {"experiment_id": SAMPLE_ID, "iteration_name": ""}, None),
+    (IterationDocument, {"dataset.id": SAMPLE_ID}, None),
+    (Prediction, {"monitored_model_id": SAMPLE_ID}, [("prediction_date", 1), ("_id", 1)]),
+    (MetricSeries, {"iteration_id": SAMPLE_ID, "name": ""}, None),
+    (DriftBucket, {"monitored_model_id": SAMPLE_ID, "bucket_start": {"$gte": datetime(1970, 1, 5)}}, None),
+]
+
+
+async def verify_indexes(document_models: List[Type[Document]]) -> None:
+    """
+    Check that indexes declared in settings of documents exist in their collections with the declared keys and
+    uniqueness. Keys of text indexes are not compared, MongoDB stores them in a different form.
+
+    Args:
+        document_models: Initialized documents.
+
+    Raises:
+        RuntimeError: If any declared index is missing or different.
+
+    Returns:
+        None
+    """
+    invalid_indexes = []
+    for document_model in document_models:
+        collection = document_model.get_motor_collection()
+        existing_indexes = await collection.index_information()
+
+        for index in document_model.get_settings().indexes or []:
+            declared = index.document
+            existing = existing_indexes.get(declared["name"])
+            if existing is None or existing.get("unique", False) != declared.get("unique", False) or (
+                    TEXT not in declared["key"].values() and
+                    [tuple(key) for key in existing["key"]] != list(declared["key"].items())):
+                invalid_indexes.append(f"{collection.name}.{declared['name']}")
+
+    if invalid_indexes:
+        raise RuntimeError(f"Indexes are missing or different than declared: {', '.join(invalid_indexes)}. "
+                           f"Drop them to let them be created again.")
+
+    return None
+
+
+def find_stages(plan: dict) -> List[str]:
+    """
+    Get stages of query plan and all its input stages.
+
+    Args:
+        plan: Query plan, e.g. winning plan of explain output.
+
+    Returns:
+        Stage names.
+    """
+    stages = [plan["stage"]] if "stage" in plan else []
+    for value in plan.values():
+        for child in (value if isinstance(value, list) else [value]):
+            if isinstance(child, dict):
+                stages += find_stages(child)
+
+    return stages
+
+
+async def get_collection_scans() -> List[dict]:
+    """
+    Explain queries on the client call paths and get the ones whose winning plan scans the whole collection.
+
+    Returns:
+        Collection, query, sort and stages of the plan of every query doing a collection scan.
+    """
+    collection_scans = []
+    for document_model, query, sort in HOT_QUERIES:
+        cursor = document_model.get_motor_collection().find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explain = await cursor.explain()
+
+        stages = find_stages(explain["queryPlanner"]["winningPlan"])
+        if "COLLSCAN" in stages:
+            collection_scans.append({
+                "collection": document_model.get_settings().name,
+                "query": query,
+                "sort": sort,
+                "stages": stages
+            })
+
+    return collection_scans
+
+
+async def print_collection_scans_report() -> None:
+    """
+    Initialize database and print queries on the client call paths doing a collection scan.
+
+    Returns:
+        None
+    """
+    from app.database.init_mongo_db import init_mongo_db
+
+    await init_mongo_db()
+    collection_scans = await get_collection_scans()
+
+    for collection_scan in collection_scans:
+        print(f"COLLSCAN {collection_scan['collection']}: query {collection_scan['query']}, "
+              f"sort {collection_scan['sort']}, plan {' <- '.join(collection_scan['stages'])}")
+    print(f"{len(collection_scans)} of {len(HOT_QUERIES)} queries do a collection scan.")
+
+
+if __name__ == "__main__":
+    asyncio.run(print_collection_scans_report())
@@ -2,6 +2,16 @@ from app.config.config import settings
 from app.models.project import Project
 from app.models.dataset import Dataset
 from app.models.monitored_model import MonitoredModel
+from app.models.prediction import Prediction
+from app.models.chart_aggregate import ChartAggregate
+from app.models.drift_bucket import DriftBucket
+from app.models.artifact_upload import ArtifactUpload
+from app.models.metric_series import MetricSeries
+from app.models.iteration_document import IterationDocument
+from app.database.indexes import verify_indexes
+from app.database.migrations import migrate_embedded_predictions_data, migrate_input_schemas, \
+    migrate_encoded_ml_models, migrate_embedded_iterations, migrate_duplicate_names, migrate_drift_buckets
+from app.utils.artifact_store import init_artifact_store
 
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -10,19 +20,34 @@ from pymongo import MongoClient
 
 async def init_mongo_db():
     """
-    Initialize mongoDB database connection using beanie ODM
+    Initialize mongoDB database connection using beanie ODM. Indexes declared in settings of documents are created
+    by beanie and verified.
     """
     db_client = AsyncIOMotorClient(settings.MONGODB_URL)
     db_name = settings.MONGODB_TEST_DB_NAME if settings.TESTING else settings.MONGODB_DB_NAME
+    document_models = [
+        Project,
+        Dataset,
+        MonitoredModel,
+        Prediction,
+        ChartAggregate,
+        DriftBucket,
+        ArtifactUpload,
+        MetricSeries,
+        IterationDocument
+    ]
 
-    await init_beanie(
-        database=db_client[db_name],
-        document_models=[
-            Project,
-            Dataset,
-            MonitoredModel
-        ]
-    )
+    # unique indexes can not be created while there are duplicates
+    await migrate_duplicate_names(db_client[db_name])
+    await init_beanie(database=db_client[db_name], document_models=document_models)
+    await verify_indexes(document_models)
+    init_artifact_store(db_client[db_name])
+
+    await migrate_embedded_predictions_data()
+    await migrate_input_schemas()
+    await migrate_drift_buckets()
+    await migrate_encoded_ml_models()
+    await migrate_embedded_iterations()
 
 
 async def drop_database():
@@ -0,0 +1,462 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.config.config import settings
+from app.models.dataset import Dataset
+from app.models.drift_bucket import DriftBucket
+from app.models.input_schema import InputSchema
+from app.models.iteration_document import IterationDocument
+from app.models.monitored_model import MonitoredModel
+from app.models.prediction import Prediction
+from app.models.project import Project
+from app.utils.artifact_store import get_artifact_store
+from app.utils.chart_aggregates import get_prediction_row
+from app.utils.drift import get_drift_bucket_update_documents
+from app.utils.input_schema import get_input_schema_update
+from app.utils.ml_model import decode_encoded_ml_model
+
+
+async def migrate_embedded_predictions_data() -> None:
+    """
+    Move predictions data embedded in monitored model documents into prediction collection.
+    Migration is idempotent, predictions already moved to prediction collection are skipped.
+
+    Returns:
+        None
+    """
+    monitored_model_collection = MonitoredModel.get_motor_collection()
+    prediction_collection = Prediction.get_motor_collection()
+
+    async for document in monitored_model_collection.find({"predictions_data.0": {"$exists": True}},
+                                                          {"predictions_data": 1}):
+        predictions = [
+            {
+                "_id": prediction_data["id"],
+                "monitored_model_id": document["_id"],
+                "prediction_date": prediction_data["prediction_date"],
+                "input_data": prediction_data["input_data"],
+                "prediction": prediction_data["prediction"],
+                "actual": prediction_data.get("actual")
+            } for prediction_data in document["predictions_data"]
+        ]
+
+        try:
+            await prediction_collection.insert_many(predictions, ordered=False)
+        except BulkWriteError as e:
+            # ignore predictions moved by previous, interrupted migration
+            if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise e
+
+        await monitored_model_collection.update_one({"_id": document["_id"]}, {"$set": {"predictions_data": []}})
+
+    return None
+
+
+async def migrate_input_schemas(batch_size: int = 1000) -> None:
+    """
+    Build input schemas of monitored models created before input schemas were introduced from their predictions.
+    Schema is built in memory and stored with one update, only if the monitored model still has no input schema, so
+    an interrupted migration leaves no partial schema and a schema built by a concurrent migration is not overwritten.
+
+    Args:
+        batch_size: Number of predictions included in the schema at once.
+
+    Returns:
+        None
+    """
+    monitored_model_collection = MonitoredModel.get_motor_collection()
+    prediction_collection = Prediction.get_motor_collection()
+
+    async for document in monitored_model_collection.find({"input_schema": {"$exists": False}}, {"_id": 1}):
+        schema_document = {"input_schema": InputSchema().dict()}
+
+        rows = []
+        async for prediction in prediction_collection.find({"monitored_model_id": document["_id"]},
+                                                          {"input_data": 1, "prediction": 1, "actual": 1}):
+            rows.append(get_prediction_row(prediction))
+            if len(rows) >= batch_size:
+                include_rows_in_input_schema(schema_document, rows)
+                rows = []
+        include_rows_in_input_schema(schema_document, rows)
+
+        await monitored_model_collection.update_one({"_id": document["_id"], "input_schema": {"$exists": False}},
+                                                    {"$set": schema_document})
+
+    return None
+
+
+def include_rows_in_input_schema(schema_document: dict, rows: list) -> None:
+    """
+    Include rows in input schema built in memory, applying the update used for monitored models in the database.
+
+    Args:
+        schema_document: Document with input schema field, updated in place.
+        rows: Rows of input data with prediction and actual values.
+
+    Returns:
+        None
+    """
+    update = get_input_schema_update(InputSchema.parse_obj(schema_document["input_schema"]), rows) if rows else None
+
+    for operator, fields in (update or {}).items():
+        for path, value in fields.items():
+            *parents, name = path.split(".")
+            target = schema_document
+            for parent in parents:
+                target = target.setdefault(parent, {})
+
+            if operator == "$inc":
+                target[name] = target.get(name, 0) + value
+            elif operator == "$set":
+                target[name] = value
+            elif operator == "$addToSet":
+                target.setdefault(name, []).extend(item for item in value["$each"] if item not in target[name])
+
+    return None
+
+
+async def migrate_drift_buckets(batch_size: int = 1000, lease_seconds: float = 600) -> None:
+    """
+    Add predictions of monitored models created before drift buckets were introduced to drift buckets. Their
+    drift_buckets_since is set to the time of the first migration, predictions made since then are added to drift
+    buckets as they are made, so only older predictions are migrated. Monitored model is migrated by one worker
+    holding a lease, which is taken over when it expires. Every drift bucket is completed with one update marking it
+    migrated, so an interrupted migration or a migration taken over does not add predictions twice.
+
+    Args:
+        batch_size: Number of predictions read before completed drift buckets are written.
+        lease_seconds: Seconds after which migration of monitored model by another worker is taken over.
+
+    Returns:
+        None
+    """
+    monitored_model_collection = MonitoredModel.get_motor_collection()
+    prediction_collection = Prediction.get_motor_collection()
+
+    await monitored_model_collection.update_many(
+        {"drift_buckets_since": {"$exists": False}},
+        {"$set": {"drift_buckets_since": datetime.now(), "drift_buckets_migration_lease": datetime.min}})
+
+    async for document in monitored_model_collection.find({"drift_buckets_migration_lease": {"$exists": True}},
+                                                          {"_id": 1}):
+        document = await monitored_model_collection.find_one_and_update(
+            {"_id": document["_id"], "drift_buckets_migration_lease": {"$lt": datetime.now()}},
+            {"$set": {"drift_buckets_migration_lease": datetime.now() + timedelta(seconds=lease_seconds)}},
+            {"input_schema": 1, "drift_buckets_since": 1})
+        if document is None:
+            # monitored model is migrated by another worker
+            continue
+
+        input_schema = InputSchema.parse_obj(document.get("input_schema", {}))
+        updates = {}
+        predictions = []
+        async for prediction in prediction_collection.find(
+                {"monitored_model_id": document["_id"], "prediction_date": {"$lt": document["drift_buckets_since"]}},
+                {"prediction_date": 1, "input_data": 1, "prediction": 1}
+        ).sort([("prediction_date", 1), ("_id", 1)]):
+            predictions.append(prediction)
+            if len(predictions) >= batch_size:
+                merge_drift_bucket_updates(updates, input_schema, predictions)
+                # predictions are sorted by date, so buckets before the last one are complete
+                last_bucket_start = max(updates)
+                await write_migrated_drift_buckets(document["_id"], {
+                    bucket_start: updates.pop(bucket_start) for bucket_start in list(updates)
+                    if bucket_start != last_bucket_start})
+                predictions = []
+        merge_drift_bucket_updates(updates, input_schema, predictions)
+        await write_migrated_drift_buckets(document["_id"], updates)
+
+        await monitored_model_collection.update_one({"_id": document["_id"]},
+                                                    {"$unset": {"drift_buckets_migration_lease": ""}})
+
+    return None
+
+
+def merge_drift_bucket_updates(updates: dict, input_schema: InputSchema, predictions: List[dict]) -> None:
+    """
+    Merge update documents of drift buckets for predictions into updates by bucket start.
+
+    Args:
+        updates: Update documents by bucket start, updated in place.
+        input_schema: Input schema of monitored model.
+        predictions: Prediction documents.
+
+    Returns:
+        None
+    """
+    for bucket_start, update in get_drift_bucket_update_documents(input_schema, predictions).items():
+        merged = updates.setdefault(bucket_start, {})
+        for operator, fields in update.items():
+            merged_fields = merged.setdefault(operator, {})
+            for path, value in fields.items():
+                if path not in merged_fields:
+                    merged_fields[path] = value
+                elif operator == "$inc":
+                    merged_fields[path] += value
+                elif operator == "$min":
+                    merged_fields[path] = min(merged_fields[path], value)
+                elif operator == "$max":
+                    merged_fields[path] = max(merged_fields[path], value)
+
+    return None
+
+
+async def write_migrated_drift_buckets(monitored_model_id, updates: dict) -> None:
+    """
+    Add complete updates of drift buckets to the buckets which are not migrated yet and mark them migrated. Bucket
+    updated by live predictions is updated, missing one is inserted.
+
+    Args:
+        monitored_model_id: Monitored model id.
+        updates: Update documents by bucket start.
+
+    Returns:
+        None
+    """
+    if not updates:
+        return None
+
+    try:
+        await DriftBucket.get_motor_collection().bulk_write([
+            UpdateOne({"monitored_model_id": monitored_model_id, "bucket_start": bucket_start,
+                       "migrated": {"$ne": True}},
+                      {**update, "$set": {"migrated": True}}, upsert=True)
+            for bucket_start, update in updates.items()
+        ], ordered=False)
+    except BulkWriteError as e:
+        # upsert of bucket already migrated by interrupted migration or another worker conflicts with it
+        if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+            raise e
+
+    return None
+
+
+async def migrate_encoded_ml_models() -> None:
+    """
+    Move encoded ml models embedded in iterations of projects and monitored models into the artifact store,
+    leaving only artifact ids in the documents. Migration is idempotent, iterations without encoded ml model
+    are skipped.
+
+    Returns:
+        None
+    """
+    project_collection = Project.get_motor_collection()
+    monitored_model_collection = MonitoredModel.get_motor_collection()
+
+    async for document in project_collection.find({"experiments.iterations.encoded_ml_model": {"$type": "string"}},
+                                                  {"experiments": 1}):
+        moved = False
+        for experiment in document["experiments"]:
+            for iteration in experiment.get("iterations", []):
+                moved = await store_encoded_ml_model(iteration) or moved
+
+        if moved:
+            await project_collection.update_one({"_id": document["_id"]},
+                                                {"$set": {"experiments": document["experiments"]}})
+
+    async for document in monitored_model_collection.find({"iteration.encoded_ml_model": {"$type": "string"}},
+                                                          {"iteration": 1}):
+        if await store_encoded_ml_model(document["iteration"]):
+            await monitored_model_collection.update_one({"_id": document["_id"]},
+                                                        {"$set": {"iteration": document["iteration"]}})
+
+    return None
+
+
+async def migrate_embedded_iterations() -> None:
+    """
+    Move iterations embedded in experiments of project documents into iteration collection. Migration is
+    idempotent, iterations already moved to iteration collection are skipped.
+
+    Returns:
+        None
+    """
+    project_collection = Project.get_motor_collection()
+    iteration_collection = IterationDocument.get_motor_collection()
+
+    async for document in project_collection.find({"experiments.iterations.0": {"$exists": True}},
+                                                  {"title": 1, "experiments.id": 1, "experiments.iterations": 1}):
+        iterations = []
+        for experiment in document["experiments"]:
+            for iteration in experiment.get("iterations", []):
+                iterations.append({
+                    **{key: value for key, value in iteration.items() if key != "id"},
+                    "_id": iteration["id"],
+                    "project_id": document["_id"],
+                    "experiment_id": experiment["id"],
+                    "project_title": document["title"]
+                })
+
+        try:
+            await iteration_collection.insert_many(iterations, ordered=False)
+        except BulkWriteError as e:
+            # ignore iterations moved by previous, interrupted migration
+            if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise e
+
+        await project_collection.update_one(
+            {"_id": document["_id"]},
+            {"$set": {f"experiments.{index}.iterations": [] for index in range(len(document["experiments"]))}}
+        )
+
+    return None
+
+
+async def store_encoded_ml_model(iteration: dict) -> bool:
+    """
+    Move encoded ml model of iteration document into the artifact store.
+
+    Args:
+        iteration: Iteration document, updated in place.
+
+    Returns:
+        True if encoded ml model was moved, False if iteration has no valid encoded ml model.
+    """
+    if not iteration.get("encoded_ml_model"):
+        return False
+
+    try:
+        ml_model_data = decode_encoded_ml_model(iteration["encoded_ml_model"])
+    except ValueError:
+        # keep invalid encoded ml model untouched, it could not be loaded before the migration either
+        return False
+
+    iteration["ml_model_artifact_id"] = await get_artifact_store().put(ml_model_data)
+    iteration["encoded_ml_model"] = None
+    return True
+
+
+async def migrate_duplicate_names(database: AsyncIOMotorDatabase) -> None:
+    """
+    Check that project titles, dataset names with versions and monitored model names are unique, so unique indexes can
+    be created. Names duplicated before unique indexes were introduced are renamed only if RENAME_DUPLICATE_NAMES
+    setting is enabled, since renamed documents are no longer found by their old names. The oldest document keeps its
+    name, the others get ' (2)', ' (3)', ... suffix. Copies of renamed names in iterations are updated, including
+    iterations still embedded in projects. Migration must run before indexes are created, so before iterations are
+    moved out of projects.
+
+    Args:
+        database: Database, collections are used directly because documents are not initialized yet.
+
+    Raises:
+        RuntimeError: If names are duplicated and renaming is not enabled.
+
+    Returns:
+        None
+    """
+    project_collection = database[Project.Settings.name]
+    dataset_collection = database[Dataset.Settings.name]
+    iteration_collection = database[IterationDocument.Settings.name]
+    monitored_model_collection = database[MonitoredModel.Settings.name]
+
+    project_duplicates = await find_duplicates(project_collection, "title")
+    dataset_duplicates = await find_duplicates(dataset_collection, "version", group_fields=["dataset_name"])
+    monitored_model_duplicates = await find_duplicates(monitored_model_collection, "model_name")
+
+    if not settings.RENAME_DUPLICATE_NAMES:
+        conflicts = [f"{collection.name} {duplicate['_id']}: {', '.join(map(str, duplicate['ids']))}"
+                     for collection, duplicates in [(project_collection, project_duplicates),
+                                                    (dataset_collection, dataset_duplicates),
+                                                    (monitored_model_collection, monitored_model_duplicates)]
+                     for duplicate in duplicates]
+        if conflicts:
+            raise RuntimeError(f"Unique indexes can not be created, names are duplicated: {'; '.join(conflicts)}. "
+                               f"Rename the documents or set RENAME_DUPLICATE_NAMES to rename them with ' (2)', "
+                               f"' (3)', ... suffix.")
+        return None
+
+    for project_id, title in await rename_duplicates(project_collection, project_duplicates, "title", max_length=40):
+        await project_collection.update_one({"_id": project_id, "experiments.iterations.0": {"$exists": True}},
+                                            {"$set": {"experiments.$[].iterations.$[].project_title": title}})
+        await iteration_collection.update_many({"project_id": project_id}, {"$set": {"project_title": title}})
+        await monitored_model_collection.update_many({"iteration.project_id": project_id},
+                                                     {"$set": {"iteration.project_title": title}})
+
+    for dataset_id, version in await rename_duplicates(dataset_collection, dataset_duplicates, "version",
+                                                       group_fields=["dataset_name"]):
+        await project_collection.update_many(
+            {"experiments.iterations.dataset.id": dataset_id},
+            {"$set": {"experiments.$[].iterations.$[iteration].dataset.version": version}},
+            array_filters=[{"iteration.dataset.id": dataset_id}])
+        await iteration_collection.update_many({"dataset.id": dataset_id}, {"$set": {"dataset.version": version}})
+        await monitored_model_collection.update_many({"iteration.dataset.id": dataset_id},
+                                                     {"$set": {"iteration.dataset.version": version}})
+
+    for monitored_model_id, name in await rename_duplicates(monitored_model_collection, monitored_model_duplicates,
+                                                            "model_name", max_length=100):
+        await project_collection.update_many(
+            {"experiments.iterations.assigned_monitored_model_id": monitored_model_id},
+            {"$set": {"experiments.$[].iterations.$[iteration].assigned_monitored_model_name": name}},
+            array_filters=[{"iteration.assigned_monitored_model_id": monitored_model_id}])
+        await iteration_collection.update_many({"assigned_monitored_model_id": monitored_model_id},
+                                               {"$set": {"assigned_monitored_model_name": name}})
+        await monitored_model_collection.update_one({"_id": monitored_model_id, "iteration": {"$ne": None}},
+                                                    {"$set": {"iteration.assigned_monitored_model_name": name}})
+
+    return None
+
+
+async def find_duplicates(collection: AsyncIOMotorCollection, field: str,
+                          group_fields: Optional[List[str]] = None) -> List[dict]:
+    """
+    Find documents having the same value of the field (and group fields).
+
+    Args:
+        collection: Collection of documents.
+        field: Field which must be unique.
+        group_fields: Fields which must be the same, in addition to the field, for documents to be duplicates.
+
+    Returns:
+        Duplicated values with ids of their documents, from the oldest.
+    """
+    group_fields = group_fields or []
+    return await collection.aggregate([
+        {"$sort": {"created_at": 1, "_id": 1}},
+        {"$group": {"_id": {name: f"${name}" for name in group_fields + [field]},
+                    "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}}
+    ]).to_list(length=None)
+
+
+async def rename_duplicates(collection: AsyncIOMotorCollection, duplicates: List[dict], field: str,
+                            group_fields: Optional[List[str]] = None,
+                            max_length: Optional[int] = None) -> List[Tuple[object, str]]:
+    """
+    Add ' (2)', ' (3)', ... suffix to the field of documents having the same value of the field (and group fields)
+    as an older document.
+
+    Args:
+        collection: Collection of documents.
+        duplicates: Duplicated values with ids of their documents, from find_duplicates.
+        field: Renamed field.
+        group_fields: Fields which must be the same, in addition to the renamed field, for documents to be duplicates.
+        max_length: Maximum length of the field, value is truncated to fit the suffix.
+
+    Returns:
+        Ids of renamed documents with their new field values.
+    """
+    group_fields = group_fields or []
+    renamed = []
+
+    for duplicate in duplicates:
+        group = {name: duplicate["_id"].get(name) for name in group_fields}
+        value = duplicate["_id"].get(field) or ""
+        number = 1
+
+        for document_id in duplicate["ids"][1:]:
+            while True:
+                number += 1
+                suffix = f" ({number})"
+                new_value = (value if max_length is None else value[:max_length - len(suffix)]) + suffix
+                new_value = new_value.strip()
+                if not await collection.find_one({**group, field: new_value}, {"_id": 1}):
+                    break
+
+            await collection.update_one({"_id": document_id}, {"$set": {field: new_value}})
+            renamed.append((document_id, new_value))
+
+    return renamed
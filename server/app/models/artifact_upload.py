@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional
+
+from beanie import Document
+from pydantic import Field
+
+
+class ArtifactUpload(Document):
+    """
+    Resumable chunked upload of artifact. Chunks are appended to the upload at its current offset and the upload
+    is stored in the artifact store when it is completed.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Upload id.
+    - **size (Optional[int])**: Expected artifact size in bytes, checked on completion.
+    - **sha256 (Optional[str])**: Expected SHA-256 hash of artifact content, checked on completion.
+    - **offset (int)**: Number of bytes received so far.
+    - **artifact_id (Optional[str])**: Id of the stored artifact, set when upload is completed.
+    - **created_at (datetime)**: Upload creation date.
+    - **updated_at (datetime)**: Upload last update date.
+    """
+    size: Optional[int] = Field(default=None, ge=0, description="Expected artifact size in bytes")
+    sha256: Optional[str] = Field(default=None, regex=r'^[0-9a-f]{64}$',
+                                  description="Expected SHA-256 hash of artifact content")
+    offset: int = Field(default=0, description="Number of bytes received so far")
+    artifact_id: Optional[str] = Field(default=None, description="Id of the stored artifact")
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"<ArtifactUpload {self.id}>"
+
+    def __str__(self) -> str:
+        return str(self.id)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArtifactUpload):
+            return self.id == other.id
+        return False
+
+    class Settings:
+        name = "artifact_upload"
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "size": 1048576,
+                "sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+            }
+        }
@@ -1,9 +1,83 @@
+import base64
+import binascii
+
+import numpy as np
 from pydantic import BaseModel, Field, validator, root_validator
 from beanie import PydanticObjectId
-from typing import List, Optional
+from typing import List, Optional, Union
 from fastapi import HTTPException, status
 
 
+class EncodedChartData(BaseModel):
+    """
+    Chart data encoded as row-major, little-endian float32 or float64 array in base64, a compact alternative to
+    lists of numbers for charts with many points.
+
+    Attributes:
+    - **dtype (str)**: Data type, 'float32' or 'float64'.
+    - **shape (List[int])**: Number of series and number of points in every series.
+    - **data (str)**: Base64 encoded array.
+    """
+    dtype: str = Field(description="Data type")
+    shape: List[int] = Field(description="Number of series and number of points in every series")
+    data: str = Field(description="Base64 encoded array")
+
+    @root_validator(skip_on_failure=True)
+    def validate_array(cls, values):
+        if values['dtype'] not in cls.Settings.dtypes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"dtype of encoded chart data must be one of {cls.Settings.dtypes}"
+            )
+        if len(values['shape']) != 2 or any(size < 0 for size in values['shape']):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="shape of encoded chart data must be number of series and number of points"
+            )
+        try:
+            size = len(base64.b64decode(values['data'], validate=True))
+        except binascii.Error:
+            size = None
+        if size != values['shape'][0] * values['shape'][1] * np.dtype(values['dtype']).itemsize:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="data of encoded chart data must be base64 encoded array of dtype and shape"
+            )
+        return values
+
+    @property
+    def lengths(self) -> List[int]:
+        return [self.shape[1]] * self.shape[0]
+
+    def to_array(self) -> np.ndarray:
+        """
+        Decode chart data.
+
+        Returns:
+            Array of dtype and shape.
+        """
+        dtype = np.dtype(self.dtype).newbyteorder('<')
+        return np.frombuffer(base64.b64decode(self.data), dtype=dtype).reshape(self.shape)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, dtype: str = 'float64') -> 'EncodedChartData':
+        """
+        Encode chart data.
+
+        Args:
+            array: Two-dimensional array of series.
+            dtype: Data type, 'float32' or 'float64'.
+
+        Returns:
+            Encoded chart data.
+        """
+        array = np.ascontiguousarray(array, dtype=np.dtype(dtype).newbyteorder('<'))
+        return cls(dtype=dtype, shape=list(array.shape), data=base64.b64encode(array.tobytes()).decode('ascii'))
+
+    class Settings:
+        dtypes = ['float32', 'float64']
+
+
 class InteractiveChart(BaseModel):
     """
     Interactive chart model.
@@ -14,8 +88,8 @@ class InteractiveChart(BaseModel):
     - **name (str)**: Logical name of chart.
     - **chart_title (str)**: Chart title.
     - **chart_subtitle (Optional[str])**: Chart subtitle.
-    - **x_data(List[float])**: X data.
-    - **y_data (List[float])**: Y data.
+    - **x_data (Union[List[List], EncodedChartData])**: X data, lists of values or encoded array of numbers.
+    - **y_data (Union[List[List], EncodedChartData])**: Y data, lists of values or encoded array of numbers.
     - **y_data_names (Optional[List[str]])**: Y data names.
     - **x_label (Optional[str])**: X label.
     - **y_label (Optional[str])**: Y label.
@@ -31,8 +105,8 @@ class InteractiveChart(BaseModel):
     name: str = Field(description="Logical name of chart", min_length=1, max_length=100)
     chart_title: str = Field(description="Chart title", min_length=1, max_length=100)
     chart_subtitle: Optional[str] = Field(description="Chart subtitle", min_length=1, max_length=100)
-    x_data: List[List] = Field(description="X axis data")
-    y_data: List[List] = Field(description="Y axis data")
+    x_data: Union[List[List], EncodedChartData] = Field(description="X axis data")
+    y_data: Union[List[List], EncodedChartData] = Field(description="Y axis data")
     y_data_names: Optional[List[str]] = Field(default=[], description="Y axis data names")
     x_label: Optional[str] = Field(default="x", description="X label", min_length=1, max_length=100)
     y_label: Optional[str] = Field(default="y", description="Y label", min_length=1, max_length=100)
@@ -63,16 +137,22 @@ class InteractiveChart(BaseModel):
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="x_data and y_data must be a list of lists of float or int"
                 )
+
+        # encoded data are validated by their shape, without decoding values
+        x_data_list = get_data_lengths(x_data_list)
+        y_data_list = get_data_lengths(y_data_list)
+
+        if chart_type in ['scatter', 'line']:
             if len(x_data_list) == 1 and len(y_data_list) > 1:
                 for y_data in y_data_list:
-                    if len(x_data_list[0]) != len(y_data):
+                    if x_data_list[0] != y_data:
                         raise HTTPException(
                             status_code=status.HTTP_400_BAD_REQUEST,
                             detail="Length of x_data and y_data must be equal"
                         )
             else:
                 for x_data, y_data in zip(x_data_list, y_data_list):
-                    if len(x_data) != len(y_data):
+                    if x_data != y_data:
                         raise HTTPException(
                             status_code=status.HTTP_400_BAD_REQUEST,
                             detail="Length of x_data and y_data must be equal"
@@ -84,7 +164,7 @@ class InteractiveChart(BaseModel):
                     detail="x_data can only have one list of data"
                 )
             for y_data in y_data_list:
-                if len(x_data_list[0]) != len(y_data):
+                if x_data_list[0] != y_data:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Length of x_data and y_data must be equal"
@@ -95,7 +175,7 @@ class InteractiveChart(BaseModel):
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="x_data and y_data can only have one list of data"
                 )
-            if len(x_data_list[0]) != len(y_data_list[0]):
+            if x_data_list[0] != y_data_list[0]:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Length of x_data and y_data must be equal"
@@ -106,12 +186,12 @@ class InteractiveChart(BaseModel):
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="x_data can only have one list of data"
                 )
-            if len(x_data_list[0]) != len(y_data_list):
+            if x_data_list[0] != len(y_data_list):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Error: For each element in x_data, there must be a list of y_data"
                 )
-            if any(len(y_data) != 5 for y_data in y_data_list):
+            if any(y_data != 5 for y_data in y_data_list):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Length of y_data must contain 5 values: min, q1, median, q3, max"
@@ -166,4 +246,12 @@ class InteractiveChart(BaseModel):
 
 
 def check_nested_data_type(data_list):
+    if isinstance(data_list, EncodedChartData):
+        return True
     return all(isinstance(value, (float, int)) for sublist in data_list for value in sublist)
+
+
+def get_data_lengths(data_list) -> List[int]:
+    if isinstance(data_list, EncodedChartData):
+        return data_list.lengths
+    return [len(data) for data in data_list]
@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import IndexModel, ASCENDING
+
+
+class ChartAggregate(Document):
+    """
+    Incrementally maintained aggregates of monitored model predictions used by one interactive chart.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Chart aggregate id.
+    - **monitored_model_id (PydanticObjectId)**: Monitored model id.
+    - **chart_id (PydanticObjectId)**: Interactive chart id.
+    - **chart_type (str)**: Chart type.
+    - **built (bool)**: Is the aggregate built from all predictions and updated as predictions are written.
+    - **build_started_at (Optional[datetime])**: Date the build of not built aggregate was started.
+    - **pending (List[dict])**: Prediction changes written while the aggregate is built, applied when it is built.
+    - **predictions_count (int)**: Number of aggregated predictions.
+    - **sketches (dict)**: Value sketches (count, sum, sum of squares, min and max bounds and logarithmic buckets)
+      by column.
+    - **categories (dict)**: Value counts by column.
+    - **regression (dict)**: Regression metrics accumulators.
+    - **confusion_matrix (dict)**: Confusion matrix cells counts.
+    """
+    monitored_model_id: PydanticObjectId = Field(..., description="Monitored model id")
+    chart_id: PydanticObjectId = Field(..., description="Interactive chart id")
+    chart_type: str = Field(..., description="Chart type")
+    built: bool = Field(default=True, description="Is the aggregate built")
+    build_started_at: Optional[datetime] = Field(default=None, description="Build start date")
+    pending: List[dict] = Field(default=[], description="Prediction changes written during the build")
+    predictions_count: int = Field(default=0, description="Number of aggregated predictions")
+    sketches: dict = Field(default={}, description="Value sketches by column")
+    categories: dict = Field(default={}, description="Value counts by column")
+    regression: dict = Field(default={}, description="Regression metrics accumulators")
+    confusion_matrix: dict = Field(default={}, description="Confusion matrix cells counts")
+
+    def __repr__(self) -> str:
+        return f"<ChartAggregate {self.chart_id}>"
+
+    def __str__(self) -> str:
+        return f"{self.chart_type} {self.chart_id}"
+
+    def __hash__(self) -> int:
+        return hash(self.chart_id)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChartAggregate):
+            return self.id == other.id
+        return False
+
+    class Settings:
+        name = "chart_aggregate"
+        indexes = [
+            IndexModel([("chart_id", ASCENDING)], name="chart_id", unique=True),
+            IndexModel([("monitored_model_id", ASCENDING)], name="monitored_model_id")
+        ]
@@ -3,6 +3,9 @@ from typing import Optional, Union, Dict
 from pathlib import Path
 from beanie import Document
 from pydantic import Field, HttpUrl
+from pymongo import IndexModel, ASCENDING, TEXT
+
+from app.models.dataset_profile import DatasetProfile
 
 
 class Dataset(Document):
@@ -21,6 +24,7 @@ class Dataset(Document):
     - **version** (str): Dataset version
     - **linked_iterations** (Dict): Linked iterations (key - iteration id, value - (project_id, experiment_id)
     - **pinned** (bool): Dataset pinned status
+    - **profile** (DatasetProfile): Dataset file fingerprint and content statistics
     """
     dataset_name: str = Field(description="Dataset name", min_length=1, max_length=40)
     path_to_dataset: str = Field(default='', description="Path to dataset")
@@ -32,6 +36,7 @@ class Dataset(Document):
     version: Optional[str] = Field(default='', description="Dataset version")
     linked_iterations: Optional[Dict] = Field(default_factory=dict, description="Linked iterations")
     pinned: bool = Field(default=False, description="Dataset pinned status")
+    profile: Optional[DatasetProfile] = Field(default=None, description="Dataset file fingerprint and statistics")
 
     def __repr__(self) -> str:
         return f"<Dataset {self.dataset_name}>"
@@ -49,6 +54,14 @@ class Dataset(Document):
 
     class Settings:
         name = "dataset"
+        indexes = [
+            IndexModel([("dataset_name", ASCENDING), ("version", ASCENDING)], name="dataset_name_version", unique=True),
+            IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)], name="created_at_id"),
+            IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)], name="updated_at_id"),
+            IndexModel([("dataset_name", ASCENDING), ("_id", ASCENDING)], name="dataset_name_id"),
+            IndexModel([("dataset_name", TEXT), ("dataset_description", TEXT)], name="dataset_name_description_text"),
+            IndexModel([("profile.content_hash", ASCENDING)], name="profile_content_hash", sparse=True)
+        ]
 
     class Config:
         schema_extra = {
@@ -77,6 +90,7 @@ class UpdateDataset(Dataset):
     - **version (str)**: Dataset version
     - **updated_at (datetime)**: Date and time of dataset update
     - **pinned (bool)**: Dataset pinned status
+    - **profile (DatasetProfile)**: Dataset file fingerprint and content statistics
     """
 
     dataset_name: Optional[str]
@@ -87,6 +101,7 @@ class UpdateDataset(Dataset):
     version: Optional[str]
     updated_at: datetime = Field(default_factory=datetime.now)
     pinned: Optional[bool]
+    profile: Optional[DatasetProfile]
 
     class Config:
         schema_extra = {
@@ -99,4 +114,16 @@ class UpdateDataset(Dataset):
                 "version": "1.0.0",
                 "pinned": False
             }
-        }
\ No newline at end of file
+        }
+
+
+class DisplayDataset(Dataset):
+    """
+    Display dataset model, dataset without linked iterations.
+
+    Attributes:
+    - **iterations_count (int)**: Number of iterations using the dataset.
+    """
+
+    linked_iterations: Optional[Dict] = Field(default=None, exclude=True)
+    iterations_count: int = Field(default=0, description="Number of iterations")
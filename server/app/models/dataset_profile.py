@@ -0,0 +1,52 @@
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+
+
+class ColumnProfile(BaseModel):
+    """
+    Statistics of dataset column computed by the client library.
+
+    Attributes:
+    - **name (str)**: Column name.
+    - **dtype (Optional[str])**: Column dtype, e.g. 'int64', 'float64' or 'object'.
+    - **count (int)**: Number of non-null values.
+    - **null_count (int)**: Number of null values.
+    - **min (Any)**: Minimum value, None if values can not be compared.
+    - **max (Any)**: Maximum value, None if values can not be compared.
+    - **quantiles (Optional[List[float]])**: Approximate quantiles of numeric column at profile quantile levels.
+    """
+    name: str = Field(..., description="Column name")
+    dtype: Optional[str] = Field(default=None, description="Column dtype")
+    count: int = Field(default=0, description="Number of non-null values")
+    null_count: int = Field(default=0, description="Number of null values")
+    min: Any = Field(default=None, description="Minimum value")
+    max: Any = Field(default=None, description="Maximum value")
+    quantiles: Optional[List[float]] = Field(default=None, description="Approximate quantiles of numeric column")
+
+
+class DatasetProfile(BaseModel):
+    """
+    Fingerprint and content statistics of dataset file, computed by the client library while streaming the file.
+
+    Attributes:
+    - **content_hash (str)**: SHA-256 hash of the file.
+    - **size (int)**: File size in bytes.
+    - **format (str)**: File format, 'csv' or 'parquet'.
+    - **rows_count (int)**: Number of rows.
+    - **columns_count (int)**: Number of columns.
+    - **quantile_levels (List[float])**: Levels of quantiles of numeric columns.
+    - **columns (List[ColumnProfile])**: Statistics of columns.
+    """
+    content_hash: str = Field(..., description="SHA-256 hash of the file", regex="^[0-9a-f]{64}$")
+    size: int = Field(default=0, description="File size in bytes")
+    format: str = Field(default='csv', description="File format")
+    rows_count: int = Field(default=0, description="Number of rows")
+    columns_count: int = Field(default=0, description="Number of columns")
+    quantile_levels: List[float] = Field(default=[], description="Levels of quantiles of numeric columns")
+    columns: List[ColumnProfile] = Field(default=[], description="Statistics of columns")
+
+    def __repr__(self) -> str:
+        return f"<DatasetProfile {self.content_hash}>"
+
+    def __str__(self) -> str:
+        return self.content_hash
@@ -0,0 +1,48 @@
+from datetime import datetime
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import IndexModel, ASCENDING
+
+
+class DriftBucket(Document):
+    """
+    Incrementally maintained sketches of monitored model prediction inputs made in one time bucket, used to compute
+    data drift.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Drift bucket id.
+    - **monitored_model_id (PydanticObjectId)**: Monitored model id.
+    - **bucket_start (datetime)**: Start of the time bucket, buckets are DRIFT_BUCKET_SECONDS long.
+    - **predictions_count (int)**: Number of predictions made in the time bucket.
+    - **sketches (dict)**: Value sketches (count, sum, sum of squares, min, max and logarithmic buckets) of numeric
+      values by column.
+    - **categories (dict)**: Value counts of string and boolean values by column.
+    - **migrated (bool)**: Are predictions made before drift buckets were introduced added to the bucket.
+    """
+    monitored_model_id: PydanticObjectId = Field(..., description="Monitored model id")
+    bucket_start: datetime = Field(..., description="Start of the time bucket")
+    predictions_count: int = Field(default=0, description="Number of predictions made in the time bucket")
+    sketches: dict = Field(default={}, description="Value sketches by column")
+    categories: dict = Field(default={}, description="Value counts by column")
+    migrated: bool = Field(default=False, description="Are predictions made before drift buckets were introduced added")
+
+    def __repr__(self) -> str:
+        return f"<DriftBucket {self.monitored_model_id} {self.bucket_start}>"
+
+    def __str__(self) -> str:
+        return f"{self.monitored_model_id} {self.bucket_start}"
+
+    def __hash__(self) -> int:
+        return hash((self.monitored_model_id, self.bucket_start))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DriftBucket):
+            return self.id == other.id
+        return False
+
+    class Settings:
+        name = "drift_bucket"
+        indexes = [
+            IndexModel([("monitored_model_id", ASCENDING), ("bucket_start", ASCENDING)],
+                       name="monitored_model_id_bucket_start", unique=True)
+        ]
@@ -74,3 +74,28 @@ class UpdateExperiment(Experiment):
                 "description": "Predicting if the passenger survived the Titanic disaster."
             }
         }
+
+
+class DisplayExperiment(BaseModel):
+    """
+    Display experiment model, experiment without iterations.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Experiment ID.
+    - **project_id (PydanticObjectId)**: Project ID.
+    - **name (str)**: Experiment title.
+    - **description (Optional[str])**: Experiment description.
+    - **created_at (datetime)**: Experiment creation date.
+    - **updated_at (Optional[datetime])**: Experiment last update date.
+    - **iterations_count (int)**: Number of iterations in the experiment.
+    - **last_activity_at (datetime)**: Date of the last update of the experiment or the last iteration added to it.
+    """
+
+    id: PydanticObjectId = Field(..., alias="id")
+    project_id: Optional[PydanticObjectId] = Field(default=None, alias="project_id")
+    name: str = Field(..., description="Experiment title")
+    description: Optional[str] = Field(default="", description="Experiment description")
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    iterations_count: int = Field(default=0, description="Number of iterations")
+    last_activity_at: Optional[datetime] = Field(default=None, description="Date of the last activity")
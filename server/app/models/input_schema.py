@@ -0,0 +1,128 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from app.config.config import settings
+
+
+class ColumnSchema(BaseModel):
+    """
+    Schema of monitored model input data column inferred from predictions.
+
+    Attributes:
+    - **name (str)**: Column name.
+    - **types (Dict[str, int])**: Number of non-null values by type ('numeric', 'string', 'boolean' or 'other').
+    - **values (list)**: Distinct observed values, at most INPUT_SCHEMA_MAX_VALUES.
+    """
+    name: str = Field(..., description="Column name")
+    types: Dict[str, int] = Field(default={}, description="Number of non-null values by type")
+    values: list = Field(default=[], description="Distinct observed values")
+
+    @property
+    def count(self) -> int:
+        return sum(self.types.values())
+
+    @property
+    def dtype(self) -> str:
+        """
+        Column dtype: 'null' if there are only null values, value type if all non-null values have the same type,
+        'mixed' otherwise.
+        """
+        types = [value_type for value_type, count in self.types.items() if count > 0]
+        if not types:
+            return 'null'
+        return types[0] if len(types) == 1 else 'mixed'
+
+    def __repr__(self) -> str:
+        return f"<ColumnSchema {self.name} {self.dtype}>"
+
+    def __str__(self) -> str:
+        return f"{self.name} {self.dtype}"
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnSchema):
+            return self.name == other.name and self.types == other.types
+        return False
+
+
+class InputSchema(BaseModel):
+    """
+    Input data schema of monitored model, maintained incrementally as predictions arrive.
+    Prediction and actual values are tracked as 'prediction' and 'actual' columns.
+
+    Attributes:
+    - **rows (int)**: Number of predictions included in the schema.
+    - **columns (Dict[str, ColumnSchema])**: Column schemas by encoded column name.
+    """
+    rows: int = Field(default=0, description="Number of predictions included in the schema")
+    columns: Dict[str, ColumnSchema] = Field(default={}, description="Column schemas by encoded column name")
+
+    class Settings:
+        output_columns = ['prediction', 'actual']
+
+    def get_column(self, name: str) -> Optional[ColumnSchema]:
+        """
+        Get column schema by column name.
+
+        Args:
+            name: Column name.
+
+        Returns:
+            Column schema or None if column was never observed.
+        """
+        return next((column for column in self.columns.values() if column.name == name), None)
+
+    def is_numeric(self, name: str) -> bool:
+        """
+        Check if column is numeric. Actual values are always numeric, missing ones are treated as NaN.
+
+        Args:
+            name: Column name.
+
+        Returns:
+            True if all non-null values of the column are numbers or booleans.
+        """
+        if name == 'actual':
+            return True
+        column = self.get_column(name)
+        return column is not None and column.dtype in ('numeric', 'boolean')
+
+    def is_string(self, name: str) -> bool:
+        """
+        Check if column is string.
+
+        Args:
+            name: Column name.
+
+        Returns:
+            True if all non-null values of the column are strings.
+        """
+        column = self.get_column(name)
+        return column is not None and column.dtype == 'string'
+
+    def summary(self) -> List[dict]:
+        """
+        Get summary of column schemas.
+
+        Returns:
+            List of column name, dtype, nullability, number of nulls, observed cardinality and flag if cardinality
+            reached INPUT_SCHEMA_MAX_VALUES, so it is only a lower bound.
+        """
+        return [
+            {
+                'name': column.name,
+                'dtype': column.dtype,
+                'nullable': column.count < self.rows,
+                'null_count': self.rows - column.count,
+                'cardinality': len(column.values),
+                'cardinality_exceeded': len(column.values) >= settings.INPUT_SCHEMA_MAX_VALUES
+            } for column in self.columns.values()
+        ]
+
+    def __repr__(self) -> str:
+        return f"<InputSchema {list(column.name for column in self.columns.values())}>"
+
+    def __str__(self) -> str:
+        return ", ".join(str(column) for column in self.columns.values())
@@ -1,7 +1,7 @@
 import getpass
 from pydantic import Field, BaseModel
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from beanie import PydanticObjectId
 from app.models.chart import InteractiveChart
 from app.models.image_chart import ImageChart
@@ -42,7 +42,9 @@ class Iteration(BaseModel):
     - **image_charts (Optional[List[ImageChart]])**: Image charts list.
     - **assigned_monitored_model_id (Optional[PydanticObjectId])**: Assigned monitored model id.
     - **assigned_monitored_model_name (Optional[str])**: Assigned monitored model name.
-    - **encoded_ml_model (Optional[str])**: Encoded ml model.
+    - **encoded_ml_model (Optional[str])**: Encoded ml model, accepted on iteration creation only. It is moved into
+      the artifact store and replaced by ml_model_artifact_id.
+    - **ml_model_artifact_id (Optional[str])**: Artifact id of pickled ml model, e.g. uploaded with artifact upload.
     """
 
     id: PydanticObjectId = Field(default_factory=PydanticObjectId, alias="id")
@@ -62,6 +64,7 @@ class Iteration(BaseModel):
     assigned_monitored_model_id: Optional[PydanticObjectId] = Field(default=None, alias="assigned_monitored_model_id")
     assigned_monitored_model_name: Optional[str] = Field(default=None, alias="assigned_monitored_model_name")
     encoded_ml_model: Optional[str] = Field(default=None, description="Encoded ml model")
+    ml_model_artifact_id: Optional[str] = Field(default=None, description="Artifact id of pickled ml model")
 
     def __repr__(self) -> str:
         return f"<Iteration {self.iteration_name}>"
@@ -133,3 +136,99 @@ class UpdateIteration(Iteration):
                         "assigned_monitored_model_name": "Model name"
                     }
                 }
+
+
+class BulkIterationResult(BaseModel):
+    """
+    Status of iteration added with bulk request.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Iteration id.
+    - **iteration_name (str)**: Iteration title.
+    - **status_code (int)**: HTTP status code, 201 if iteration was added.
+    - **detail (Optional[str])**: Error detail if iteration was not added.
+    """
+    id: PydanticObjectId = Field(..., alias="id")
+    iteration_name: str = Field(..., description="Iteration title")
+    status_code: int = Field(..., description="HTTP status code")
+    detail: Optional[str] = Field(default=None, description="Error detail")
+
+
+class IterationValueFilter(BaseModel):
+    """
+    Filter of metric or parameter value of iteration, all given conditions must be met.
+
+    Attributes:
+    - **eq (Optional[Any])**: Value is equal to.
+    - **ne (Optional[Any])**: Value is not equal to.
+    - **gt (Optional[Any])**: Value is greater than.
+    - **gte (Optional[Any])**: Value is greater than or equal to.
+    - **lt (Optional[Any])**: Value is less than.
+    - **lte (Optional[Any])**: Value is less than or equal to.
+    - **in_ (Optional[List[Any]])**: Value is one of, 'in' in request.
+    """
+    eq: Optional[Any] = Field(default=None, description="Value is equal to")
+    ne: Optional[Any] = Field(default=None, description="Value is not equal to")
+    gt: Optional[Any] = Field(default=None, description="Value is greater than")
+    gte: Optional[Any] = Field(default=None, description="Value is greater than or equal to")
+    lt: Optional[Any] = Field(default=None, description="Value is less than")
+    lte: Optional[Any] = Field(default=None, description="Value is less than or equal to")
+    in_: Optional[List[Any]] = Field(default=None, alias="in", description="Value is one of")
+
+
+class IterationQuery(BaseModel):
+    """
+    Query of iterations of experiment.
+
+    Attributes:
+    - **metrics (Dict[str, IterationValueFilter])**: Filters of metrics by metric name.
+    - **parameters (Dict[str, IterationValueFilter])**: Filters of parameters by parameter name.
+    - **user_name (Optional[str])**: Username.
+    - **dataset_id (Optional[PydanticObjectId])**: Dataset id.
+    - **date_from (Optional[datetime])**: Minimum iteration creation date.
+    - **date_to (Optional[datetime])**: Maximum iteration creation date.
+    - **sort_by (str)**: Sort field, 'created_at', 'iteration_name', 'user_name', 'metrics.<name>' or
+      'parameters.<name>'.
+    - **order (str)**: Sort order, 'asc' or 'desc'.
+    - **limit (int)**: Maximum number of iterations in page (1-1000).
+    - **offset (int)**: Number of skipped iterations.
+    - **cursor (Optional[str])**: Cursor of the page returned with previous page.
+    - **fields (Optional[List[str]])**: Returned fields, e.g. 'iteration_name' or 'metrics.accuracy'. All fields
+      except charts by default.
+    """
+    metrics: Dict[str, IterationValueFilter] = Field(default={}, description="Filters of metrics")
+    parameters: Dict[str, IterationValueFilter] = Field(default={}, description="Filters of parameters")
+    user_name: Optional[str] = Field(default=None, description="User name")
+    dataset_id: Optional[PydanticObjectId] = Field(default=None, description="Dataset id")
+    date_from: Optional[datetime] = Field(default=None, description="Minimum iteration creation date")
+    date_to: Optional[datetime] = Field(default=None, description="Maximum iteration creation date")
+    sort_by: str = Field(default="created_at", description="Sort field")
+    order: str = Field(default="asc", regex="^(asc|desc)$", description="Sort order")
+    limit: int = Field(default=100, ge=1, le=1000, description="Maximum number of iterations in page")
+    offset: int = Field(default=0, ge=0, description="Number of skipped iterations")
+    cursor: Optional[str] = Field(default=None, description="Cursor of the page")
+    fields: Optional[List[str]] = Field(default=None, description="Returned fields")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "parameters": {"lr": {"lt": 0.01}},
+                "metrics": {"val_auc": {"gte": 0.8}},
+                "sort_by": "metrics.val_auc",
+                "order": "desc",
+                "limit": 10,
+                "fields": ["iteration_name", "metrics", "parameters"]
+            }
+        }
+
+
+class IterationsPage(BaseModel):
+    """
+    Page of iterations matching query.
+
+    Attributes:
+    - **iterations (List[dict])**: Iterations with requested fields.
+    - **next_cursor (Optional[str])**: Cursor of the next page, None if there are no more iterations.
+    """
+    iterations: List[dict] = Field(default=[], description="Iterations")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor of the next page")
@@ -0,0 +1,101 @@
+import getpass
+from datetime import datetime
+from typing import Optional, List
+
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import IndexModel, ASCENDING
+
+from app.models.chart import InteractiveChart
+from app.models.image_chart import ImageChart
+from app.models.iteration import Iteration, DatasetInIteration
+
+
+class IterationDocument(Document):
+    """
+    Iteration of experiment stored in its own collection.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Iteration id.
+    - **experiment_id (PydanticObjectId)**: Experiment id.
+    - **project_id (PydanticObjectId)**: Project id.
+    - **experiment_name (str)**: Experiment name.
+    - **project_title (str)**: Project title.
+    - **user_name (str)**: Username.
+    - **iteration_name (str)**: Iteration title.
+    - **created_at (datetime)**: Iteration creation date.
+    - **metrics (Optional[dict])**: Iteration metrics.
+    - **parameters (Optional[dict])**: Iteration parameters.
+    - **path_to_model (Optional[str])**: Path to model.
+    - **dataset (Optional[DatasetInIteration])**: Dataset.
+    - **interactive_charts (Optional[List[InteractiveChart]])**: Interactive charts list.
+    - **image_charts (Optional[List[ImageChart]])**: Image charts list.
+    - **assigned_monitored_model_id (Optional[PydanticObjectId])**: Assigned monitored model id.
+    - **assigned_monitored_model_name (Optional[str])**: Assigned monitored model name.
+    - **ml_model_artifact_id (Optional[str])**: Artifact id of pickled ml model.
+    """
+    experiment_id: PydanticObjectId = Field(..., description="Experiment id")
+    project_id: PydanticObjectId = Field(..., description="Project id")
+    experiment_name: Optional[str] = Field(default=None, description="Experiment name")
+    project_title: Optional[str] = Field(default=None, description="Project title")
+    user_name: str = Field(default=getpass.getuser(), description="User name")
+    iteration_name: str = Field(..., description="Iteration title")
+    created_at: datetime = Field(default_factory=datetime.now)
+    metrics: Optional[dict] = Field(default=None, description="Iteration metrics")
+    parameters: Optional[dict] = Field(default=None, description="Iteration parameters")
+    path_to_model: Optional[str] = Field(default='', description="Path to model")
+    dataset: Optional[DatasetInIteration] = Field(default=None, description="Dataset")
+    interactive_charts: Optional[List[InteractiveChart]] = Field(default=[], description="Interactive charts list")
+    image_charts: Optional[List[ImageChart]] = Field(default=[], description="Image charts list")
+    assigned_monitored_model_id: Optional[PydanticObjectId] = Field(default=None)
+    assigned_monitored_model_name: Optional[str] = Field(default=None)
+    ml_model_artifact_id: Optional[str] = Field(default=None, description="Artifact id of pickled ml model")
+
+    @classmethod
+    def from_iteration(cls, iteration: Iteration) -> 'IterationDocument':
+        """
+        Create iteration document from iteration added to experiment.
+
+        Args:
+            iteration: Iteration, with encoded ml model already moved into the artifact store.
+
+        Returns:
+            Iteration document with the same id as iteration.
+        """
+        return cls(id=iteration.id, **iteration.dict(exclude={"id", "encoded_ml_model"}))
+
+    def to_iteration(self) -> Iteration:
+        """
+        Convert iteration document to iteration of experiment.
+
+        Returns:
+            Iteration.
+        """
+        return Iteration(**self.dict(exclude={"id", "revision_id"}), id=self.id)
+
+    def __repr__(self) -> str:
+        return f"<IterationDocument {self.iteration_name}>"
+
+    def __str__(self) -> str:
+        return self.iteration_name
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IterationDocument):
+            return self.id == other.id
+        return False
+
+    class Settings:
+        name = "iteration"
+        indexes = [
+            IndexModel([("project_id", ASCENDING), ("experiment_id", ASCENDING), ("created_at", ASCENDING)],
+                       name="project_id_experiment_id_created_at"),
+            IndexModel([("experiment_id", ASCENDING), ("iteration_name", ASCENDING)],
+                       name="experiment_id_iteration_name"),
+            IndexModel([("created_at", ASCENDING)], name="created_at"),
+            IndexModel([("dataset.id", ASCENDING)], name="dataset_id", sparse=True),
+            IndexModel([("metrics.$**", ASCENDING)], name="metrics"),
+            IndexModel([("parameters.$**", ASCENDING)], name="parameters")
+        ]
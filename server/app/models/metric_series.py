@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import List, Optional, Dict
+
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field, root_validator
+from pymongo import IndexModel, ASCENDING
+
+
+class MetricSeries(Document):
+    """
+    Bucket of step-wise metric values of iteration, stored as parallel arrays. Points of one metric are appended
+    to the bucket until it holds METRIC_SERIES_BUCKET_SIZE points, then new bucket is created.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Metric series bucket id.
+    - **iteration_id (PydanticObjectId)**: Iteration id, iteration may not be added yet while it is running.
+    - **experiment_id (PydanticObjectId)**: Experiment id.
+    - **project_id (PydanticObjectId)**: Project id.
+    - **name (str)**: Metric name.
+    - **points_count (int)**: Number of points in the bucket.
+    - **steps (List[int])**: Steps of the points.
+    - **values (List[Optional[float]])**: Metric values of the points.
+    - **timestamps (List[datetime])**: Timestamps of the points.
+    """
+    iteration_id: PydanticObjectId = Field(..., description="Iteration id")
+    experiment_id: PydanticObjectId = Field(..., description="Experiment id")
+    project_id: PydanticObjectId = Field(..., description="Project id")
+    name: str = Field(..., description="Metric name")
+    points_count: int = Field(default=0, description="Number of points in the bucket")
+    steps: List[int] = Field(default=[], description="Steps of the points")
+    values: List[Optional[float]] = Field(default=[], description="Metric values of the points")
+    timestamps: List[datetime] = Field(default=[], description="Timestamps of the points")
+
+    def __repr__(self) -> str:
+        return f"<MetricSeries {self.name}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MetricSeries):
+            return self.id == other.id
+        return False
+
+    class Settings:
+        name = "metric_series"
+        indexes = [
+            IndexModel([("iteration_id", ASCENDING), ("name", ASCENDING), ("points_count", ASCENDING)],
+                       name="iteration_id_name_points_count"),
+            IndexModel([("experiment_id", ASCENDING)], name="experiment_id")
+        ]
+
+
+class MetricPoints(BaseModel):
+    """
+    Step-wise metric values as parallel arrays.
+
+    Attributes:
+    - **steps (List[int])**: Steps of the points.
+    - **values (List[Optional[float]])**: Metric values of the points.
+    - **timestamps (Optional[List[datetime]])**: Timestamps of the points, time of the request by default.
+    """
+    steps: List[int] = Field(..., description="Steps of the points")
+    values: List[Optional[float]] = Field(..., description="Metric values of the points")
+    timestamps: Optional[List[datetime]] = Field(default=None, description="Timestamps of the points")
+
+    @root_validator(skip_on_failure=True)
+    def check_lengths(cls, values: dict) -> dict:
+        if len(values["values"]) != len(values["steps"]):
+            raise ValueError("Steps and values must have the same length.")
+        if values["timestamps"] is not None and len(values["timestamps"]) != len(values["steps"]):
+            raise ValueError("Steps and timestamps must have the same length.")
+        return values
+
+
+class MetricPointsBatch(BaseModel):
+    """
+    Batch of step-wise metric values logged during iteration.
+
+    Attributes:
+    - **metrics (Dict[str, MetricPoints])**: Points by metric name.
+    """
+    metrics: Dict[str, MetricPoints] = Field(..., description="Points by metric name")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "metrics": {
+                    "loss": {
+                        "steps": [1, 2, 3],
+                        "values": [0.9, 0.7, 0.6],
+                        "timestamps": ["2023-11-01T12:00:00", "2023-11-01T12:00:10", "2023-11-01T12:00:20"]
+                    }
+                }
+            }
+        }
+
+
+class DownsampledMetricSeries(MetricPoints):
+    """
+    Metric series of iteration sorted by step, downsampled to requested number of points.
+
+    Attributes:
+    - **count (int)**: Number of points in the whole series.
+    """
+    count: int = Field(..., description="Number of points in the whole series")
@@ -6,7 +6,9 @@ from typing import Optional, List, Set, Tuple
 from beanie import Document
 from fastapi import HTTPException, status
 from datetime import datetime
+from pymongo import IndexModel, ASCENDING, TEXT
 
+from app.models.input_schema import InputSchema
 from app.models.iteration import Iteration
 from app.models.monitored_model_chart import MonitoredModelInteractiveChart
 from app.models.prediction_data import PredictionData
@@ -23,7 +25,13 @@ class MonitoredModel(Document):
     - **model_status (str)**: Monitored model status.
     - **iteration (Iteration)**: Related Iteration.
     - **pinned (bool)**: Monitored model pinned status.
-    - **predictions_data (list[dict])**: Predictions data list of rows as dicts.
+    - **batch_predictions (bool)**: Coalesce concurrent predictions into batches.
+    - **validate_input (bool)**: Reject input data not matching input schema before making prediction.
+    - **predictions_data (list[dict])**: Predictions data list of rows as dicts, accepted on creation only. Responses
+      do not include stored predictions, they are returned page by page by GET /{id}/predictions.
+    - **input_schema (InputSchema)**: Input data schema inferred from predictions.
+    - **drift_buckets_since (datetime)**: Predictions made since this date are added to drift buckets as they are made,
+      older predictions of monitored models created before drift buckets were introduced are added by the migration.
     - **interactive_charts (list[MonitoredModelInteractiveChart])**: Interactive charts
     - **interactive_charts_existed (Set[Tuple[str, Optional[str], Optional[Tuple[str]]]])**: Interactive charts existed pairs of columns
     - **created_at (datetime)**: Monitored model creation date.
@@ -34,7 +42,12 @@ class MonitoredModel(Document):
     model_status: str = Field(default='idle', description="Model status")
     iteration: Optional[Iteration] = Field(default=None, description="Iteration")
     pinned: bool = Field(default=False, description="Model pinned status")
+    batch_predictions: bool = Field(default=False, description="Coalesce concurrent predictions into batches")
+    validate_input: bool = Field(default=False, description="Reject input data not matching input schema")
     predictions_data: Optional[list[PredictionData]] = Field(default=[], description="Predictions data")
+    input_schema: InputSchema = Field(default_factory=InputSchema, description="Input data schema")
+    drift_buckets_since: datetime = Field(default_factory=datetime.now,
+                                          description="Date since predictions are added to drift buckets as made")
     interactive_charts: Optional[list[MonitoredModelInteractiveChart]] = Field(default=[], description="Interactive "
                                                                                                        "charts")
     interactive_charts_existed: Optional[List[Tuple[str, Optional[str], Optional[List[str]]]]] = Field(default=[], description="Interactive charts existed pairs of columns")
@@ -67,6 +80,15 @@ class MonitoredModel(Document):
     class Settings:
         name = "monitored_model"
         valid_statuses = ['active', 'idle', 'archived']
+        indexes = [
+            IndexModel([("model_name", ASCENDING)], name="model_name", unique=True),
+            IndexModel([("model_status", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)],
+                       name="model_status_created_at_id"),
+            IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)], name="created_at_id"),
+            IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)], name="updated_at_id"),
+            IndexModel([("model_name", ASCENDING), ("_id", ASCENDING)], name="model_name_id"),
+            IndexModel([("model_name", TEXT), ("model_description", TEXT)], name="model_name_description_text")
+        ]
 
     class Config:
         schema_extra = {
@@ -106,6 +128,8 @@ class UpdateMonitoredModel(MonitoredModel):
     - **model_status (str)**: Monitored model status.
     - **iteration (Iteration)**: Related Iteration.
     - **pinned (bool)**: Monitored model pinned status.
+    - **batch_predictions (bool)**: Coalesce concurrent predictions into batches.
+    - **validate_input (bool)**: Reject input data not matching input schema before making prediction.
     - **predictions_data (list[dict])**: Predictions data list of rows as dicts.
     - **updated_at (datetime)**: Monitored model last update date.
     """
@@ -114,6 +138,8 @@ class UpdateMonitoredModel(MonitoredModel):
     model_status: Optional[str]
     iteration: Optional[Iteration]
     pinned: Optional[bool]
+    batch_predictions: Optional[bool]
+    validate_input: Optional[bool]
     predictions_data: Optional[list[PredictionData]]
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import Union, List, Optional
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING
+
+from app.models.prediction_data import PredictionData
+
+
+class Prediction(Document):
+    """
+    Prediction of monitored model stored in its own collection.
+
+    Attributes:
+    - **id (PydanticObjectId)**: Prediction id.
+    - **monitored_model_id (PydanticObjectId)**: Monitored model id.
+    - **prediction_date (datetime)**: Prediction date.
+    - **input_data (dict)**: Input data.
+    - **prediction (Union[float, int])**: Prediction.
+    - **actual (Union[float, int])**: Actual.
+    - **revision (int)**: Number of writes of the prediction, incremented when actual value is set. Chart aggregate
+      builds record the revision they aggregated in 'aggregated.<chart id>', so concurrent writes are aggregated once.
+    """
+    monitored_model_id: PydanticObjectId = Field(..., description="Monitored model id")
+    prediction_date: datetime = Field(default_factory=datetime.now)
+    input_data: dict
+    prediction: Union[float, int]
+    actual: Union[float, int] = Field(default=None)
+    revision: int = Field(default=1, description="Number of writes of the prediction")
+
+    @classmethod
+    def from_prediction_data(cls, monitored_model_id: PydanticObjectId, prediction_data: PredictionData) \
+            -> 'Prediction':
+        """
+        Create prediction document from prediction data of monitored model.
+
+        Args:
+            monitored_model_id: Monitored model id.
+            prediction_data: Prediction data.
+
+        Returns:
+            Prediction document with the same id as prediction data.
+        """
+        return cls(
+            id=prediction_data.id,
+            monitored_model_id=monitored_model_id,
+            prediction_date=prediction_data.prediction_date,
+            input_data=prediction_data.input_data,
+            prediction=prediction_data.prediction,
+            actual=prediction_data.actual
+        )
+
+    def to_prediction_data(self) -> PredictionData:
+        """
+        Convert prediction document to prediction data of monitored model.
+
+        Returns:
+            Prediction data.
+        """
+        return PredictionData(
+            id=self.id,
+            prediction_date=self.prediction_date,
+            input_data=self.input_data,
+            prediction=self.prediction,
+            actual=self.actual
+        )
+
+    def __repr__(self) -> str:
+        return f"<Prediction {self.prediction_date} {self.input_data} {self.prediction}>"
+
+    def __str__(self) -> str:
+        return f"{self.prediction_date} {self.input_data} {self.prediction}"
+
+    def __hash__(self) -> int:
+        return hash(self.prediction_date)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Prediction):
+            return self.id == other.id
+        return False
+
+    class Settings:
+        name = "prediction"
+        indexes = [
+            IndexModel([("monitored_model_id", ASCENDING), ("prediction_date", ASCENDING), ("_id", ASCENDING)],
+                       name="monitored_model_id_prediction_date")
+        ]
+
+
+class PredictionsPage(BaseModel):
+    """
+    Page of monitored model predictions.
+
+    Attributes:
+    - **predictions (List[dict])**: Predictions data with requested fields.
+    - **next_cursor (Optional[str])**: Cursor of the next page, None if there are no more predictions.
+    """
+    predictions: List[dict] = Field(default=[], description="Predictions data")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor of the next page")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "predictions": [
+                    {
+                        "id": "5f9b3b7e9c9d6c0a3c7b3b7e",
+                        "prediction_date": "2023-11-20T12:00:00",
+                        "input_data": {"X1": 1.0, "X2": 2.0},
+                        "prediction": 7.89,
+                        "actual": None
+                    }
+                ],
+                "next_cursor": "MjAyMy0xMS0yMFQxMjowMDowMHw1ZjliM2I3ZTljOWQ2YzBhM2M3YjNiN2U="
+            }
+        }
@@ -3,6 +3,7 @@ from pydantic import Field, validator
 from typing import Optional, List
 from datetime import datetime
 from fastapi import HTTPException, status
+from pymongo import IndexModel, ASCENDING, TEXT
 
 from app.models.experiment import Experiment
 
@@ -58,6 +59,13 @@ class Project(Document):
     class Settings:
         name = "project"
         valid_statuses = ['not_started', 'in_progress', 'completed']
+        indexes = [
+            IndexModel([("title", ASCENDING)], name="title", unique=True),
+            IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)], name="created_at_id"),
+            IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)], name="updated_at_id"),
+            IndexModel([("title", ASCENDING), ("_id", ASCENDING)], name="title_id"),
+            IndexModel([("title", TEXT), ("description", TEXT)], name="title_description_text")
+        ]
 
     class Config:
         schema_extra = {
@@ -117,9 +125,13 @@ class DisplayProject(Project):
     - **created_at (datetime)**: Project creation date.
     - **updated_at (datetime)**: Project last update date.
     - **experiments (List[str])**: List of experiments in the project.
+    - **iterations_count (int)**: Number of iterations in the project.
+    - **last_activity_at (datetime)**: Date of the last update of the project or the last iteration added to it.
     """
 
     experiments: List[str] = []
+    iterations_count: int = Field(default=0, description="Number of iterations")
+    last_activity_at: Optional[datetime] = Field(default=None, description="Date of the last activity")
 
     class Config:
         schema_extra = {
@@ -0,0 +1,176 @@
+from datetime import datetime
+
+from beanie import PydanticObjectId
+from fastapi import APIRouter, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.models.artifact_upload import ArtifactUpload
+from app.routers.exceptions.artifact import artifact_not_found_exception, artifact_upload_not_found_exception, \
+    artifact_upload_completed_exception, artifact_upload_offset_mismatch_exception, \
+    artifact_upload_size_exceeded_exception, artifact_upload_incomplete_exception, artifact_upload_checksum_exception
+from app.utils.artifact_store import ArtifactChecksumError, ArtifactSizeExceededError, get_artifact_store
+
+artifact_router = APIRouter()
+
+
+@artifact_router.post("/uploads", response_model=ArtifactUpload, status_code=status.HTTP_201_CREATED)
+async def create_artifact_upload(artifact_upload: ArtifactUpload) -> ArtifactUpload:
+    """
+    Start resumable chunked upload of artifact. If artifact with given SHA-256 hash and size is already stored,
+    upload is completed immediately and no data needs to be sent.
+
+    Args:
+    - **artifact_upload (ArtifactUpload)**: Expected artifact size and SHA-256 hash, both optional.
+
+    Returns:
+    - **ArtifactUpload**: Created artifact upload.
+    """
+    artifact_upload.offset = 0
+    artifact_upload.artifact_id = None
+
+    if artifact_upload.sha256 is not None:
+        size = await get_artifact_store().size(artifact_upload.sha256)
+        if size is not None and artifact_upload.size in (None, size):
+            artifact_upload.artifact_id = artifact_upload.sha256
+            artifact_upload.size = artifact_upload.offset = size
+
+    return await artifact_upload.insert()
+
+
+@artifact_router.get("/uploads/{upload_id}", response_model=ArtifactUpload, status_code=status.HTTP_200_OK)
+async def get_artifact_upload(upload_id: PydanticObjectId) -> ArtifactUpload:
+    """
+    Get artifact upload, e.g. to find the offset of the next chunk when resuming interrupted upload.
+
+    Args:
+    - **upload_id (PydanticObjectId)**: Upload id
+
+    Returns:
+    - **ArtifactUpload**: Artifact upload.
+    """
+    artifact_upload = await ArtifactUpload.get(upload_id)
+    if not artifact_upload:
+        raise artifact_upload_not_found_exception()
+
+    return artifact_upload
+
+
+@artifact_router.patch("/uploads/{upload_id}", response_model=ArtifactUpload, status_code=status.HTTP_200_OK)
+async def upload_artifact_chunk(upload_id: PydanticObjectId, offset: int, request: Request) -> ArtifactUpload:
+    """
+    Append chunk of raw bytes sent in request body to artifact upload. Chunk offset must be equal to the current
+    upload offset, chunk which was interrupted can be sent again at the same offset.
+
+    Args:
+    - **upload_id (PydanticObjectId)**: Upload id
+    - **offset (int)**: Offset of the chunk.
+
+    Returns:
+    - **ArtifactUpload**: Artifact upload with updated offset.
+    """
+    artifact_upload = await ArtifactUpload.get(upload_id)
+    if not artifact_upload:
+        raise artifact_upload_not_found_exception()
+    if artifact_upload.artifact_id is not None:
+        raise artifact_upload_completed_exception()
+    if offset != artifact_upload.offset:
+        raise artifact_upload_offset_mismatch_exception(artifact_upload.offset)
+
+    # chunk is rejected before it is written if it is declared larger than the rest of the artifact,
+    # otherwise reading of the body stops as soon as it exceeds the rest of the artifact
+    max_size = None if artifact_upload.size is None else artifact_upload.size - offset
+    content_length = request.headers.get("content-length")
+    if max_size is not None and content_length is not None and content_length.isdigit() and \
+            int(content_length) > max_size:
+        raise artifact_upload_size_exceeded_exception(artifact_upload.size)
+
+    try:
+        written = await get_artifact_store().write_upload(str(upload_id), offset, request.stream(), max_size)
+    except ArtifactSizeExceededError:
+        raise artifact_upload_size_exceeded_exception(artifact_upload.size)
+
+    # offset is moved only if no other chunk was written at the same offset in the meantime
+    result = await ArtifactUpload.get_motor_collection().update_one(
+        {"_id": upload_id, "offset": offset, "artifact_id": None},
+        {"$set": {"offset": offset + written, "updated_at": datetime.now()}}
+    )
+    if result.modified_count == 0:
+        raise artifact_upload_offset_mismatch_exception((await ArtifactUpload.get(upload_id)).offset)
+
+    artifact_upload.offset = offset + written
+    return artifact_upload
+
+
+@artifact_router.post("/uploads/{upload_id}/complete", response_model=ArtifactUpload, status_code=status.HTTP_200_OK)
+async def complete_artifact_upload(upload_id: PydanticObjectId) -> ArtifactUpload:
+    """
+    Complete artifact upload and store uploaded data in the artifact store. Uploaded data is checked against
+    expected size and SHA-256 hash, upload which does not match its hash is removed.
+
+    Args:
+    - **upload_id (PydanticObjectId)**: Upload id
+
+    Returns:
+    - **ArtifactUpload**: Completed artifact upload with artifact id.
+    """
+    artifact_upload = await ArtifactUpload.get(upload_id)
+    if not artifact_upload:
+        raise artifact_upload_not_found_exception()
+    if artifact_upload.artifact_id is not None:
+        return artifact_upload
+    if artifact_upload.size is not None and artifact_upload.offset != artifact_upload.size:
+        raise artifact_upload_incomplete_exception(artifact_upload.offset, artifact_upload.size)
+
+    artifact_store = get_artifact_store()
+    try:
+        artifact_id, size = await artifact_store.complete_upload(str(upload_id), artifact_upload.sha256)
+    except ArtifactChecksumError as e:
+        await artifact_store.delete_upload(str(upload_id))
+        await artifact_upload.delete()
+        raise artifact_upload_checksum_exception(str(e))
+
+    await artifact_upload.set({ArtifactUpload.artifact_id: artifact_id, ArtifactUpload.size: size,
+                               ArtifactUpload.updated_at: datetime.now()})
+    return artifact_upload
+
+
+@artifact_router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_artifact_upload(upload_id: PydanticObjectId) -> None:
+    """
+    Abort artifact upload and remove uploaded data. Artifact of completed upload is kept.
+
+    Args:
+    - **upload_id (PydanticObjectId)**: Upload id
+
+    Returns:
+    - **None**
+    """
+    artifact_upload = await ArtifactUpload.get(upload_id)
+    if not artifact_upload:
+        raise artifact_upload_not_found_exception()
+
+    await get_artifact_store().delete_upload(str(upload_id))
+    await artifact_upload.delete()
+
+    return None
+
+
+@artifact_router.get("/{artifact_id}", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def download_artifact(artifact_id: str) -> StreamingResponse:
+    """
+    Download artifact, e.g. pickled ml model of iteration, by its id.
+
+    Args:
+    - **artifact_id (str)**: Artifact id (SHA-256 hash of artifact content)
+
+    Returns:
+    - **StreamingResponse**: Artifact content.
+    """
+    artifact_store = get_artifact_store()
+
+    size = await artifact_store.size(artifact_id) if artifact_store.is_artifact_id(artifact_id) else None
+    if size is None:
+        raise artifact_not_found_exception()
+
+    return StreamingResponse(artifact_store.stream(artifact_id), media_type="application/octet-stream",
+                             headers={"Content-Length": str(size), "ETag": f'"{artifact_id}"'})
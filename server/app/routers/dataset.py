@@ -1,71 +1,140 @@
 import os
-import requests
 import validators
 
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, status, HTTPException
+from fastapi import APIRouter, Depends, Response, status, HTTPException
 from beanie import PydanticObjectId
+from beanie.exceptions import RevisionIdWasChanged
+from pymongo.errors import DuplicateKeyError
 
-from app.models.dataset import Dataset, UpdateDataset
-from app.models.project import Project
+from app.models.dataset import Dataset, UpdateDataset, DisplayDataset
+from app.models.iteration_document import IterationDocument
+from app.models.monitored_model import MonitoredModel
 
 from app.routers.exceptions.dataset import dataset_not_found_exception, dataset_name_and_version_not_unique_exception
-from app.routers.exceptions.experiment import experiment_not_found_exception
-from app.routers.exceptions.iteration import iteration_not_found_exception
-from app.routers.exceptions.project import project_not_found_exception
+from app.utils.iteration import get_iterations_activity
+from app.utils.pagination import ListPage, find_page
+from app.utils.url_validator import url_validator
 
 dataset_router = APIRouter()
 
+DATASET_SORT_FIELDS = ['created_at', 'updated_at', 'dataset_name']
+
 
 @dataset_router.get("/", response_model=List[Dataset], status_code=status.HTTP_200_OK)
-async def get_datasets() -> List[Dataset]:
+async def get_datasets(response: Response, page: ListPage = Depends()) -> List[Dataset]:
     """
-    Retrieve all datasets.
+    Retrieve all datasets, sorted by creation date by default. <br>
+    **NOTE:** number of matching datasets is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of datasets in page (1-1000), all datasets if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'dataset_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[Dataset]**: List of datasets
     """
-
-    datasets = await Dataset.find_all().to_list()
+    documents = await find_page(Dataset.get_motor_collection(), response, {}, page, DATASET_SORT_FIELDS)
+    datasets = [Dataset.parse_obj(document) for document in documents]
 
     return datasets
 
 
 @dataset_router.get("/non-archived", response_model=List[Dataset], status_code=status.HTTP_200_OK)
-async def get_non_archived_datasets() -> List[Dataset]:
+async def get_non_archived_datasets(response: Response, page: ListPage = Depends()) -> List[Dataset]:
     """
-    Get all non-archived datasets.
+    Get all non-archived datasets, sorted by creation date by default. <br>
+    **NOTE:** number of matching datasets is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of datasets in page (1-1000), all datasets if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'dataset_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[Dataset]**: List of all non-archived datasets.
     """
-    datasets = await Dataset.find(Dataset.archived == False).to_list()
+    documents = await find_page(Dataset.get_motor_collection(), response, {"archived": False}, page,
+                                DATASET_SORT_FIELDS)
+    datasets = [Dataset.parse_obj(document) for document in documents]
+
     return datasets
 
 
 @dataset_router.get("/archived", response_model=List[Dataset], status_code=status.HTTP_200_OK)
-async def get_archived_datasets() -> List[Dataset]:
+async def get_archived_datasets(response: Response, page: ListPage = Depends()) -> List[Dataset]:
     """
-    Get all archived datasets.
+    Get all archived datasets, sorted by creation date by default. <br>
+    **NOTE:** number of matching datasets is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of datasets in page (1-1000), all datasets if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'dataset_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[Dataset]**: List of all archived datasets.
     """
-    datasets = await Dataset.find(Dataset.archived == True).to_list()
+    documents = await find_page(Dataset.get_motor_collection(), response, {"archived": True}, page,
+                                DATASET_SORT_FIELDS)
+    datasets = [Dataset.parse_obj(document) for document in documents]
+
     return datasets
 
 
+@dataset_router.get("/base", response_model=List[DisplayDataset], status_code=status.HTTP_200_OK)
+async def get_datasets_base(response: Response, page: ListPage = Depends(),
+                            archived: Optional[bool] = None) -> List[DisplayDataset]:
+    """
+    Retrieve base information about datasets, with number of iterations using the dataset instead of linked
+    iterations. Datasets are sorted by creation date by default. <br>
+    **NOTE:** number of matching datasets is returned in 'X-Total-Count' header.
+
+    Args:
+    - **limit (Optional[int])**: Maximum number of datasets in page (1-1000), all datasets if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'dataset_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
+    - **archived (Optional[bool])**: If set, return only archived (True) or non-archived (False) datasets
+
+    Returns:
+    - **List[DisplayDataset]**: List of base information about datasets
+    """
+    query = {} if archived is None else {"archived": archived}
+    datasets = await find_page(Dataset.get_motor_collection(), response, query, page, DATASET_SORT_FIELDS,
+                               {"linked_iterations": 0, "profile.columns": 0})
+
+    activity = await get_iterations_activity("dataset.id", [dataset["_id"] for dataset in datasets])
+
+    return [DisplayDataset(**dataset, iterations_count=activity.get(dataset["_id"], (0, None))[0])
+            for dataset in datasets]
+
+
+@dataset_router.get("/url-validation", response_model=dict, status_code=status.HTTP_200_OK)
+async def get_url_validation_stats() -> dict:
+    """
+    Get statistics of the cache of dataset URL validation results.
+
+    Args:
+    - **None**
+
+    Returns:
+    - **dict**: Cache size, maximum size, ttl, hits and misses.
+    """
+
+    return url_validator.stats()
+
+
 @dataset_router.get("/name/{name}", response_model=Dataset, status_code=status.HTTP_200_OK)
 async def get_dataset_by_name(name: str) -> Dataset:
     """
@@ -127,6 +196,24 @@ async def get_datasets_by_name(name: str) -> List[Dataset]:
     return datasets
 
 
+@dataset_router.get("/content-hash/{content_hash}", response_model=List[Dataset], status_code=status.HTTP_200_OK)
+async def get_datasets_by_content_hash(content_hash: str) -> List[Dataset]:
+    """
+    Retrieve datasets with the same file content, by content hash of their profiles, e.g. to find duplicates of
+    dataset before creating it.
+
+    Args:
+    - **content_hash (str)**: SHA-256 hash of dataset file
+
+    Returns:
+    - **List[Dataset]**: List of datasets, empty if there are no datasets with the content hash
+    """
+
+    datasets = await Dataset.find({"profile.content_hash": content_hash.lower()}).to_list()
+
+    return datasets
+
+
 @dataset_router.get("/{id}", response_model=Dataset, status_code=status.HTTP_200_OK)
 async def get_dataset(id: PydanticObjectId) -> Dataset:
     """
@@ -165,7 +252,12 @@ async def create_dataset(dataset: Dataset) -> Dataset:
     dataset.created_at = datetime.now()
     dataset.updated_at = datetime.now()
 
-    await dataset.insert()
+    try:
+        await dataset.insert()
+    except DuplicateKeyError:
+        # dataset with the same name and version added concurrently
+        raise dataset_name_and_version_not_unique_exception()
+
     return dataset
 
 
@@ -194,13 +286,20 @@ async def update_dataset(id: PydanticObjectId, updated_dataset: UpdateDataset) -
         await validate_path(updated_dataset.path_to_dataset)
 
     updated_dataset.updated_at = datetime.now()
+    name_or_version_changed = (dataset.dataset_name, dataset.version) != (
+        updated_dataset.dataset_name or dataset.dataset_name,
+        dataset.version if updated_dataset.version is None else updated_dataset.version)
 
-    if updated_dataset.dataset_name and updated_dataset.dataset_name != dataset.dataset_name:
-        await update_linked_iterations(dataset, updated_dataset)
-
-    await dataset.update({"$set": updated_dataset.dict(exclude_unset=True)})
+    try:
+        await dataset.update({"$set": updated_dataset.dict(exclude_unset=True)})
+    except (DuplicateKeyError, RevisionIdWasChanged):
+        # beanie raises duplicate key error of update as RevisionIdWasChanged
+        raise dataset_name_and_version_not_unique_exception()
     await dataset.save()
 
+    if name_or_version_changed:
+        await update_linked_iterations(dataset)
+
     return dataset
 
 
@@ -220,50 +319,44 @@ async def delete_dataset(id: PydanticObjectId):
     if not dataset:
         raise dataset_not_found_exception()
 
-    await update_linked_iterations(dataset)
+    await update_linked_iterations(dataset, deleted=True)
 
     await dataset.delete()
 
     return None
 
 
-async def update_linked_iterations(dataset: Dataset, updated_dataset: Optional[Dataset] = None) -> None:
+async def update_linked_iterations(dataset: Dataset, deleted: bool = False) -> None:
     """
-    Util function to update linked iterations when dataset is deleted or when dataset name is updated.
+    Util function to update linked iterations when dataset is deleted or when dataset name or version is updated.
+    Iterations, and iterations of monitored models, are updated with one update of each collection using the
+    dataset id, whatever number of projects the iterations belong to.
 
     Args:
-    - **dataset (Dataset)**: Dataset
-    - **updated_dataset (Optional[Dataset])**: Updated dataset (optional, used when updating dataset name)
+    - **dataset (Dataset)**: Dataset, with updated name and version
+    - **deleted (bool)**: True if dataset is deleted
 
     Returns:
     - **None**
     """
-    if dataset.linked_iterations:
-        for iteration, value in dataset.linked_iterations.items():
-            project_id = value[0]
-            experiment_id = value[1]
-
-            project = await Project.get(project_id)
-            if not project:
-                raise project_not_found_exception()
-            experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
-            if not experiment:
-                raise experiment_not_found_exception()
-            iteration = next((iter for iter in experiment.iterations if iter.id == PydanticObjectId(iteration)), None)
-            if not iteration:
-                raise iteration_not_found_exception()
+    if deleted:
+        iteration_update = {"dataset": None}
+    else:
+        iteration_update = {"dataset.name": dataset.dataset_name, "dataset.version": dataset.version}
 
-            if updated_dataset:
-                iteration.dataset.name = updated_dataset.dataset_name
-            else:
-                iteration.dataset = None
+    await IterationDocument.get_motor_collection().update_many({"dataset.id": dataset.id},
+                                                               {"$set": iteration_update})
+    await MonitoredModel.get_motor_collection().update_many(
+        {"iteration.dataset.id": dataset.id},
+        {"$set": {f"iteration.{key}": value for key, value in iteration_update.items()}})
 
-            await project.save()
+    return None
 
 
 async def validate_path(value):
     """
-    Util function to validate path or URL.
+    Util function to validate path or URL. URL is checked without downloading the dataset, recent results are
+    cached.
 
     Args:
     - **value**: Path or URL
@@ -282,16 +375,15 @@ async def validate_path(value):
     if not validators.url(value):
         return value
 
-    try:
-        response = requests.get(value)
-        if response.ok:
-            return value
-        else:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="URL is not accessible or "
-                                                                              "returns an error.")
-    except requests.exceptions.RequestException:
+    status_code = await url_validator.get_status_code(value)
+    if status_code is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invalid URL or unable to connect to "
                                                                           "the URL.")
+    if status_code >= 400:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="URL is not accessible or "
+                                                                          "returns an error.")
+
+    return value
 
 
 async def is_name_and_version_unique(name: str, version: str) -> bool:
@@ -0,0 +1,50 @@
+from fastapi import HTTPException, status
+
+
+def artifact_not_found_exception():
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Artifact not found."
+    )
+
+
+def artifact_upload_not_found_exception():
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Artifact upload not found."
+    )
+
+
+def artifact_upload_completed_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Artifact upload is already completed."
+    )
+
+
+def artifact_upload_offset_mismatch_exception(offset: int):
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Chunk offset does not match artifact upload offset {offset}."
+    )
+
+
+def artifact_upload_size_exceeded_exception(size: int):
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Uploaded data exceeds declared artifact size {size}."
+    )
+
+
+def artifact_upload_incomplete_exception(offset: int, size: int):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Artifact upload is incomplete, received {offset} of {size} bytes."
+    )
+
+
+def artifact_upload_checksum_exception(description: str):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Artifact upload checksum mismatch: {description} Upload is removed, start a new one."
+    )
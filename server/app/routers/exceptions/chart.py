@@ -6,3 +6,17 @@ def chart_name_in_iteration_not_unique_exception():
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Chart names in iteration must be unique"
     )
+
+
+def chart_not_found_exception():
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Chart not found"
+    )
+
+
+def chart_data_not_numeric_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Chart data must be lists of numbers of equal length to be returned as array"
+    )
@@ -33,4 +33,47 @@ def iteration_no_path_to_model_exception():
     return HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Iteration does not have path to model."
-    )
\ No newline at end of file
+    )
+
+
+def iteration_invalid_encoded_ml_model_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Encoded ml model is not a valid base64 string."
+    )
+
+
+def iteration_ml_model_artifact_not_found_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Ml model artifact not found. Upload ml model before adding iteration."
+    )
+
+
+def iteration_already_exists_exception():
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Iteration with given id already exists."
+    )
+
+
+
+def iteration_query_bad_cursor_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid value for 'cursor'. Use 'next_cursor' value returned with previous iterations page."
+    )
+
+
+def iteration_query_bad_fields_exception(fields: list):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid value for 'fields'. Fields must be one of {fields}, 'metrics.<name>' or 'parameters.<name>'."
+    )
+
+
+def iteration_query_bad_sort_by_exception(fields: list):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid value for 'sort_by'. Must be one of {fields}, 'metrics.<name>' or 'parameters.<name>'."
+    )
@@ -203,4 +203,52 @@ def monitored_model_timeseries_chart_y_axis_columns_not_None_exception():
     return HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Invalid value for 'y_axis_columns'. Cannot be None for chart type 'timeseries'."
-    )
\ No newline at end of file
+    )
+
+def monitored_model_predictions_bad_cursor_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid value for 'cursor'. Use 'next_cursor' value returned with previous predictions page."
+    )
+
+
+def monitored_model_predictions_bad_fields_exception(fields: list):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid value for 'fields'. Must be comma separated list of {fields}."
+    )
+
+
+def monitored_model_inference_pool_full_exception(message: str):
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"Server is busy, try again later. {message}"
+    )
+
+
+def monitored_model_chart_not_aggregated_exception(chart_type: str):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Chart type '{chart_type}' has no aggregated data. Use monitored model predictions instead."
+    )
+
+
+def monitored_model_input_data_schema_exception(description: str):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Input data does not match monitored model input schema: {description}"
+    )
+
+
+def monitored_model_drift_dataset_profile_not_found_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Iteration of monitored model has no dataset with profile. Use 'reference' baseline instead."
+    )
+
+
+def monitored_model_drift_reference_window_exception(description: str):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid reference window: {description}"
+    )
@@ -0,0 +1,15 @@
+from fastapi import HTTPException, status
+
+
+def list_bad_cursor_exception():
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid value for 'cursor'. Use 'X-Next-Cursor' header value returned with previous page."
+    )
+
+
+def list_bad_sort_by_exception(fields: list):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid value for 'sort_by'. Must be one of {fields}."
+    )
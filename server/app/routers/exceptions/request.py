@@ -0,0 +1,15 @@
+from fastapi import HTTPException, status
+
+
+def request_bad_gzip_body_exception(description: str):
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Cannot decompress gzip request body: {description}"
+    )
+
+
+def request_body_too_large_exception(max_size: int):
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Decompressed request body exceeds {max_size} bytes."
+    )
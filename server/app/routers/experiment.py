@@ -4,27 +4,28 @@ from fastapi import APIRouter, status
 from beanie import PydanticObjectId
 from typing import List, Dict
 
-from app.models.dataset import Dataset
-from app.models.experiment import Experiment, UpdateExperiment
-from app.models.iteration import Iteration
+from app.models.experiment import Experiment, UpdateExperiment, DisplayExperiment
+from app.models.iteration_document import IterationDocument
+from app.models.metric_series import MetricSeries
 from app.models.project import Project
-from app.routers.exceptions.dataset import dataset_not_found_exception
 from app.routers.exceptions.experiment import experiment_name_not_unique_exception, experiment_not_found_exception
 from app.routers.exceptions.iteration import iteration_not_found_exception, \
     iteration_in_experiment_assigned_to_monitored_model_exception, iteration_assigned_to_monitored_model_exception
 from app.routers.exceptions.project import project_not_found_exception
+from app.utils.iteration import attach_iterations, unlink_iterations_from_datasets, get_iterations_activity
 
 experiment_router = APIRouter()
 
 
 @experiment_router.get("/", response_model=List[Experiment], status_code=status.HTTP_200_OK)
-async def get_experiments(project_id: PydanticObjectId) -> List[Experiment]:
+async def get_experiments(project_id: PydanticObjectId, include_iterations: bool = True) -> List[Experiment]:
     """
     Retrieve all experiments.
 
     Args:
 
     - **project_id (PydanticObjectId)**: Project id
+    - **include_iterations (bool)**: Include iterations of experiments, experiments without iterations if False
 
     Returns:
     - **List[Experiment]**: List of experiments
@@ -34,18 +35,52 @@ async def get_experiments(project_id: PydanticObjectId) -> List[Experiment]:
         raise project_not_found_exception()
 
     experiments = project.experiments
+    if include_iterations:
+        await attach_iterations(experiments)
 
     return experiments
 
 
+@experiment_router.get("/base", response_model=List[DisplayExperiment], status_code=status.HTTP_200_OK)
+async def get_experiments_base(project_id: PydanticObjectId) -> List[DisplayExperiment]:
+    """
+    Retrieve base information about all experiments of project, with number of iterations and date of the last
+    activity instead of iterations.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+
+    Returns:
+    - **List[DisplayExperiment]**: List of base information about experiments
+    """
+    project = await Project.get_motor_collection().find_one({"_id": project_id}, {"experiments.iterations": 0})
+    if not project:
+        raise project_not_found_exception()
+
+    experiments = project.get("experiments", [])
+    activity = await get_iterations_activity("experiment_id", [experiment["id"] for experiment in experiments])
+    display_experiments = []
+
+    for experiment in experiments:
+        iterations_count, last_iteration_at = activity.get(experiment["id"], (0, None))
+        display_experiment = DisplayExperiment(**experiment, iterations_count=iterations_count)
+        display_experiment.last_activity_at = max(
+            filter(None, [display_experiment.updated_at, last_iteration_at]), default=None)
+        display_experiments.append(display_experiment)
+
+    return display_experiments
+
+
 @experiment_router.get("/{id}", response_model=Experiment, status_code=status.HTTP_200_OK)
-async def get_experiment(project_id: PydanticObjectId, id: PydanticObjectId) -> Experiment:
+async def get_experiment(project_id: PydanticObjectId, id: PydanticObjectId, include_iterations: bool = True) -> \
+        Experiment:
     """
     Retrieve experiment by id.
 
     Args:
     - **project_id (PydanticObjectId)**: Project id
     - **id (PydanticObjectId)**: Experiment id
+    - **include_iterations (bool)**: Include iterations of experiment, experiment without iterations if False
 
     Returns:
     - **Experiment**: Experiment
@@ -58,17 +93,22 @@ async def get_experiment(project_id: PydanticObjectId, id: PydanticObjectId) ->
     if not experiment:
         raise experiment_not_found_exception()
 
+    if include_iterations:
+        await attach_iterations([experiment])
+
     return experiment
 
 
 @experiment_router.get("/name/{name}", response_model=Experiment, status_code=status.HTTP_200_OK)
-async def get_experiment_by_name(project_id: PydanticObjectId, name: str) -> Experiment:
+async def get_experiment_by_name(project_id: PydanticObjectId, name: str, include_iterations: bool = True) -> \
+        Experiment:
     """
     Retrieve experiment by name.
 
     Args:
     - **project_id (PydanticObjectId)**: Project id
     - **name (str)**: Experiment name
+    - **include_iterations (bool)**: Include iterations of experiment, experiment without iterations if False
 
     Returns:
     - **Experiment**: Experiment
@@ -81,6 +121,9 @@ async def get_experiment_by_name(project_id: PydanticObjectId, name: str) -> Exp
     if not experiment:
         raise experiment_not_found_exception()
 
+    if include_iterations:
+        await attach_iterations([experiment])
+
     return experiment
 
 
@@ -105,6 +148,8 @@ async def add_experiment(project_id: PydanticObjectId, experiment: Experiment) -
         raise experiment_name_not_unique_exception()
 
     experiment.project_id = project_id
+    # iterations are added to iteration collection with iteration endpoints
+    experiment.iterations = []
 
     project.experiments.append(experiment)
     await project.save()
@@ -142,8 +187,9 @@ async def update_experiment(project_id: PydanticObjectId, id: PydanticObjectId,
     experiment.description = updated_experiment.description or experiment.description
     experiment.updated_at = datetime.now()
 
-    await update_iteration_experiment_name(project, experiment)
     await project.save()
+    await update_iteration_experiment_name(experiment)
+    await attach_iterations([experiment])
 
     return experiment
 
@@ -168,17 +214,21 @@ async def delete_experiment(project_id: PydanticObjectId, id: PydanticObjectId)
     if not experiment:
         raise experiment_not_found_exception()
 
-    iterations = experiment.iterations
-    if iterations:
-        for iteration in iterations:
-            if iteration.assigned_monitored_model_name:
-                raise iteration_in_experiment_assigned_to_monitored_model_exception()
+    collection = IterationDocument.get_motor_collection()
+    if await collection.find_one({"experiment_id": experiment.id, "assigned_monitored_model_id": {"$ne": None}},
+                                 {"_id": 1}):
+        raise iteration_in_experiment_assigned_to_monitored_model_exception()
 
-    await delete_iteration_from_dataset_deleting_experiment(iterations)
+    iterations = await collection.find({"experiment_id": experiment.id, "dataset": {"$ne": None}},
+                                       {"dataset": 1}).to_list(length=None)
+    await unlink_iterations_from_datasets(iterations)
 
     project.experiments.remove(experiment)
     await project.save()
 
+    await collection.delete_many({"experiment_id": experiment.id})
+    await MetricSeries.find(MetricSeries.experiment_id == experiment.id).delete()
+
     return None
 
 
@@ -201,25 +251,32 @@ List[PydanticObjectId]]) -> None:
     if not project:
         raise project_not_found_exception()
 
+    collection = IterationDocument.get_motor_collection()
+    iterations = []
+
     for experiment_id, iteration_ids in experiment_dict.items():
         experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
         if not experiment:
             raise experiment_not_found_exception()
 
-        for iteration_id in iteration_ids:
-            iteration = next((iter for iter in experiment.iterations if iter.id == iteration_id), None)
-            if not iteration:
-                raise iteration_not_found_exception()
+        experiment_iterations = await collection.find(
+            {"_id": {"$in": iteration_ids}, "experiment_id": experiment_id},
+            {"dataset": 1, "assigned_monitored_model_id": 1}
+        ).to_list(length=None)
+        if len(experiment_iterations) != len(set(iteration_ids)):
+            raise iteration_not_found_exception()
 
-            if iteration.assigned_monitored_model_id:
-                raise iteration_assigned_to_monitored_model_exception()
+        if any(iteration.get("assigned_monitored_model_id") for iteration in experiment_iterations):
+            raise iteration_assigned_to_monitored_model_exception()
 
-            if iteration.dataset:
-                await delete_iteration_from_dataset_deleting_iterations(iteration)
+        iterations.extend(experiment_iterations)
 
-            experiment.iterations.remove(iteration)
+    await unlink_iterations_from_datasets(iterations)
+    await collection.delete_many({"_id": {"$in": [iteration["_id"] for iteration in iterations]},
+                                  "assigned_monitored_model_id": None})
 
-    await project.save()
+    iteration_ids = [iteration_id for iteration_ids in experiment_dict.values() for iteration_id in iteration_ids]
+    await MetricSeries.find({"iteration_id": {"$in": iteration_ids}}).delete()
 
     return None
 
@@ -241,61 +298,17 @@ async def is_name_unique(experiments: List[Experiment], name: str) -> bool:
     return True
 
 
-async def delete_iteration_from_dataset_deleting_experiment(iterations: List[Iteration]) -> None:
-    """
-    Util function for deleting iteration from dataset when experiment is deleted.
-
-    Args:
-    - **iterations (List[Iteration])**: List of iterations
-
-    Returns:
-    - **None**
-    """
-
-    for iteration in iterations:
-        if iteration.dataset:
-            dataset = await Dataset.get(iteration.dataset.id)
-            if not dataset:
-                raise dataset_not_found_exception()
-
-            del dataset.linked_iterations[str(iteration.id)]
-            await dataset.save()
-
-    return None
-
-
-async def delete_iteration_from_dataset_deleting_iterations(iteration: Iteration) -> None:
+async def update_iteration_experiment_name(experiment: Experiment) -> None:
     """
-    Util function for deleting iteration from dataset when iterations are deleted.
+    Util function for updating experiment name inside iterations.
 
     Args:
-    - **iteration (Iteration)**: Iteration
-
-    Returns:
-    - **None**
-    """
-    dataset = await Dataset.get(iteration.dataset.id)
-    if not dataset:
-        raise dataset_not_found_exception()
-
-    del dataset.linked_iterations[str(iteration.id)]
-    await dataset.save()
-
-    return None
-
-
-async def update_iteration_experiment_name(project: Project, experiment: Experiment) -> None:
-    """
-    Util function for updating experiment name inside iteration.
-
-    Args:
-        project: Project.
         experiment: Experiment.
 
     Returns:
         None
     """
-    for iteration in experiment.iterations:
-        iteration.experiment_name = experiment.name
+    await IterationDocument.get_motor_collection().update_many({"experiment_id": experiment.id},
+                                                               {"$set": {"experiment_name": experiment.name}})
 
-    await project.save()
+    return None
@@ -1,21 +1,46 @@
+import asyncio
 from datetime import datetime
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
 from beanie import PydanticObjectId
-from typing import List, Dict
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+from typing import List, Dict, Optional, Tuple, Set
 
+from app.models.chart import InteractiveChart
 from app.models.dataset import Dataset
-from app.models.iteration import Iteration, UpdateIteration
+from app.models.iteration import Iteration, UpdateIteration, BulkIterationResult, IterationQuery, IterationsPage
+from app.models.iteration_document import IterationDocument
+from app.models.metric_series import MetricSeries, MetricPointsBatch, DownsampledMetricSeries
 from app.models.project import Project
-from app.routers.exceptions.chart import chart_name_in_iteration_not_unique_exception
+from app.routers.exceptions.chart import chart_name_in_iteration_not_unique_exception, chart_not_found_exception
 from app.routers.exceptions.dataset import dataset_not_found_exception
 from app.routers.exceptions.experiment import experiment_not_found_exception
 from app.routers.exceptions.project import project_not_found_exception
 from app.routers.exceptions.iteration import iteration_not_found_exception, \
-    iteration_assigned_to_monitored_model_exception, iteration_no_path_to_model_exception
+    iteration_assigned_to_monitored_model_exception, iteration_no_path_to_model_exception, \
+    iteration_invalid_encoded_ml_model_exception, iteration_ml_model_artifact_not_found_exception, \
+    iteration_already_exists_exception, iteration_query_bad_cursor_exception, iteration_query_bad_fields_exception, \
+    iteration_query_bad_sort_by_exception
+from app.utils.artifact_store import get_artifact_store
+from app.utils.chart_data import CHART_DTYPE_HEADER, CHART_SHAPE_HEADER, get_chart_data_array
+from app.utils.iteration import link_iterations_to_datasets, unlink_iterations_from_datasets
+from app.utils.metric_series import append_metric_points, get_metric_series
+from app.utils.ml_model import decode_encoded_ml_model
+from app.utils.pagination import encode_cursor, get_cursor_query
 
 iteration_router = APIRouter()
 
+ITERATION_FIELDS = ['experiment_id', 'project_id', 'experiment_name', 'project_title', 'user_name', 'iteration_name',
+                    'created_at', 'metrics', 'parameters', 'path_to_model', 'dataset', 'interactive_charts',
+                    'image_charts', 'assigned_monitored_model_id', 'assigned_monitored_model_name',
+                    'ml_model_artifact_id']
+ITERATION_SORT_FIELDS = ['created_at', 'iteration_name', 'user_name']
+ITERATION_FILTER_OPERATORS = {'eq': '$eq', 'ne': '$ne', 'gt': '$gt', 'gte': '$gte', 'lt': '$lt', 'lte': '$lte',
+                              'in_': '$in'}
+
 
 @iteration_router.get("/", response_model=List[Iteration], status_code=status.HTTP_200_OK)
 async def get_iterations(project_id: PydanticObjectId, experiment_id: PydanticObjectId) -> List[Iteration]:
@@ -29,18 +54,14 @@ async def get_iterations(project_id: PydanticObjectId, experiment_id: PydanticOb
     Returns:
     - **List[Iteration]**: List of iterations
     """
-    project = await Project.get(project_id)
-    if not project:
-        raise project_not_found_exception()
-
-    experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
+    await get_project_experiment(project_id, experiment_id)
 
-    if not experiment:
-        raise experiment_not_found_exception()
+    iterations = await IterationDocument.find(
+        IterationDocument.project_id == project_id,
+        IterationDocument.experiment_id == experiment_id
+    ).sort("created_at").to_list()
 
-    iterations = experiment.iterations
-
-    return iterations
+    return [iteration.to_iteration() for iteration in iterations]
 
 
 @iteration_router.get("/{id}", response_model=Iteration, status_code=status.HTTP_200_OK)
@@ -57,19 +78,15 @@ async def get_iteration(project_id: PydanticObjectId, experiment_id: PydanticObj
     Returns:
     - **Iteration**: Iteration
     """
-    project = await Project.get(project_id)
-    if not project:
-        raise project_not_found_exception()
-
-    experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
-    if not experiment:
-        raise experiment_not_found_exception()
-
-    iteration = next((iter for iter in experiment.iterations if iter.id == id), None)
+    iteration = await IterationDocument.find_one(
+        IterationDocument.id == id,
+        IterationDocument.project_id == project_id,
+        IterationDocument.experiment_id == experiment_id
+    )
     if not iteration:
-        raise iteration_not_found_exception()
+        raise await get_iteration_not_found_exception(project_id, experiment_id)
 
-    return iteration
+    return iteration.to_iteration()
 
 
 @iteration_router.get("/name/{name}", response_model=List[Iteration], status_code=status.HTTP_200_OK)
@@ -86,20 +103,16 @@ async def get_iterations_by_name(project_id: PydanticObjectId, experiment_id: Py
     Returns:
     - **List[Iteration]**: List of iterations with selected name
     """
-    project = await Project.get(project_id)
-    if not project:
-        raise project_not_found_exception()
-
-    experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
-    if not experiment:
-        raise experiment_not_found_exception()
-
-    iterations = [iter for iter in experiment.iterations if iter.iteration_name == name]
+    iterations = await IterationDocument.find(
+        IterationDocument.experiment_id == experiment_id,
+        IterationDocument.iteration_name == name,
+        IterationDocument.project_id == project_id
+    ).sort("created_at").to_list()
 
     if not iterations:
-        raise iteration_not_found_exception()
+        raise await get_iteration_not_found_exception(project_id, experiment_id)
 
-    return iterations
+    return [iteration.to_iteration() for iteration in iterations]
 
 
 @iteration_router.post("/", response_model=Iteration, status_code=status.HTTP_201_CREATED)
@@ -116,40 +129,117 @@ async def add_iteration(project_id: PydanticObjectId, experiment_id: PydanticObj
     Returns:
     - **Iteration**: Iteration added to experiment
     """
-    project = await Project.get(project_id)
-    if not project:
-        raise project_not_found_exception()
+    project, experiment = await get_project_experiment(project_id, experiment_id)
 
-    experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
-    if not experiment:
-        raise experiment_not_found_exception()
+    if await get_existing_iteration_ids([iteration]):
+        raise iteration_already_exists_exception()
 
-    iteration.experiment_id = experiment_id
-    iteration.project_id = project_id
-    iteration.experiment_name = experiment.name
-    iteration.project_title = project.title
-    iteration.created_at = datetime.now()
+    datasets = await get_iterations_datasets([iteration])
+    await prepare_new_iteration(project, experiment, iteration, datasets)
 
-    if iteration.interactive_charts:
-        unique_charts_names = await is_chart_name_unique(iteration)
-        if not unique_charts_names:
-            raise chart_name_in_iteration_not_unique_exception()
+    if not await insert_iterations([iteration]):
+        raise iteration_already_exists_exception()
 
     if iteration.dataset:
-        dataset = await Dataset.get(iteration.dataset.id)
-        if not dataset:
-            raise dataset_not_found_exception()
+        await link_iterations_to_datasets([iteration])
+
+    return iteration
 
-        # set iteration dataset name and version automatically based on given id
-        iteration.dataset.name = dataset.dataset_name
-        iteration.dataset.version = dataset.version
 
-        await add_iteration_to_dataset_linked_iterations(iteration)
+@iteration_router.post("/bulk", response_model=List[BulkIterationResult], status_code=status.HTTP_207_MULTI_STATUS)
+async def add_iterations(project_id: PydanticObjectId, experiment_id: PydanticObjectId,
+                         iterations: List[Iteration]) -> List[BulkIterationResult]:
+    """
+    Add many iterations to experiment at once, e.g. trials of hyperparameter sweep. Every iteration is validated
+    separately, valid iterations are added with a single write and invalid ones are reported with the error.
 
-    experiment.iterations.append(iteration)
-    await project.save()
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+    - **iterations (List[Iteration])**: Iterations
 
-    return iteration
+    Returns:
+    - **List[BulkIterationResult]**: Status of every iteration, in order of the request
+    """
+    project, experiment = await get_project_experiment(project_id, experiment_id)
+
+    existing_ids = await get_existing_iteration_ids(iterations)
+    datasets = await get_iterations_datasets(iterations)
+    results = []
+    added_iterations = []
+
+    for iteration in iterations:
+        try:
+            if iteration.id in existing_ids or \
+                    any(added_iteration.id == iteration.id for added_iteration in added_iterations):
+                raise iteration_already_exists_exception()
+            await prepare_new_iteration(project, experiment, iteration, datasets)
+        except HTTPException as e:
+            results.append(BulkIterationResult(id=iteration.id, iteration_name=iteration.iteration_name,
+                                               status_code=e.status_code, detail=e.detail))
+            continue
+
+        added_iterations.append(iteration)
+        results.append(BulkIterationResult(id=iteration.id, iteration_name=iteration.iteration_name,
+                                           status_code=status.HTTP_201_CREATED))
+
+    if added_iterations:
+        inserted_ids = await insert_iterations(added_iterations)
+        await link_iterations_to_datasets(
+            [iteration for iteration in added_iterations if iteration.id in inserted_ids])
+
+        # iterations with the same ids added concurrently
+        exception = iteration_already_exists_exception()
+        for result in results:
+            if result.status_code == status.HTTP_201_CREATED and result.id not in inserted_ids:
+                result.status_code, result.detail = exception.status_code, exception.detail
+
+    return results
+
+
+@iteration_router.post("/query", response_model=IterationsPage, status_code=status.HTTP_200_OK)
+async def query_iterations(project_id: PydanticObjectId, experiment_id: PydanticObjectId,
+                           query: IterationQuery) -> IterationsPage:
+    """
+    Get page of iterations of experiment matching query, e.g. top 10 iterations by metric with parameter
+    in range. <br>
+    **NOTE:** to get the next page pass 'next_cursor' from the response as 'cursor' with the same query.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+    - **query (IterationQuery)**: Filters, sort, page and returned fields
+
+    Returns:
+    - **IterationsPage**: Iterations and cursor of the next page
+    """
+    await get_project_experiment(project_id, experiment_id)
+
+    sort_by = get_iterations_sort_by(query.sort_by)
+    projection = get_iterations_projection(query.fields, sort_by)
+
+    filters = get_iterations_query(project_id, experiment_id, query)
+    if query.cursor is not None:
+        filters = {"$and": [filters, get_cursor_query(query.cursor, sort_by, query.order,
+                                                       iteration_query_bad_cursor_exception)]}
+
+    direction = 1 if query.order == "asc" else -1
+    documents = await IterationDocument.get_motor_collection() \
+        .find(filters, projection) \
+        .sort([(sort_by, direction), ("_id", direction)]) \
+        .skip(query.offset) \
+        .limit(query.limit + 1) \
+        .to_list(length=query.limit + 1)
+
+    next_cursor = None
+    if len(documents) > query.limit:
+        documents = documents[:query.limit]
+        next_cursor = encode_cursor(documents[-1], sort_by)
+
+    return IterationsPage(
+        iterations=[iteration_document_to_dict(document) for document in documents],
+        next_cursor=next_cursor
+    )
 
 
 @iteration_router.put("/{id}", response_model=Iteration, status_code=status.HTTP_200_OK)
@@ -167,23 +257,20 @@ async def update_iteration(project_id: PydanticObjectId, experiment_id: Pydantic
     Returns:
     - **Iteration**: Updated iteration
     """
-    project = await Project.get(project_id)
-    if not project:
-        raise project_not_found_exception()
-
-    experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
-    if not experiment:
-        raise experiment_not_found_exception()
-
-    iteration = next((iter for iter in experiment.iterations if iter.id == id), None)
+    query = {"_id": id, "project_id": project_id, "experiment_id": experiment_id}
+    collection = IterationDocument.get_motor_collection()
+
+    if updated_iteration.iteration_name:
+        iteration = await collection.find_one_and_update(
+            query, {"$set": {"iteration_name": updated_iteration.iteration_name}},
+            return_document=ReturnDocument.AFTER
+        )
+    else:
+        iteration = await collection.find_one(query)
     if not iteration:
-        raise iteration_not_found_exception()
-
-    iteration.iteration_name = updated_iteration.iteration_name or iteration.iteration_name
+        raise await get_iteration_not_found_exception(project_id, experiment_id)
 
-    await project.save()
-
-    return iteration
+    return IterationDocument.parse_obj(iteration).to_iteration()
 
 
 @iteration_router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -199,48 +286,293 @@ async def delete_iteration(project_id: PydanticObjectId, experiment_id: Pydantic
     Returns:
     - **None**: None
     """
-    project = await Project.get(project_id)
+    query = {"_id": id, "project_id": project_id, "experiment_id": experiment_id}
+    collection = IterationDocument.get_motor_collection()
+
+    # iteration is removed only if it is not assigned to monitored model, checked within the same operation
+    iteration = await collection.find_one_and_delete({**query, "assigned_monitored_model_id": None},
+                                                     {"dataset": 1})
+    if not iteration:
+        if await collection.find_one(query, {"_id": 1}):
+            raise iteration_assigned_to_monitored_model_exception()
+        raise await get_iteration_not_found_exception(project_id, experiment_id)
+
+    await unlink_iterations_from_datasets([iteration])
+
+    await MetricSeries.find(MetricSeries.iteration_id == id).delete()
+
+    return None
+
+
+@iteration_router.post("/{id}/metrics", response_model=Dict[str, int], status_code=status.HTTP_201_CREATED)
+async def add_metric_points(project_id: PydanticObjectId, experiment_id: PydanticObjectId, id: PydanticObjectId,
+                            batch: MetricPointsBatch) -> Dict[str, int]:
+    """
+    Add batch of step-wise metric values to iteration. Points can be added while the iteration is running,
+    before the iteration itself is added with the same id.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+    - **id (PydanticObjectId)**: Iteration id
+    - **batch (MetricPointsBatch)**: Points by metric name
+
+    Returns:
+    - **Dict[str, int]**: Number of added points by metric name
+    """
+    await get_project_experiment(project_id, experiment_id)
+
+    for name, points in batch.metrics.items():
+        await append_metric_points(project_id, experiment_id, id, name, points)
+
+    return {name: len(points.steps) for name, points in batch.metrics.items()}
+
+
+@iteration_router.get("/{id}/metrics", response_model=Dict[str, DownsampledMetricSeries],
+                      status_code=status.HTTP_200_OK)
+async def get_metric_points(project_id: PydanticObjectId, experiment_id: PydanticObjectId, id: PydanticObjectId,
+                            name: Optional[List[str]] = Query(default=None),
+                            max_points: int = Query(default=1000, ge=2, le=10000)) -> \
+        Dict[str, DownsampledMetricSeries]:
+    """
+    Get step-wise metric series of iteration, e.g. to draw live loss curve. Series with more points are downsampled
+    to max_points points preserving the shape of the curve.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+    - **id (PydanticObjectId)**: Iteration id
+    - **name (Optional[List[str]])**: Metric names, all metrics by default
+    - **max_points (int)**: Maximum number of points of every series
+
+    Returns:
+    - **Dict[str, DownsampledMetricSeries]**: Metric series by metric name
+    """
+    await get_project_experiment(project_id, experiment_id)
+
+    return await get_metric_series(id, name, max_points)
+
+
+@iteration_router.get("/{id}/charts/{name}/data", response_class=Response, status_code=status.HTTP_200_OK)
+async def get_chart_data(project_id: PydanticObjectId, experiment_id: PydanticObjectId, id: PydanticObjectId,
+                         name: str, axis: str = Query(default='y', regex='^(x|y)$')) -> Response:
+    """
+    Get data of interactive chart axis as raw bytes of row-major, little-endian array of series, without JSON
+    and base64 overhead. Data type is in 'X-Chart-Dtype' header, number of series and number of points
+    in 'X-Chart-Shape' header. Data logged as lists of numbers are returned as float64 array.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+    - **id (PydanticObjectId)**: Iteration id
+    - **name (str)**: Logical name of chart
+    - **axis (str)**: Axis, 'x' or 'y'
+
+    Returns:
+    - **Response**: Array bytes
+    """
+    iteration = await IterationDocument.get_motor_collection().find_one(
+        {"_id": id, "project_id": project_id, "experiment_id": experiment_id},
+        {"interactive_charts": {"$elemMatch": {"name": name}}}
+    )
+    if not iteration:
+        raise await get_iteration_not_found_exception(project_id, experiment_id)
+    if not iteration.get("interactive_charts"):
+        raise chart_not_found_exception()
+
+    chart = InteractiveChart.parse_obj(iteration["interactive_charts"][0])
+    array = get_chart_data_array(chart.x_data if axis == 'x' else chart.y_data)
+
+    return Response(content=array.tobytes(), media_type="application/octet-stream", headers={
+        CHART_DTYPE_HEADER: array.dtype.name,
+        CHART_SHAPE_HEADER: ",".join(str(size) for size in array.shape)
+    })
+
+
+async def get_project_experiment(project_id: PydanticObjectId, experiment_id: PydanticObjectId) -> \
+        Tuple[dict, dict]:
+    """
+    Util function for getting project title and experiment name, without loading the whole project document.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+
+    Returns:
+    - **Tuple[dict, dict]**: Project with id and title, experiment with id and name
+    """
+    project = await Project.get_motor_collection().find_one(
+        {"_id": project_id}, {"title": 1, "experiments.id": 1, "experiments.name": 1})
     if not project:
         raise project_not_found_exception()
 
-    experiment = next((exp for exp in project.experiments if exp.id == experiment_id), None)
+    experiment = next((exp for exp in project.get("experiments", []) if exp["id"] == experiment_id), None)
     if not experiment:
         raise experiment_not_found_exception()
 
-    iteration = next((iter for iter in experiment.iterations if iter.id == id), None)
-    if not iteration:
-        raise iteration_not_found_exception()
+    return project, experiment
 
-    if iteration.assigned_monitored_model_id:
-        raise iteration_assigned_to_monitored_model_exception()
 
-    if iteration.dataset:
-        await delete_iteration_from_dataset_deleting_iteration(iteration)
+async def get_iteration_not_found_exception(project_id: PydanticObjectId,
+                                            experiment_id: PydanticObjectId) -> HTTPException:
+    """
+    Util function for getting exception of iteration which was not found, raising not found exception of project
+    or experiment instead if they do not exist.
 
-    experiment.iterations.remove(iteration)
-    await project.save()
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
 
-    return None
+    Returns:
+    - **HTTPException**: Iteration not found exception
+    """
+    await get_project_experiment(project_id, experiment_id)
 
+    return iteration_not_found_exception()
 
-async def delete_iteration_from_dataset_deleting_iteration(iteration: Iteration) -> None:
+
+async def get_existing_iteration_ids(iterations: List[Iteration]) -> Set[PydanticObjectId]:
     """
-    Util function for deleting iteration from dataset when iteration is deleted.
+    Util function for getting ids of iterations which already exist, with one query.
 
     Args:
-    - **iteration (Iteration)**: Iteration
+    - **iterations (List[Iteration])**: Iterations
 
     Returns:
-    - **None**: None
+    - **Set[PydanticObjectId]**: Ids of existing iterations
     """
-    dataset = await Dataset.get(iteration.dataset.id)
-    if not dataset:
-        raise dataset_not_found_exception()
+    cursor = IterationDocument.get_motor_collection().find(
+        {"_id": {"$in": [iteration.id for iteration in iterations]}}, {"_id": 1})
 
-    del dataset.linked_iterations[str(iteration.id)]
-    await dataset.save()
+    return {document["_id"] async for document in cursor}
 
-    return None
+
+async def insert_iterations(iterations: List[Iteration]) -> Set[PydanticObjectId]:
+    """
+    Util function for inserting iterations into iteration collection with one write. Iterations with ids of
+    iterations added concurrently are skipped.
+
+    Args:
+    - **iterations (List[Iteration])**: Iterations
+
+    Returns:
+    - **Set[PydanticObjectId]**: Ids of inserted iterations
+    """
+    ids = {iteration.id for iteration in iterations}
+
+    try:
+        await IterationDocument.insert_many([IterationDocument.from_iteration(iteration) for iteration in iterations],
+                                            ordered=False)
+    except BulkWriteError as e:
+        if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+            raise e
+        ids -= {iterations[error["index"]].id for error in e.details["writeErrors"]}
+
+    return ids
+
+
+def get_iterations_query(project_id: PydanticObjectId, experiment_id: PydanticObjectId,
+                         query: IterationQuery) -> dict:
+    """
+    Util function for building iteration collection query from iterations filters.
+
+    Args:
+    - **project_id (PydanticObjectId)**: Project id
+    - **experiment_id (PydanticObjectId)**: Experiment id
+    - **query (IterationQuery)**: Iterations query
+
+    Returns:
+    - **dict**: MongoDB query
+    """
+    filters = {"project_id": project_id, "experiment_id": experiment_id}
+
+    for field, value_filters in (("metrics", query.metrics), ("parameters", query.parameters)):
+        for name, value_filter in value_filters.items():
+            conditions = {ITERATION_FILTER_OPERATORS[operator]: value
+                          for operator, value in value_filter.dict(exclude_unset=True).items()}
+            if conditions:
+                filters[f"{field}.{name}"] = conditions
+
+    if query.user_name is not None:
+        filters["user_name"] = query.user_name
+
+    if query.dataset_id is not None:
+        filters["dataset.id"] = query.dataset_id
+
+    if query.date_from is not None or query.date_to is not None:
+        filters["created_at"] = {}
+        if query.date_from is not None:
+            filters["created_at"]["$gte"] = query.date_from
+        if query.date_to is not None:
+            filters["created_at"]["$lte"] = query.date_to
+
+    return filters
+
+
+def is_metric_or_parameter_field(field: str) -> bool:
+    """
+    Check if field is a metric or parameter of iteration, e.g. 'metrics.accuracy'.
+
+    Args:
+    - **field (str)**: Field
+
+    Returns:
+    - **bool**: True if field is metric or parameter, False otherwise
+    """
+    prefix, _, name = field.partition(".")
+    return prefix in ("metrics", "parameters") and bool(name)
+
+
+def get_iterations_sort_by(sort_by: str) -> str:
+    """
+    Util function for validating sort field of iterations.
+
+    Args:
+    - **sort_by (str)**: Sort field
+
+    Returns:
+    - **str**: Sort field
+    """
+    if sort_by not in ITERATION_SORT_FIELDS and not is_metric_or_parameter_field(sort_by):
+        raise iteration_query_bad_sort_by_exception(ITERATION_SORT_FIELDS)
+
+    return sort_by
+
+
+def get_iterations_projection(fields: Optional[List[str]], sort_by: str) -> dict:
+    """
+    Util function for building iteration collection projection from list of fields.
+
+    Args:
+    - **fields (Optional[List[str]])**: Fields, None for all fields except charts
+    - **sort_by (str)**: Sort field, needed for the cursor of the next page
+
+    Returns:
+    - **dict**: MongoDB projection
+    """
+    if fields is None:
+        return {"interactive_charts": 0, "image_charts": 0}
+
+    if any(field not in ITERATION_FIELDS and not is_metric_or_parameter_field(field) for field in fields):
+        raise iteration_query_bad_fields_exception(ITERATION_FIELDS)
+
+    # nested field can not be projected together with its parent, e.g. 'metrics.accuracy' and 'metrics'
+    fields = set(fields + [sort_by])
+    return {field: 1 for field in fields if "." not in field or field.split(".")[0] not in fields}
+
+
+def iteration_document_to_dict(document: dict) -> dict:
+    """
+    Util function for converting raw iteration document to JSON serializable iteration.
+
+    Args:
+    - **document (dict)**: Iteration document
+
+    Returns:
+    - **dict**: Iteration
+    """
+    iteration = {"id": document.pop("_id"), **document}
+    return jsonable_encoder(iteration, custom_encoder={ObjectId: str})
 
 
 async def is_chart_name_unique(iteration: Iteration) -> bool:
@@ -259,22 +591,87 @@ async def is_chart_name_unique(iteration: Iteration) -> bool:
     return True
 
 
-async def add_iteration_to_dataset_linked_iterations(iteration: Iteration) -> None:
+async def get_iterations_datasets(iterations: List[Iteration]) -> Dict[PydanticObjectId, Dataset]:
+    """
+    Util function for getting datasets of iterations with one query.
+
+    Args:
+    - **iterations (List[Iteration])**: Iterations
+
+    Returns:
+    - **Dict[PydanticObjectId, Dataset]**: Datasets by id
+    """
+    dataset_ids = list({iteration.dataset.id for iteration in iterations if iteration.dataset})
+    if not dataset_ids:
+        return {}
+
+    datasets = await Dataset.find({"_id": {"$in": dataset_ids}}).to_list()
+    return {dataset.id: dataset for dataset in datasets}
+
+
+async def prepare_new_iteration(project: dict, experiment: dict, iteration: Iteration,
+                                datasets: Dict[PydanticObjectId, Dataset]) -> None:
     """
-    Util function for adding iteration to dataset linked iterations.
+    Util function for validating iteration added to experiment and setting its fields filled by the server.
+    Encoded ml model of the iteration is moved into the artifact store.
 
     Args:
+    - **project (dict)**: Project with id and title
+    - **experiment (dict)**: Experiment with id and name
     - **iteration (Iteration)**: Iteration
+    - **datasets (Dict[PydanticObjectId, Dataset])**: Datasets of iterations by id
 
     Returns:
     - **None**: None
     """
-    dataset = await Dataset.get(iteration.dataset.id)
-    if not dataset:
-        raise dataset_not_found_exception()
+    iteration.experiment_id = experiment["id"]
+    iteration.project_id = project["_id"]
+    iteration.experiment_name = experiment["name"]
+    iteration.project_title = project["title"]
+    iteration.created_at = datetime.now()
+
+    if iteration.interactive_charts:
+        unique_charts_names = await is_chart_name_unique(iteration)
+        if not unique_charts_names:
+            raise chart_name_in_iteration_not_unique_exception()
+
+    if iteration.dataset:
+        dataset = datasets.get(iteration.dataset.id)
+        if not dataset:
+            raise dataset_not_found_exception()
+
+        # set iteration dataset name and version automatically based on given id
+        iteration.dataset.name = dataset.dataset_name
+        iteration.dataset.version = dataset.version
+
+    if iteration.encoded_ml_model:
+        await store_iteration_ml_model(iteration)
+    elif iteration.ml_model_artifact_id:
+        # ml model uploaded to the artifact store before adding iteration
+        if not await get_artifact_store().exists(iteration.ml_model_artifact_id):
+            raise iteration_ml_model_artifact_not_found_exception()
+
+    return None
+
+
+async def store_iteration_ml_model(iteration: Iteration) -> None:
+    """
+    Util function for moving encoded ml model of iteration into the artifact store, so iteration document keeps
+    only the artifact id.
+
+    Args:
+    - **iteration (Iteration)**: Iteration
 
-    iteration.dataset.name = dataset.dataset_name
-    dataset.linked_iterations[str(iteration.id)] = (iteration.project_id, iteration.experiment_id)
-    await dataset.save()
+    Returns:
+    - **None**: None
+    """
+    try:
+        ml_model_data = await asyncio.get_running_loop().run_in_executor(None, decode_encoded_ml_model,
+                                                                         iteration.encoded_ml_model)
+    except ValueError:
+        raise iteration_invalid_encoded_ml_model_exception()
+
+    iteration.ml_model_artifact_id = await get_artifact_store().put(ml_model_data)
+    iteration.encoded_ml_model = None
 
     return None
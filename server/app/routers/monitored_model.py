@@ -1,15 +1,27 @@
+import asyncio
 import base64
-import io
-import pandas as pd
+import json
 from typing import List, Union, Optional
 import pickle
-from datetime import datetime
+from datetime import datetime, timedelta
 from beanie import PydanticObjectId
-from fastapi import APIRouter, status
-
+from bson import ObjectId
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pymongo import ReturnDocument, UpdateOne
+from beanie.odm.utils.encoder import Encoder
+from pymongo.errors import DuplicateKeyError
+
+from app.config.config import settings
+from app.models.chart_aggregate import ChartAggregate
+from app.models.dataset import Dataset
+from app.models.drift_bucket import DriftBucket
+from app.models.input_schema import InputSchema
 from app.models.iteration import Iteration
+from app.models.iteration_document import IterationDocument
 from app.models.monitored_model import MonitoredModel, UpdateMonitoredModel
 from app.models.monitored_model_chart import MonitoredModelInteractiveChart, UpdateMonitoredModelInteractiveChart
+from app.models.prediction import Prediction, PredictionsPage
 from app.models.prediction_data import PredictionData, UpdatePredictionData
 from app.models.project import Project
 from app.routers.exceptions.experiment import experiment_not_found_exception
@@ -29,103 +41,191 @@ from app.routers.exceptions.monitored_model import monitored_model_not_found_exc
     monitored_model_chart_changing_columns_exception, monitored_model_prediction_not_found_exception, \
     monitored_model_chart_metrics_None_exception, monitored_model_scatter_chart_y_axis_columns_not_None_exception, \
     monitored_model_timeseries_chart_y_axis_columns_not_None_exception, \
-    monitored_model_chart_metrics_not_None_exception, monitored_model_chart_metric_not_in_metrics_exception
+    monitored_model_chart_metrics_not_None_exception, monitored_model_chart_metric_not_in_metrics_exception, \
+    monitored_model_predictions_bad_cursor_exception, monitored_model_predictions_bad_fields_exception, \
+    monitored_model_inference_pool_full_exception, monitored_model_chart_not_aggregated_exception, \
+    monitored_model_input_data_schema_exception, monitored_model_drift_dataset_profile_not_found_exception, \
+    monitored_model_drift_reference_window_exception
 from app.routers.exceptions.project import project_not_found_exception
+from app.utils.chart_aggregates import AGGREGATED_CHART_TYPES, get_chart_aggregate_update, get_chart_aggregate_data, \
+    get_prediction_row
+from app.utils.drift import DRIFT_INTERVALS, get_drift_bucket_updates, merge_drift_buckets, get_profile_baseline, \
+    get_reference_baseline, get_drift_data, get_bucket_start
+from app.utils.input_schema import get_input_schema_update, validate_input_data
+from app.utils.inference_pool import inference_pool, InferencePoolFullError
+from app.utils.artifact_store import ArtifactNotFoundError, get_artifact_store
+from app.utils.ml_model import CustomUnpickler, unpickle_ml_model
+from app.utils.ml_model_cache import ml_model_cache
+from app.utils.pagination import ListPage, encode_cursor, find_page, get_cursor_query
+from app.utils.prediction_batcher import prediction_batchers
 
 monitored_model_router = APIRouter()
 
+PREDICTION_FIELDS = ['prediction_date', 'input_data', 'prediction', 'actual']
 
-class CustomUnpickler(pickle.Unpickler):
-    def find_class(self, module, name):
-        if name == 'MonitoredModelWrapper':
-            from app.models.monitored_model_wrapper import MonitoredModelWrapper
-            return MonitoredModelWrapper
-        if name == 'BaselineNN':
-            from app.models.monitored_model_wrapper import BaselineNN
-            return BaselineNN
-        return super().find_class(module, name)
+MONITORED_MODEL_SORT_FIELDS = ['created_at', 'updated_at', 'model_name']
 
 
 @monitored_model_router.get("/", response_model=List[MonitoredModel], status_code=status.HTTP_200_OK)
-async def get_all_monitored_models() -> List[MonitoredModel]:
+async def get_all_monitored_models(response: Response, page: ListPage = Depends()) -> List[MonitoredModel]:
     """
-    Get all monitored models.
+    Get all monitored models, sorted by creation date by default. <br>
+    **NOTE:** number of matching monitored models is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of monitored models in page (1-1000), all monitored models if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'model_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[MonitoredModel]**: List of all monitored models.
     """
 
-    monitored_models = await MonitoredModel.find_all().to_list()
+    documents = await find_page(MonitoredModel.get_motor_collection(), response, {}, page,
+                                MONITORED_MODEL_SORT_FIELDS)
+    monitored_models = [MonitoredModel.parse_obj(document) for document in documents]
     return monitored_models
 
 
 @monitored_model_router.get("/non-archived", response_model=List[MonitoredModel], status_code=status.HTTP_200_OK)
-async def get_non_archived_monitored_models() -> List[MonitoredModel]:
+async def get_non_archived_monitored_models(response: Response, page: ListPage = Depends()) -> List[MonitoredModel]:
     """
-    Get all non-archived monitored models.
+    Get all non-archived monitored models, sorted by creation date by default. <br>
+    **NOTE:** number of matching monitored models is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of monitored models in page (1-1000), all monitored models if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'model_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[MonitoredModel]**: List of all non-archived monitored models.
     """
 
-    monitored_models = await MonitoredModel.find(MonitoredModel.model_status != 'archived').to_list()
+    documents = await find_page(MonitoredModel.get_motor_collection(), response,
+                                {'model_status': {'$ne': 'archived'}}, page, MONITORED_MODEL_SORT_FIELDS)
+    monitored_models = [MonitoredModel.parse_obj(document) for document in documents]
     return monitored_models
 
 
 @monitored_model_router.get("/archived", response_model=List[MonitoredModel], status_code=status.HTTP_200_OK)
-async def get_archived_monitored_models() -> List[MonitoredModel]:
+async def get_archived_monitored_models(response: Response, page: ListPage = Depends()) -> List[MonitoredModel]:
     """
-    Get all archived monitored models.
+    Get all archived monitored models, sorted by creation date by default. <br>
+    **NOTE:** number of matching monitored models is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of monitored models in page (1-1000), all monitored models if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'model_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[MonitoredModel]**: List of all archived monitored models.
     """
 
-    monitored_models = await MonitoredModel.find(MonitoredModel.model_status == 'archived').to_list()
+    documents = await find_page(MonitoredModel.get_motor_collection(), response, {'model_status': 'archived'}, page,
+                                MONITORED_MODEL_SORT_FIELDS)
+    monitored_models = [MonitoredModel.parse_obj(document) for document in documents]
     return monitored_models
 
 
 @monitored_model_router.get("/active", response_model=List[MonitoredModel], status_code=status.HTTP_200_OK)
-async def get_active_monitored_models() -> List[MonitoredModel]:
+async def get_active_monitored_models(response: Response, page: ListPage = Depends()) -> List[MonitoredModel]:
     """
-    Get all active monitored models.
+    Get all active monitored models, sorted by creation date by default. <br>
+    **NOTE:** number of matching monitored models is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of monitored models in page (1-1000), all monitored models if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'model_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[MonitoredModel]**: List of all active monitored models.
     """
 
-    monitored_models = await MonitoredModel.find(MonitoredModel.model_status == 'active').to_list()
+    documents = await find_page(MonitoredModel.get_motor_collection(), response, {'model_status': 'active'}, page,
+                                MONITORED_MODEL_SORT_FIELDS)
+    monitored_models = [MonitoredModel.parse_obj(document) for document in documents]
     return monitored_models
 
 
 @monitored_model_router.get("/idle", response_model=List[MonitoredModel], status_code=status.HTTP_200_OK)
-async def get_idle_monitored_models() -> List[MonitoredModel]:
+async def get_idle_monitored_models(response: Response, page: ListPage = Depends()) -> List[MonitoredModel]:
     """
-    Get all idle monitored models.
+    Get all idle monitored models, sorted by creation date by default. <br>
+    **NOTE:** number of matching monitored models is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of monitored models in page (1-1000), all monitored models if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'model_name'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in names and descriptions
 
     Returns:
     - **List[MonitoredModel]**: List of all idle monitored models.
     """
 
-    monitored_models = await MonitoredModel.find(MonitoredModel.model_status == 'idle').to_list()
+    documents = await find_page(MonitoredModel.get_motor_collection(), response, {'model_status': 'idle'}, page,
+                                MONITORED_MODEL_SORT_FIELDS)
+    monitored_models = [MonitoredModel.parse_obj(document) for document in documents]
     return monitored_models
 
 
+@monitored_model_router.get('/ml-model-cache', response_model=dict, status_code=status.HTTP_200_OK)
+async def get_ml_model_cache_stats() -> dict:
+    """
+    Get statistics of the decoded ml models cache.
+
+    Args:
+    - **None**
+
+    Returns:
+    - **dict**: Cache size, maximum size, hits, misses and evictions.
+    """
+
+    return ml_model_cache.stats()
+
+
+@monitored_model_router.get('/prediction-batching', response_model=dict, status_code=status.HTTP_200_OK)
+async def get_prediction_batching_stats() -> dict:
+    """
+    Get statistics of prediction batching queues of monitored models with enabled batch_predictions.
+
+    Args:
+    - **None**
+
+    Returns:
+    - **dict**: Batching queue statistics by monitored model id.
+    """
+
+    return prediction_batchers.stats()
+
+
+@monitored_model_router.get('/inference-pool', response_model=dict, status_code=status.HTTP_200_OK)
+async def get_inference_pool_stats() -> dict:
+    """
+    Get statistics of the worker pool running ml models decoding and inference.
+
+    Args:
+    - **None**
+
+    Returns:
+    - **dict**: Pool type, number of workers, queue limit, running and waiting tasks, number of tasks and rejected tasks.
+    """
+
+    return inference_pool.stats()
+
+
 @monitored_model_router.get('/name/{name}', response_model=MonitoredModel, status_code=status.HTTP_200_OK)
 async def get_monitored_model_by_name(name: str) -> MonitoredModel:
     """
@@ -192,7 +292,15 @@ async def create_monitored_model(monitored_model: MonitoredModel) -> MonitoredMo
         if iteration_to_check.path_to_model is None or iteration_to_check.path_to_model == '':
             raise iteration_has_no_path_to_model_exception()
 
-    monitored_model = await monitored_model.insert()
+    # predictions data are stored in prediction collection, not inside monitored model document
+    predictions_data = monitored_model.predictions_data or []
+    monitored_model.predictions_data = []
+    monitored_model.input_schema = InputSchema()
+    try:
+        monitored_model = await monitored_model.insert()
+    except DuplicateKeyError:
+        # monitored model with the same name added concurrently
+        raise monitored_model_name_not_unique_exception()
 
     if monitored_model.iteration is not None:
         await get_iteration_from_monitored_model(monitored_model)
@@ -203,6 +311,15 @@ async def create_monitored_model(monitored_model: MonitoredModel) -> MonitoredMo
 
     await monitored_model.save()
 
+    if predictions_data:
+        await Prediction.insert_many([Prediction.from_prediction_data(monitored_model.id, prediction_data)
+                                      for prediction_data in predictions_data])
+        await update_input_schema(monitored_model, [get_prediction_row(prediction_data.dict())
+                                                    for prediction_data in predictions_data])
+        await update_drift_buckets(monitored_model, [prediction_data.dict() for prediction_data in predictions_data])
+        monitored_model.input_schema = (await MonitoredModel.get(monitored_model.id)).input_schema
+    monitored_model.predictions_data = predictions_data
+
     return monitored_model
   
 
@@ -280,10 +397,22 @@ async def update_monitored_model(id: PydanticObjectId, updated_monitored_model:
             updated_monitored_model.iteration = iteration_with_assigned_model
 
     updated_monitored_model.updated_at = datetime.now()
-    await monitored_model.update({"$set": updated_monitored_model.dict(exclude_unset=True)})
-    monitored_model = await MonitoredModel.get(id)
-    await monitored_model.save()
+    # predictions data can be changed only through predictions endpoints
+    # motor collection is updated directly, beanie raises duplicate key error of update as RevisionIdWasChanged
+    update = Encoder(to_db=True).encode(updated_monitored_model.dict(exclude_unset=True,
+                                                                     exclude={'predictions_data', 'input_schema'}))
+    try:
+        document = await MonitoredModel.get_motor_collection().find_one_and_update(
+            {"_id": id}, {"$set": update}, return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise monitored_model_name_not_unique_exception()
+    if not document:
+        raise monitored_model_not_found_exception()
+    monitored_model = MonitoredModel.parse_obj(document)
 
+    ml_model_cache.invalidate(monitored_model.id)
+    prediction_batchers.remove(monitored_model.id)
     return monitored_model
 
 
@@ -306,7 +435,13 @@ async def delete_monitored_model(id: PydanticObjectId) -> MonitoredModel:
     if monitored_model.iteration is not None:
         await update_assigned_model_in_iteration(monitored_model.iteration, None, None)
 
+    await Prediction.find(Prediction.monitored_model_id == monitored_model.id).delete()
+    await ChartAggregate.find(ChartAggregate.monitored_model_id == monitored_model.id).delete()
+    await DriftBucket.find(DriftBucket.monitored_model_id == monitored_model.id).delete()
     await monitored_model.delete()
+    ml_model_cache.invalidate(monitored_model.id)
+    prediction_batchers.remove(monitored_model.id)
+
     return monitored_model
 
 
@@ -329,16 +464,37 @@ async def get_monitored_model_ml_model_metadata(id: PydanticObjectId) -> dict:
         raise monitored_model_has_no_iteration_exception()
 
     try:
-        monitored_model.iteration.encoded_ml_model = await load_ml_model(monitored_model)
+        ml_model = await load_ml_model(monitored_model)
+    except InferencePoolFullError as e:
+        raise monitored_model_inference_pool_full_exception(str(e))
     except Exception as e:
         raise monitored_model_load_ml_model_exception(str(e))
 
     return {
         'response_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'ml_model': str(monitored_model.iteration.encoded_ml_model)
+        'ml_model': str(ml_model)
     }
 
 
+@monitored_model_router.get('/{id}/input-schema', response_model=List[dict], status_code=status.HTTP_200_OK)
+async def get_monitored_model_input_schema(id: PydanticObjectId) -> List[dict]:
+    """
+    Get monitored model input schema inferred from its predictions, including prediction and actual columns.
+
+    Args:
+    - **id (str)**: Monitored model id
+
+    Returns:
+    - **List[dict]**: Columns with name, dtype, nullability, number of nulls and observed cardinality.
+    """
+    monitored_model = await MonitoredModel.get(id)
+
+    if not monitored_model:
+        raise monitored_model_not_found_exception()
+
+    return monitored_model.input_schema.summary()
+
+
 @monitored_model_router.post('/{id}/predict', response_model=list[PredictionData], status_code=status.HTTP_200_OK)
 async def monitored_model_predict(id: PydanticObjectId, input_data: list[dict]) -> list[PredictionData]:
     """
@@ -352,7 +508,6 @@ async def monitored_model_predict(id: PydanticObjectId, input_data: list[dict])
     Returns:
     - **list[PredictionData]**: List of predictions data.
     """
-    input_data_df = pd.DataFrame(input_data)
     monitored_model = await MonitoredModel.get(id)
 
     if not monitored_model:
@@ -360,13 +515,33 @@ async def monitored_model_predict(id: PydanticObjectId, input_data: list[dict])
     if not monitored_model.iteration:
         raise monitored_model_has_no_iteration_exception()
 
-    try:
-        ml_model = await load_ml_model(monitored_model)
-    except Exception as e:
-        raise monitored_model_load_ml_model_exception(str(e))
+    if monitored_model.validate_input:
+        error = validate_input_data(monitored_model.input_schema, input_data)
+        if error:
+            raise monitored_model_input_data_schema_exception(error)
+
+    cache_key = get_ml_model_cache_key(monitored_model)
+    ml_model = None
+    # process pool workers load and decode ml model themselves, so it is not unpickled in the server process
+    if inference_pool.pool_type == 'thread' or cache_key is None:
+        try:
+            ml_model = await load_ml_model(monitored_model, cache_key)
+        except InferencePoolFullError as e:
+            raise monitored_model_inference_pool_full_exception(str(e))
+        except Exception as e:
+            raise monitored_model_load_ml_model_exception(str(e))
+
+    async def predict(samples: List[dict]) -> list:
+        return await inference_pool.predict(cache_key, monitored_model.iteration.ml_model_artifact_id, samples,
+                                            ml_model)
 
     try:
-        predictions = ml_model.predict(input_data_df)
+        if monitored_model.batch_predictions:
+            predictions = await prediction_batchers.get(monitored_model.id).predict(cache_key, predict, input_data)
+        else:
+            predictions = await predict(input_data)
+    except InferencePoolFullError as e:
+        raise monitored_model_inference_pool_full_exception(str(e))
     except Exception as e:
         raise monitored_model_prediction_exception(str(e))
 
@@ -376,12 +551,169 @@ async def monitored_model_predict(id: PydanticObjectId, input_data: list[dict])
             prediction=prediction
         ) for sample, prediction in zip(input_data, predictions)
     ]
-    monitored_model.predictions_data.extend(predictions_data)
-    await monitored_model.save()
+    aggregates = await find_chart_aggregates(monitored_model)
+    await Prediction.insert_many([Prediction.from_prediction_data(monitored_model.id, prediction_data)
+                                  for prediction_data in predictions_data])
+    rows = [get_prediction_row(prediction_data.dict()) for prediction_data in predictions_data]
+    await update_input_schema(monitored_model, rows)
+    await update_chart_aggregates(monitored_model, aggregates, [prediction_data.id for prediction_data in
+                                                                predictions_data], [1] * len(rows), rows)
+    await update_drift_buckets(monitored_model, [prediction_data.dict() for prediction_data in predictions_data])
 
     return predictions_data
 
 
+@monitored_model_router.get('/{id}/drift', response_model=dict, status_code=status.HTTP_200_OK)
+async def get_monitored_model_drift(id: PydanticObjectId,
+                                   baseline: str = Query(default='dataset', regex='^(dataset|reference)$'),
+                                   interval: str = Query(default='day', regex='^(hour|day|week)$'),
+                                   date_from: Optional[datetime] = None,
+                                   date_to: Optional[datetime] = None,
+                                   reference_from: Optional[datetime] = None,
+                                   reference_to: Optional[datetime] = None) -> dict:
+    """
+    Get drift of monitored model prediction inputs and predictions from baseline in every interval, computed from
+    sketches maintained as predictions arrive. Numeric columns are compared by population stability index (PSI),
+    Kolmogorov-Smirnov statistic (KS) and Jensen-Shannon divergence (JS) of values binned by baseline quantiles,
+    categorical columns by PSI and JS of proportions of values. <br>
+    **NOTE:** dates are rounded to time buckets of DRIFT_BUCKET_SECONDS (default one hour).
+
+    Args:
+    - **id (str)**: Monitored model id
+    - **baseline (str)**: 'dataset' to compare with profile of the dataset of monitored model iteration (numeric
+      columns only), 'reference' to compare with predictions of the reference window.
+    - **interval (str)**: Length of compared intervals, 'hour', 'day' or 'week'.
+    - **date_from (Optional[datetime])**: Minimum prediction date of compared intervals.
+    - **date_to (Optional[datetime])**: Maximum prediction date of compared intervals.
+    - **reference_from (Optional[datetime])**: Minimum prediction date of reference window.
+    - **reference_to (Optional[datetime])**: Maximum prediction date of reference window, required for 'reference'
+      baseline.
+
+    Returns:
+    - **dict**: Baseline, interval and list of intervals with start, end, number of predictions and drift of
+      columns (name, type, count, psi, ks, js and drift flag set if PSI exceeds DRIFT_PSI_THRESHOLD).
+    """
+    monitored_model = await MonitoredModel.get(id)
+
+    if not monitored_model:
+        raise monitored_model_not_found_exception()
+
+    if baseline == 'dataset':
+        if not monitored_model.iteration:
+            raise monitored_model_has_no_iteration_exception()
+        dataset = await Dataset.get(monitored_model.iteration.dataset.id) if monitored_model.iteration.dataset \
+            else None
+        if not dataset or not dataset.profile:
+            raise monitored_model_drift_dataset_profile_not_found_exception()
+        columns_baseline = get_profile_baseline(dataset.profile.dict())
+    else:
+        if reference_to is None:
+            raise monitored_model_drift_reference_window_exception("'reference_to' is required.")
+        reference = merge_drift_buckets(await find_drift_buckets(id, reference_from, reference_to))
+        if not reference:
+            raise monitored_model_drift_reference_window_exception("there are no predictions in reference window.")
+        columns_baseline = get_reference_baseline(next(iter(reference.values())))
+
+    interval_seconds = DRIFT_INTERVALS[interval]
+    intervals = merge_drift_buckets(await find_drift_buckets(id, date_from, date_to), interval_seconds)
+
+    return {
+        'baseline': baseline,
+        'interval': interval,
+        'intervals': get_drift_data(columns_baseline, intervals, interval_seconds)
+    }
+
+
+@monitored_model_router.get('/{id}/predictions', response_model=PredictionsPage, status_code=status.HTTP_200_OK)
+async def get_monitored_model_predictions(id: PydanticObjectId,
+                                          limit: int = Query(default=100, ge=1, le=1000),
+                                          cursor: Optional[str] = None,
+                                          order: str = Query(default='asc', regex='^(asc|desc)$'),
+                                          date_from: Optional[datetime] = None,
+                                          date_to: Optional[datetime] = None,
+                                          has_actual: Optional[bool] = None,
+                                          fields: Optional[str] = None) -> PredictionsPage:
+    """
+    Get page of monitored model predictions, sorted by prediction date. <br>
+    **NOTE:** to get the next page pass 'next_cursor' from the response as 'cursor' with the same filters.
+
+    Args:
+    - **id (str)**: Monitored model id
+    - **limit (int)**: Maximum number of predictions in page (1-1000).
+    - **cursor (Optional[str])**: Cursor of the page returned with previous page.
+    - **order (str)**: Sort order by prediction date, 'asc' or 'desc'.
+    - **date_from (Optional[datetime])**: Minimum prediction date.
+    - **date_to (Optional[datetime])**: Maximum prediction date.
+    - **has_actual (Optional[bool])**: If set, return only predictions with (True) or without (False) actual value.
+    - **fields (Optional[str])**: Comma separated list of returned fields (prediction_date, input_data, prediction,
+      actual). Prediction id and date are always returned.
+
+    Returns:
+    - **PredictionsPage**: Predictions and cursor of the next page.
+    """
+    if not await MonitoredModel.find(MonitoredModel.id == id).count():
+        raise monitored_model_not_found_exception()
+
+    query = get_predictions_query(id, date_from, date_to, has_actual)
+    if cursor is not None:
+        query = {'$and': [query, get_cursor_query(cursor, 'prediction_date', order,
+                                                  monitored_model_predictions_bad_cursor_exception)]}
+
+    direction = 1 if order == 'asc' else -1
+    documents = await Prediction.get_motor_collection() \
+        .find(query, get_predictions_projection(fields)) \
+        .sort([('prediction_date', direction), ('_id', direction)]) \
+        .limit(limit + 1) \
+        .to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = encode_cursor(documents[-1], 'prediction_date')
+
+    return PredictionsPage(
+        predictions=[prediction_document_to_dict(document) for document in documents],
+        next_cursor=next_cursor
+    )
+
+
+@monitored_model_router.get('/{id}/predictions/export', status_code=status.HTTP_200_OK)
+async def export_monitored_model_predictions(id: PydanticObjectId,
+                                             date_from: Optional[datetime] = None,
+                                             date_to: Optional[datetime] = None,
+                                             has_actual: Optional[bool] = None,
+                                             fields: Optional[str] = None) -> StreamingResponse:
+    """
+    Stream all monitored model predictions as newline delimited JSON (one prediction per line),
+    sorted by prediction date.
+
+    Args:
+    - **id (str)**: Monitored model id
+    - **date_from (Optional[datetime])**: Minimum prediction date.
+    - **date_to (Optional[datetime])**: Maximum prediction date.
+    - **has_actual (Optional[bool])**: If set, return only predictions with (True) or without (False) actual value.
+    - **fields (Optional[str])**: Comma separated list of returned fields (prediction_date, input_data, prediction,
+      actual). Prediction id and date are always returned.
+
+    Returns:
+    - **StreamingResponse**: Predictions in NDJSON format.
+    """
+    if not await MonitoredModel.find(MonitoredModel.id == id).count():
+        raise monitored_model_not_found_exception()
+
+    query = get_predictions_query(id, date_from, date_to, has_actual)
+    projection = get_predictions_projection(fields)
+
+    async def stream_predictions():
+        documents = Prediction.get_motor_collection() \
+            .find(query, projection, batch_size=1000) \
+            .sort([('prediction_date', 1), ('_id', 1)])
+        async for document in documents:
+            yield json.dumps(prediction_document_to_dict(document)) + '\n'
+
+    return StreamingResponse(stream_predictions(), media_type='application/x-ndjson')
+
+
 @monitored_model_router.put('/{id}/predictions/{prediction_id}', response_model=PredictionData, status_code=status.HTTP_200_OK)
 async def monitored_model_set_actual_prediction_value(id: PydanticObjectId, prediction_id: PydanticObjectId, updated_prediction: UpdatePredictionData) -> PredictionData:
     """
@@ -400,14 +732,9 @@ async def monitored_model_set_actual_prediction_value(id: PydanticObjectId, pred
     if not monitored_model:
         raise monitored_model_not_found_exception()
 
-    prediction = next((prediction for prediction in monitored_model.predictions_data if prediction.id == prediction_id), None)
-    if not prediction:
-        monitored_model_prediction_not_found_exception()
+    prediction = await set_prediction_actual(monitored_model, prediction_id, updated_prediction.actual)
 
-    prediction.actual = updated_prediction.actual
-    await monitored_model.save()
-
-    return prediction
+    return prediction.to_prediction_data()
 
 
 @monitored_model_router.delete('/{id}/predictions/{prediction_id}/actual', response_model=PredictionData, status_code=status.HTTP_200_OK)
@@ -428,14 +755,9 @@ async def monitored_model_delete_prediction_actual(id: PydanticObjectId, predict
     if not monitored_model:
         raise monitored_model_not_found_exception()
 
-    prediction = next((prediction for prediction in monitored_model.predictions_data if prediction.id == prediction_id), None)
-    if not prediction:
-        monitored_model_prediction_not_found_exception()
-
-    prediction.actual = None
-    await monitored_model.save()
+    prediction = await set_prediction_actual(monitored_model, prediction_id, None)
 
-    return prediction
+    return prediction.to_prediction_data()
 
 
 @monitored_model_router.post('/{id}/charts', response_model=MonitoredModelInteractiveChart,
@@ -457,26 +779,22 @@ async def add_chart_to_monitored_model(id: PydanticObjectId, chart: MonitoredMod
     if not monitored_model:
         raise monitored_model_not_found_exception()
 
-    if not monitored_model.predictions_data:
+    if monitored_model.input_schema.rows == 0:
         raise monitored_model_has_no_predictions_data_exception()
 
-    data = pd.DataFrame([{**prediction.input_data, 'prediction': prediction.prediction, 'actual': prediction.actual} for
-                         prediction in monitored_model.predictions_data])
-    data['actual'] = pd.to_numeric(data['actual'], errors='coerce')
-
-
     if (chart.chart_type, chart.x_axis_column, chart.y_axis_columns) in monitored_model.interactive_charts_existed:
         raise monitored_model_chart_existing_pair_of_columns_of_chart_type_exception(chart.chart_type,
                                                                                      chart.x_axis_column,
                                                                                      chart.y_axis_columns)
 
-    validated_chart = validate_chart(chart, data)
+    validated_chart = validate_chart(chart, monitored_model.input_schema)
     if validated_chart:
         chart.monitored_model_id = monitored_model.id
         monitored_model.interactive_charts.append(chart)
         monitored_model.interactive_charts_existed.append((chart.chart_type, chart.x_axis_column, chart.y_axis_columns))
 
-    await monitored_model.save()
+    await save_interactive_charts(monitored_model)
+    await build_chart_aggregate(chart)
 
     return chart
 
@@ -506,6 +824,41 @@ async def get_chart_from_monitored_model(id: PydanticObjectId, chart_id: Pydanti
     return chart
 
 
+@monitored_model_router.get('/{id}/charts/{chart_id}/data', response_model=dict, status_code=status.HTTP_200_OK)
+async def get_chart_data_from_monitored_model(id: PydanticObjectId, chart_id: PydanticObjectId) -> dict:
+    """
+    Get data of monitored model chart computed from its incrementally updated aggregate, i.e. histogram bins,
+    value counts, confusion matrix or metrics. Available for histogram, countplot, scatter_with_histograms
+    (histograms of both columns), regression_metrics, classification_metrics and confusion_matrix charts.
+
+    Args:
+    - **id (str)**: Monitored model id
+    - **chart_id (str)**: Chart id.
+
+    Returns:
+    - **dict**: Chart id, chart type, number of aggregated predictions and chart data.
+    """
+    monitored_model = await MonitoredModel.get(id)
+
+    if not monitored_model:
+        raise monitored_model_not_found_exception()
+
+    chart = next((chart for chart in monitored_model.interactive_charts if chart.id == chart_id), None)
+    if not chart:
+        raise monitored_model_chart_not_found_exception()
+    if chart.chart_type not in AGGREGATED_CHART_TYPES:
+        raise monitored_model_chart_not_aggregated_exception(chart.chart_type)
+
+    aggregate = await find_built_chart_aggregate(chart)
+
+    return {
+        'chart_id': str(chart.id),
+        'chart_type': chart.chart_type,
+        'count': aggregate['predictions_count'],
+        'data': get_chart_aggregate_data(chart, aggregate)
+    }
+
+
 @monitored_model_router.put('/{id}/charts/{chart_id}', response_model=MonitoredModelInteractiveChart, status_code=status.HTTP_200_OK)
 async def update_chart_from_monitored_model(id: PydanticObjectId, chart_id: PydanticObjectId, updated_chart: UpdateMonitoredModelInteractiveChart) -> MonitoredModelInteractiveChart:
     """
@@ -528,15 +881,11 @@ async def update_chart_from_monitored_model(id: PydanticObjectId, chart_id: Pyda
     if not chart:
         raise monitored_model_chart_not_found_exception()
 
-    data = pd.DataFrame([{**prediction.input_data, 'prediction': prediction.prediction, 'actual': prediction.actual} for
-                         prediction in monitored_model.predictions_data])
-    data['actual'] = pd.to_numeric(data['actual'], errors='coerce')
-
     if updated_chart.chart_type is None:
         updated_chart.chart_type = chart.chart_type
 
     if chart.chart_type == updated_chart.chart_type:
-        validated_chart = validate_chart(updated_chart, data)
+        validated_chart = validate_chart(updated_chart, monitored_model.input_schema)
         updated_chart.monitored_model_id = monitored_model.id
         if validated_chart:
             monitored_model.interactive_charts.append(updated_chart)
@@ -546,7 +895,9 @@ async def update_chart_from_monitored_model(id: PydanticObjectId, chart_id: Pyda
     else:
         raise monitored_model_chart_changing_columns_exception()
 
-    await monitored_model.save()
+    await save_interactive_charts(monitored_model)
+    await ChartAggregate.find(ChartAggregate.chart_id == chart.id).delete()
+    await build_chart_aggregate(updated_chart)
 
     return updated_chart
 
@@ -574,7 +925,8 @@ async def delete_chart_from_monitored_model(id: PydanticObjectId, chart_id: Pyda
 
     monitored_model.interactive_charts_existed.remove((chart.chart_type, chart.x_axis_column, chart.y_axis_columns))
     monitored_model.interactive_charts.remove(chart)
-    await monitored_model.save()
+    await save_interactive_charts(monitored_model)
+    await ChartAggregate.find(ChartAggregate.chart_id == chart.id).delete()
 
     return chart
 
@@ -598,6 +950,397 @@ async def is_name_unique(name: str) -> bool:
     return True
 
 
+def get_predictions_query(monitored_model_id: PydanticObjectId, date_from: Optional[datetime] = None,
+                          date_to: Optional[datetime] = None, has_actual: Optional[bool] = None) -> dict:
+    """
+    Util function for building prediction collection query from predictions filters.
+
+    Args:
+        monitored_model_id: Monitored model id.
+        date_from: Minimum prediction date.
+        date_to: Maximum prediction date.
+        has_actual: If set, filter predictions with (True) or without (False) actual value.
+
+    Returns:
+        MongoDB query.
+    """
+    query = {'monitored_model_id': monitored_model_id}
+
+    if date_from is not None or date_to is not None:
+        query['prediction_date'] = {}
+        if date_from is not None:
+            query['prediction_date']['$gte'] = date_from
+        if date_to is not None:
+            query['prediction_date']['$lte'] = date_to
+
+    if has_actual is not None:
+        query['actual'] = {'$ne': None} if has_actual else None
+
+    return query
+
+
+def get_predictions_projection(fields: Optional[str]) -> Optional[dict]:
+    """
+    Util function for building prediction collection projection from comma separated list of fields.
+
+    Args:
+        fields: Comma separated list of fields, None for all fields.
+
+    Returns:
+        MongoDB projection.
+    """
+    if fields is None:
+        return {'monitored_model_id': 0, 'revision': 0, 'aggregated': 0}
+
+    fields = [field.strip() for field in fields.split(',') if field.strip()]
+    if not fields or any(field not in PREDICTION_FIELDS for field in fields):
+        raise monitored_model_predictions_bad_fields_exception(PREDICTION_FIELDS)
+
+    # prediction date is needed for the cursor of the next page
+    return {field: 1 for field in fields + ['prediction_date']}
+
+
+def prediction_document_to_dict(document: dict) -> dict:
+    """
+    Util function for converting raw prediction document to JSON serializable prediction data.
+
+    Args:
+        document: Prediction document.
+
+    Returns:
+        Prediction data.
+    """
+    prediction = {'id': str(document.pop('_id'))}
+    for field, value in document.items():
+        prediction[field] = value.isoformat() if isinstance(value, datetime) else value
+
+    return prediction
+
+
+async def set_prediction_actual(monitored_model: MonitoredModel, prediction_id: PydanticObjectId,
+                                actual: Optional[Union[float, int]]) -> Prediction:
+    """
+    Util function for setting actual value of prediction and updating chart aggregates with the change.
+
+    Args:
+        monitored_model: Monitored model.
+        prediction_id: Prediction id.
+        actual: Actual value, None to delete it.
+
+    Returns:
+        Updated prediction.
+    """
+    aggregates = await find_chart_aggregates(monitored_model)
+    # previous actual value is read atomically with the update, so concurrent updates are aggregated correctly
+    previous = await Prediction.get_motor_collection().find_one_and_update(
+        {"_id": prediction_id, "monitored_model_id": monitored_model.id},
+        {"$set": {"actual": actual}, "$inc": {"revision": 1}}
+    )
+    if not previous:
+        raise monitored_model_prediction_not_found_exception()
+
+    # predictions stored before revisions were introduced have revision 0
+    revision = previous.get("revision", 0) + 1
+    prediction = Prediction.parse_obj({**previous, "actual": actual, "revision": revision})
+    added_rows, removed_rows = [get_prediction_row(prediction.dict())], [get_prediction_row(previous)]
+    await update_input_schema(monitored_model, added_rows, removed_rows)
+    await update_chart_aggregates(monitored_model, aggregates, [prediction_id], [revision], added_rows,
+                                  removed_rows)
+
+    return prediction
+
+
+async def update_input_schema(monitored_model: MonitoredModel, added_rows: List[dict],
+                              removed_rows: Optional[List[dict]] = None) -> None:
+    """
+    Util function for updating monitored model input schema with added and removed prediction rows.
+
+    Args:
+        monitored_model: Monitored model.
+        added_rows: Rows of input data with prediction and actual values to add.
+        removed_rows: Rows to remove.
+
+    Returns:
+        None
+    """
+    update = get_input_schema_update(monitored_model.input_schema, added_rows, removed_rows)
+    if update:
+        await MonitoredModel.get_motor_collection().update_one({"_id": monitored_model.id}, update)
+
+    return None
+
+
+async def update_drift_buckets(monitored_model: MonitoredModel, predictions: List[dict]) -> None:
+    """
+    Util function for adding predictions to drift buckets of monitored model, with one bulk write of upserts of
+    time buckets of the predictions.
+
+    Args:
+        monitored_model: Monitored model.
+        predictions: Prediction data dictionaries.
+
+    Returns:
+        None
+    """
+    updates = get_drift_bucket_updates(monitored_model.id, monitored_model.input_schema, predictions)
+    if updates:
+        await DriftBucket.get_motor_collection().bulk_write(updates, ordered=False)
+
+    return None
+
+
+async def find_drift_buckets(monitored_model_id: PydanticObjectId, date_from: Optional[datetime] = None,
+                             date_to: Optional[datetime] = None) -> List[dict]:
+    """
+    Util function for finding drift buckets of monitored model with predictions made between dates.
+
+    Args:
+        monitored_model_id: Monitored model id.
+        date_from: Minimum prediction date.
+        date_to: Maximum prediction date.
+
+    Returns:
+        Drift bucket documents.
+    """
+    query = {"monitored_model_id": monitored_model_id}
+    if date_from is not None or date_to is not None:
+        query["bucket_start"] = {}
+    if date_from is not None:
+        query["bucket_start"]["$gte"] = get_bucket_start(date_from, settings.DRIFT_BUCKET_SECONDS)
+    if date_to is not None:
+        query["bucket_start"]["$lte"] = date_to
+
+    return await DriftBucket.get_motor_collection().find(query).to_list(length=None)
+
+
+async def save_interactive_charts(monitored_model: MonitoredModel) -> None:
+    """
+    Util function for saving interactive charts of monitored model. Only charts fields are updated, so input schema
+    updated by concurrent predictions is not overwritten.
+
+    Args:
+        monitored_model: Monitored model.
+
+    Returns:
+        None
+    """
+    await monitored_model.set({
+        MonitoredModel.interactive_charts: monitored_model.interactive_charts,
+        MonitoredModel.interactive_charts_existed: monitored_model.interactive_charts_existed
+    })
+
+    return None
+
+
+async def find_chart_aggregates(monitored_model: MonitoredModel) -> dict:
+    """
+    Util function for finding aggregates of monitored model charts, before predictions are written. Changes of
+    predictions are added directly only to aggregates which were built before the predictions were written,
+    see update_chart_aggregates.
+
+    Args:
+        monitored_model: Monitored model.
+
+    Returns:
+        Chart aggregate documents with id and built flag by chart id.
+    """
+    aggregates = await ChartAggregate.get_motor_collection() \
+        .find({"monitored_model_id": monitored_model.id}, {"chart_id": 1, "built": 1}) \
+        .to_list(length=None)
+
+    return {aggregate["chart_id"]: aggregate for aggregate in aggregates}
+
+
+def get_prediction_changes(prediction_ids: list, revisions: List[int], added_rows: List[dict],
+                           removed_rows: Optional[List[dict]] = None) -> List[dict]:
+    """
+    Util function for getting changes of written predictions, queued in chart aggregates which are being built.
+
+    Args:
+        prediction_ids: Prediction ids.
+        revisions: Prediction revisions after the write.
+        added_rows: Chart data rows of predictions after the write.
+        removed_rows: Chart data rows of predictions before the write, None for inserted predictions.
+
+    Returns:
+        Prediction changes.
+    """
+    removed_rows = removed_rows or [None] * len(added_rows)
+    return [{"prediction_id": prediction_id, "revision": revision, "added": added, "removed": removed}
+            for prediction_id, revision, added, removed in zip(prediction_ids, revisions, added_rows, removed_rows)]
+
+
+async def apply_not_aggregated_changes(chart: MonitoredModelInteractiveChart, aggregate_id: ObjectId,
+                                       changes: List[dict]) -> None:
+    """
+    Util function for adding prediction changes to built chart aggregate, except the changes whose result was
+    already aggregated by the build of the aggregate.
+
+    Args:
+        chart: Interactive chart.
+        aggregate_id: Chart aggregate id.
+        changes: Prediction changes.
+
+    Returns:
+        None
+    """
+    aggregated_revisions = {}
+    async for document in Prediction.get_motor_collection().find(
+            {"_id": {"$in": [change["prediction_id"] for change in changes]}}, {f"aggregated.{chart.id}": 1}):
+        aggregated = document.get("aggregated", {}).get(str(chart.id))
+        if aggregated and aggregated["aggregate_id"] == aggregate_id:
+            aggregated_revisions[document["_id"]] = aggregated["revision"]
+
+    changes = [change for change in changes
+               if change["revision"] > aggregated_revisions.get(change["prediction_id"], -1)]
+    update = get_chart_aggregate_update(chart, [change["added"] for change in changes],
+                                        [change["removed"] for change in changes if change["removed"] is not None])
+    if update:
+        await ChartAggregate.get_motor_collection().update_one({"_id": aggregate_id}, update)
+
+    return None
+
+
+async def update_chart_aggregates(monitored_model: MonitoredModel, aggregates: dict, prediction_ids: list,
+                                  revisions: List[int], added_rows: List[dict],
+                                  removed_rows: Optional[List[dict]] = None) -> None:
+    """
+    Util function for updating aggregates of monitored model charts with written predictions.
+
+    Aggregates which were built before the predictions were written are updated directly. Otherwise the build may
+    or may not have read the predictions: changes are queued in aggregate which is being built and applied when
+    it is built, aggregate built in the meantime gets only changes its build did not read. Charts without
+    aggregate are skipped, their aggregates are built from all predictions on read.
+
+    Args:
+        monitored_model: Monitored model.
+        aggregates: Chart aggregates found by find_chart_aggregates before the predictions were written.
+        prediction_ids: Written prediction ids.
+        revisions: Prediction revisions after the write.
+        added_rows: Chart data rows of predictions after the write.
+        removed_rows: Chart data rows of predictions before the write, None for inserted predictions.
+
+    Returns:
+        None
+    """
+    collection = ChartAggregate.get_motor_collection()
+    changes = get_prediction_changes(prediction_ids, revisions, added_rows, removed_rows)
+
+    for chart in monitored_model.interactive_charts:
+        if chart.chart_type not in AGGREGATED_CHART_TYPES:
+            continue
+
+        update = get_chart_aggregate_update(chart, added_rows, removed_rows)
+        if not update:
+            continue
+
+        aggregate = aggregates.get(chart.id)
+        if aggregate is not None and aggregate.get("built", True) and \
+                (await collection.update_one({"_id": aggregate["_id"]}, update)).matched_count:
+            continue
+
+        while True:
+            aggregate = await collection.find_one({"chart_id": chart.id}, {"built": 1})
+            if aggregate is None:
+                break
+            if aggregate.get("built", True):
+                await apply_not_aggregated_changes(chart, aggregate["_id"], changes)
+                break
+            result = await collection.update_one({"_id": aggregate["_id"], "built": False},
+                                                 {"$push": {"pending": {"$each": changes}}})
+            if result.matched_count:
+                break
+
+    return None
+
+
+async def build_chart_aggregate(chart: MonitoredModelInteractiveChart, batch_size: int = 1000) -> None:
+    """
+    Util function for building chart aggregate from all predictions of monitored model. Aggregate is inserted
+    as not built first, so predictions written during the build are queued in it by update_chart_aggregates.
+    Revision of every aggregated prediction is recorded in the prediction, so queued changes, which were already
+    read by the build, are not aggregated twice when the aggregate is published as built.
+
+    Args:
+        chart: Interactive chart.
+        batch_size: Number of predictions aggregated with one update.
+
+    Returns:
+        None
+    """
+    if chart.chart_type not in AGGREGATED_CHART_TYPES:
+        return None
+
+    collection = ChartAggregate.get_motor_collection()
+    prediction_collection = Prediction.get_motor_collection()
+    try:
+        aggregate = await ChartAggregate(monitored_model_id=chart.monitored_model_id, chart_id=chart.id,
+                                         chart_type=chart.chart_type, built=False,
+                                         build_started_at=datetime.now()).insert()
+    except DuplicateKeyError:
+        # aggregate is already built or built by concurrent request
+        return None
+
+    # aggregate is updated by id, so a build which timed out does not change the aggregate built again
+    async def aggregate_predictions(documents: List[dict]) -> None:
+        update = get_chart_aggregate_update(chart, [get_prediction_row(document) for document in documents])
+        if update:
+            await collection.update_one({"_id": aggregate.id}, update)
+        if documents:
+            await prediction_collection.bulk_write([
+                UpdateOne({"_id": document["_id"]}, {"$set": {f"aggregated.{chart.id}": {
+                    "aggregate_id": aggregate.id, "revision": document.get("revision", 0)}}})
+                for document in documents
+            ], ordered=False)
+
+    documents = []
+    async for document in prediction_collection.find({"monitored_model_id": chart.monitored_model_id},
+                                                     {"input_data": 1, "prediction": 1, "actual": 1,
+                                                      "revision": 1}):
+        documents.append(document)
+        if len(documents) >= batch_size:
+            await aggregate_predictions(documents)
+            documents = []
+    await aggregate_predictions(documents)
+
+    # changes queued until the aggregate is published are taken atomically with publishing
+    published = await collection.find_one_and_update(
+        {"_id": aggregate.id, "built": False},
+        {"$set": {"built": True, "build_started_at": None, "pending": []}},
+        projection={"pending": 1}
+    )
+    if published and published["pending"]:
+        await apply_not_aggregated_changes(chart, aggregate.id, published["pending"])
+
+    return None
+
+
+async def find_built_chart_aggregate(chart: MonitoredModelInteractiveChart, poll_interval: float = 0.1) -> dict:
+    """
+    Util function for finding built chart aggregate, building it if it does not exist. Aggregate built by
+    a concurrent request is waited for. Aggregate whose build did not finish in CHART_AGGREGATE_BUILD_TIMEOUT
+    seconds, e.g. because the server was stopped, is built again.
+
+    Args:
+        chart: Interactive chart.
+        poll_interval: Seconds between checks of aggregate built by concurrent request.
+
+    Returns:
+        Chart aggregate document.
+    """
+    collection = ChartAggregate.get_motor_collection()
+    while True:
+        aggregate = await collection.find_one({"chart_id": chart.id})
+        if aggregate is None:
+            await build_chart_aggregate(chart)
+        elif aggregate.get("built", True):
+            return aggregate
+        elif aggregate["build_started_at"] < datetime.now() - timedelta(seconds=settings.CHART_AGGREGATE_BUILD_TIMEOUT):
+            await collection.delete_one({"_id": aggregate["_id"], "built": False})
+        else:
+            await asyncio.sleep(poll_interval)
+
+
 async def update_assigned_model_in_iteration(iteration_to_found: Iteration, monitored_model_id: PydanticObjectId,
                                              monitored_model_name: str):
     """
@@ -610,24 +1353,18 @@ async def update_assigned_model_in_iteration(iteration_to_found: Iteration, moni
     Returns:
         Iteration.
     """
-    project = await Project.get(iteration_to_found.project_id)
-    if not project:
-        raise project_not_found_exception()
-
-    experiment = next((exp for exp in project.experiments if exp.id == iteration_to_found.experiment_id),
-                      None)
-    if not experiment:
-        raise experiment_not_found_exception()
-
-    iteration = next((iter for iter in experiment.iterations if iter.id == iteration_to_found.id), None)
+    iteration = await IterationDocument.get_motor_collection().find_one_and_update(
+        {"_id": iteration_to_found.id, "project_id": iteration_to_found.project_id,
+         "experiment_id": iteration_to_found.experiment_id},
+        {"$set": {"assigned_monitored_model_id": monitored_model_id,
+                  "assigned_monitored_model_name": monitored_model_name}},
+        return_document=ReturnDocument.AFTER
+    )
     if not iteration:
+        await check_iteration_experiment_exists(iteration_to_found)
         raise iteration_not_found_exception()
 
-    iteration.assigned_monitored_model_id = monitored_model_id
-    iteration.assigned_monitored_model_name = monitored_model_name
-    await project.save()
-
-    return iteration
+    return IterationDocument.parse_obj(iteration).to_iteration()
 
 
 async def load_ml_model_from_file_and_encode(pkl_file_path) -> str:
@@ -668,38 +1405,83 @@ async def load_and_decode_pkl(monitored_model: MonitoredModel) -> object:
         decoded_model: Decoded model.
     """
     try:
-        if monitored_model.iteration.encoded_ml_model:
-            # Load and deserialize the pickled model from ml_model
-            model_data = base64.b64decode(monitored_model.iteration.encoded_ml_model.encode("utf-8"))
-
-            # instead pickle loads use custom unpickler
-            decoded_model = CustomUnpickler(io.BytesIO(model_data)).load()
-
-            # Now, loaded_model contains your decoded model
-            return decoded_model
+        if monitored_model.iteration.ml_model_artifact_id:
+            ml_model_data = await get_artifact_store().get(monitored_model.iteration.ml_model_artifact_id)
+            # unpickle the model in the inference pool, so it does not block the event loop
+            return await inference_pool.run_in_thread(unpickle_ml_model, ml_model_data)
         else:
             raise monitored_model_no_ml_model_to_decode_exception()
 
+    except InferencePoolFullError as e:
+        raise e
     except Exception as e:
         # Handle any exceptions or errors that may occur during decoding
         raise monitored_model_decoding_pkl_file_exception(str(e))
 
 
-async def load_ml_model(monitored_model: MonitoredModel) -> object:
+def get_ml_model_cache_key(monitored_model: MonitoredModel) -> Optional[tuple]:
+    """
+    Get cache key of monitored model ml model.
+
+    Args:
+        monitored_model: Monitored model.
+
+    Returns:
+        Cache key or None if monitored model has no ml model.
+    """
+    if not monitored_model.iteration.ml_model_artifact_id:
+        return None
+
+    return ml_model_cache.get_key(monitored_model.id, monitored_model.iteration.ml_model_artifact_id)
+
+
+async def load_ml_model(monitored_model: MonitoredModel, cache_key: Optional[tuple] = None) -> object:
     """
-    Load ml model from path using pickle.
+    Load ml model using pickle. Decoded ml models are cached, so the pickle is decoded only once
+    for each ml model artifact.
 
     Args:
-        monitored_model: Monitored model to load ml model from path.
+        monitored_model: Monitored model to load ml model from.
+        cache_key: Cache key of ml model, computed if not passed.
 
     Returns:
         Loaded ml model instance.
     """
-    ml_model = await load_and_decode_pkl(monitored_model)
+    if not monitored_model.iteration.ml_model_artifact_id:
+        return await load_and_decode_pkl(monitored_model)
+
+    if cache_key is None:
+        cache_key = get_ml_model_cache_key(monitored_model)
+    ml_model = ml_model_cache.get(cache_key)
+    if ml_model is None:
+        ml_model = await load_and_decode_pkl(monitored_model)
+        ml_model_cache.put(cache_key, ml_model)
 
     return ml_model
 
 
+async def start_inference_pool() -> None:
+    """
+    Start inference pool. Process pool workers are pre-warmed with ml models of active monitored models.
+
+    Returns:
+        None
+    """
+    ml_models = []
+    if inference_pool.pool_type == 'process':
+        active_monitored_models = await MonitoredModel.find(MonitoredModel.model_status == 'active').to_list()
+        for monitored_model in active_monitored_models:
+            if monitored_model.iteration and monitored_model.iteration.ml_model_artifact_id:
+                try:
+                    ml_model_data = await get_artifact_store().get(monitored_model.iteration.ml_model_artifact_id)
+                except ArtifactNotFoundError:
+                    # missing model fails on prediction with a proper error
+                    continue
+                ml_models.append((get_ml_model_cache_key(monitored_model), ml_model_data))
+
+    inference_pool.start(ml_models)
+
+
 async def get_iteration_from_monitored_model(monitored_model: MonitoredModel) -> Iteration:
     """
     Get iteration from monitored model.
@@ -710,25 +1492,42 @@ async def get_iteration_from_monitored_model(monitored_model: MonitoredModel) ->
     Returns:
         Iteration.
     """
-    project = await Project.get(monitored_model.iteration.project_id)
+    iteration = await IterationDocument.find_one(
+        IterationDocument.id == monitored_model.iteration.id,
+        IterationDocument.project_id == monitored_model.iteration.project_id,
+        IterationDocument.experiment_id == monitored_model.iteration.experiment_id
+    )
+    if not iteration:
+        await check_iteration_experiment_exists(monitored_model.iteration)
+        raise iteration_not_found_exception()
+
+    return iteration.to_iteration()
+
+
+async def check_iteration_experiment_exists(iteration: Iteration) -> None:
+    """
+    Check if project and experiment of iteration exist.
+
+    Args:
+        iteration: Iteration.
+
+    Returns:
+        None
+    """
+    project = await Project.get(iteration.project_id)
     if not project:
         raise project_not_found_exception()
 
-    experiment = next((exp for exp in project.experiments if exp.id == monitored_model.iteration.experiment_id),
-                      None)
+    experiment = next((exp for exp in project.experiments if exp.id == iteration.experiment_id), None)
     if not experiment:
         raise experiment_not_found_exception()
 
-    iteration = next((iter for iter in experiment.iterations if iter.id == monitored_model.iteration.id), None)
-    if not iteration:
-        raise iteration_not_found_exception()
-
-    return iteration
+    return None
 
 
-def validate_chart(chart: MonitoredModelInteractiveChart, data: pd.DataFrame) -> MonitoredModelInteractiveChart:
+def validate_chart(chart: MonitoredModelInteractiveChart, input_schema: InputSchema) -> MonitoredModelInteractiveChart:
     if chart.chart_type == 'histogram':
-        if not pd.api.types.is_numeric_dtype(data[chart.x_axis_column]):
+        if not input_schema.is_numeric(chart.x_axis_column):
             raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'numeric', 'x_axis_column')
         if chart.y_axis_columns is not None:
             raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'None', 'y_axis_columns')
@@ -743,8 +1542,7 @@ def validate_chart(chart: MonitoredModelInteractiveChart, data: pd.DataFrame) ->
         if chart.metrics is not None:
             raise monitored_model_chart_metrics_None_exception(chart.chart_type)
     elif chart.chart_type == 'countplot':
-        if not pd.api.types.is_string_dtype(data[chart.x_axis_column]) and not pd.api.types.is_numeric_dtype(
-                data[chart.x_axis_column]):
+        if not input_schema.is_string(chart.x_axis_column) and not input_schema.is_numeric(chart.x_axis_column):
             raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'string or numeric', 'x_axis_column')
         if chart.y_axis_columns is not None:
             raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'None', 'y_axis_columns')
@@ -755,13 +1553,13 @@ def validate_chart(chart: MonitoredModelInteractiveChart, data: pd.DataFrame) ->
         if chart.metrics is not None:
             raise monitored_model_chart_metrics_None_exception(chart.chart_type)
     elif chart.chart_type == 'scatter':
-        if not pd.api.types.is_numeric_dtype(data[chart.x_axis_column]):
+        if not input_schema.is_numeric(chart.x_axis_column):
             raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'numeric', 'x_axis_column')
         if chart.y_axis_columns is None:
             raise monitored_model_scatter_chart_y_axis_columns_not_None_exception()
         else:
             for y_column in chart.y_axis_columns:
-                if not pd.api.types.is_numeric_dtype(data[y_column]):
+                if not input_schema.is_numeric(y_column):
                     raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'numeric', y_column)
                 if chart.x_axis_column == y_column:
                     raise monitored_model_chart_columns_different_values_exception(chart.chart_type, y_column)
@@ -772,7 +1570,7 @@ def validate_chart(chart: MonitoredModelInteractiveChart, data: pd.DataFrame) ->
         if chart.metrics is not None:
             raise monitored_model_chart_metrics_None_exception(chart.chart_type)
     elif chart.chart_type == 'scatter_with_histograms':
-        if not pd.api.types.is_numeric_dtype(data[chart.x_axis_column]) or not pd.api.types.is_numeric_dtype(data[chart.y_axis_columns[0]]):
+        if not input_schema.is_numeric(chart.x_axis_column) or not input_schema.is_numeric(chart.y_axis_columns[0]):
             raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'numeric', 'first_column or second_column')
         if chart.x_axis_column == chart.y_axis_columns[0]:
             raise monitored_model_chart_columns_different_values_exception(chart.chart_type, chart.y_axis_columns[0])
@@ -793,7 +1591,7 @@ def validate_chart(chart: MonitoredModelInteractiveChart, data: pd.DataFrame) ->
             raise monitored_model_timeseries_chart_y_axis_columns_not_None_exception()
         else:
             for y_column in chart.y_axis_columns:
-                if not pd.api.types.is_numeric_dtype(data[y_column]):
+                if not input_schema.is_numeric(y_column):
                     raise monitored_model_chart_column_bad_type_exception(chart.chart_type, 'numeric', 'y_axis_columns')
         if chart.bin_method is not None:
             raise monitored_model_chart_bad_bin_method_type_exception(chart.chart_type)
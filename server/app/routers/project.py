@@ -1,72 +1,76 @@
 from datetime import datetime
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Response, status
 from beanie import PydanticObjectId
+from beanie.exceptions import RevisionIdWasChanged
+from pymongo.errors import DuplicateKeyError
 from typing import List, Dict
 
-from app.models.dataset import Dataset
-from app.models.experiment import Experiment
-from app.models.iteration import Iteration
+from app.models.iteration_document import IterationDocument
+from app.models.metric_series import MetricSeries
 from app.models.project import Project, UpdateProject, DisplayProject
-from app.routers.exceptions.dataset import dataset_not_found_exception
 from app.routers.exceptions.iteration import iteration_in_experiment_in_project_assigned_to_monitored_model_exception
 from app.routers.exceptions.project import (
     project_not_found_exception,
     project_title_not_unique_exception,
 )
+from app.utils.iteration import attach_iterations, unlink_iterations_from_datasets, get_iterations_activity
+from app.utils.pagination import ListPage, find_page
 
 router = APIRouter()
 
+DISPLAY_PROJECT_PROJECTION = {"title": 1, "description": 1, "status": 1, "archived": 1, "created_at": 1,
+                              "updated_at": 1, "pinned": 1, "experiments.name": 1}
+
+PROJECT_SORT_FIELDS = ['created_at', 'updated_at', 'title']
+
 
 @router.get("/", response_model=List[Project], status_code=status.HTTP_200_OK)
-async def get_all_projects() -> List[Project]:
+async def get_all_projects(response: Response, page: ListPage = Depends(),
+                           include_iterations: bool = True) -> List[Project]:
     """
-    Get all projects.
+    Get all projects, sorted by creation date by default. <br>
+    **NOTE:** number of matching projects is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of projects in page (1-1000), all projects if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'title'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in titles and descriptions
+    - **include_iterations (bool)**: Include iterations of experiments, experiments without iterations if False
 
     Returns:
     - **List[Project]**: List of all projects.
     """
-    projects = await Project.find_all().to_list()
+    documents = await find_page(Project.get_motor_collection(), response, {}, page, PROJECT_SORT_FIELDS)
+    projects = [Project.parse_obj(document) for document in documents]
+    if include_iterations:
+        await attach_iterations([experiment for project in projects for experiment in project.experiments])
+
     return projects
 
 
 @router.get("/base", response_model=List[DisplayProject], status_code=status.HTTP_200_OK)
-async def get_all_projects_base() -> List[DisplayProject]:
+async def get_all_projects_base(response: Response, page: ListPage = Depends()) -> List[DisplayProject]:
     """
-    Get base information about all projects.
+    Get base information about all projects, sorted by creation date by default. <br>
+    **NOTE:** number of matching projects is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of projects in page (1-1000), all projects if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'title'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in titles and descriptions
 
     Returns:
     - **List[DisplayProject]**: List of base information about all projects.
     """
+    projects = await find_page(Project.get_motor_collection(), response, {}, page, PROJECT_SORT_FIELDS,
+                               DISPLAY_PROJECT_PROJECTION)
 
-    projects = await Project.find_all().to_list()
-    display_projects = []
-
-    for project in projects:
-        display_project = DisplayProject(
-            id=project.id,
-            title=project.title,
-            description=project.description,
-            status=project.status,
-            archived=project.archived,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            experiments=[]
-        )
-
-        experiments_names = [experiment.name for experiment in project.experiments]
-
-        display_project.experiments = experiments_names
-
-        display_projects.append(display_project)
-
-    return display_projects
+    return await get_display_projects(projects)
 
 
 @router.get("/{id}/base", response_model=DisplayProject, status_code=status.HTTP_200_OK)
@@ -80,61 +84,77 @@ async def get_project_base(id: PydanticObjectId) -> DisplayProject:
     Returns:
     - **DisplayProject**: Base information about project.
     """
-    project = await Project.get(id)
+    project = await Project.get_motor_collection().find_one({"_id": id}, DISPLAY_PROJECT_PROJECTION)
     if not project:
         raise project_not_found_exception()
 
-    display_project = DisplayProject(
-        id=project.id,
-        title=project.title,
-        description=project.description,
-        status=project.status,
-        archived=project.archived,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        experiments=[experiment.name for experiment in project.experiments]
-    )
+    display_projects = await get_display_projects([project])
 
-    return display_project
+    return display_projects[0]
 
 
 @router.get("/non-archived", response_model=List[Project], status_code=status.HTTP_200_OK)
-async def get_non_archived_projects() -> List[Project]:
+async def get_non_archived_projects(response: Response, page: ListPage = Depends(),
+                                    include_iterations: bool = True) -> List[Project]:
     """
-    Get all non-archived projects.
+    Get all non-archived projects, sorted by creation date by default. <br>
+    **NOTE:** number of matching projects is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of projects in page (1-1000), all projects if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'title'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in titles and descriptions
+    - **include_iterations (bool)**: Include iterations of experiments, experiments without iterations if False
 
     Returns:
     - **List[Project]**: List of all non-archived projects.
     """
-    projects = await Project.find(Project.archived == False).to_list()
+    documents = await find_page(Project.get_motor_collection(), response, {"archived": False}, page,
+                                PROJECT_SORT_FIELDS)
+    projects = [Project.parse_obj(document) for document in documents]
+    if include_iterations:
+        await attach_iterations([experiment for project in projects for experiment in project.experiments])
+
     return projects
 
 
 @router.get("/archived", response_model=List[Project], status_code=status.HTTP_200_OK)
-async def get_archived_projects() -> List[Project]:
+async def get_archived_projects(response: Response, page: ListPage = Depends(),
+                                include_iterations: bool = True) -> List[Project]:
     """
-    Get all archived projects.
+    Get all archived projects, sorted by creation date by default. <br>
+    **NOTE:** number of matching projects is returned in 'X-Total-Count' header.
 
     Args:
-    - **None**
+    - **limit (Optional[int])**: Maximum number of projects in page (1-1000), all projects if not set
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page
+    - **sort_by (str)**: Sort field, 'created_at' (default), 'updated_at' or 'title'
+    - **order (str)**: Sort order, 'asc' or 'desc'
+    - **search (Optional[str])**: Words searched in titles and descriptions
+    - **include_iterations (bool)**: Include iterations of experiments, experiments without iterations if False
 
     Returns:
     - **List[Project]**: List of all archived projects.
     """
-    projects = await Project.find(Project.archived == True).to_list()
+    documents = await find_page(Project.get_motor_collection(), response, {"archived": True}, page,
+                                PROJECT_SORT_FIELDS)
+    projects = [Project.parse_obj(document) for document in documents]
+    if include_iterations:
+        await attach_iterations([experiment for project in projects for experiment in project.experiments])
+
     return projects
 
 
 @router.get("/{id}", response_model=Project, status_code=status.HTTP_200_OK)
-async def get_project(id: PydanticObjectId) -> Project:
+async def get_project(id: PydanticObjectId, include_iterations: bool = True) -> Project:
     """
     Get project by id.
 
     Args:
     - **id** (PydanticObjectId): Project id.
+    - **include_iterations** (bool): Include iterations of experiments, experiments without iterations if False.
 
     Returns:
     - **Project**: Project with given id.
@@ -143,6 +163,9 @@ async def get_project(id: PydanticObjectId) -> Project:
     if not project:
         raise project_not_found_exception()
 
+    if include_iterations:
+        await attach_iterations(project.experiments)
+
     return project
 
 
@@ -161,7 +184,12 @@ async def add_project(project: Project) -> Project:
     if not title_unique:
         raise project_title_not_unique_exception()
 
-    await project.insert()
+    try:
+        await project.insert()
+    except DuplicateKeyError:
+        # project with the same title added concurrently
+        raise project_title_not_unique_exception()
+
     return project
 
 
@@ -185,23 +213,19 @@ async def update_project(id: PydanticObjectId, updated_project: UpdateProject) -
         raise project_title_not_unique_exception()
 
     updated_project.updated_at = datetime.now()
-    await project.update({"$set": updated_project.dict(exclude_unset=True)})
+    try:
+        await project.update({"$set": updated_project.dict(exclude_unset=True)})
+    except (DuplicateKeyError, RevisionIdWasChanged):
+        # beanie raises duplicate key error of update as RevisionIdWasChanged
+        raise project_title_not_unique_exception()
     await project.save()
 
     await update_iteration_project_title(project)
 
-    display_project = DisplayProject(
-        id=project.id,
-        title=project.title,
-        description=project.description,
-        status=project.status,
-        archived=project.archived,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        experiments=[experiment.name for experiment in project.experiments]
-    )
+    display_projects = await get_display_projects(
+        [await Project.get_motor_collection().find_one({"_id": id}, DISPLAY_PROJECT_PROJECTION)])
 
-    return display_project
+    return display_projects[0]
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -219,27 +243,32 @@ async def delete_project(id: PydanticObjectId):
     if not project:
         raise project_not_found_exception()
 
-    experiments = project.experiments
-
-    for experiment in experiments:
-        iterations = experiment.iterations
-        for iteration in iterations:
-            if iteration.assigned_monitored_model_id:
-                raise iteration_in_experiment_in_project_assigned_to_monitored_model_exception()
+    collection = IterationDocument.get_motor_collection()
+    if await collection.find_one({"project_id": project.id, "assigned_monitored_model_id": {"$ne": None}},
+                                 {"_id": 1}):
+        raise iteration_in_experiment_in_project_assigned_to_monitored_model_exception()
 
-    await delete_iterations_from_dataset_deleting_project(experiments)
+    iterations = await collection.find({"project_id": project.id, "dataset": {"$ne": None}},
+                                       {"dataset": 1}).to_list(length=None)
+    await unlink_iterations_from_datasets(iterations)
 
     await project.delete()
+
+    await collection.delete_many({"project_id": project.id})
+    experiment_ids = [experiment.id for experiment in project.experiments]
+    await MetricSeries.find({"experiment_id": {"$in": experiment_ids}}).delete()
+
     return None
 
 
 @router.get("/title/{title}", response_model=Project, status_code=status.HTTP_200_OK)
-async def get_project_by_title(title: str) -> Project:
+async def get_project_by_title(title: str, include_iterations: bool = True) -> Project:
     """
     Get project by title.
 
     Args:
     - **title** (str): Project title.
+    - **include_iterations** (bool): Include iterations of experiments, experiments without iterations if False.
 
     Returns:
     - **Project**: Project with given title.
@@ -248,6 +277,9 @@ async def get_project_by_title(title: str) -> Project:
     if not project:
         raise project_not_found_exception()
 
+    if include_iterations:
+        await attach_iterations(project.experiments)
+
     return project
 
 
@@ -269,42 +301,45 @@ async def is_title_unique(title: str) -> bool:
     return True
 
 
-async def delete_iterations_from_dataset_deleting_project(experiments: List[Experiment]) -> None:
+async def update_iteration_project_title(project: Project) -> None:
     """
-    Util function for deleting iterations from dataset when deleting project.
+    Util function for updating project title inside iterations.
 
     Args:
-        experiments: List of experiments.
+        project: Project.
 
     Returns:
         None
     """
-    for experiment in experiments:
-        iterations = experiment.iterations
-        for iteration in iterations:
-            if iteration.dataset:
-                dataset = await Dataset.get(iteration.dataset.id)
-                if not dataset:
-                    raise dataset_not_found_exception()
-
-                del dataset.linked_iterations[str(iteration.id)]
-                await dataset.save()
+    await IterationDocument.get_motor_collection().update_many({"project_id": project.id},
+                                                               {"$set": {"project_title": project.title}})
 
     return None
 
 
-async def update_iteration_project_title(project: Project) -> None:
+async def get_display_projects(projects: List[dict]) -> List[DisplayProject]:
     """
-    Util function for updating project title inside iteration.
+    Util function for building base information about projects from project documents with display fields only.
+    Iterations of all projects are counted with one aggregation.
 
     Args:
-        project: Project.
+        projects: Project documents projected with DISPLAY_PROJECT_PROJECTION.
 
     Returns:
-        None
+        Base information about projects.
     """
-    for experiment in project.experiments:
-        for iteration in experiment.iterations:
-            iteration.project_title = project.title
+    activity = await get_iterations_activity("project_id", [project["_id"] for project in projects])
+    display_projects = []
 
-    await project.save()
+    for project in projects:
+        iterations_count, last_iteration_at = activity.get(project["_id"], (0, None))
+        display_project = DisplayProject(
+            **{key: value for key, value in project.items() if key != "experiments"},
+            experiments=[experiment["name"] for experiment in project.get("experiments", [])],
+            iterations_count=iterations_count
+        )
+        display_project.last_activity_at = max(filter(None, [display_project.updated_at, last_iteration_at]),
+                                               default=None)
+        display_projects.append(display_project)
+
+    return display_projects
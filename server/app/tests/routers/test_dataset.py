@@ -452,3 +452,159 @@ async def test_update_dataset_to_existing_pair_of_name_and_version_failure(clien
     response = await client.put(f"/datasets/{dataset_id}", json=updated_dataset)
     assert response.status_code == 400
     assert response.json()["detail"] == "Dataset name and version must be unique."
+
+
+@pytest.mark.asyncio
+async def test_update_dataset_version_to_existing_pair_of_name_and_version_failure(client: AsyncClient):
+    """
+    Test update only version of dataset to existing pair of name and version.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    test_file_path = os.path.join(os.path.dirname(__file__), "test_files", "test_dataset.csv")
+    dataset_ids = []
+
+    for version in ["1.0.0", "1.0.1"]:
+        response = await client.post("/datasets/", json={"dataset_name": "Test dataset 10", "version": version,
+                                                         "path_to_dataset": test_file_path})
+        assert response.status_code == 201
+        dataset_ids.append(response.json()["_id"])
+
+    response = await client.put(f"/datasets/{dataset_ids[1]}", json={"version": "1.0.0"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Dataset name and version must be unique."
+
+    response = await client.get(f"/datasets/{dataset_ids[1]}")
+    assert response.json()["version"] == "1.0.1"
+
+
+@pytest.mark.asyncio
+async def test_update_dataset_with_linked_iterations(client: AsyncClient):
+    """
+    Test update name and version of dataset linked to iterations of different projects.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    test_file_path = os.path.join(os.path.dirname(__file__), "test_files", "test_dataset.csv")
+    response = await client.post("/datasets/", json={"dataset_name": "Test dataset 11", "version": "1.0.0",
+                                                     "path_to_dataset": test_file_path})
+    assert response.status_code == 201
+    dataset_id = response.json()["_id"]
+
+    iterations = []
+    for title in ["Test project dataset 1", "Test project dataset 2"]:
+        response = await client.post("/projects/", json={"title": title})
+        project_id = response.json()["_id"]
+        response = await client.post(f"/projects/{project_id}/experiments/", json={"name": "Test experiment"})
+        experiment_id = response.json()["id"]
+
+        for iteration_name in ["Test iteration 1", "Test iteration 2"]:
+            response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/",
+                                         json={"iteration_name": iteration_name, "dataset": {"id": dataset_id}})
+            assert response.status_code == 201
+            iterations.append((project_id, experiment_id, response.json()["id"]))
+
+    response = await client.get(f"/datasets/{dataset_id}")
+    assert sorted(response.json()["linked_iterations"]) == sorted(iteration[2] for iteration in iterations)
+
+    response = await client.put(f"/datasets/{dataset_id}", json={"dataset_name": "Test dataset 12", "version": "2.0.0"})
+    assert response.status_code == 200
+
+    for project_id, experiment_id, iteration_id in iterations:
+        response = await client.get(f"/projects/{project_id}/experiments/{experiment_id}/iterations/{iteration_id}")
+        assert response.json()["dataset"] == {"id": dataset_id, "name": "Test dataset 12", "version": "2.0.0"}
+
+    project_id, experiment_id, iteration_id = iterations[0]
+    response = await client.delete(f"/projects/{project_id}/experiments/{experiment_id}/iterations/{iteration_id}")
+    assert response.status_code == 204
+    response = await client.delete(f"/projects/{iterations[2][0]}")
+    assert response.status_code == 204
+
+    response = await client.get(f"/datasets/{dataset_id}")
+    assert list(response.json()["linked_iterations"]) == [iterations[1][2]]
+
+    response = await client.delete(f"/datasets/{dataset_id}")
+    assert response.status_code == 204
+
+    response = await client.get(f"/projects/{project_id}/experiments/{experiment_id}/iterations/{iterations[1][2]}")
+    assert response.json()["dataset"] is None
+
+    response = await client.delete(f"/projects/{project_id}")
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_create_dataset_unreachable_url(client: AsyncClient):
+    """
+    Test create dataset with URL which can not be connected to, validation result is cached.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    dataset = {
+        "dataset_name": "Test dataset 13",
+        "path_to_dataset": "https://mlops-test.invalid/dataset.csv"
+    }
+
+    response = await client.get("/datasets/url-validation")
+    assert response.status_code == 200
+    stats = response.json()
+
+    for _ in range(2):
+        response = await client.post("/datasets/", json=dataset)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Invalid URL or unable to connect to the URL."
+
+    response = await client.get("/datasets/url-validation")
+    assert response.json()["misses"] == stats["misses"] + 1
+    assert response.json()["hits"] == stats["hits"] + 1
+
+
+@pytest.mark.asyncio
+async def test_get_datasets_by_content_hash(client: AsyncClient):
+    """
+    Test create dataset with profile and find datasets with the same content hash.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    test_file_path = os.path.join(os.path.dirname(__file__), "test_files", "test_dataset.csv")
+    content_hash = "a" * 64
+    profile = {
+        "content_hash": content_hash,
+        "size": 100,
+        "format": "csv",
+        "rows_count": 10,
+        "columns_count": 1,
+        "quantile_levels": [0.5],
+        "columns": [{"name": "x", "dtype": "int64", "count": 10, "null_count": 0, "min": 0, "max": 9,
+                     "quantiles": [4.5]}]
+    }
+
+    for version in ["1.0.0", "2.0.0"]:
+        response = await client.post("/datasets/", json={"dataset_name": "Test dataset 14", "version": version,
+                                                         "path_to_dataset": test_file_path, "profile": profile})
+        assert response.status_code == 201
+        assert response.json()["profile"]["columns"][0]["quantiles"] == [4.5]
+
+    response = await client.get(f"/datasets/content-hash/{content_hash}")
+    assert response.status_code == 200
+    assert [dataset["version"] for dataset in response.json()] == ["1.0.0", "2.0.0"]
+
+    response = await client.get(f"/datasets/content-hash/{'b' * 64}")
+    assert response.status_code == 200
+    assert response.json() == []
@@ -1,8 +1,12 @@
+import asyncio
 import os
 
 import pytest
 import logging
 import base64
+import hashlib
+
+import numpy as np
 
 from httpx import AsyncClient
 from app.database.init_mongo_db import drop_database
@@ -794,6 +798,70 @@ async def test_add_iteration_with_pie_plot(client: AsyncClient):
     assert response.json()["detail"] == "x_data and y_data can only have one list of data"
 
 
+@pytest.mark.asyncio
+async def test_add_iteration_with_encoded_line_plot(client: AsyncClient):
+    """
+    Test add iteration with line plot of encoded data and get raw data of chart axes.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}")
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response_exp = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response_exp.json()["id"]
+
+    y_data = np.array([[0.5, 0.25, 0.125], [1, 2, 3]], dtype='<f4')
+    encoded_y_data = {"dtype": "float32", "shape": [2, 3], "data": base64.b64encode(y_data.tobytes()).decode()}
+    iteration = {
+        "iteration_name": "Test iteration with encoded line plot",
+        "interactive_charts": [
+            {
+                "chart_type": "line",
+                "name": "line_plot-1",
+                "chart_title": "Loss",
+                "x_data": [[1, 2, 3]],
+                "y_data": encoded_y_data,
+                "y_data_names": ["train", "test"]
+            }
+        ]
+    }
+
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 201
+    assert response.json()["interactive_charts"][0]["y_data"] == encoded_y_data
+    iteration_id = response.json()["id"]
+
+    url = f"/projects/{project_id}/experiments/{experiment_id}/iterations/{iteration_id}/charts/line_plot-1/data"
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.headers["X-Chart-Dtype"] == "float32"
+    assert response.headers["X-Chart-Shape"] == "2,3"
+    assert response.content == y_data.tobytes()
+
+    response = await client.get(url, params={"axis": "x"})
+    assert response.status_code == 200
+    assert response.headers["X-Chart-Dtype"] == "float64"
+    assert response.headers["X-Chart-Shape"] == "1,3"
+    assert np.frombuffer(response.content, dtype='<f8').tolist() == [1, 2, 3]
+
+    response = await client.get(url.replace("line_plot-1", "line_plot-2"))
+    assert response.status_code == 404
+
+    iteration["iteration_name"] = "Test iteration with invalid encoded line plot"
+    iteration["interactive_charts"][0]["y_data"] = {**encoded_y_data, "shape": [2, 4]}
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "data of encoded chart data must be base64 encoded array of dtype and shape"
+
+
 @pytest.mark.asyncio
 async def test_delete_iteration_assigned_to_monitored_model(client: AsyncClient):
     """
@@ -849,3 +917,514 @@ async def test_delete_iteration_assigned_to_monitored_model(client: AsyncClient)
     assert response.status_code == 400
     assert response.json()["detail"] == ("Iteration is assigned to monitored model. Cannot delete it. "
                                          "Please delete monitored model first.")
+
+
+@pytest.mark.asyncio
+async def test_add_iteration_with_ml_model_artifact(client: AsyncClient):
+    """
+    Test add iteration with encoded ml model, which is moved into the artifact store.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}")
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response.json()["id"]
+
+    with open(os.path.join(os.path.dirname(__file__), "test_files", "linear_regression_model.pkl"), "rb") as file:
+        ml_model_data = file.read()
+
+    iteration = {
+        "iteration_name": "Iteration with ml model artifact",
+        "path_to_model": os.path.join(
+            os.path.dirname(__file__), "test_files", "linear_regression_model.pkl"
+        ),
+        "encoded_ml_model": base64.b64encode(ml_model_data).decode("utf-8")
+    }
+
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 201
+    assert response.json()["encoded_ml_model"] is None
+    assert response.json()["ml_model_artifact_id"] == hashlib.sha256(ml_model_data).hexdigest()
+    artifact_id = response.json()["ml_model_artifact_id"]
+
+    iteration["iteration_name"] = "Iteration with the same ml model artifact"
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 201
+    assert response.json()["ml_model_artifact_id"] == artifact_id
+
+    response = await client.get(f"/artifacts/{artifact_id}")
+    assert response.status_code == 200
+    assert response.content == ml_model_data
+
+    response = await client.get(f"/artifacts/{'0' * 64}")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Artifact not found."
+
+    iteration["encoded_ml_model"] = "not base64 encoded ml model"
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Encoded ml model is not a valid base64 string."
+
+
+@pytest.mark.asyncio
+async def test_add_iteration_with_uploaded_ml_model_artifact(client: AsyncClient):
+    """
+    Test add iteration with ml model uploaded in chunks to the artifact store.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}")
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response.json()["id"]
+
+    ml_model_data = b"uploaded ml model " * 1000
+    sha256 = hashlib.sha256(ml_model_data).hexdigest()
+
+    response = await client.post("/artifacts/uploads", json={"size": len(ml_model_data), "sha256": sha256})
+    assert response.status_code == 201
+    assert response.json()["offset"] == 0
+    assert response.json()["artifact_id"] is None
+    upload_id = response.json()["_id"]
+
+    response = await client.patch(f"/artifacts/uploads/{upload_id}", params={"offset": 0},
+                                  content=ml_model_data[:10000])
+    assert response.status_code == 200
+    assert response.json()["offset"] == 10000
+
+    response = await client.patch(f"/artifacts/uploads/{upload_id}", params={"offset": 0},
+                                  content=ml_model_data[:10000])
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Chunk offset does not match artifact upload offset 10000."
+
+    response = await client.post(f"/artifacts/uploads/{upload_id}/complete")
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"Artifact upload is incomplete, received 10000 of {len(ml_model_data)} bytes."
+
+    async def chunked(data: bytes):
+        for start in range(0, len(data), 1000):
+            yield data[start:start + 1000]
+
+    for content in (ml_model_data, chunked(ml_model_data)):
+        response = await client.patch(f"/artifacts/uploads/{upload_id}", params={"offset": 10000}, content=content)
+        assert response.status_code == 413
+        assert response.json()["detail"] == f"Uploaded data exceeds declared artifact size {len(ml_model_data)}."
+
+    response = await client.get(f"/artifacts/uploads/{upload_id}")
+    offset = response.json()["offset"]
+    response = await client.patch(f"/artifacts/uploads/{upload_id}", params={"offset": offset},
+                                  content=ml_model_data[offset:])
+    assert response.status_code == 200
+    assert response.json()["offset"] == len(ml_model_data)
+
+    response = await client.post(f"/artifacts/uploads/{upload_id}/complete")
+    assert response.status_code == 200
+    assert response.json()["artifact_id"] == sha256
+
+    response = await client.get(f"/artifacts/{sha256}")
+    assert response.status_code == 200
+    assert response.content == ml_model_data
+
+    response = await client.post("/artifacts/uploads", json={"size": len(ml_model_data), "sha256": sha256})
+    assert response.status_code == 201
+    assert response.json()["artifact_id"] == sha256
+    assert response.json()["offset"] == len(ml_model_data)
+
+    iteration = {
+        "iteration_name": "Iteration with uploaded ml model artifact",
+        "path_to_model": "model.pkl",
+        "ml_model_artifact_id": sha256
+    }
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 201
+    assert response.json()["ml_model_artifact_id"] == sha256
+
+    iteration["ml_model_artifact_id"] = "0" * 64
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/", json=iteration)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Ml model artifact not found. Upload ml model before adding iteration."
+
+    response = await client.post("/artifacts/uploads", json={"sha256": "0" * 64})
+    upload_id = response.json()["_id"]
+    await client.patch(f"/artifacts/uploads/{upload_id}", params={"offset": 0}, content=b"corrupted ml model")
+    response = await client.post(f"/artifacts/uploads/{upload_id}/complete")
+    assert response.status_code == 400
+    response = await client.get(f"/artifacts/uploads/{upload_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_add_metric_points_of_running_iteration(client: AsyncClient):
+    """
+    Test add step-wise metric values of running iteration and get downsampled metric series.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}")
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response.json()["id"]
+
+    iteration_id = "6540f4a7c1d2e3f4a5b6c7d8"
+    iterations_url = f"/projects/{project_id}/experiments/{experiment_id}/iterations"
+
+    for start in range(0, 3000, 1500):
+        steps = list(range(start, start + 1500))
+        batch = {"metrics": {"loss": {"steps": steps, "values": [1 / (step + 1) for step in steps]}}}
+        response = await client.post(f"{iterations_url}/{iteration_id}/metrics", json=batch)
+        assert response.status_code == 201
+        assert response.json() == {"loss": 1500}
+
+    # resent point replaces the point logged at the same step
+    batch = {"metrics": {"loss": {"steps": [2999], "values": [0.5]}, "accuracy": {"steps": [0], "values": [0.1]}}}
+    response = await client.post(f"{iterations_url}/{iteration_id}/metrics", json=batch)
+    assert response.status_code == 201
+
+    response = await client.post(f"{iterations_url}/{iteration_id}/metrics",
+                                 json={"metrics": {"loss": {"steps": [1, 2], "values": [0.5]}}})
+    assert response.status_code == 422
+
+    response = await client.get(f"{iterations_url}/{iteration_id}/metrics", params={"max_points": 100})
+    assert response.status_code == 200
+    loss = response.json()["loss"]
+    assert loss["count"] == 3000
+    assert len(loss["steps"]) == len(loss["values"]) == len(loss["timestamps"]) == 100
+    assert loss["steps"][0] == 0 and loss["steps"][-1] == 2999
+    assert loss["steps"] == sorted(loss["steps"])
+    assert loss["values"][-1] == 0.5
+    assert response.json()["accuracy"]["count"] == 1
+
+    response = await client.get(f"{iterations_url}/{iteration_id}/metrics", params={"name": "accuracy"})
+    assert list(response.json()) == ["accuracy"]
+
+    iteration = {"id": iteration_id, "iteration_name": "Iteration with metric series", "metrics": {"loss": 0.5}}
+    response = await client.post(f"{iterations_url}/", json=iteration)
+    assert response.status_code == 201
+    assert response.json()["id"] == iteration_id
+
+    response = await client.post(f"{iterations_url}/", json=iteration)
+    assert response.status_code == 409
+
+    response = await client.delete(f"{iterations_url}/{iteration_id}")
+    assert response.status_code == 204
+
+    response = await client.get(f"{iterations_url}/{iteration_id}/metrics")
+    assert response.status_code == 200
+    assert response.json() == {}
+
+
+@pytest.mark.asyncio
+async def test_add_iterations_in_bulk(client: AsyncClient):
+    """
+    Test add many iterations at once with status of every iteration.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}")
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response.json()["id"]
+    iterations_count = len(response.json()["iterations"])
+
+    dataset = {
+        "dataset_name": "Test dataset of sweep",
+        "path_to_dataset": "datasets/sweep.csv",
+        "version": "1.0"
+    }
+    response = await client.post("/datasets/", json=dataset)
+    assert response.status_code == 201
+    dataset_id = response.json()["_id"]
+
+    chart = {"chart_type": "line", "chart_title": "Loss", "x_data": [[1, 2]], "y_data": [[1, 2]]}
+    iterations = [
+        {"iteration_name": f"Sweep trial {trial}", "parameters": {"trial": trial}, "dataset": {"id": dataset_id}}
+        for trial in range(3)
+    ]
+    iterations.append({"iteration_name": "Sweep trial with duplicated chart names",
+                       "interactive_charts": [{**chart, "name": "chart"}, {**chart, "name": "chart"}]})
+    iterations.append({"iteration_name": "Sweep trial with missing dataset",
+                       "dataset": {"id": "5f9b3b7e9c9d6c0a3c7b3b7e"}})
+    iterations.append({**iterations[0], "id": "6540f4a7c1d2e3f4a5b6c7d9"})
+    iterations.append({**iterations[0], "id": "6540f4a7c1d2e3f4a5b6c7d9"})
+
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/bulk",
+                                 json=iterations)
+    assert response.status_code == 207
+    results = response.json()
+    assert [result["status_code"] for result in results] == [201, 201, 201, 400, 404, 201, 409]
+    assert results[4]["detail"] == "Dataset not found."
+    assert results[5]["id"] == "6540f4a7c1d2e3f4a5b6c7d9"
+
+    response = await client.get(f"/projects/{project_id}/experiments/{experiment_id}/iterations/")
+    added_iterations = response.json()[iterations_count:]
+    assert [iteration["iteration_name"] for iteration in added_iterations] == \
+           ["Sweep trial 0", "Sweep trial 1", "Sweep trial 2", "Sweep trial 0"]
+    assert added_iterations[1]["dataset"]["name"] == "Test dataset of sweep"
+    assert added_iterations[1]["project_title"] == project_title
+
+    response = await client.get(f"/datasets/{dataset_id}")
+    linked_iterations = response.json()["linked_iterations"]
+    assert set(linked_iterations) == {result["id"] for result in results if result["status_code"] == 201}
+
+    for iteration in added_iterations:
+        response = await client.delete(
+            f"/projects/{project_id}/experiments/{experiment_id}/iterations/{iteration['id']}")
+        assert response.status_code == 204
+
+    response = await client.delete(f"/datasets/{dataset_id}")
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_add_iterations_concurrently(client: AsyncClient):
+    """
+    Test concurrent adding, renaming and deleting iterations of one experiment, which must not lose updates.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}")
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response.json()["id"]
+    iterations_count = len(response.json()["iterations"])
+    iterations_url = f"/projects/{project_id}/experiments/{experiment_id}/iterations"
+
+    responses = await asyncio.gather(*[
+        client.post(f"{iterations_url}/", json={"iteration_name": f"Parallel trial {trial}"}) for trial in range(10)
+    ])
+    assert all(response.status_code == 201 for response in responses)
+    iteration_ids = [response.json()["id"] for response in responses]
+
+    responses = await asyncio.gather(
+        *[client.put(f"{iterations_url}/{id}", json={"iteration_name": f"Renamed trial {trial}"})
+          for trial, id in enumerate(iteration_ids[:5])],
+        *[client.delete(f"{iterations_url}/{id}") for id in iteration_ids[5:]]
+    )
+    assert [response.status_code for response in responses] == [200] * 5 + [204] * 5
+    assert responses[0].json()["iteration_name"] == "Renamed trial 0"
+    assert responses[0].json()["experiment_name"] == experiment_name
+
+    response = await client.get(f"{iterations_url}/")
+    iterations = response.json()
+    assert len(iterations) == iterations_count + 5
+    assert [iteration["iteration_name"] for iteration in iterations[iterations_count:]] == \
+           [f"Renamed trial {trial}" for trial in range(5)]
+
+    response = await client.put(f"{iterations_url}/{iteration_ids[5]}", json={"iteration_name": "Deleted trial"})
+    assert response.status_code == 404
+
+    for id in iteration_ids[:5]:
+        response = await client.delete(f"{iterations_url}/{id}")
+        assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_get_project_without_iterations(client: AsyncClient):
+    """
+    Test get project and experiment with and without iterations, which are stored in iteration collection.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}", params={"include_iterations": False})
+    assert response.status_code == 200
+    project_id = response.json()["_id"]
+    assert all(experiment["iterations"] == [] for experiment in response.json()["experiments"])
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}",
+                                params={"include_iterations": False})
+    assert response.status_code == 200
+    assert response.json()["iterations"] == []
+    experiment_id = response.json()["id"]
+
+    response = await client.get(f"/projects/{project_id}/experiments/{experiment_id}/iterations/")
+    iterations = response.json()
+    assert iterations
+
+    response = await client.get(f"/projects/{project_id}")
+    experiment = next(exp for exp in response.json()["experiments"] if exp["id"] == experiment_id)
+    assert experiment["iterations"] == iterations
+
+    response = await client.get(f"/projects/{project_id}/experiments/{experiment_id}/iterations/"
+                                f"{iterations[0]['id']}")
+    assert response.json() == iterations[0]
+
+    response = await client.get(f"/projects/{project_id}/experiments/5f9b3b7e9c9d6c0a3c7b3b7e/iterations/"
+                                f"{iterations[0]['id']}")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Experiment not found."
+
+
+@pytest.mark.asyncio
+async def test_query_iterations(client: AsyncClient):
+    """
+    Test query iterations filtered by parameters, sorted by metric, with projection and pagination.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}", params={"include_iterations": False})
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}",
+                                params={"include_iterations": False})
+    experiment_id = response.json()["id"]
+    iterations_url = f"/projects/{project_id}/experiments/{experiment_id}/iterations"
+
+    iterations = [
+        {"iteration_name": f"Query trial {trial}", "parameters": {"lr": lr}, "metrics": {"val_auc": val_auc}}
+        for trial, (lr, val_auc) in enumerate([(0.001, 0.7), (0.005, 0.9), (0.1, 0.95), (0.002, 0.8), (0.003, 0.85)])
+    ]
+    response = await client.post(f"{iterations_url}/bulk", json=iterations)
+    iteration_ids = [result["id"] for result in response.json()]
+
+    query = {
+        "parameters": {"lr": {"lt": 0.01}},
+        "metrics": {"val_auc": {"gte": 0.5}},
+        "sort_by": "metrics.val_auc",
+        "order": "desc",
+        "limit": 3,
+        "fields": ["iteration_name", "parameters.lr"]
+    }
+    response = await client.post(f"{iterations_url}/query", json=query)
+    assert response.status_code == 200
+    page = response.json()
+    assert [iteration["iteration_name"] for iteration in page["iterations"]] == \
+           ["Query trial 1", "Query trial 4", "Query trial 3"]
+    assert page["iterations"][0] == {"id": iteration_ids[1], "iteration_name": "Query trial 1",
+                                     "parameters": {"lr": 0.005}, "metrics": {"val_auc": 0.9}}
+    assert page["next_cursor"] is not None
+
+    response = await client.post(f"{iterations_url}/query", json={**query, "cursor": page["next_cursor"]})
+    assert response.status_code == 200
+    assert [iteration["iteration_name"] for iteration in response.json()["iterations"]] == ["Query trial 0"]
+    assert response.json()["next_cursor"] is None
+
+    response = await client.post(f"{iterations_url}/query", json={**query, "offset": 3})
+    assert [iteration["iteration_name"] for iteration in response.json()["iterations"]] == ["Query trial 0"]
+
+    response = await client.post(f"{iterations_url}/query", json={"parameters": {"lr": {"in": [0.1]}}})
+    iterations = response.json()["iterations"]
+    assert [iteration["iteration_name"] for iteration in iterations] == ["Query trial 2"]
+    assert "interactive_charts" not in iterations[0]
+    assert iterations[0]["experiment_id"] == experiment_id
+
+    response = await client.post(f"{iterations_url}/query", json={"sort_by": "charts"})
+    assert response.status_code == 400
+
+    response = await client.post(f"{iterations_url}/query", json={"fields": ["encoded_ml_model"]})
+    assert response.status_code == 400
+
+    response = await client.post(f"{iterations_url}/query", json={"cursor": "invalid"})
+    assert response.status_code == 400
+
+    response = await client.post(f"/projects/{project_id}/experiments/delete_iterations",
+                                 json={experiment_id: iteration_ids})
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_get_base_listings_with_iterations_count(client: AsyncClient):
+    """
+    Test base information about projects, experiments and datasets with number of iterations.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_title = "Test project updated"
+    response = await client.get(f"/projects/title/{project_title}", params={"include_iterations": False})
+    project_id = response.json()["_id"]
+
+    experiment_name = "Test experiment updated"
+    response = await client.get(f"/projects/{project_id}/experiments/name/{experiment_name}")
+    experiment_id = response.json()["id"]
+    iterations_count = len(response.json()["iterations"])
+
+    dataset = {"dataset_name": "Test dataset of listing", "path_to_dataset": "datasets/listing.csv", "version": "1.0"}
+    response = await client.post("/datasets/", json=dataset)
+    dataset_id = response.json()["_id"]
+
+    iterations = [{"iteration_name": f"Listing trial {trial}", "dataset": {"id": dataset_id}} for trial in range(2)]
+    response = await client.post(f"/projects/{project_id}/experiments/{experiment_id}/iterations/bulk",
+                                 json=iterations)
+    iteration_ids = [result["id"] for result in response.json()]
+
+    response = await client.get(f"/projects/{project_id}/base")
+    assert response.status_code == 200
+    project = response.json()
+    assert experiment_name in project["experiments"]
+    assert project["iterations_count"] >= iterations_count + 2
+    assert project["last_activity_at"] >= project["updated_at"]
+
+    response = await client.get("/projects/base")
+    assert response.status_code == 200
+    assert next(proj for proj in response.json() if proj["_id"] == project_id) == project
+
+    response = await client.get(f"/projects/{project_id}/experiments/base")
+    assert response.status_code == 200
+    experiment = next(exp for exp in response.json() if exp["id"] == experiment_id)
+    assert experiment["name"] == experiment_name
+    assert experiment["iterations_count"] == iterations_count + 2
+    assert "iterations" not in experiment
+
+    response = await client.get("/datasets/base", params={"archived": False})
+    assert response.status_code == 200
+    dataset = next(data for data in response.json() if data["_id"] == dataset_id)
+    assert dataset["iterations_count"] == 2
+    assert "linked_iterations" not in dataset
+
+    response = await client.post(f"/projects/{project_id}/experiments/delete_iterations",
+                                 json={experiment_id: iteration_ids})
+    assert response.status_code == 204
+
+    response = await client.delete(f"/datasets/{dataset_id}")
+    assert response.status_code == 204
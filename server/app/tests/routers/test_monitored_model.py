@@ -1,14 +1,22 @@
+import asyncio
 import base64
+import json
 import pickle
 
 import pytest
 import os
+from beanie import PydanticObjectId
+from datetime import datetime
 from httpx import AsyncClient
 
 from app.database.init_mongo_db import drop_database
+from app.models.chart_aggregate import ChartAggregate
 from app.models.monitored_model_chart import MonitoredModelInteractiveChart
+from app.models.prediction import Prediction
 from app.routers.exceptions.monitored_model import monitored_model_encoding_pkl_file_exception
 from app.routers.monitored_model import CustomUnpickler
+from app.utils.inference_pool import inference_pool
+from app.utils.ml_model_cache import ml_model_cache
 
 
 def load_ml_model_from_file_and_encode(pkl_file_path) -> str:
@@ -39,6 +47,27 @@ def load_ml_model_from_file_and_encode(pkl_file_path) -> str:
         raise monitored_model_encoding_pkl_file_exception(str(e))
 
 
+async def get_predictions_data(client: AsyncClient, monitored_model_id: str) -> list:
+    """
+    Get all predictions of monitored model, page by page.
+
+    Args:
+        client: Async client.
+        monitored_model_id: Monitored model id.
+
+    Returns:
+        predictions: Predictions sorted by prediction date.
+    """
+    predictions = []
+    params = {"limit": 1000}
+    while True:
+        response = await client.get(f"/monitored-models/{monitored_model_id}/predictions", params=params)
+        predictions += response.json()["predictions"]
+        if response.json()["next_cursor"] is None:
+            return predictions
+        params["cursor"] = response.json()["next_cursor"]
+
+
 @pytest.mark.asyncio
 async def test_empty_get_monitored_models(client: AsyncClient):
     """
@@ -511,7 +540,9 @@ async def test_monitored_ml_model_predict_success_single_data(client: AsyncClien
     monitored_model_name = "Engine failure prediction model v4 changed"
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     assert response.status_code == 200
-    assert len(response.json()["predictions_data"]) == 1
+    assert response.json()["predictions_data"] == []
+    predictions_data = await get_predictions_data(client, response.json()["_id"])
+    assert len(predictions_data) == 1
 
 
 @pytest.mark.asyncio
@@ -552,7 +583,8 @@ async def test_monitored_ml_model_predict_success_multiple_data(client: AsyncCli
     monitored_model_name = "Engine failure prediction model v4 changed"
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     assert response.status_code == 200
-    assert len(response.json()["predictions_data"]) == 3
+    predictions_data = await get_predictions_data(client, response.json()["_id"])
+    assert len(predictions_data) == 3
 
 
 @pytest.mark.asyncio
@@ -587,8 +619,9 @@ async def test_monitored_ml_model_predict_failure(client: AsyncClient):
     monitored_model_name = "Engine failure prediction model v4 changed"
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     assert response.status_code == 200
-    assert len(response.json()["predictions_data"]) == 3
-    assert response.json()["predictions_data"][0]["prediction"] == pytest.approx(7.89043535267264)
+    predictions_data = await get_predictions_data(client, response.json()["_id"])
+    assert len(predictions_data) == 3
+    assert predictions_data[0]["prediction"] == pytest.approx(7.89043535267264)
 
 
 @pytest.mark.asyncio
@@ -622,8 +655,9 @@ async def test_monitored_ml_model_predict_failure_2(client: AsyncClient):
     monitored_model_name = "Engine failure prediction model v4 changed"
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     assert response.status_code == 200
-    assert len(response.json()["predictions_data"]) == 3
-    assert response.json()["predictions_data"][0]["prediction"] == pytest.approx(7.89043535267264)
+    predictions_data = await get_predictions_data(client, response.json()["_id"])
+    assert len(predictions_data) == 3
+    assert predictions_data[0]["prediction"] == pytest.approx(7.89043535267264)
 
 
 @pytest.mark.asyncio
@@ -955,7 +989,8 @@ async def test_create_monitored_model_histogram_chart(client: AsyncClient):
     monitored_model_name = "Engine failure prediction model v8"
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     assert response.status_code == 200
-    assert len(response.json()["predictions_data"]) == 2
+    predictions_data = await get_predictions_data(client, response.json()["_id"])
+    assert len(predictions_data) == 2
 
     chart = {
         "chart_type": "histogram",
@@ -1290,7 +1325,7 @@ async def test_update_actual_value_in_prediction(client: AsyncClient):
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     monitored_model_id = response.json()["_id"]
 
-    prediction_id = response.json()["predictions_data"][0]["id"]
+    prediction_id = (await get_predictions_data(client, monitored_model_id))[0]["id"]
 
     updated_prediction = {
         "actual": 10.0
@@ -1382,13 +1417,12 @@ async def test_delete_actual_value_for_prediction(client: AsyncClient):
     response = await client.get(f"/monitored-models/name/{monitored_model_name}")
     monitored_model_id = response.json()["_id"]
 
-    prediction_id = response.json()["predictions_data"][0]["id"]
+    prediction_id = (await get_predictions_data(client, monitored_model_id))[0]["id"]
 
     await client.delete(f"monitored-models/{monitored_model_id}/predictions/{prediction_id}/actual")
 
-    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
-    assert response.status_code == 200
-    assert response.json()["predictions_data"][0]["actual"] is None
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+    assert predictions_data[0]["actual"] is None
 
 
 @pytest.mark.asyncio
@@ -1566,3 +1600,583 @@ async def test_create_monitored_model_failure_no_iteration(client: AsyncClient):
     }
     response = await client.post("/monitored-models/", json=monitored_model)
     assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_monitored_ml_model_predict_uses_ml_model_cache(client: AsyncClient):
+    """
+    Test monitored model predict uses decoded ml models cache.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    assert response.status_code == 200
+
+    monitored_model_id = response.json()["_id"]
+    data = [
+        {
+            "X1": 1.0,
+            "X2": 2.0
+        }
+    ]
+
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=data)
+    assert response.status_code == 200
+
+    response = await client.get("/monitored-models/ml-model-cache")
+    assert response.status_code == 200
+    hits = response.json()["hits"]
+
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=data)
+    assert response.status_code == 200
+    assert response.json()[0]["prediction"] == pytest.approx(7.89043535267264)
+
+    response = await client.get("/monitored-models/ml-model-cache")
+    assert response.status_code == 200
+    assert response.json()["hits"] == hits + 1
+    assert response.json()["size"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_update_actual_value_in_not_existing_prediction(client: AsyncClient):
+    """
+    Test update actual value in prediction which does not exist.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+
+    updated_prediction = {
+        "actual": 10.0
+    }
+
+    response = await client.put(f"monitored-models/{monitored_model_id}/predictions/5f9b3b7e9c9d6c0a3c7b3b7e",
+                                json=updated_prediction)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Monitored model prediction with such id not found."
+
+
+@pytest.mark.asyncio
+async def test_get_monitored_model_predictions_pages(client: AsyncClient):
+    """
+    Test get monitored model predictions page by page.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+
+    predictions = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(f"/monitored-models/{monitored_model_id}/predictions", params=params)
+        assert response.status_code == 200
+        assert len(response.json()["predictions"]) <= 2
+        predictions.extend(response.json()["predictions"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [prediction["id"] for prediction in predictions] == \
+           [prediction["id"] for prediction in predictions_data]
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/predictions",
+                                params={"order": "desc", "limit": 1, "fields": "prediction"})
+    assert response.status_code == 200
+    assert response.json()["predictions"][0]["id"] == predictions_data[-1]["id"]
+    assert "input_data" not in response.json()["predictions"][0]
+    assert response.json()["predictions"][0]["prediction"] == pytest.approx(predictions_data[-1]["prediction"])
+
+
+@pytest.mark.asyncio
+async def test_get_monitored_model_predictions_with_filters(client: AsyncClient):
+    """
+    Test get monitored model predictions with actual value filter and bad parameters.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+
+    prediction_id = predictions_data[-1]["id"]
+    response = await client.put(f"monitored-models/{monitored_model_id}/predictions/{prediction_id}",
+                                json={"actual": 8.0})
+    assert response.status_code == 200
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/predictions", params={"has_actual": True})
+    assert response.status_code == 200
+    assert prediction_id in [prediction["id"] for prediction in response.json()["predictions"]]
+    assert all(prediction["actual"] is not None for prediction in response.json()["predictions"])
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/predictions", params={"has_actual": False})
+    assert response.status_code == 200
+    assert prediction_id not in [prediction["id"] for prediction in response.json()["predictions"]]
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/predictions", params={"cursor": "bad"})
+    assert response.status_code == 400
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/predictions", params={"fields": "model"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_monitored_model_predictions(client: AsyncClient):
+    """
+    Test export monitored model predictions as NDJSON.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/predictions/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    predictions = [json.loads(line) for line in response.text.splitlines()]
+    assert [prediction["id"] for prediction in predictions] == \
+           [prediction["id"] for prediction in predictions_data]
+
+
+@pytest.mark.asyncio
+async def test_monitored_ml_model_predict_with_batching(client: AsyncClient):
+    """
+    Test concurrent predictions of monitored model with enabled prediction batching.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+
+    response = await client.put(f"/monitored-models/{monitored_model_id}", json={"batch_predictions": True})
+    assert response.status_code == 200
+    assert response.json()["batch_predictions"] is True
+
+    data = [{"X1": 1.0, "X2": 2.0}]
+    bad_data = [{"X1": 100.0, "X2": "Invalid value :)"}]
+
+    responses = await asyncio.gather(
+        *[client.post(f"/monitored-models/{monitored_model_id}/predict", json=data) for _ in range(4)],
+        client.post(f"/monitored-models/{monitored_model_id}/predict", json=bad_data)
+    )
+
+    for response in responses[:4]:
+        assert response.status_code == 200
+        assert response.json()[0]["prediction"] == pytest.approx(7.89043535267264)
+    assert responses[4].status_code == 400
+
+    response = await client.get("/monitored-models/prediction-batching")
+    assert response.status_code == 200
+    assert response.json()[monitored_model_id]["requests"] == 5
+    assert response.json()[monitored_model_id]["batches"] < 5
+
+    response = await client.put(f"/monitored-models/{monitored_model_id}", json={"batch_predictions": False})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_monitored_ml_model_predict_in_inference_pool(client: AsyncClient):
+    """
+    Test prediction of monitored model in inference pool and rejection of predictions when pool queue is full.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+
+    response = await client.get("/monitored-models/inference-pool")
+    assert response.status_code == 200
+    tasks = response.json()["tasks"]
+
+    data = [{"X1": 1.0, "X2": 2.0}]
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=data)
+    assert response.status_code == 200
+    assert response.json()[0]["prediction"] == pytest.approx(7.89043535267264)
+
+    response = await client.get("/monitored-models/inference-pool")
+    assert response.status_code == 200
+    assert response.json()["tasks"] > tasks
+    assert response.json()["running_tasks"] == 0
+    assert response.json()["waiting_tasks"] == 0
+
+    max_queue = inference_pool.max_queue
+    inference_pool.max_queue = -inference_pool.workers
+    try:
+        response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=data)
+    finally:
+        inference_pool.max_queue = max_queue
+    assert response.status_code == 503
+
+    response = await client.get("/monitored-models/inference-pool")
+    assert response.json()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_monitored_ml_model_predict_in_process_inference_pool(client: AsyncClient):
+    """
+    Test prediction of monitored model in process inference pool, ml model is decoded only by the pool workers.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    ml_model_cache.invalidate(PydanticObjectId(monitored_model_id))
+    response = await client.get("/monitored-models/ml-model-cache")
+    cache_size = response.json()["size"]
+
+    inference_pool.shutdown()
+    inference_pool.pool_type = 'process'
+    try:
+        data = [{"X1": 1.0, "X2": 2.0}]
+        response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=data)
+        assert response.status_code == 200
+        assert response.json()[0]["prediction"] == pytest.approx(7.89043535267264)
+
+        response = await client.get("/monitored-models/ml-model-cache")
+        assert response.json()["size"] == cache_size
+    finally:
+        inference_pool.shutdown()
+        inference_pool.pool_type = 'thread'
+
+
+@pytest.mark.asyncio
+async def test_get_monitored_model_chart_data(client: AsyncClient):
+    """
+    Test getting aggregated data of monitored model charts and their incremental update.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+    charts = response.json()["interactive_charts"]
+
+    chart = {
+        "chart_type": "histogram",
+        "x_axis_column": "prediction",
+        "bin_method": "fixedNumber",
+        "bin_number": 4
+    }
+    response = await client.post(f"/monitored-models/{monitored_model_id}/charts", json=chart)
+    assert response.status_code == 201
+    histogram_id = response.json()["id"]
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{histogram_id}/data")
+    assert response.status_code == 200
+    assert response.json()["count"] == len(predictions_data)
+    bins = response.json()["data"]["prediction"]
+    assert len(bins) == 4
+    assert sum(count for _, _, _, count in bins) == len(predictions_data)
+    assert bins[0][0] == pytest.approx(min(prediction["prediction"] for prediction in predictions_data))
+    assert bins[-1][1] == pytest.approx(max(prediction["prediction"] for prediction in predictions_data))
+
+    scatter = next(chart for chart in charts if chart["chart_type"] == "scatter")
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{scatter['id']}/data")
+    assert response.status_code == 400
+
+    chart = {
+        "chart_type": "confusion_matrix"
+    }
+    response = await client.post(f"/monitored-models/{monitored_model_id}/charts", json=chart)
+    assert response.status_code == 201
+    confusion_matrix_id = response.json()["id"]
+
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=[{"X1": 1.0, "X2": 2.0}])
+    assert response.status_code == 200
+    prediction_id = response.json()[0]["id"]
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{histogram_id}/data")
+    assert response.json()["count"] == len(predictions_data) + 1
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{confusion_matrix_id}/data")
+    assert response.status_code == 200
+    cells = sum(map(sum, response.json()["data"]["confusion_matrix"]))
+
+    response = await client.put(f"/monitored-models/{monitored_model_id}/predictions/{prediction_id}",
+                                json={"actual": 7})
+    assert response.status_code == 200
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{confusion_matrix_id}/data")
+    assert sum(map(sum, response.json()["data"]["confusion_matrix"])) == cells + 1
+    assert 7 in response.json()["data"]["classes"]
+
+    response = await client.delete(f"/monitored-models/{monitored_model_id}/predictions/{prediction_id}/actual")
+    assert response.status_code == 200
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{confusion_matrix_id}/data")
+    assert sum(map(sum, response.json()["data"]["confusion_matrix"])) == cells
+
+    # range of histogram is narrowed to values left after the maximum is removed
+    chart = {
+        "chart_type": "histogram",
+        "x_axis_column": "actual",
+        "bin_method": "fixedNumber",
+        "bin_number": 4
+    }
+    response = await client.post(f"/monitored-models/{monitored_model_id}/charts", json=chart)
+    actual_histogram_id = response.json()["id"]
+    max_actual = max(prediction["actual"] for prediction in predictions_data if prediction["actual"] is not None)
+
+    await client.put(f"/monitored-models/{monitored_model_id}/predictions/{prediction_id}", json={"actual": 1000})
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{actual_histogram_id}/data")
+    assert response.json()["data"]["actual"][-1][1] == pytest.approx(1000)
+
+    await client.delete(f"/monitored-models/{monitored_model_id}/predictions/{prediction_id}/actual")
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{actual_histogram_id}/data")
+    assert response.json()["data"]["actual"][-1][1] == pytest.approx(max_actual, rel=0.02)
+
+    # aggregate whose build did not finish in time is built again
+    await ChartAggregate.find(ChartAggregate.chart_id == PydanticObjectId(histogram_id)).delete()
+    await ChartAggregate(monitored_model_id=monitored_model_id, chart_id=histogram_id, chart_type="histogram",
+                         built=False, build_started_at=datetime(2020, 1, 1)).insert()
+    response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{histogram_id}/data")
+    assert response.json()["count"] == len(predictions_data) + 1
+
+    for chart_id in (histogram_id, confusion_matrix_id, actual_histogram_id):
+        response = await client.delete(f"/monitored-models/{monitored_model_id}/charts/{chart_id}")
+        assert response.status_code == 200
+
+
+class SlowCursor:
+    """
+    Cursor which yields to the event loop before every document, so concurrent requests run during the scan.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    async def __aiter__(self):
+        async for document in self.cursor:
+            await asyncio.sleep(0.001)
+            yield document
+
+
+class SlowCollection:
+    """
+    Collection whose find cursors yield to the event loop before every document.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def find(self, *args, **kwargs):
+        return SlowCursor(self.collection.find(*args, **kwargs))
+
+
+@pytest.mark.asyncio
+async def test_build_chart_aggregate_with_concurrent_predictions(client: AsyncClient, monkeypatch):
+    """
+    Test chart aggregate built on the first read while predictions are made and actual values are set concurrently.
+
+    Args:
+        client (AsyncClient): Async client fixture
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+
+    chart_ids = []
+    for column in ("prediction", "actual"):
+        chart = {"chart_type": "histogram", "x_axis_column": column, "bin_method": "fixedNumber", "bin_number": 4}
+        response = await client.post(f"/monitored-models/{monitored_model_id}/charts", json=chart)
+        assert response.status_code == 201
+        chart_ids.append(response.json()["id"])
+
+    monkeypatch.setattr(Prediction, "get_motor_collection",
+                        lambda collection=Prediction.get_motor_collection(): SlowCollection(collection))
+    responses = await asyncio.gather(
+        *[client.get(f"/monitored-models/{monitored_model_id}/charts/{chart_id}/data") for chart_id in chart_ids],
+        *[client.post(f"/monitored-models/{monitored_model_id}/predict", json=[{"X1": float(i), "X2": 2.0}])
+          for i in range(10)],
+        *[client.put(f"/monitored-models/{monitored_model_id}/predictions/{prediction['id']}",
+                     json={"actual": 100 + i}) for i, prediction in enumerate(predictions_data[:10])]
+    )
+    monkeypatch.undo()
+    assert all(response.status_code == 200 for response in responses)
+
+    charts_data = []
+    for chart_id in chart_ids:
+        response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{chart_id}/data")
+        assert response.json()["count"] == len(predictions_data) + 10
+        charts_data.append(response.json())
+    assert sum(count for _, _, _, count in charts_data[1]["data"]["actual"]) == \
+           len([prediction for prediction in predictions_data[10:] if prediction["actual"] is not None]) + 10
+
+    # aggregates built again without concurrent writes count the same predictions
+    # (bin edges may differ by one sketch bucket since actual values were replaced)
+    await ChartAggregate.find(ChartAggregate.monitored_model_id == PydanticObjectId(monitored_model_id)).delete()
+    for chart_id, chart_data, column in zip(chart_ids, charts_data, ("prediction", "actual")):
+        response = await client.get(f"/monitored-models/{monitored_model_id}/charts/{chart_id}/data")
+        assert response.json()["count"] == chart_data["count"]
+        assert sum(count for _, _, _, count in response.json()["data"][column]) == \
+               sum(count for _, _, _, count in chart_data["data"][column])
+
+        response = await client.delete(f"/monitored-models/{monitored_model_id}/charts/{chart_id}")
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_monitored_model_input_schema(client: AsyncClient):
+    """
+    Test monitored model input schema and validation of input data against it.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    monitored_model_name = "Engine failure prediction model v8"
+    response = await client.get(f"/monitored-models/name/{monitored_model_name}")
+    monitored_model_id = response.json()["_id"]
+    predictions_data = await get_predictions_data(client, monitored_model_id)
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/input-schema")
+    assert response.status_code == 200
+    columns = {column["name"]: column for column in response.json()}
+    assert set(columns) == {"X1", "X2", "prediction", "actual"}
+    assert columns["X1"]["dtype"] == "numeric"
+    assert columns["X1"]["nullable"] is False
+    assert columns["X1"]["cardinality"] == len({prediction["input_data"]["X1"] for prediction in predictions_data})
+    assert columns["actual"]["null_count"] == len([prediction for prediction in predictions_data
+                                                   if prediction["actual"] is None])
+
+    response = await client.put(f"/monitored-models/{monitored_model_id}", json={"validate_input": True})
+    assert response.status_code == 200
+
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict",
+                                 json=[{"X1": 1.0, "X2": "Invalid value :)"}])
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Input data does not match monitored model input schema: sample 0 " \
+                                        "column 'X2' must be numeric, got string value 'Invalid value :)'"
+
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict",
+                                 json=[{"X1": 1.0, "X2": 2.0}, {"X1": 1.0, "X3": 2.0}])
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Input data does not match monitored model input schema: sample 1 " \
+                                        "has unknown columns ['X3']"
+
+    response = await client.post(f"/monitored-models/{monitored_model_id}/predict", json=[{"X1": 1.0, "X2": 2.0}])
+    assert response.status_code == 200
+
+    response = await client.put(f"/monitored-models/{monitored_model_id}", json={"validate_input": False})
+    assert response.status_code == 200
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/input-schema")
+    columns = {column["name"]: column for column in response.json()}
+    assert columns["actual"]["null_count"] == len([prediction for prediction in predictions_data
+                                                   if prediction["actual"] is None]) + 1
+
+
+@pytest.mark.asyncio
+async def test_get_monitored_model_drift(client: AsyncClient):
+    """
+    Test drift of monitored model predictions from reference window, with drifted numeric and categorical columns
+    in the second day.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    predictions_data = [
+        {"prediction_date": f"2024-01-01T{i % 24:02d}:00:00", "input_data": {"X1": i % 10, "city": "A" if i % 2 else "B"},
+         "prediction": 1.0} for i in range(100)
+    ] + [
+        {"prediction_date": f"2024-01-02T{i % 24:02d}:00:00", "input_data": {"X1": 5 + i % 10, "city": "C"},
+         "prediction": 1.0} for i in range(100)
+    ]
+    response = await client.post("/monitored-models/", json={"model_name": "Drift test model",
+                                                             "predictions_data": predictions_data})
+    assert response.status_code == 201
+    monitored_model_id = response.json()["_id"]
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/drift",
+                                params={"baseline": "reference", "reference_to": "2024-01-01T23:59:59"})
+    assert response.status_code == 200
+    intervals = response.json()["intervals"]
+    assert [interval["start"] for interval in intervals] == ["2024-01-01T00:00:00", "2024-01-02T00:00:00"]
+    assert [interval["predictions_count"] for interval in intervals] == [100, 100]
+
+    reference, current = [{column["name"]: column for column in interval["columns"]} for interval in intervals]
+    assert set(reference) == {"X1", "city", "prediction"}
+    assert reference["X1"]["psi"] == pytest.approx(0, abs=1e-9)
+    assert reference["X1"]["ks"] == pytest.approx(0, abs=1e-9)
+    assert not reference["X1"]["drift"] and not reference["city"]["drift"]
+    assert current["X1"]["drift"] and current["X1"]["ks"] == pytest.approx(0.5)
+    assert current["city"]["drift"] and current["city"]["js"] == pytest.approx(1)
+    assert current["city"]["ks"] is None
+    assert not current["prediction"]["drift"]
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/drift", params={"baseline": "reference"})
+    assert response.status_code == 400
+
+    response = await client.get(f"/monitored-models/{monitored_model_id}/drift")
+    assert response.status_code == 400
+
+    response = await client.delete(f"/monitored-models/{monitored_model_id}")
+    assert response.status_code == 200
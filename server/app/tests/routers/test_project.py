@@ -1,10 +1,14 @@
+import asyncio
 import base64
+import gzip
+import json
 import os
 import pickle
 
 import pytest
 from httpx import AsyncClient
 
+from app.config.config import settings
 from app.database.init_mongo_db import drop_database
 from app.routers.exceptions.monitored_model import monitored_model_encoding_pkl_file_exception
 from app.routers.monitored_model import CustomUnpickler
@@ -329,3 +333,147 @@ async def test_delete_project_with_iteration_assigned_to_monitored_model(client:
     assert response.status_code == 400
     assert response.json()["detail"] == ("Iteration in experiment in project is assigned to monitored model. "
                                          "Cannot delete it. Please delete monitored model first.")
+
+
+@pytest.mark.asyncio
+async def test_create_project_with_gzip_compressed_body(client: AsyncClient):
+    """
+    Test create project with gzip compressed request body.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project = {
+        "title": "Test project gzip",
+        "description": "Test project description " * 10
+    }
+
+    response = await client.post("/projects/", content=gzip.compress(json.dumps(project).encode("utf-8")),
+                                 headers={"Content-Type": "application/json", "Content-Encoding": "gzip"})
+    assert response.status_code == 201
+    assert response.json()["title"] == project["title"]
+    assert response.json()["description"] == project["description"]
+
+    response = await client.delete(f"/projects/{response.json()['_id']}")
+    assert response.status_code == 204
+
+    response = await client.post("/projects/", content=json.dumps(project).encode("utf-8"),
+                                 headers={"Content-Type": "application/json", "Content-Encoding": "gzip"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_create_project_with_invalid_gzip_compressed_body(client: AsyncClient):
+    """
+    Test rejection of truncated and too large gzip compressed request bodies.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    body = gzip.compress(json.dumps({"title": "Test project gzip", "description": " " * 1000}).encode("utf-8"))
+
+    response = await client.post("/projects/", content=body[:len(body) // 2], headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Cannot decompress gzip request body")
+
+    max_size = settings.GZIP_REQUEST_MAX_SIZE
+    settings.GZIP_REQUEST_MAX_SIZE = 100
+    try:
+        response = await client.post("/projects/", content=body, headers=headers)
+    finally:
+        settings.GZIP_REQUEST_MAX_SIZE = max_size
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_get_projects_page(client: AsyncClient):
+    """
+    Test get projects page by page, sorted by title.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    project_ids = []
+    for title in ["Page project c", "Page project a", "Page project b"]:
+        response = await client.post("/projects/", json={"title": title, "archived": title == "Page project b"})
+        assert response.status_code == 201
+        project_ids.append(response.json()["_id"])
+
+    response = await client.get("/projects/")
+    total_count = len(response.json())
+    assert response.headers["X-Total-Count"] == str(total_count)
+    assert "X-Next-Cursor" not in response.headers
+
+    titles = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "sort_by": "title", "order": "desc", "include_iterations": False}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/projects/", params=params)
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == str(total_count)
+        assert len(response.json()) <= 2
+        titles += [project["title"] for project in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert len(titles) == total_count
+    assert titles == sorted(titles, reverse=True)
+    assert titles.index("Page project c") < titles.index("Page project b") < titles.index("Page project a")
+
+    response = await client.get("/projects/archived", params={"limit": 1})
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "1"
+    assert [project["title"] for project in response.json()] == ["Page project b"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await client.get("/projects/base", params={"limit": 1, "sort_by": "updated_at", "order": "desc"})
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == "Page project b"
+    assert "X-Next-Cursor" in response.headers
+
+    response = await client.get("/projects/", params={"sort_by": "status"})
+    assert response.status_code == 400
+
+    response = await client.get("/projects/", params={"cursor": "not a cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == ("Invalid value for 'cursor'. "
+                                         "Use 'X-Next-Cursor' header value returned with previous page.")
+
+    for project_id in project_ids:
+        response = await client.delete(f"/projects/{project_id}")
+        assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_create_projects_with_same_title_concurrently(client: AsyncClient):
+    """
+    Test that only one of projects with the same title created concurrently is added.
+
+    Args:
+        client (AsyncClient): Async client fixture
+
+    Returns:
+        None
+    """
+    responses = await asyncio.gather(*[client.post("/projects/", json={"title": "Concurrent project"})
+                                       for _ in range(3)])
+    assert sorted(response.status_code for response in responses) == [201, 400, 400]
+
+    response = await client.get("/projects/title/Concurrent project")
+    assert response.status_code == 200
+
+    response = await client.delete(f"/projects/{response.json()['_id']}")
+    assert response.status_code == 204
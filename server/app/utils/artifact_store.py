@@ -0,0 +1,454 @@
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket
+
+from app.config.config import settings
+
+ARTIFACT_ID_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ArtifactNotFoundError(Exception):
+    """
+    Raised when there is no artifact with given id in the artifact store.
+    """
+
+
+class ArtifactChecksumError(Exception):
+    """
+    Raised when uploaded content does not match its expected SHA-256 hash.
+    """
+
+
+class ArtifactSizeExceededError(Exception):
+    """
+    Raised when uploaded content exceeds the allowed size.
+    """
+
+
+class ArtifactStore(ABC):
+    """
+    Content-addressed store of binary artifacts, e.g. pickled ml models. Artifacts are identified by SHA-256 hash
+    of their content, so the same content is stored only once.
+    """
+
+    chunk_size: int = 1024 * 1024
+
+    @staticmethod
+    def get_artifact_id(data: bytes) -> str:
+        """
+        Get artifact id of content.
+
+        Args:
+            data: Artifact content.
+
+        Returns:
+            SHA-256 hash of content as hex string.
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def is_artifact_id(artifact_id: str) -> bool:
+        """
+        Check if string is a valid artifact id.
+
+        Args:
+            artifact_id: String to check.
+
+        Returns:
+            True if string is a SHA-256 hex digest, False otherwise.
+        """
+        return bool(ARTIFACT_ID_PATTERN.match(artifact_id or ''))
+
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """
+        Store artifact, unless artifact with the same content is already stored.
+
+        Args:
+            data: Artifact content.
+
+        Returns:
+            Artifact id.
+        """
+
+    async def get(self, artifact_id: str) -> bytes:
+        """
+        Get artifact content.
+
+        Args:
+            artifact_id: Artifact id.
+
+        Returns:
+            Artifact content.
+        """
+        return b''.join([chunk async for chunk in self.stream(artifact_id)])
+
+    @abstractmethod
+    def stream(self, artifact_id: str) -> AsyncIterator[bytes]:
+        """
+        Stream artifact content in chunks.
+
+        Args:
+            artifact_id: Artifact id.
+
+        Returns:
+            Async iterator of content chunks.
+        """
+
+    @abstractmethod
+    async def exists(self, artifact_id: str) -> bool:
+        """
+        Check if artifact is stored.
+
+        Args:
+            artifact_id: Artifact id.
+
+        Returns:
+            True if artifact is stored, False otherwise.
+        """
+
+    @abstractmethod
+    async def size(self, artifact_id: str) -> Optional[int]:
+        """
+        Get artifact size.
+
+        Args:
+            artifact_id: Artifact id.
+
+        Returns:
+            Artifact size in bytes or None if artifact is not stored.
+        """
+
+    @staticmethod
+    async def limit_chunks(chunks: AsyncIterator[bytes], max_size: Optional[int]) -> AsyncIterator[bytes]:
+        """
+        Pass chunks through until their total size exceeds maximum size, the rest of chunks is not read.
+
+        Args:
+            chunks: Async iterator of chunks.
+            max_size: Maximum total size of chunks in bytes, no limit if None.
+
+        Returns:
+            Async iterator of chunks, raising ArtifactSizeExceededError when maximum size is exceeded.
+        """
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise ArtifactSizeExceededError(f"Uploaded data exceeds {max_size} bytes.")
+            yield chunk
+
+    @abstractmethod
+    async def write_upload(self, upload_id: str, offset: int, chunks: AsyncIterator[bytes],
+                           max_size: Optional[int] = None) -> int:
+        """
+        Write chunks of resumable upload at given offset. Data previously written at or after the offset
+        is discarded, so interrupted chunk can be written again. Reading of chunks stops with
+        ArtifactSizeExceededError as soon as more than max_size bytes are received.
+
+        Args:
+            upload_id: Upload id.
+            offset: Offset of the first chunk.
+            chunks: Async iterator of chunks.
+            max_size: Maximum number of written bytes, no limit if None.
+
+        Returns:
+            Number of written bytes.
+        """
+
+    @abstractmethod
+    async def complete_upload(self, upload_id: str, expected_artifact_id: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Store uploaded content as artifact and remove the upload.
+
+        Args:
+            upload_id: Upload id.
+            expected_artifact_id: Expected artifact id, ArtifactChecksumError is raised if uploaded content
+                has different hash.
+
+        Returns:
+            Artifact id and artifact size.
+        """
+
+    @abstractmethod
+    async def delete_upload(self, upload_id: str) -> None:
+        """
+        Remove upload data.
+
+        Args:
+            upload_id: Upload id.
+
+        Returns:
+            None
+        """
+
+
+class LocalArtifactStore(ArtifactStore):
+    """
+    Artifact store keeping artifacts in local filesystem directory, in files named by artifact id.
+
+    Attributes:
+    - **path (str)**: Directory of the store.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+
+    def get_path(self, artifact_id: str) -> str:
+        """
+        Get path of artifact file. Artifacts are spread into subdirectories by the first bytes of their id.
+
+        Args:
+            artifact_id: Artifact id.
+
+        Returns:
+            Path of artifact file.
+        """
+        if not self.is_artifact_id(artifact_id):
+            raise ArtifactNotFoundError(f"Artifact '{artifact_id}' not found.")
+        return os.path.join(self.path, artifact_id[:2], artifact_id[2:4], artifact_id)
+
+    def _write(self, artifact_id: str, data: bytes) -> None:
+        path = self.get_path(artifact_id)
+        if os.path.exists(path):
+            return None
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to temporary file first, so partially written artifact is never visible
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    async def put(self, data: bytes) -> str:
+        artifact_id = self.get_artifact_id(data)
+        await asyncio.get_running_loop().run_in_executor(None, self._write, artifact_id, data)
+        return artifact_id
+
+    async def stream(self, artifact_id: str) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        try:
+            file = await loop.run_in_executor(None, open, self.get_path(artifact_id), 'rb')
+        except FileNotFoundError:
+            raise ArtifactNotFoundError(f"Artifact '{artifact_id}' not found.")
+
+        try:
+            while chunk := await loop.run_in_executor(None, file.read, self.chunk_size):
+                yield chunk
+        finally:
+            file.close()
+
+    async def exists(self, artifact_id: str) -> bool:
+        return self.is_artifact_id(artifact_id) and os.path.exists(self.get_path(artifact_id))
+
+    async def size(self, artifact_id: str) -> Optional[int]:
+        if not await self.exists(artifact_id):
+            return None
+        return os.path.getsize(self.get_path(artifact_id))
+
+    def get_upload_path(self, upload_id: str) -> str:
+        """
+        Get path of file with uploaded data.
+
+        Args:
+            upload_id: Upload id.
+
+        Returns:
+            Path of upload file.
+        """
+        return os.path.join(self.path, 'uploads', os.path.basename(upload_id))
+
+    def _open_upload(self, upload_id: str, offset: int):
+        path = self.get_upload_path(upload_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file = open(path, 'r+b' if os.path.exists(path) else 'wb')
+        file.truncate(offset)
+        file.seek(offset)
+        return file
+
+    def _complete_upload(self, upload_id: str, expected_artifact_id: Optional[str]) -> Tuple[str, int]:
+        upload_path = self.get_upload_path(upload_id)
+        if not os.path.exists(upload_path):
+            self._open_upload(upload_id, 0).close()
+
+        content_hash = hashlib.sha256()
+        size = 0
+        with open(upload_path, 'rb') as file:
+            while chunk := file.read(self.chunk_size):
+                content_hash.update(chunk)
+                size += len(chunk)
+
+        artifact_id = content_hash.hexdigest()
+        if expected_artifact_id is not None and artifact_id != expected_artifact_id:
+            raise ArtifactChecksumError(f"Uploaded content hash '{artifact_id}' does not match "
+                                        f"expected hash '{expected_artifact_id}'.")
+
+        path = self.get_path(artifact_id)
+        if os.path.exists(path):
+            os.remove(upload_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(upload_path, path)
+        return artifact_id, size
+
+    def _delete_upload(self, upload_id: str) -> None:
+        path = self.get_upload_path(upload_id)
+        if os.path.exists(path):
+            os.remove(path)
+
+    async def write_upload(self, upload_id: str, offset: int, chunks: AsyncIterator[bytes],
+                           max_size: Optional[int] = None) -> int:
+        loop = asyncio.get_running_loop()
+        file = await loop.run_in_executor(None, self._open_upload, upload_id, offset)
+        written = 0
+        try:
+            async for chunk in self.limit_chunks(chunks, max_size):
+                await loop.run_in_executor(None, file.write, chunk)
+                written += len(chunk)
+        finally:
+            await loop.run_in_executor(None, file.close)
+        return written
+
+    async def complete_upload(self, upload_id: str, expected_artifact_id: Optional[str] = None) -> Tuple[str, int]:
+        return await asyncio.get_running_loop().run_in_executor(None, self._complete_upload, upload_id,
+                                                                expected_artifact_id)
+
+    async def delete_upload(self, upload_id: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._delete_upload, upload_id)
+
+
+class GridFSArtifactStore(ArtifactStore):
+    """
+    Artifact store keeping artifacts in MongoDB GridFS bucket, in files named by artifact id. Uploaded data is
+    kept in chunk documents of '<bucket_name>.uploads' collection until the upload is completed.
+
+    Attributes:
+    - **bucket_name (str)**: GridFS bucket name.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase, bucket_name: str = 'artifacts'):
+        self.bucket_name: str = bucket_name
+        self._files = database[f'{bucket_name}.files']
+        self._uploads = database[f'{bucket_name}.uploads']
+        self._uploads_indexed: bool = False
+        self._bucket = AsyncIOMotorGridFSBucket(database, bucket_name=bucket_name, chunk_size_bytes=self.chunk_size)
+
+    async def put(self, data: bytes) -> str:
+        artifact_id = self.get_artifact_id(data)
+        if not await self.exists(artifact_id):
+            await self._bucket.upload_from_stream(artifact_id, data)
+        return artifact_id
+
+    async def stream(self, artifact_id: str) -> AsyncIterator[bytes]:
+        document = await self._files.find_one({'filename': artifact_id}, {'_id': 1})
+        if document is None:
+            raise ArtifactNotFoundError(f"Artifact '{artifact_id}' not found.")
+
+        download_stream = await self._bucket.open_download_stream(document['_id'])
+        while chunk := await download_stream.readchunk():
+            yield chunk
+
+    async def exists(self, artifact_id: str) -> bool:
+        return await self._files.find_one({'filename': artifact_id}, {'_id': 1}) is not None
+
+    async def size(self, artifact_id: str) -> Optional[int]:
+        document = await self._files.find_one({'filename': artifact_id}, {'length': 1})
+        return document['length'] if document else None
+
+    async def write_upload(self, upload_id: str, offset: int, chunks: AsyncIterator[bytes],
+                           max_size: Optional[int] = None) -> int:
+        if not self._uploads_indexed:
+            await self._uploads.create_index([('upload_id', 1), ('offset', 1)])
+            self._uploads_indexed = True
+
+        await self._uploads.delete_many({'upload_id': upload_id, 'offset': {'$gte': offset}})
+
+        # request body chunks have arbitrary sizes, they are regrouped so documents stay far below BSON size limit
+        written = 0
+        buffer = bytearray()
+        async for chunk in self.limit_chunks(chunks, max_size):
+            buffer.extend(chunk)
+            while len(buffer) >= self.chunk_size:
+                await self._uploads.insert_one({'upload_id': upload_id, 'offset': offset + written,
+                                                'data': bytes(buffer[:self.chunk_size])})
+                written += self.chunk_size
+                del buffer[:self.chunk_size]
+        if buffer:
+            await self._uploads.insert_one({'upload_id': upload_id, 'offset': offset + written,
+                                            'data': bytes(buffer)})
+            written += len(buffer)
+        return written
+
+    async def complete_upload(self, upload_id: str, expected_artifact_id: Optional[str] = None) -> Tuple[str, int]:
+        content_hash = hashlib.sha256()
+        grid_in = self._bucket.open_upload_stream(f'upload-{upload_id}')
+        async for document in self._uploads.find({'upload_id': upload_id}).sort('offset', 1):
+            content_hash.update(document['data'])
+            await grid_in.write(document['data'])
+        await grid_in.close()
+
+        artifact_id = content_hash.hexdigest()
+        checksum_mismatch = expected_artifact_id is not None and artifact_id != expected_artifact_id
+        if checksum_mismatch or await self.exists(artifact_id):
+            await self._bucket.delete(grid_in._id)
+        else:
+            await self._bucket.rename(grid_in._id, artifact_id)
+
+        if checksum_mismatch:
+            raise ArtifactChecksumError(f"Uploaded content hash '{artifact_id}' does not match "
+                                        f"expected hash '{expected_artifact_id}'.")
+
+        await self.delete_upload(upload_id)
+        return artifact_id, grid_in.length
+
+    async def delete_upload(self, upload_id: str) -> None:
+        await self._uploads.delete_many({'upload_id': upload_id})
+
+
+_artifact_store: Optional[ArtifactStore] = None
+
+
+def init_artifact_store(database: AsyncIOMotorDatabase) -> ArtifactStore:
+    """
+    Initialize artifact store with backend set by ARTIFACT_STORE_BACKEND setting ('gridfs' or 'local').
+
+    Args:
+        database: Database used by GridFS backend.
+
+    Returns:
+        Artifact store.
+    """
+    global _artifact_store
+
+    if settings.ARTIFACT_STORE_BACKEND == 'local':
+        _artifact_store = LocalArtifactStore(settings.ARTIFACT_STORE_PATH)
+    elif settings.ARTIFACT_STORE_BACKEND == 'gridfs':
+        _artifact_store = GridFSArtifactStore(database)
+    else:
+        raise ValueError(f"Artifact store backend must be 'gridfs' or 'local', "
+                         f"got '{settings.ARTIFACT_STORE_BACKEND}'")
+
+    return _artifact_store
+
+
+def get_artifact_store() -> ArtifactStore:
+    """
+    Get artifact store initialized on application startup.
+
+    Returns:
+        Artifact store.
+    """
+    if _artifact_store is None:
+        raise RuntimeError("Artifact store is not initialized.")
+    return _artifact_store
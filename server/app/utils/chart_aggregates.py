@@ -0,0 +1,503 @@
+import math
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+from app.models.monitored_model_chart import MonitoredModelInteractiveChart
+from app.utils.values import encode_key, decode_key, normalize_value, is_number
+
+# relative accuracy of values represented by sketch buckets
+SKETCH_RELATIVE_ACCURACY = 0.01
+SKETCH_GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+# absolute values below this threshold are counted in zero bucket
+SKETCH_MIN_VALUE = 1e-12
+
+AGGREGATED_CHART_TYPES = ["histogram", "countplot", "scatter_with_histograms", "regression_metrics",
+                          "classification_metrics", "confusion_matrix"]
+
+
+def get_prediction_row(prediction: dict) -> dict:
+    """
+    Get chart data row of prediction, i.e. input data with prediction and actual values.
+
+    Args:
+        prediction: Prediction document or prediction data dictionary.
+
+    Returns:
+        Row with input data columns, prediction and actual.
+    """
+    return {**prediction['input_data'], 'prediction': prediction['prediction'], 'actual': prediction.get('actual')}
+
+
+def get_sketch_bucket(value: float) -> str:
+    """
+    Get sketch bucket of value. Buckets have logarithmic width, so every value in bucket is represented by bucket
+    value with SKETCH_RELATIVE_ACCURACY relative error.
+
+    Args:
+        value: Value.
+
+    Returns:
+        Bucket name.
+    """
+    if abs(value) < SKETCH_MIN_VALUE:
+        return 'zero'
+    index = math.ceil(math.log(abs(value), SKETCH_GAMMA))
+    return f"{'positive' if value > 0 else 'negative'}.{index}"
+
+
+def get_sketch_bucket_value(bucket: str, index: str) -> float:
+    """
+    Get value representing values of sketch bucket.
+
+    Args:
+        bucket: Bucket type, 'positive' or 'negative'.
+        index: Bucket index.
+
+    Returns:
+        Bucket value.
+    """
+    value = 2 * SKETCH_GAMMA ** int(index) / (SKETCH_GAMMA + 1)
+    return value if bucket == 'positive' else -value
+
+
+class ChartAggregateUpdate:
+    """
+    MongoDB update of chart aggregate built from predictions.
+
+    Minimum and maximum of sketches are updated only when values are added, so after values are removed they are
+    bounds of values, narrowed by get_sketch_range to the buckets which are not empty.
+
+    Attributes:
+    - **inc (dict)**: Values to increment by field path.
+    - **min (dict)**: Minimum values by field path.
+    - **max (dict)**: Maximum values by field path.
+    """
+
+    def __init__(self):
+        self.inc: dict = defaultdict(int)
+        self.min: dict = {}
+        self.max: dict = {}
+
+    def add_value(self, path: str, value: float, sign: int) -> None:
+        """
+        Add value to sketch.
+
+        Args:
+            path: Sketch field path.
+            value: Value to add.
+            sign: 1 to add value, -1 to remove previously added value.
+
+        Returns:
+            None
+        """
+        self.inc[f"{path}.count"] += sign
+        self.inc[f"{path}.sum"] += sign * value
+        self.inc[f"{path}.sum_sq"] += sign * value * value
+        self.inc[f"{path}.buckets.{get_sketch_bucket(value)}"] += sign
+        if sign > 0:
+            self.min[f"{path}.min"] = min(self.min.get(f"{path}.min", value), value)
+            self.max[f"{path}.max"] = max(self.max.get(f"{path}.max", value), value)
+
+    def add_chart_rows(self, chart: MonitoredModelInteractiveChart, rows: List[dict], sign: int = 1) -> None:
+        """
+        Add aggregates of chart columns of rows.
+
+        Args:
+            chart: Interactive chart.
+            rows: Chart data rows.
+            sign: 1 to add rows, -1 to remove previously added rows.
+
+        Returns:
+            None
+        """
+        self.inc["predictions_count"] += sign * len(rows)
+
+        if chart.chart_type in ("histogram", "scatter_with_histograms"):
+            columns = [chart.x_axis_column] + (chart.y_axis_columns[:1] if chart.y_axis_columns else [])
+            for column in columns:
+                for row in rows:
+                    if is_number(row.get(column)):
+                        self.add_value(f"sketches.{encode_key(column)}", row[column], sign)
+
+        elif chart.chart_type == "countplot":
+            for row in rows:
+                if row.get(chart.x_axis_column) is not None:
+                    value = normalize_value(row[chart.x_axis_column])
+                    self.inc[f"categories.{encode_key(chart.x_axis_column)}.{encode_key(value)}"] += sign
+
+        elif chart.chart_type == "regression_metrics":
+            for row in rows:
+                actual, prediction = row.get('actual'), row.get('prediction')
+                if not is_number(actual) or not is_number(prediction):
+                    continue
+                error = actual - prediction
+                self.inc["regression.count"] += sign
+                self.inc["regression.sum_actual"] += sign * actual
+                self.inc["regression.sum_actual_sq"] += sign * actual * actual
+                self.inc["regression.sse"] += sign * error * error
+                self.inc["regression.sae"] += sign * abs(error)
+                denominator = (abs(actual) + abs(prediction)) / 2
+                self.inc["regression.smape"] += sign * (abs(error) / denominator if denominator != 0 else 0)
+                if actual > -1 and prediction > -1:
+                    self.inc["regression.sle"] += sign * (math.log1p(actual) - math.log1p(prediction)) ** 2
+                else:
+                    self.inc["regression.sle_invalid"] += sign
+                self.add_value("regression.absolute_error", abs(error), sign)
+
+        elif chart.chart_type in ("classification_metrics", "confusion_matrix"):
+            for row in rows:
+                if row.get('actual') is None or row.get('prediction') is None:
+                    continue
+                cell = [normalize_value(row['actual']), normalize_value(row['prediction'])]
+                self.inc[f"confusion_matrix.{encode_key(cell)}"] += sign
+
+    def to_mongo(self) -> Optional[dict]:
+        """
+        Get MongoDB update document.
+
+        Returns:
+            Update document or None if update does not change the aggregate.
+        """
+        update = {}
+        inc = {path: value for path, value in self.inc.items() if value != 0}
+        if inc:
+            update["$inc"] = inc
+        if self.min:
+            update["$min"] = dict(self.min)
+        if self.max:
+            update["$max"] = dict(self.max)
+        return update or None
+
+
+def get_chart_aggregate_update(chart: MonitoredModelInteractiveChart, added_rows: List[dict],
+                               removed_rows: Optional[List[dict]] = None) -> Optional[dict]:
+    """
+    Get MongoDB update of chart aggregate for added and removed chart data rows.
+
+    Args:
+        chart: Interactive chart.
+        added_rows: Chart data rows to add to the aggregate.
+        removed_rows: Chart data rows, previously added to the aggregate, to remove from it.
+
+    Returns:
+        Update document or None if the aggregate does not change.
+    """
+    update = ChartAggregateUpdate()
+    update.add_chart_rows(chart, added_rows)
+    if removed_rows:
+        update.add_chart_rows(chart, removed_rows, sign=-1)
+    return update.to_mongo()
+
+
+def get_sketch_bucket_bounds(bucket: str, index: Optional[str]) -> Tuple[float, float]:
+    """
+    Get bounds of values of sketch bucket.
+
+    Args:
+        bucket: Bucket type, 'positive', 'negative' or 'zero'.
+        index: Bucket index, None for zero bucket.
+
+    Returns:
+        Lower and upper bound of bucket values.
+    """
+    if bucket == 'zero':
+        return -SKETCH_MIN_VALUE, SKETCH_MIN_VALUE
+    lower, upper = SKETCH_GAMMA ** (int(index) - 1), SKETCH_GAMMA ** int(index)
+    return (lower, upper) if bucket == 'positive' else (-upper, -lower)
+
+
+def get_non_empty_buckets(sketch: dict) -> List[Tuple[str, Optional[str], int]]:
+    """
+    Get sketch buckets with values.
+
+    Args:
+        sketch: Sketch.
+
+    Returns:
+        List of bucket type, bucket index (None for zero bucket) and count.
+    """
+    buckets = sketch.get('buckets', {})
+    non_empty_buckets = []
+    for bucket in ('negative', 'positive'):
+        for index, count in buckets.get(bucket, {}).items():
+            if count > 0:
+                non_empty_buckets.append((bucket, index, int(count)))
+    if buckets.get('zero', 0) > 0:
+        non_empty_buckets.append(('zero', None, int(buckets['zero'])))
+    return non_empty_buckets
+
+
+def get_sketch_range(sketch: dict) -> Tuple[float, float]:
+    """
+    Get range of sketch values. Stored minimum and maximum are exact if values were only added, after values were
+    removed they are narrowed to the bounds of non-empty buckets, i.e. they are accurate to one bucket.
+
+    Args:
+        sketch: Sketch.
+
+    Returns:
+        Minimum and maximum of values.
+    """
+    bounds = [get_sketch_bucket_bounds(bucket, index) for bucket, index, _ in get_non_empty_buckets(sketch)]
+    if not bounds:
+        return sketch['min'], sketch['max']
+
+    min_value = max(sketch['min'], min(lower for lower, _ in bounds))
+    max_value = min(sketch['max'], max(upper for _, upper in bounds))
+    return min_value, max(min_value, max_value)
+
+
+def get_sketch_buckets(sketch: dict) -> List[Tuple[float, int]]:
+    """
+    Get non-empty sketch buckets sorted by value.
+
+    Args:
+        sketch: Sketch.
+
+    Returns:
+        List of pairs of bucket value and count.
+    """
+    min_value, max_value = get_sketch_range(sketch)
+    values = [(0.0 if bucket == 'zero' else get_sketch_bucket_value(bucket, index), count)
+              for bucket, index, count in get_non_empty_buckets(sketch)]
+
+    # keep bucket values within the range of values
+    return sorted((min(max(value, min_value), max_value), count) for value, count in values)
+
+
+def get_sketch_quantile(sketch: dict, q: float) -> Optional[float]:
+    """
+    Get approximate q-quantile of sketch values.
+
+    Args:
+        sketch: Sketch.
+        q: Quantile.
+
+    Returns:
+        q-quantile or None if sketch is empty.
+    """
+    buckets = get_sketch_buckets(sketch)
+    count = sum(bucket_count for _, bucket_count in buckets)
+    if count == 0:
+        return None
+
+    rank = q * (count - 1)
+    cumulative = 0
+    for value, bucket_count in buckets:
+        cumulative += bucket_count
+        if cumulative > rank:
+            return value
+    return buckets[-1][0]
+
+
+def get_histogram_bins_number(sketch: dict, bin_method: str, bin_number: Optional[int]) -> int:
+    """
+    Get number of histogram bins with the same rules as the client.
+
+    Args:
+        sketch: Sketch.
+        bin_method: Bin method.
+        bin_number: Bin number of 'fixedNumber' bin method.
+
+    Returns:
+        Number of bins.
+    """
+    n = sketch['count']
+    sturges = math.ceil(math.log2(n) + 1)
+
+    if bin_method == 'fixedNumber':
+        return bin_number
+    if bin_method == 'squareRoot':
+        return math.ceil(math.sqrt(n))
+    if bin_method == 'sturges':
+        return sturges
+
+    if bin_method == 'scott':
+        mean = sketch['sum'] / n
+        std = math.sqrt(max(sketch['sum_sq'] / n - mean * mean, 0))
+        bin_width = 3.5 * std / n ** (1 / 3)
+    else:
+        bin_width = 2 * (get_sketch_quantile(sketch, 0.75) - get_sketch_quantile(sketch, 0.25)) / n ** (1 / 3)
+
+    # zero width of bins of constant or heavily concentrated data falls back to sturges rule
+    if bin_width <= 0:
+        return sturges
+    min_value, max_value = get_sketch_range(sketch)
+    return max(math.ceil((max_value - min_value) / bin_width), 1)
+
+
+def get_histogram_data(sketch: Optional[dict], bin_method: str, bin_number: Optional[int]) -> List[list]:
+    """
+    Get histogram bins from sketch. Values of one sketch bucket are counted in the bin of bucket value.
+
+    Args:
+        sketch: Sketch.
+        bin_method: Bin method.
+        bin_number: Bin number of 'fixedNumber' bin method.
+
+    Returns:
+        List of bins [bin start, bin end, bin center, number of items], the same as the client histogram data.
+    """
+    if not sketch or sketch.get('count', 0) <= 0:
+        return []
+
+    min_value, max_value = get_sketch_range(sketch)
+    if min_value == max_value:
+        return [[min_value, max_value, min_value, int(sketch['count'])]]
+
+    bins_number = get_histogram_bins_number(sketch, bin_method, bin_number)
+    bin_width = (max_value - min_value) / bins_number
+
+    counts = [0] * bins_number
+    for value, count in get_sketch_buckets(sketch):
+        counts[min(int((value - min_value) / bin_width), bins_number - 1)] += count
+
+    return [[min_value + i * bin_width, min_value + (i + 1) * bin_width, min_value + (i + 0.5) * bin_width, count]
+            for i, count in enumerate(counts)]
+
+
+def get_countplot_data(categories: dict) -> dict:
+    """
+    Get countplot data from value counts.
+
+    Args:
+        categories: Value counts by encoded value.
+
+    Returns:
+        Dictionary with unique values and their counts.
+    """
+    counts = sorted(((decode_key(key), int(count)) for key, count in categories.items() if count > 0),
+                    key=lambda item: (isinstance(item[0], str), item[0]))
+    return {
+        'values': [value for value, _ in counts],
+        'counts': [count for _, count in counts]
+    }
+
+
+def get_confusion_matrix_data(cells: dict) -> dict:
+    """
+    Get confusion matrix from its cells counts.
+
+    Args:
+        cells: Cells counts by encoded pair of actual and predicted class.
+
+    Returns:
+        Dictionary with sorted classes and confusion matrix, rows are actual and columns predicted classes.
+    """
+    cells = [(decode_key(key), int(count)) for key, count in cells.items() if count > 0]
+    classes = sorted({value for (actual, prediction), _ in cells for value in (actual, prediction)},
+                     key=lambda value: (isinstance(value, str), value))
+    classes_map = {value: index for index, value in enumerate(classes)}
+
+    confusion_matrix = [[0] * len(classes) for _ in classes]
+    for (actual, prediction), count in cells:
+        confusion_matrix[classes_map[actual]][classes_map[prediction]] += count
+
+    return {
+        'classes': classes,
+        'confusion_matrix': confusion_matrix
+    }
+
+
+def get_classification_metrics(confusion_matrix: List[List[int]]) -> dict:
+    """
+    Get classification metrics from confusion matrix, calculated the same way as the client does.
+    Precision, recall and f1 score are macro averaged.
+
+    Args:
+        confusion_matrix: Confusion matrix.
+
+    Returns:
+        Dictionary of metrics.
+    """
+    s = sum(map(sum, confusion_matrix))
+    if s == 0:
+        return {'accuracy': 0, 'precision': 0, 'recall': 0, 'f1score': 0, 'mcc': 0}
+
+    size = len(confusion_matrix)
+    c = sum(confusion_matrix[i][i] for i in range(size))
+    t = [sum(confusion_matrix[i][k] for i in range(size)) for k in range(size)]
+    p = [sum(confusion_matrix[k]) for k in range(size)]
+
+    precision, recall, f1score = [], [], []
+    for i in range(size):
+        true_positive = confusion_matrix[i][i]
+        precision.append(true_positive / t[i] if t[i] else 0)
+        recall.append(true_positive / p[i] if p[i] else 0)
+        f1score.append(2 * precision[i] * recall[i] / (precision[i] + recall[i]) if precision[i] + recall[i] else 0)
+
+    denominator = math.sqrt(s * s - sum(x * x for x in p)) * math.sqrt(s * s - sum(x * x for x in t))
+
+    return {
+        'accuracy': c / s,
+        'precision': sum(precision) / size,
+        'recall': sum(recall) / size,
+        'f1score': sum(f1score) / size,
+        'mcc': (c * s - sum(x * y for x, y in zip(t, p))) / denominator if denominator else 0
+    }
+
+
+def get_regression_metrics(regression: dict) -> dict:
+    """
+    Get regression metrics from accumulators, calculated the same way as the client does.
+    Median absolute error is approximated with the absolute errors sketch.
+
+    Args:
+        regression: Regression metrics accumulators.
+
+    Returns:
+        Dictionary of metrics, metrics which cannot be calculated are None.
+    """
+    n = regression.get('count', 0)
+    if n <= 0:
+        return {'r2': 0, 'mse': 0, 'rmse': 0, 'mae': 0, 'msle': 0, 'rmsle': 0, 'medae': 0, 'smape': 0}
+
+    sst = regression['sum_actual_sq'] - regression['sum_actual'] ** 2 / n
+    mse = max(regression['sse'], 0) / n
+    msle = max(regression.get('sle', 0), 0) / n if regression.get('sle_invalid', 0) <= 0 else None
+
+    return {
+        'r2': 1 - regression['sse'] / sst if sst > 0 else None,
+        'mse': mse,
+        'rmse': math.sqrt(mse),
+        'mae': regression['sae'] / n,
+        'msle': msle,
+        'rmsle': math.sqrt(msle) if msle is not None else None,
+        'medae': get_sketch_quantile(regression['absolute_error'], 0.5),
+        'smape': regression['smape'] / n
+    }
+
+
+def get_chart_aggregate_data(chart: MonitoredModelInteractiveChart, aggregate: dict) -> dict:
+    """
+    Get chart data from chart aggregate. Computation depends only on number of bins, categories or classes,
+    not on number of predictions.
+
+    Args:
+        chart: Interactive chart.
+        aggregate: Chart aggregate document.
+
+    Returns:
+        Chart data.
+    """
+    if chart.chart_type in ("histogram", "scatter_with_histograms"):
+        columns = [chart.x_axis_column] + (chart.y_axis_columns[:1] if chart.y_axis_columns else [])
+        return {
+            column: get_histogram_data(aggregate.get('sketches', {}).get(encode_key(column)), chart.bin_method,
+                                       chart.bin_number)
+            for column in columns
+        }
+
+    if chart.chart_type == "countplot":
+        return get_countplot_data(aggregate.get('categories', {}).get(encode_key(chart.x_axis_column), {}))
+
+    if chart.chart_type == "regression_metrics":
+        metrics = get_regression_metrics(aggregate.get('regression', {}))
+        return {metric: metrics[metric] for metric in chart.metrics}
+
+    confusion_matrix = get_confusion_matrix_data(aggregate.get('confusion_matrix', {}))
+    if chart.chart_type == "confusion_matrix":
+        return confusion_matrix
+
+    metrics = get_classification_metrics(confusion_matrix['confusion_matrix'])
+    return {metric: metrics[metric] for metric in chart.metrics}
@@ -0,0 +1,37 @@
+from typing import Union, List
+
+import numpy as np
+
+from app.models.chart import EncodedChartData
+from app.routers.exceptions.chart import chart_data_not_numeric_exception
+
+# headers of raw chart data responses, exposed to the front-end
+CHART_DTYPE_HEADER = "X-Chart-Dtype"
+CHART_SHAPE_HEADER = "X-Chart-Shape"
+
+
+def get_chart_data_array(data: Union[List[List], EncodedChartData]) -> np.ndarray:
+    """
+    Get chart data as little-endian array of series, encoded data are decoded without copying, lists of numbers
+    are converted to float64 array.
+
+    Args:
+        data: Lists of values or encoded array of chart axis.
+
+    Raises:
+        HTTPException: If lists are not numbers or are not of equal length.
+
+    Returns:
+        Two-dimensional array of series.
+    """
+    if isinstance(data, EncodedChartData):
+        return data.to_array()
+
+    try:
+        array = np.array(data, dtype='<f8')
+    except (TypeError, ValueError):
+        raise chart_data_not_numeric_exception()
+    if array.ndim != 2:
+        raise chart_data_not_numeric_exception()
+
+    return array
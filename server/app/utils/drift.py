@@ -0,0 +1,357 @@
+import math
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+
+from app.config.config import settings
+from app.models.input_schema import InputSchema
+from app.utils.chart_aggregates import ChartAggregateUpdate, get_sketch_buckets, get_sketch_quantile
+from app.utils.values import encode_key, decode_key, is_number, normalize_value
+
+# lengths of intervals drift is computed for, in seconds
+DRIFT_INTERVALS = {'hour': 3600, 'day': 86400, 'week': 604800}
+# time buckets and intervals are aligned to midnight of Monday
+DRIFT_ORIGIN = datetime(1970, 1, 5)
+# levels of quantiles of reference window used as bin edges, the same as levels of dataset profile quantiles
+DRIFT_QUANTILE_LEVELS = [0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+# proportions of empty bins are replaced with this value, so PSI is finite
+DRIFT_EPSILON = 1e-4
+# key of values of columns with more than INPUT_SCHEMA_MAX_VALUES distinct values, encoded keys start with 'k'
+OTHER_CATEGORY = 'other'
+
+
+def get_bucket_start(date: datetime, seconds: int) -> datetime:
+    """
+    Get start of time bucket of date. Time zone of aware dates is ignored, prediction dates are stored without it.
+
+    Args:
+        date: Date.
+        seconds: Length of time buckets in seconds.
+
+    Returns:
+        Start of the time bucket.
+    """
+    date = date.replace(tzinfo=None)
+    return DRIFT_ORIGIN + timedelta(seconds=(date - DRIFT_ORIGIN).total_seconds() // seconds * seconds)
+
+
+def get_drift_bucket_updates(monitored_model_id: PydanticObjectId, input_schema: InputSchema,
+                             predictions: List[dict]) -> List[UpdateOne]:
+    """
+    Get MongoDB updates of drift buckets for added predictions.
+
+    Args:
+        monitored_model_id: Monitored model id.
+        input_schema: Input schema of monitored model, used to limit number of counted distinct values.
+        predictions: Prediction documents or prediction data dictionaries.
+
+    Returns:
+        Upserts of drift buckets, one for each time bucket of predictions.
+    """
+    return [UpdateOne({"monitored_model_id": monitored_model_id, "bucket_start": bucket_start}, update, upsert=True)
+            for bucket_start, update in get_drift_bucket_update_documents(input_schema, predictions).items()]
+
+
+def get_drift_bucket_update_documents(input_schema: InputSchema, predictions: List[dict]) -> Dict[datetime, dict]:
+    """
+    Get MongoDB update documents of drift buckets for added predictions. Numeric values of input data and predictions
+    are added to sketches, string and boolean values to value counts. Values of columns with more distinct values than
+    INPUT_SCHEMA_MAX_VALUES are counted together as other values.
+
+    Args:
+        input_schema: Input schema of monitored model, used to limit number of counted distinct values.
+        predictions: Prediction documents or prediction data dictionaries.
+
+    Returns:
+        Update documents by start of time bucket, sorted by start.
+    """
+    updates = defaultdict(ChartAggregateUpdate)
+    values = defaultdict(set)
+
+    for prediction in predictions:
+        update = updates[get_bucket_start(prediction['prediction_date'], settings.DRIFT_BUCKET_SECONDS)]
+        update.inc["predictions_count"] += 1
+
+        for name, value in {**prediction['input_data'], 'prediction': prediction['prediction']}.items():
+            key = encode_key(name)
+            if is_number(value):
+                update.add_value(f"sketches.{key}", value, 1)
+            elif isinstance(value, (str, bool)):
+                value = normalize_value(value)
+                column = input_schema.columns.get(key)
+                column_values = column.values if column else []
+                if value in values[key] or value in column_values or \
+                        len(column_values) + len(values[key]) < settings.INPUT_SCHEMA_MAX_VALUES:
+                    values[key].add(value)
+                    update.inc[f"categories.{key}.{encode_key(value)}"] += 1
+                else:
+                    update.inc[f"categories.{key}.{OTHER_CATEGORY}"] += 1
+
+    return {bucket_start: update.to_mongo() for bucket_start, update in sorted(updates.items())}
+
+
+def merge_aggregates(aggregate: dict, other: dict) -> dict:
+    """
+    Add counts, sums, minimums and maximums of other sketches or value counts to aggregate.
+
+    Args:
+        aggregate: Sketches or value counts, updated in place.
+        other: Sketches or value counts to add.
+
+    Returns:
+        Updated aggregate.
+    """
+    for key, value in other.items():
+        if isinstance(value, dict):
+            merge_aggregates(aggregate.setdefault(key, {}), value)
+        elif key not in aggregate:
+            aggregate[key] = value
+        elif key == 'min':
+            aggregate[key] = min(aggregate[key], value)
+        elif key == 'max':
+            aggregate[key] = max(aggregate[key], value)
+        else:
+            aggregate[key] += value
+
+    return aggregate
+
+
+def merge_drift_buckets(buckets: List[dict], interval_seconds: Optional[int] = None) -> Dict[datetime, dict]:
+    """
+    Merge drift buckets into intervals.
+
+    Args:
+        buckets: Drift bucket documents.
+        interval_seconds: Length of intervals in seconds, all buckets are merged into one if None.
+
+    Returns:
+        Merged predictions counts, sketches and value counts by start of interval, sorted by start.
+    """
+    intervals = {}
+    for bucket in sorted(buckets, key=lambda bucket: bucket['bucket_start']):
+        start = get_bucket_start(bucket['bucket_start'], interval_seconds) if interval_seconds else DRIFT_ORIGIN
+        merge_aggregates(intervals.setdefault(start, {}), {
+            'predictions_count': bucket.get('predictions_count', 0),
+            'sketches': bucket.get('sketches', {}),
+            'categories': bucket.get('categories', {})
+        })
+
+    return intervals
+
+
+def get_sketch_cdf(sketch: dict, edges: List[float]) -> List[float]:
+    """
+    Get proportions of sketch values less than or equal to edges.
+
+    Args:
+        sketch: Sketch.
+        edges: Sorted values.
+
+    Returns:
+        Cumulative distribution function at edges.
+    """
+    buckets = get_sketch_buckets(sketch)
+    values = [value for value, _ in buckets]
+    cumulative = [0]
+    for _, count in buckets:
+        cumulative.append(cumulative[-1] + count)
+
+    return [cumulative[bisect_right(values, edge)] / cumulative[-1] for edge in edges]
+
+
+def get_numeric_baseline(points: List[tuple], exact: bool = True) -> dict:
+    """
+    Get baseline of numeric column from points of its cumulative distribution function. Points with the same
+    value, e.g. quantiles of column with many equal values, are merged into one with the highest proportion.
+    If points are quantiles, proportion of values less than or equal to merged value is known only to be between
+    the highest proportion and proportion of the next point, the upper bound is kept with the edge.
+
+    Args:
+        points: Sorted pairs of value and proportion of values less than or equal to it.
+        exact: False if points are quantiles, True if proportions are exact.
+
+    Returns:
+        Bin edges, cumulative distribution function at edges and its upper bounds.
+    """
+    edges, cdf, cdf_upper = [], [], []
+    for value, proportion in points:
+        if edges and value == edges[-1]:
+            cdf[-1] = max(cdf[-1], proportion)
+            cdf_upper[-1] = cdf[-1] if exact else None
+        else:
+            if cdf_upper and cdf_upper[-1] is None:
+                cdf_upper[-1] = proportion
+            edges.append(value)
+            cdf.append(proportion)
+            cdf_upper.append(proportion)
+
+    if cdf_upper[-1] is None:
+        cdf_upper[-1] = 1
+
+    return {'type': 'numeric', 'edges': edges, 'cdf': cdf, 'cdf_upper': cdf_upper}
+
+
+def get_categorical_baseline(categories: dict) -> dict:
+    """
+    Get baseline of categorical column from its value counts.
+
+    Args:
+        categories: Value counts by encoded value.
+
+    Returns:
+        Proportions of values by encoded value.
+    """
+    total = sum(count for count in categories.values() if count > 0)
+    return {'type': 'categorical', 'proportions': {key: count / total for key, count in categories.items()
+                                                   if count > 0}}
+
+
+def get_profile_baseline(profile: dict) -> Dict[str, dict]:
+    """
+    Get drift baseline from dataset profile. Numeric columns are binned by their quantiles, columns of other types
+    have no value counts in the profile and are not compared.
+
+    Args:
+        profile: Dataset profile.
+
+    Returns:
+        Baselines of columns by encoded column name.
+    """
+    baseline = {}
+    for column in profile.get('columns', []):
+        if not column.get('quantiles') or not is_number(column.get('min')) or not is_number(column.get('max')):
+            continue
+        points = [(column['min'], 0)] + list(zip(column['quantiles'], profile['quantile_levels'])) + \
+                 [(column['max'], 1)]
+        baseline[encode_key(column['name'])] = get_numeric_baseline(points, exact=False)
+
+    return baseline
+
+
+def get_reference_baseline(aggregate: dict) -> Dict[str, dict]:
+    """
+    Get drift baseline from merged drift buckets of reference window. Numeric columns are binned by their
+    quantiles.
+
+    Args:
+        aggregate: Merged drift buckets.
+
+    Returns:
+        Baselines of columns by encoded column name.
+    """
+    baseline = {}
+    for key, sketch in aggregate.get('sketches', {}).items():
+        if sketch.get('count', 0) <= 0:
+            continue
+        edges = [sketch['min']] + [get_sketch_quantile(sketch, level) for level in DRIFT_QUANTILE_LEVELS] + \
+                [sketch['max']]
+        baseline[key] = get_numeric_baseline(list(zip(edges, get_sketch_cdf(sketch, edges))))
+
+    for key, categories in aggregate.get('categories', {}).items():
+        if key not in baseline and any(count > 0 for count in categories.values()):
+            baseline[key] = get_categorical_baseline(categories)
+
+    return baseline
+
+
+def get_drift_metrics(expected: List[float], actual: List[float]) -> dict:
+    """
+    Get population stability index and Jensen-Shannon divergence (base 2, between 0 and 1) of binned
+    distributions.
+
+    Args:
+        expected: Proportions of baseline values in bins.
+        actual: Proportions of compared values in the same bins.
+
+    Returns:
+        Dictionary with 'psi' and 'js'.
+    """
+    psi = 0
+    js = 0
+    for e, a in zip(expected, actual):
+        psi += (max(a, DRIFT_EPSILON) - max(e, DRIFT_EPSILON)) * math.log(max(a, DRIFT_EPSILON) /
+                                                                          max(e, DRIFT_EPSILON))
+        m = (e + a) / 2
+        js += (e * math.log2(e / m) if e > 0 else 0) / 2 + (a * math.log2(a / m) if a > 0 else 0) / 2
+
+    return {'psi': psi, 'js': max(js, 0)}
+
+
+def get_column_drift(baseline: dict, aggregate: dict, key: str) -> Optional[dict]:
+    """
+    Get drift of column values from baseline. Numeric values are binned by baseline edges with two more bins for
+    values out of baseline range, Kolmogorov-Smirnov statistic is computed at bin edges (a lower bound of the
+    statistic). Categorical values are
+    compared by proportions of values, KS statistic is not defined for them.
+
+    Args:
+        baseline: Baseline of the column.
+        aggregate: Merged drift buckets of compared interval.
+        key: Encoded column name.
+
+    Returns:
+        Column name, type, number of values, PSI, KS statistic, JS divergence and drift flag, None if the interval
+        has no values of the column of baseline type.
+    """
+    if baseline['type'] == 'numeric':
+        sketch = aggregate.get('sketches', {}).get(key)
+        if not sketch or sketch.get('count', 0) <= 0:
+            return None
+        count = sketch['count']
+        cdf = get_sketch_cdf(sketch, baseline['edges'])
+        # proportion known within bounds closest to the compared one
+        baseline_cdf = [min(max(proportion, lower), upper)
+                        for proportion, lower, upper in zip(cdf, baseline['cdf'], baseline['cdf_upper'])]
+        expected = [b - a for a, b in zip([0] + baseline_cdf, baseline_cdf + [1])]
+        actual = [b - a for a, b in zip([0] + cdf, cdf + [1])]
+        ks = max(abs(a - b) for a, b in zip(cdf, baseline_cdf))
+    else:
+        categories = {value: count for value, count in aggregate.get('categories', {}).get(key, {}).items()
+                      if count > 0}
+        count = sum(categories.values())
+        if count <= 0:
+            return None
+        values = sorted(set(baseline['proportions']) | set(categories))
+        expected = [baseline['proportions'].get(value, 0) for value in values]
+        actual = [categories.get(value, 0) / count for value in values]
+        ks = None
+
+    metrics = get_drift_metrics(expected, actual)
+
+    return {
+        'name': decode_key(key),
+        'type': baseline['type'],
+        'count': int(count),
+        'psi': metrics['psi'],
+        'ks': ks,
+        'js': metrics['js'],
+        'drift': metrics['psi'] >= settings.DRIFT_PSI_THRESHOLD
+    }
+
+
+def get_drift_data(baseline: Dict[str, dict], intervals: Dict[datetime, dict], interval_seconds: int) -> List[dict]:
+    """
+    Get drift of columns from baseline in every interval. Computation depends only on number of columns, bins
+    and categories, not on number of predictions.
+
+    Args:
+        baseline: Baselines of columns by encoded column name.
+        intervals: Merged drift buckets by start of interval.
+        interval_seconds: Length of intervals in seconds.
+
+    Returns:
+        List of intervals with start, end, number of predictions and drift of columns.
+    """
+    return [
+        {
+            'start': start.isoformat(),
+            'end': (start + timedelta(seconds=interval_seconds)).isoformat(),
+            'predictions_count': int(aggregate.get('predictions_count', 0)),
+            'columns': [column for column in (get_column_drift(column_baseline, aggregate, key)
+                                              for key, column_baseline in baseline.items()) if column is not None]
+        } for start, aggregate in intervals.items()
+    ]
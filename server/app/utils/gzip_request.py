@@ -0,0 +1,55 @@
+import zlib
+from typing import Callable
+
+from app.config.config import settings
+from app.routers.exceptions.request import request_bad_gzip_body_exception, request_body_too_large_exception
+
+
+class GZipRequestMiddleware:
+    """
+    ASGI middleware decompressing request bodies sent with 'Content-Encoding: gzip' header, e.g. JSON bodies
+    compressed by the mlops library. Body is decompressed incrementally, as it is received. Invalid gzip data is
+    rejected with 400 status code and body decompressed to more than GZIP_REQUEST_MAX_SIZE bytes with 413 status code,
+    decompressed output is capped, so a small compressed body cannot expand without limit in memory.
+
+    Attributes:
+    - **app (Callable)**: Wrapped ASGI application.
+    """
+
+    def __init__(self, app: Callable):
+        self.app: Callable = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or (b"content-encoding", b"gzip") not in \
+                [(name, value.lower()) for name, value in scope["headers"]]:
+            await self.app(scope, receive, send)
+            return
+
+        # compressed content length and encoding do not describe decompressed body
+        scope = dict(scope)
+        scope["headers"] = [(name, value) for name, value in scope["headers"]
+                            if name not in (b"content-encoding", b"content-length")]
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        max_size = settings.GZIP_REQUEST_MAX_SIZE
+        size = 0
+
+        async def receive_decompressed() -> dict:
+            nonlocal size
+            message = await receive()
+            if message["type"] == "http.request":
+                try:
+                    # one byte over the remaining size is enough to know that the limit is exceeded
+                    body = decompressor.decompress(message.get("body", b""), max_size - size + 1)
+                    if not message.get("more_body", False) and len(body) <= max_size - size:
+                        body += decompressor.flush()
+                        if not decompressor.eof:
+                            raise zlib.error("incomplete or truncated stream")
+                except zlib.error as e:
+                    raise request_bad_gzip_body_exception(str(e))
+                size += len(body)
+                if size > max_size:
+                    raise request_body_too_large_exception(max_size)
+                message = {**message, "body": body}
+            return message
+
+        await self.app(scope, receive_decompressed, send)
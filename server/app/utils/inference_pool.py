@@ -0,0 +1,208 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from app.config.config import settings
+from app.utils.artifact_store import get_artifact_store
+from app.utils.ml_model import predict_ml_model, unpickle_ml_model
+from app.utils.ml_model_cache import MlModelCache
+
+# decoded ml models of the process pool worker, every worker process has its own cache
+_worker_ml_model_cache = MlModelCache(settings.ML_MODEL_CACHE_SIZE)
+
+
+def _init_worker(ml_models: List[Tuple[Tuple[str, str], bytes]]) -> None:
+    """
+    Pre-warm process pool worker by decoding ml models into its cache.
+
+    Args:
+        ml_models: List of pairs of cache key and pickled ml model.
+
+    Returns:
+        None
+    """
+    for cache_key, ml_model_data in ml_models:
+        try:
+            _worker_ml_model_cache.put(cache_key, unpickle_ml_model(ml_model_data))
+        except Exception:
+            # model which cannot be decoded fails on prediction with a proper error
+            pass
+
+
+def _predict_in_worker(cache_key: Tuple[str, str], input_data: List[dict],
+                       ml_model_data: Optional[bytes] = None) -> Optional[list]:
+    """
+    Make prediction in process pool worker with ml model from the worker cache.
+
+    Args:
+        cache_key: Cache key of ml model.
+        input_data: List of samples to make prediction on.
+        ml_model_data: Pickled ml model, decoded and cached if the worker has not got the model yet.
+
+    Returns:
+        List of predictions or None if the worker has not got the model and pickled ml model was not passed.
+    """
+    ml_model = _worker_ml_model_cache.get(cache_key)
+    if ml_model is None:
+        if ml_model_data is None:
+            return None
+        ml_model = unpickle_ml_model(ml_model_data)
+        _worker_ml_model_cache.put(cache_key, ml_model)
+
+    return predict_ml_model(ml_model, input_data)
+
+
+class InferencePoolFullError(Exception):
+    """
+    Raised when the number of tasks waiting in the inference pool exceeds its queue limit.
+    """
+
+
+class InferencePool:
+    """
+    Worker pool which runs ml models decoding and inference off the event loop.
+
+    With 'thread' pool type, decoding and predictions run in the same thread pool on ml models decoded in the server
+    process. With 'process' pool type, predictions run in worker processes which keep their own cache of decoded
+    ml models, so ml model is sent to the worker only once and is not decoded in the server process for predictions;
+    decoding of ml models used by the server process for other requests runs in a separate thread pool. Tasks above
+    the queue limit are rejected with InferencePoolFullError.
+
+    Attributes:
+    - **pool_type (str)**: Pool type, 'thread' or 'process'.
+    - **workers (int)**: Number of workers.
+    - **max_queue (int)**: Maximum number of tasks waiting for a free worker.
+    """
+
+    def __init__(self, pool_type: str, workers: int, max_queue: int):
+        if pool_type not in ('thread', 'process'):
+            raise ValueError(f"Inference pool type must be 'thread' or 'process', got '{pool_type}'")
+
+        self.pool_type: str = pool_type
+        self.workers: int = workers
+        self.max_queue: int = max_queue
+        self.tasks: int = 0
+        self.rejected: int = 0
+        self.worker_ml_model_loads: int = 0
+        self._in_flight: int = 0
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self, ml_models: Optional[List[Tuple[Tuple[str, str], bytes]]] = None) -> None:
+        """
+        Start the pool. Process pool workers are pre-warmed with given ml models.
+
+        Args:
+            ml_models: List of pairs of cache key and pickled ml model.
+
+        Returns:
+            None
+        """
+        if self._thread_executor is None:
+            self._thread_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='inference')
+        if self.pool_type == 'process' and self._process_executor is None:
+            self._process_executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                         mp_context=multiprocessing.get_context('spawn'),
+                                                         initializer=_init_worker,
+                                                         initargs=(ml_models or [],))
+
+    def shutdown(self) -> None:
+        """
+        Shut down the pool, waiting for running tasks.
+
+        Returns:
+            None
+        """
+        for executor in (self._thread_executor, self._process_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._thread_executor = None
+        self._process_executor = None
+
+    async def _run(self, executor: Executor, function: Callable, *args) -> object:
+        """
+        Run function in executor, rejecting it if the pool queue is full.
+
+        Args:
+            executor: Executor to run function in.
+            function: Function to run.
+            *args: Function arguments.
+
+        Returns:
+            Function result.
+        """
+        if self._in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise InferencePoolFullError(f"Inference pool queue is full ({self.max_queue} waiting tasks)")
+
+        self._in_flight += 1
+        self.tasks += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def run_in_thread(self, function: Callable, *args) -> object:
+        """
+        Run blocking function, e.g. ml model decoding, in the thread pool.
+
+        Args:
+            function: Function to run.
+            *args: Function arguments.
+
+        Returns:
+            Function result.
+        """
+        self.start()
+        return await self._run(self._thread_executor, function, *args)
+
+    async def predict(self, cache_key: Tuple[str, str], ml_model_artifact_id: str, input_data: List[dict],
+                      ml_model: object = None) -> list:
+        """
+        Make prediction on input data in the pool.
+
+        Args:
+            cache_key: Cache key of ml model.
+            ml_model_artifact_id: Artifact id of pickled ml model, loaded from the artifact store and sent to process
+                pool worker which has not got the model yet.
+            input_data: List of samples to make prediction on.
+            ml_model: Decoded ml model, required by thread pool. Process pool workers decode ml model themselves.
+
+        Returns:
+            List of predictions.
+        """
+        self.start()
+        if self.pool_type == 'thread':
+            return await self._run(self._thread_executor, predict_ml_model, ml_model, input_data)
+
+        predictions = await self._run(self._process_executor, _predict_in_worker, cache_key, input_data)
+        if predictions is None:
+            self.worker_ml_model_loads += 1
+            ml_model_data = await get_artifact_store().get(ml_model_artifact_id)
+            predictions = await self._run(self._process_executor, _predict_in_worker, cache_key, input_data,
+                                          ml_model_data)
+        return predictions
+
+    def stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with pool type, number of workers, queue limit, running and waiting tasks, number of tasks,
+            rejected tasks and ml models loaded by process pool workers.
+        """
+        return {
+            'pool_type': self.pool_type,
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'running_tasks': min(self._in_flight, self.workers),
+            'waiting_tasks': max(self._in_flight - self.workers, 0),
+            'tasks': self.tasks,
+            'rejected': self.rejected,
+            'worker_ml_model_loads': self.worker_ml_model_loads
+        }
+
+
+inference_pool = InferencePool(settings.INFERENCE_POOL_TYPE, settings.INFERENCE_POOL_WORKERS,
+                               settings.INFERENCE_POOL_MAX_QUEUE)
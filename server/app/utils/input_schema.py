@@ -0,0 +1,95 @@
+from collections import defaultdict
+from typing import List, Optional
+
+from app.config.config import settings
+from app.models.input_schema import InputSchema
+from app.utils.values import encode_key, get_value_type, normalize_value
+
+
+def get_input_schema_update(input_schema: InputSchema, added_rows: List[dict],
+                            removed_rows: Optional[List[dict]] = None) -> Optional[dict]:
+    """
+    Get MongoDB update of monitored model input schema for added and removed prediction rows.
+
+    Args:
+        input_schema: Current input schema, used to limit number of stored distinct values.
+        added_rows: Rows of input data with prediction and actual values to add to the schema.
+        removed_rows: Rows, previously added to the schema, to remove from it.
+
+    Returns:
+        Update document or None if the schema does not change.
+    """
+    inc = defaultdict(int)
+    names = {}
+    values = defaultdict(list)
+
+    inc["input_schema.rows"] += len(added_rows) - len(removed_rows or [])
+
+    for rows, sign in ((added_rows, 1), (removed_rows or [], -1)):
+        for row in rows:
+            for name, value in row.items():
+                value_type = get_value_type(value)
+                if value_type == 'null':
+                    continue
+
+                key = encode_key(name)
+                inc[f"input_schema.columns.{key}.types.{value_type}"] += sign
+                if sign < 0:
+                    continue
+
+                names[f"input_schema.columns.{key}.name"] = name
+                column = input_schema.columns.get(key)
+                if value_type != 'other' and \
+                        len(column.values if column else []) + len(values[key]) < settings.INPUT_SCHEMA_MAX_VALUES:
+                    value = normalize_value(value)
+                    if value not in values[key] and (column is None or value not in column.values):
+                        values[key].append(value)
+
+    update = {}
+    inc = {path: value for path, value in inc.items() if value != 0}
+    if inc:
+        update["$inc"] = inc
+    if names:
+        update["$set"] = names
+    if any(values.values()):
+        update["$addToSet"] = {f"input_schema.columns.{key}.values": {"$each": key_values}
+                               for key, key_values in values.items() if key_values}
+    return update or None
+
+
+def validate_input_data(input_schema: InputSchema, input_data: List[dict]) -> Optional[str]:
+    """
+    Validate input data of prediction against monitored model input schema.
+
+    Args:
+        input_schema: Input schema.
+        input_data: List of samples to make prediction on.
+
+    Returns:
+        Description of the first error or None if input data matches the schema.
+    """
+    if input_schema.rows == 0:
+        return None
+
+    columns = {column.name: column for column in input_schema.columns.values()
+               if column.name not in InputSchema.Settings.output_columns}
+    required = [name for name, column in columns.items() if column.count == input_schema.rows]
+
+    for index, sample in enumerate(input_data):
+        unknown = [name for name in sample if name not in columns]
+        if unknown:
+            return f"sample {index} has unknown columns {unknown}"
+
+        missing = [name for name in required if sample.get(name) is None]
+        if missing:
+            return f"sample {index} has missing or null values of columns {missing}"
+
+        for name, value in sample.items():
+            dtype = columns[name].dtype
+            value_type = get_value_type(value)
+            if value_type == 'null' or dtype in ('mixed', 'null'):
+                continue
+            if value_type != dtype and not (dtype == 'numeric' and value_type == 'boolean'):
+                return f"sample {index} column '{name}' must be {dtype}, got {value_type} value {value!r}"
+
+    return None
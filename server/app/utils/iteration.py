@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import List, Iterable, Dict, Optional, Tuple
+
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+
+from app.models.dataset import Dataset
+from app.models.experiment import Experiment
+from app.models.iteration import Iteration
+from app.models.iteration_document import IterationDocument
+
+
+async def attach_iterations(experiments: List[Experiment]) -> None:
+    """
+    Fill iterations of experiments, e.g. of projects returned by the API, from the iteration collection with one
+    query. Iterations are sorted by creation date.
+
+    Args:
+        experiments: Experiments, updated in place.
+
+    Returns:
+        None
+    """
+    if not experiments:
+        return None
+
+    iterations = {experiment.id: [] for experiment in experiments}
+    async for iteration in IterationDocument.find({"experiment_id": {"$in": list(iterations)}}).sort("created_at"):
+        iterations[iteration.experiment_id].append(iteration.to_iteration())
+
+    for experiment in experiments:
+        experiment.iterations = iterations[experiment.id]
+
+    return None
+
+
+async def link_iterations_to_datasets(iterations: Iterable[Iteration]) -> None:
+    """
+    Add iterations to linked iterations of their datasets, with one bulk write grouping iterations by dataset.
+
+    Args:
+        iterations: Iterations.
+
+    Returns:
+        None
+    """
+    linked_iterations = {}
+    for iteration in iterations:
+        if iteration.dataset:
+            linked_iterations.setdefault(iteration.dataset.id, {})[f"linked_iterations.{iteration.id}"] = \
+                [iteration.project_id, iteration.experiment_id]
+
+    await update_datasets([UpdateOne({"_id": dataset_id}, {"$set": update})
+                           for dataset_id, update in linked_iterations.items()])
+
+    return None
+
+
+async def unlink_iterations_from_datasets(iterations: Iterable[dict]) -> None:
+    """
+    Remove deleted iterations from linked iterations of their datasets, with one bulk write grouping iterations
+    by dataset.
+
+    Args:
+        iterations: Iteration documents with '_id' and 'dataset' fields.
+
+    Returns:
+        None
+    """
+    unset = {}
+    for iteration in iterations:
+        if iteration.get("dataset"):
+            unset.setdefault(iteration["dataset"]["id"], {})[f"linked_iterations.{iteration['_id']}"] = ""
+
+    await update_datasets([UpdateOne({"_id": dataset_id}, {"$unset": update}) for dataset_id, update in unset.items()])
+
+    return None
+
+
+async def update_datasets(updates: List[UpdateOne]) -> None:
+    """
+    Write updates of datasets with one unordered bulk write, updates of different datasets are independent.
+
+    Args:
+        updates: Updates, at most one per dataset.
+
+    Returns:
+        None
+    """
+    if updates:
+        await Dataset.get_motor_collection().bulk_write(updates, ordered=False)
+
+    return None
+
+
+async def get_iterations_activity(field: str, ids: List[PydanticObjectId]) -> \
+        Dict[PydanticObjectId, Tuple[int, Optional[datetime]]]:
+    """
+    Count iterations of projects, experiments or datasets and get creation date of their last iteration, with one
+    aggregation using index of the field.
+
+    Args:
+        field: Iteration field, 'project_id', 'experiment_id' or 'dataset.id'.
+        ids: Ids of projects, experiments or datasets.
+
+    Returns:
+        Number of iterations and creation date of the last iteration by id, ids without iterations are missing.
+    """
+    if not ids:
+        return {}
+
+    activity = await IterationDocument.get_motor_collection().aggregate([
+        {"$match": {field: {"$in": ids}}},
+        {"$group": {"_id": f"${field}", "count": {"$sum": 1}, "last_created_at": {"$max": "$created_at"}}}
+    ]).to_list(length=None)
+
+    return {document["_id"]: (document["count"], document["last_created_at"]) for document in activity}
@@ -0,0 +1,136 @@
+import math
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from beanie import PydanticObjectId
+
+from app.models.metric_series import MetricSeries, MetricPoints, DownsampledMetricSeries
+
+# maximum number of points stored in one metric series document
+METRIC_SERIES_BUCKET_SIZE = 1000
+
+
+async def append_metric_points(project_id: PydanticObjectId, experiment_id: PydanticObjectId,
+                               iteration_id: PydanticObjectId, name: str, points: MetricPoints) -> None:
+    """
+    Append points to metric series of iteration. Points are pushed to the last bucket which has room for them,
+    new bucket is created when there is none.
+
+    Args:
+        project_id: Project id.
+        experiment_id: Experiment id.
+        iteration_id: Iteration id.
+        name: Metric name.
+        points: Points to append.
+    """
+    timestamps = points.timestamps or [datetime.now()] * len(points.steps)
+    values = [value if value is None or math.isfinite(value) else None for value in points.values]
+    collection = MetricSeries.get_motor_collection()
+
+    for start in range(0, len(points.steps), METRIC_SERIES_BUCKET_SIZE):
+        end = start + METRIC_SERIES_BUCKET_SIZE
+        steps = points.steps[start:end]
+        free_points = METRIC_SERIES_BUCKET_SIZE - len(steps)
+
+        await collection.update_one(
+            {"iteration_id": iteration_id, "name": name, "points_count": {"$lte": free_points}},
+            {
+                "$push": {
+                    "steps": {"$each": steps},
+                    "values": {"$each": values[start:end]},
+                    "timestamps": {"$each": timestamps[start:end]}
+                },
+                "$inc": {"points_count": len(steps)},
+                "$setOnInsert": {"project_id": project_id, "experiment_id": experiment_id}
+            },
+            upsert=True
+        )
+
+
+def downsample(steps: List[int], values: List[Optional[float]], max_points: int) -> List[int]:
+    """
+    Select indices of points representing the series on a chart, using Largest-Triangle-Three-Buckets algorithm.
+    First and last point are always selected, from every bucket between them the point forming the largest triangle
+    with the point selected from the previous bucket and the average of the next bucket is selected.
+
+    Args:
+        steps: Steps of the points, sorted.
+        values: Values of the points, missing values are treated as 0.
+        max_points: Maximum number of selected points.
+
+    Returns:
+        Indices of selected points.
+    """
+    count = len(steps)
+    if count <= max_points:
+        return list(range(count))
+    if max_points < 3:
+        return [0, count - 1][:max_points]
+
+    y = [value if value is not None else 0.0 for value in values]
+    bucket_size = (count - 2) / (max_points - 2)
+    indices = [0]
+    selected = 0
+
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        next_start, next_end = end, min(int((bucket + 2) * bucket_size) + 1, count)
+        average_x = sum(steps[next_start:next_end]) / (next_end - next_start)
+        average_y = sum(y[next_start:next_end]) / (next_end - next_start)
+
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs((steps[selected] - average_x) * (y[index] - y[selected]) -
+                       (steps[selected] - steps[index]) * (average_y - y[selected]))
+            if area > best_area:
+                best, best_area = index, area
+
+        indices.append(best)
+        selected = best
+
+    indices.append(count - 1)
+    return indices
+
+
+async def get_metric_series(iteration_id: PydanticObjectId, names: Optional[List[str]], max_points: int) -> \
+        Dict[str, DownsampledMetricSeries]:
+    """
+    Get metric series of iteration sorted by step and downsampled to max_points points. If a step was logged more
+    than once, e.g. batch resent by the client, the latest point is used.
+
+    Args:
+        iteration_id: Iteration id.
+        names: Metric names, all metrics if None.
+        max_points: Maximum number of points of every series.
+
+    Returns:
+        Downsampled series by metric name.
+    """
+    query = {"iteration_id": iteration_id}
+    if names:
+        query["name"] = {"$in": names}
+
+    points: Dict[str, Dict[int, tuple]] = {}
+    async for bucket in MetricSeries.get_motor_collection().find(
+            query, {"name": 1, "steps": 1, "values": 1, "timestamps": 1}).sort("_id", 1):
+        series = points.setdefault(bucket["name"], {})
+        for step, value, timestamp in zip(bucket["steps"], bucket["values"], bucket["timestamps"]):
+            if step not in series or series[step][1] <= timestamp:
+                series[step] = (value, timestamp)
+
+    metric_series = {}
+    for name in sorted(points):
+        steps = sorted(points[name])
+        values = [points[name][step][0] for step in steps]
+        indices = downsample(steps, values, max_points)
+
+        metric_series[name] = DownsampledMetricSeries(
+            steps=[steps[index] for index in indices],
+            values=[values[index] for index in indices],
+            timestamps=[points[name][steps[index]][1] for index in indices],
+            count=len(steps)
+        )
+
+    return metric_series
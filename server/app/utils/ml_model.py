@@ -0,0 +1,58 @@
+import base64
+import io
+import pickle
+from typing import List
+
+import pandas as pd
+
+
+class CustomUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if name == 'MonitoredModelWrapper':
+            from app.models.monitored_model_wrapper import MonitoredModelWrapper
+            return MonitoredModelWrapper
+        if name == 'BaselineNN':
+            from app.models.monitored_model_wrapper import BaselineNN
+            return BaselineNN
+        return super().find_class(module, name)
+
+
+def decode_encoded_ml_model(encoded_ml_model: str) -> bytes:
+    """
+    Decode base64 encoded, pickled ml model into pickle bytes.
+
+    Args:
+        encoded_ml_model: Encoded ml model.
+
+    Returns:
+        Pickled ml model.
+    """
+    return base64.b64decode(encoded_ml_model.encode("utf-8"), validate=True)
+
+
+def unpickle_ml_model(ml_model_data: bytes) -> object:
+    """
+    Unpickle ml model.
+
+    Args:
+        ml_model_data: Pickled ml model.
+
+    Returns:
+        Decoded ml model.
+    """
+    # instead pickle loads use custom unpickler
+    return CustomUnpickler(io.BytesIO(ml_model_data)).load()
+
+
+def predict_ml_model(ml_model: object, input_data: List[dict]) -> list:
+    """
+    Make prediction on input data with ml model complied with scikit-learn API.
+
+    Args:
+        ml_model: Decoded ml model.
+        input_data: List of samples to make prediction on.
+
+    Returns:
+        List of predictions.
+    """
+    return list(ml_model.predict(pd.DataFrame(input_data)))
@@ -0,0 +1,136 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from beanie import PydanticObjectId
+
+from app.config.config import settings
+
+
+class MlModelCache:
+    """
+    Bounded LRU cache of decoded ml models of monitored models.
+
+    Cached models are keyed by monitored model id and artifact id of the pickled ml model, which is SHA-256 hash
+    of its content, so a model which content has changed is never served from the cache.
+
+    Attributes:
+    - **max_size (int)**: Maximum number of cached models (0 disables caching).
+    - **hits (int)**: Number of cache hits.
+    - **misses (int)**: Number of cache misses.
+    - **evictions (int)**: Number of models evicted from the cache because of its size limit.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._ml_models: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(monitored_model_id: PydanticObjectId, ml_model_artifact_id: str) -> Tuple[str, str]:
+        """
+        Get cache key for ml model.
+
+        Args:
+            monitored_model_id: Monitored model id.
+            ml_model_artifact_id: Artifact id of pickled ml model.
+
+        Returns:
+            Cache key.
+        """
+        return str(monitored_model_id), ml_model_artifact_id
+
+    def get(self, key: Tuple[str, str]) -> Optional[object]:
+        """
+        Get decoded ml model from the cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Decoded ml model or None if there is no such model in the cache.
+        """
+        with self._lock:
+            ml_model = self._ml_models.get(key)
+            if ml_model is None:
+                self.misses += 1
+                return None
+
+            self._ml_models.move_to_end(key)
+            self.hits += 1
+            return ml_model
+
+    def put(self, key: Tuple[str, str], ml_model: object) -> None:
+        """
+        Put decoded ml model into the cache, evicting the least recently used models if needed.
+
+        Args:
+            key: Cache key.
+            ml_model: Decoded ml model.
+
+        Returns:
+            None
+        """
+        if self.max_size <= 0:
+            return None
+
+        with self._lock:
+            # only one version of ml model is kept for each monitored model
+            for old_key in [old_key for old_key in self._ml_models if old_key[0] == key[0] and old_key != key]:
+                del self._ml_models[old_key]
+
+            self._ml_models[key] = ml_model
+            self._ml_models.move_to_end(key)
+
+            while len(self._ml_models) > self.max_size:
+                self._ml_models.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, monitored_model_id: PydanticObjectId) -> None:
+        """
+        Remove all cached ml models of monitored model.
+
+        Args:
+            monitored_model_id: Monitored model id.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            for key in [key for key in self._ml_models if key[0] == str(monitored_model_id)]:
+                del self._ml_models[key]
+
+    def clear(self) -> None:
+        """
+        Remove all cached ml models and reset counters.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._ml_models.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache size, maximum size, hits, misses and evictions.
+        """
+        with self._lock:
+            return {
+                'size': len(self._ml_models),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+ml_model_cache = MlModelCache(settings.ML_MODEL_CACHE_SIZE)
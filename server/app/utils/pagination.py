@@ -0,0 +1,148 @@
+import base64
+from typing import Callable, List, Optional
+
+from bson import ObjectId, json_util
+from fastapi import HTTPException, Query, Response
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.routers.exceptions.pagination import list_bad_cursor_exception, list_bad_sort_by_exception
+
+# headers of list endpoints responses, exposed to the front-end
+TOTAL_COUNT_HEADER = "X-Total-Count"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class ListPage:
+    """
+    Query parameters of list endpoints, used as a dependency. Without limit all matching documents are returned.
+
+    Attributes:
+    - **limit (Optional[int])**: Maximum number of documents in page (1-1000), all documents if not set.
+    - **cursor (Optional[str])**: Cursor of the page, 'X-Next-Cursor' header returned with previous page.
+    - **sort_by (str)**: Sort field.
+    - **order (str)**: Sort order, 'asc' or 'desc'.
+    - **search (Optional[str])**: Words searched in names and descriptions (text index search).
+    """
+
+    def __init__(self,
+                 limit: Optional[int] = Query(default=None, ge=1, le=1000),
+                 cursor: Optional[str] = None,
+                 sort_by: str = 'created_at',
+                 order: str = Query(default='asc', regex='^(asc|desc)$'),
+                 search: Optional[str] = Query(default=None, min_length=1)):
+        self.limit = limit
+        self.cursor = cursor
+        self.sort_by = sort_by
+        self.order = order
+        self.search = search
+
+
+async def find_page(collection: AsyncIOMotorCollection, response: Response, query: dict, page: ListPage,
+                    sort_fields: List[str], projection: Optional[dict] = None) -> List[dict]:
+    """
+    Find page of documents sorted by sort field and id (keyset pagination). Number of all documents matching query
+    and search is set in 'X-Total-Count' header, cursor of the next page in 'X-Next-Cursor' header if there is one.
+
+    Args:
+        collection: Collection of documents.
+        response: Response of the endpoint, to set headers.
+        query: MongoDB query.
+        page: Query parameters of the list endpoint.
+        sort_fields: Fields documents can be sorted by.
+        projection: MongoDB projection, all fields if None.
+
+    Returns:
+        Documents of the page.
+    """
+    if page.sort_by not in sort_fields:
+        raise list_bad_sort_by_exception(sort_fields)
+
+    if page.search is not None:
+        query = {"$and": [query, {"$text": {"$search": page.search}}]}
+
+    total_count = await collection.count_documents(query)
+
+    if page.cursor is not None:
+        query = {"$and": [query, get_cursor_query(page.cursor, page.sort_by, page.order)]}
+
+    direction = 1 if page.order == 'asc' else -1
+    documents = collection.find(query, projection).sort([(page.sort_by, direction), ("_id", direction)])
+    if page.limit is not None:
+        documents = documents.limit(page.limit + 1)
+    documents = await documents.to_list(length=None)
+
+    response.headers[TOTAL_COUNT_HEADER] = str(total_count)
+    if page.limit is not None and len(documents) > page.limit:
+        documents = documents[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(documents[-1], page.sort_by)
+
+    return documents
+
+
+def get_sort_value(document: dict, sort_by: str):
+    """
+    Get value of sort field of the document, None if it is missing. Sort field can be nested, e.g. 'metrics.loss'.
+
+    Args:
+        document: Document.
+        sort_by: Sort field.
+
+    Returns:
+        Value of sort field.
+    """
+    value = document
+    for key in sort_by.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+
+    return value
+
+
+def encode_cursor(document: dict, sort_by: str) -> str:
+    """
+    Encode page cursor from the last document of the page.
+
+    Args:
+        document: Last document of the page.
+        sort_by: Sort field.
+
+    Returns:
+        Cursor of the next page.
+    """
+    cursor = json_util.dumps([get_sort_value(document, sort_by), document["_id"]])
+    return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("utf-8")
+
+
+def get_cursor_query(cursor: str, sort_by: str, order: str,
+                     bad_cursor_exception: Callable[[], HTTPException] = list_bad_cursor_exception) -> dict:
+    """
+    Build query of documents after cursor. Documents without value of sort field are sorted before the others
+    in ascending order.
+
+    Args:
+        cursor: Cursor of the page.
+        sort_by: Sort field.
+        order: Sort order, 'asc' or 'desc'.
+        bad_cursor_exception: Factory of exception raised for invalid cursor, cursor of list endpoints by default.
+
+    Returns:
+        MongoDB query.
+    """
+    try:
+        value, document_id = json_util.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8"))
+        if not isinstance(document_id, ObjectId):
+            raise ValueError(document_id)
+    except Exception:
+        raise bad_cursor_exception()
+
+    operator = "$gt" if order == "asc" else "$lt"
+    same_value = {sort_by: value, "_id": {operator: document_id}}
+
+    if value is None:
+        if order == "asc":
+            return {"$or": [same_value, {sort_by: {"$ne": None}}]}
+        return same_value
+
+    after_value = [same_value, {sort_by: {operator: value}}]
+    if order == "desc":
+        after_value.append({sort_by: None})
+    return {"$or": after_value}
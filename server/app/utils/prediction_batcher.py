@@ -0,0 +1,202 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.config.config import settings
+
+
+class PredictionBatcher:
+    """
+    Batching queue of one monitored model, which coalesces concurrent predictions into a single predict call.
+
+    Requests are collected until the batch has at least max_rows rows or max_delay_ms milliseconds passed since the
+    first request of the batch. Then ml model makes one prediction for all collected rows and results are scattered
+    back to the waiting requests. If prediction of the whole batch fails, every request of the batch is predicted
+    separately, so a malformed request does not fail the other ones.
+
+    Attributes:
+    - **max_rows (int)**: Maximum number of rows in batch.
+    - **max_delay_ms (float)**: Maximum time in milliseconds the first request of batch waits for other requests.
+    """
+
+    def __init__(self, max_rows: int, max_delay_ms: float):
+        self.max_rows: int = max_rows
+        self.max_delay_ms: float = max_delay_ms
+        self.requests: int = 0
+        self.rows: int = 0
+        self.batches: int = 0
+        self.fallbacks: int = 0
+        self._ml_model_key: Optional[object] = None
+        self._predict_function: Optional[Callable[[List[dict]], Awaitable[list]]] = None
+        self._pending: List[Tuple[List[dict], asyncio.Future]] = []
+        self._pending_rows: int = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def predict(self, ml_model_key: object, predict_function: Callable[[List[dict]], Awaitable[list]],
+                      input_data: List[dict]) -> list:
+        """
+        Add input data to the batch and wait for its predictions.
+
+        Args:
+            ml_model_key: Key of ml model version, e.g. its cache key.
+            predict_function: Coroutine function making prediction on list of samples with this version of ml model.
+            input_data: List of samples to make prediction on.
+
+        Returns:
+            List of predictions for input data.
+        """
+        loop = asyncio.get_running_loop()
+
+        # batch can contain predictions of only one version of ml model
+        if self._pending and ml_model_key != self._ml_model_key:
+            self._flush()
+
+        future = loop.create_future()
+        self._ml_model_key = ml_model_key
+        self._predict_function = predict_function
+        self._pending.append((input_data, future))
+        self._pending_rows += len(input_data)
+        self.requests += 1
+        self.rows += len(input_data)
+
+        if self._pending_rows >= self.max_rows:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """
+        Start prediction of pending batch.
+
+        Returns:
+            None
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return None
+
+        batch, self._pending, self._pending_rows = self._pending, [], 0
+        task = asyncio.create_task(self._predict_batch(self._predict_function, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _predict_batch(self, predict_function: Callable[[List[dict]], Awaitable[list]],
+                             batch: List[Tuple[List[dict], asyncio.Future]]) -> None:
+        """
+        Make one prediction for the whole batch and scatter predictions back to waiting requests.
+
+        Args:
+            predict_function: Coroutine function making prediction on list of samples.
+            batch: List of pairs of input data and future waiting for its predictions.
+
+        Returns:
+            None
+        """
+        self.batches += 1
+
+        try:
+            predictions = await predict_function([sample for input_data, _ in batch for sample in input_data])
+        except Exception as e:
+            if len(batch) == 1:
+                self._set_exception(batch[0][1], e)
+                return None
+
+            # predict every request separately, so only requests which caused the failure fail
+            self.fallbacks += 1
+            for input_data, future in batch:
+                try:
+                    self._set_result(future, await predict_function(input_data))
+                except Exception as e:
+                    self._set_exception(future, e)
+            return None
+
+        start = 0
+        for input_data, future in batch:
+            self._set_result(future, list(predictions[start:start + len(input_data)]))
+            start += len(input_data)
+
+        return None
+
+    @staticmethod
+    def _set_result(future: asyncio.Future, result: list) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, exception: Exception) -> None:
+        if not future.done():
+            future.set_exception(exception)
+
+    def stats(self) -> dict:
+        """
+        Get batching queue statistics.
+
+        Returns:
+            Dictionary with number of requests, rows, batches, fallbacks, pending requests and rows.
+        """
+        return {
+            'max_rows': self.max_rows,
+            'max_delay_ms': self.max_delay_ms,
+            'requests': self.requests,
+            'rows': self.rows,
+            'batches': self.batches,
+            'average_batch_rows': self.rows / self.batches if self.batches else 0,
+            'fallbacks': self.fallbacks,
+            'pending_requests': len(self._pending),
+            'pending_rows': self._pending_rows
+        }
+
+
+class PredictionBatchers:
+    """
+    Registry of batching queues of monitored models.
+    """
+
+    def __init__(self, max_rows: int, max_delay_ms: float):
+        self.max_rows: int = max_rows
+        self.max_delay_ms: float = max_delay_ms
+        self._batchers: Dict[str, PredictionBatcher] = {}
+
+    def get(self, monitored_model_id) -> PredictionBatcher:
+        """
+        Get batching queue of monitored model, creating it if needed.
+
+        Args:
+            monitored_model_id: Monitored model id.
+
+        Returns:
+            Batching queue.
+        """
+        key = str(monitored_model_id)
+        if key not in self._batchers:
+            self._batchers[key] = PredictionBatcher(self.max_rows, self.max_delay_ms)
+        return self._batchers[key]
+
+    def remove(self, monitored_model_id) -> None:
+        """
+        Remove batching queue of monitored model. Pending batches are still predicted.
+
+        Args:
+            monitored_model_id: Monitored model id.
+
+        Returns:
+            None
+        """
+        self._batchers.pop(str(monitored_model_id), None)
+
+    def stats(self) -> dict:
+        """
+        Get statistics of all batching queues.
+
+        Returns:
+            Dictionary of batching queue statistics by monitored model id.
+        """
+        return {monitored_model_id: batcher.stats() for monitored_model_id, batcher in self._batchers.items()}
+
+
+prediction_batchers = PredictionBatchers(settings.PREDICTION_BATCH_MAX_ROWS, settings.PREDICTION_BATCH_MAX_DELAY_MS)
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+
+from app.config.config import settings
+
+# statuses of HEAD requests meaning the server does not support HEAD, e.g. presigned S3 URLs signed for GET only
+HEAD_NOT_SUPPORTED_STATUSES = frozenset([403, 405, 501])
+
+
+class UrlValidator:
+    """
+    Non-blocking check of dataset URLs, with a TTL cache of recent results.
+
+    URL is checked with HEAD request, or with GET request of the first byte if the server does not support HEAD,
+    so the dataset is never downloaded. Results, including failures, are cached for ttl seconds.
+
+    Attributes:
+    - **timeout (float)**: Timeout of requests in seconds.
+    - **ttl (float)**: Time in seconds results are cached for (0 disables caching).
+    - **max_size (int)**: Maximum number of cached results.
+    - **hits (int)**: Number of cache hits.
+    - **misses (int)**: Number of cache misses.
+    """
+
+    def __init__(self, timeout: float, ttl: float, max_size: int):
+        self.timeout: float = timeout
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._results: OrderedDict = OrderedDict()
+
+    async def get_status_code(self, url: str) -> Optional[int]:
+        """
+        Get status code of response to request of the URL.
+
+        Args:
+            url: URL.
+
+        Returns:
+            Status code, None if the server is unreachable or does not respond before timeout.
+        """
+        result = self._results.get(url)
+        if result is not None and result[1] > time.monotonic():
+            self.hits += 1
+            return result[0]
+
+        self.misses += 1
+        status_code = await self.request(url)
+
+        if self.ttl > 0 and self.max_size > 0:
+            self._results[url] = (status_code, time.monotonic() + self.ttl)
+            self._results.move_to_end(url)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+        return status_code
+
+    async def request(self, url: str) -> Optional[int]:
+        """
+        Request the URL without downloading its content.
+
+        Args:
+            url: URL.
+
+        Returns:
+            Status code, None if the server is unreachable or does not respond before timeout.
+        """
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+                response = await client.head(url)
+                if response.status_code not in HEAD_NOT_SUPPORTED_STATUSES:
+                    return response.status_code
+
+                async with client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+                    return response.status_code
+        except httpx.HTTPError:
+            return None
+
+    def clear(self) -> None:
+        """
+        Remove all cached results and reset counters.
+
+        Returns:
+            None
+        """
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache size, maximum size, ttl, hits and misses.
+        """
+        return {
+            'size': len(self._results),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+url_validator = UrlValidator(settings.DATASET_URL_TIMEOUT, settings.DATASET_URL_CACHE_TTL,
+                             settings.DATASET_URL_CACHE_SIZE)
@@ -0,0 +1,79 @@
+import base64
+import json
+import math
+
+
+def encode_key(value: object) -> str:
+    """
+    Encode column name or value into a key which can be used as MongoDB field name.
+
+    Args:
+        value: Value to encode.
+
+    Returns:
+        Encoded key.
+    """
+    return 'k' + base64.urlsafe_b64encode(json.dumps(value).encode('utf-8')).decode('utf-8').rstrip('=')
+
+
+def decode_key(key: str) -> object:
+    """
+    Decode key encoded with encode_key.
+
+    Args:
+        key: Encoded key.
+
+    Returns:
+        Decoded value.
+    """
+    encoded = key[1:]
+    return json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)).decode('utf-8'))
+
+
+def normalize_value(value: object) -> object:
+    """
+    Normalize value, so integer valued floats and integers are counted as the same category.
+
+    Args:
+        value: Value to normalize.
+
+    Returns:
+        Normalized value.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def is_number(value: object) -> bool:
+    """
+    Check if value is a finite number.
+
+    Args:
+        value: Value to check.
+
+    Returns:
+        True if value is a finite number, False otherwise.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def get_value_type(value: object) -> str:
+    """
+    Get type of JSON value used by monitored model input schema.
+
+    Args:
+        value: Value.
+
+    Returns:
+        'null', 'boolean', 'numeric', 'string' or 'other'.
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, (int, float)):
+        return 'numeric'
+    if isinstance(value, str):
+        return 'string'
+    return 'other'